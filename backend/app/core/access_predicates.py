@@ -0,0 +1,216 @@
+"""
+Access Predicates
+Compiles (principal, entity, action) into SQL WHERE clauses for role-based filtering
+"""
+
+from sqlmodel import select, and_, or_
+from sqlalchemy import false, case, literal
+from typing import Any, Dict, List, Optional
+import logging
+
+from app.models.user import User
+from app.models.role import Role
+from app.models.citizen_issues import CitizenIssue
+from app.models.received_letter import ReceivedLetter
+from app.models.sent_letter import SentLetter
+from app.models.sent_grievance_letter import SentGrievanceLetter
+from app.models.meeting_program import MeetingProgram
+from app.utils.role_permissions import role_permissions, Permission
+
+logger = logging.getLogger(__name__)
+
+# Supported actions, in the same vocabulary as Permission values ("view_all_issues", ...)
+ACTIONS = ("view", "edit", "delete")
+
+# Scopes in order of precedence; the first one the role holds wins
+SCOPES = ("all", "tenant", "assigned", "own")
+
+# Role names used for Field Agents in the roles table
+FIELD_AGENT_ROLE_NAMES = ("FieldAgent", "field_agent")
+
+# Entity -> permission family
+ENTITY_KINDS = {
+    CitizenIssue: "issues",
+    ReceivedLetter: "letters",
+    SentLetter: "letters",
+    SentGrievanceLetter: "letters",
+    MeetingProgram: "meetings",
+}
+
+
+def get_principal_role_name(user: Optional[User]) -> str:
+    """Get the raw role name of a user, empty string when no role is attached"""
+    user_role = getattr(user, 'role', None)
+    if hasattr(user_role, 'name'):
+        return user_role.name or ""
+    return str(user_role) if user_role else ""
+
+
+def resolve_access_scope(user: Optional[User], entity: Any, action: str = "view") -> Optional[str]:
+    """
+    Resolve the widest scope a user holds for an action on an entity
+
+    Returns:
+        One of SCOPES, or None if the user has no access at all
+    """
+    kind = ENTITY_KINDS.get(entity)
+    if kind is None:
+        raise ValueError(f"No access rules registered for entity: {entity}")
+    if action not in ACTIONS:
+        raise ValueError(f"Unknown action: {action}")
+
+    role_name = get_principal_role_name(user)
+    for scope in SCOPES:
+        try:
+            permission = Permission(f"{action}_{scope}_{kind}")
+        except ValueError:
+            # Not every family defines every scope (e.g. no "own" meetings)
+            continue
+        if role_permissions.has_permission(role_name, permission):
+            return scope
+    return None
+
+
+def field_agent_ids_subquery(tenant_id: str):
+    """Subquery selecting ids of Field Agents in a tenant"""
+    return select(User.id).where(
+        and_(
+            User.tenant_id == tenant_id,
+            User.role_id.in_(
+                select(Role.id).where(Role.name.in_(FIELD_AGENT_ROLE_NAMES))
+            )
+        )
+    )
+
+
+# ----- Tenant scope rules -----
+
+def _tenant_rule_default(entity, user: User):
+    return entity.tenant_id == user.tenant_id
+
+
+def _tenant_rule_meeting(entity, user: User):
+    # Admins see meetings they created and meetings assigned to Field Agents in their tenant
+    return and_(
+        MeetingProgram.tenant_id == user.tenant_id,
+        or_(
+            MeetingProgram.created_by == str(user.id),
+            MeetingProgram.user_id.in_(field_agent_ids_subquery(user.tenant_id))
+        )
+    )
+
+
+def _tenant_rule_received_letter(entity, user: User):
+    # Admins see letters they created and letters assigned to their Field Agents
+    return or_(
+        ReceivedLetter.created_by == str(user.id),
+        ReceivedLetter.assigned_to.in_(field_agent_ids_subquery(user.tenant_id))
+    )
+
+
+# ----- Assigned scope rules -----
+
+def _assigned_rule_default(entity, user: User):
+    user_id = str(user.id)
+    return or_(entity.created_by == user_id, entity.assigned_to == user_id)
+
+
+def _assigned_rule_meeting(entity, user: User):
+    return MeetingProgram.user_id == str(user.id)
+
+
+def _assigned_rule_received_letter(entity, user: User):
+    return ReceivedLetter.assigned_to == str(user.id)
+
+
+_TENANT_RULES = {
+    MeetingProgram: _tenant_rule_meeting,
+    ReceivedLetter: _tenant_rule_received_letter,
+}
+
+_ASSIGNED_RULES = {
+    MeetingProgram: _assigned_rule_meeting,
+    ReceivedLetter: _assigned_rule_received_letter,
+}
+
+
+def build_access_predicate(user: Optional[User], entity: Any, action: str = "view"):
+    """
+    Compile the access rules for a user into a SQL WHERE clause on an entity
+
+    Args:
+        user: Current authenticated user
+        entity: Model class (CitizenIssue, ReceivedLetter, SentLetter,
+            SentGrievanceLetter or MeetingProgram)
+        action: Type of access ("view", "edit", "delete")
+
+    Returns:
+        SQL expression, or None when the user is unrestricted
+    """
+    if user is None:
+        return false()
+
+    scope = resolve_access_scope(user, entity, action)
+    logger.debug(f"Access scope for user {getattr(user, 'email', user.id)} on "
+                 f"{entity.__name__} ({action}): {scope}")
+
+    if scope == "all":
+        return None
+
+    if scope == "tenant":
+        if not getattr(user, 'tenant_id', None):
+            # A tenant-scoped role without a tenant is misconfigured; it sees nothing
+            return false()
+        rule = _TENANT_RULES.get(entity, _tenant_rule_default)
+        return rule(entity, user)
+
+    if scope == "assigned":
+        rule = _ASSIGNED_RULES.get(entity, _assigned_rule_default)
+        return rule(entity, user)
+
+    if scope == "own":
+        return entity.created_by == str(user.id)
+
+    return false()
+
+
+def access_scope_key(user: Optional[User], entity: Any, action: str = "view") -> str:
+    """
+    Identify the access predicate a user gets on an entity: users with the same
+    key see exactly the same rows, so results computed for one can be shared
+
+    Returns:
+        "all", "tenant:<tenant id>", "user:<user id>:<scope>" or "none"
+    """
+    if user is None:
+        return "none"
+    scope = resolve_access_scope(user, entity, action)
+    if scope is None:
+        return "none"
+    if scope == "all":
+        return "all"
+    if scope == "tenant" and not getattr(user, 'tenant_id', None):
+        return "none"
+    # Entities with their own tenant rule also match on who created the row
+    if scope == "tenant" and getattr(user, 'tenant_id', None) and entity not in _TENANT_RULES:
+        return f"tenant:{user.tenant_id}"
+    return f"user:{user.id}:{scope}"
+
+
+def apply_access_filter(query, user: Optional[User], entity: Any, action: str = "view"):
+    """Apply the compiled access predicate to a select() on the entity"""
+    predicate = build_access_predicate(user, entity, action)
+    if predicate is None:
+        return query
+    return query.where(predicate)
+
+
+def classify_access(db, user: Optional[User], entity: Any, ids: List[Any], action: str = "view") -> Dict[Any, bool]:
+    """
+    Check many records at once: map each id that exists to whether the user may
+    perform the action on it, evaluating the access predicate in a single query
+    """
+    predicate = build_access_predicate(user, entity, action)
+    allowed = case((predicate, 1), else_=0) if predicate is not None else literal(1)
+    rows = db.exec(select(entity.id, allowed).where(entity.id.in_(ids))).all()
+    return {record_id: bool(flag) for record_id, flag in rows}
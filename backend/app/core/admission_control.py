@@ -0,0 +1,163 @@
+"""
+Admission Control
+Caps the number of requests served at once at what the database pool can
+serve, so requests wait in a bounded queue here instead of blocking on a pool
+checkout inside a worker thread until they time out.
+
+The limit is the pool size plus overflow, less the connections background job
+workers may hold; AnyIO's thread pool for sync routes is sized to match.
+Requests over the limit queue for a free slot, critical ones first.
+Non-critical endpoints (statistics, GeoJSON, dashboards, exports) are shed
+with 503 and Retry-After as soon as critical requests are waiting, and after a
+shorter wait than critical ones.
+"""
+
+from collections import deque
+from sqlalchemy.engine import Engine
+from starlette.responses import JSONResponse
+from typing import Deque, Dict, Optional
+import asyncio
+import logging
+import re
+import time
+
+from config import settings
+from app.core.metrics import metrics, gauge_lines
+
+logger = logging.getLogger(__name__)
+
+CRITICAL = "critical"
+LOW = "low"
+
+admission_rejected_total = metrics.counter(
+    "admission_rejected_total", "Requests refused with 503 by admission control", ("priority", "reason")
+)
+admission_wait_seconds = metrics.histogram(
+    "admission_wait_seconds", "Time requests waited for an admission slot", ("priority",),
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+
+class AdmissionController:
+    """Slots for concurrent requests with a two-priority wait queue; used from the event loop only"""
+
+    def __init__(self):
+        self.limit = settings.ADMISSION_MAX_CONCURRENT or 1
+        self.in_flight = 0
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {CRITICAL: deque(), LOW: deque()}
+        self._low_priority = re.compile(settings.ADMISSION_LOW_PRIORITY_PATTERN)
+
+    def configure(self, engine: Engine):
+        """Derive the limit from the engine's pool unless ADMISSION_MAX_CONCURRENT is set"""
+        if settings.ADMISSION_MAX_CONCURRENT:
+            self.limit = settings.ADMISSION_MAX_CONCURRENT
+        else:
+            pool = engine.pool
+            capacity = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+            reserved = settings.JOB_WORKERS if settings.JOBS_ENABLED else 0
+            self.limit = max(capacity - reserved, 1)
+        logger.info(f"Admission control allows {self.limit} concurrent requests")
+
+    def configure_threadpool(self):
+        """Size AnyIO's default thread limiter (sync routes and dependencies) to the limit; call from the event loop"""
+        import anyio.to_thread
+
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        limiter.total_tokens = self.limit + settings.ADMISSION_EXTRA_THREADS
+
+    @staticmethod
+    def is_exempt(path: str) -> bool:
+        return any(path == exempt or path.startswith(exempt + "/") for exempt in settings.ADMISSION_EXEMPT_PATHS)
+
+    def classify(self, path: str) -> str:
+        return LOW if self._low_priority.search(path) else CRITICAL
+
+    def queue_depth(self, priority: Optional[str] = None) -> int:
+        if priority:
+            return len(self._waiters[priority])
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    async def acquire(self, priority: str) -> Optional[str]:
+        """Take a slot, waiting if needed; returns None once admitted or the reason for refusing"""
+        if self.in_flight < self.limit and not self.queue_depth():
+            self.in_flight += 1
+            return None
+        if priority == LOW and self._waiters[CRITICAL]:
+            return "shed"
+        if self.queue_depth() >= settings.ADMISSION_MAX_QUEUE:
+            return "queue_full"
+
+        timeout = settings.ADMISSION_QUEUE_TIMEOUT_SECONDS if priority == CRITICAL else settings.ADMISSION_LOW_PRIORITY_TIMEOUT_SECONDS
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(waiter)
+        start_time = time.perf_counter()
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return None
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the wait ended; give it back
+                self.release()
+            elif waiter in self._waiters[priority]:
+                self._waiters[priority].remove(waiter)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return "timeout"
+        finally:
+            admission_wait_seconds.observe(time.perf_counter() - start_time, priority=priority)
+
+    def release(self):
+        """Hand the slot to the next waiter (critical first) or free it"""
+        for priority in (CRITICAL, LOW):
+            waiters = self._waiters[priority]
+            while waiters:
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+                    return
+        self.in_flight -= 1
+
+    def metric_lines(self):
+        return (
+            gauge_lines("admission_limit", "Requests admission control lets run at once", [({}, self.limit)])
+            + gauge_lines("admission_in_flight", "Requests holding an admission slot", [({}, self.in_flight)])
+            + gauge_lines("admission_queue_depth", "Requests waiting for an admission slot", [
+                ({"priority": priority}, self.queue_depth(priority)) for priority in (CRITICAL, LOW)
+            ])
+        )
+
+class AdmissionControlMiddleware:
+    """
+    ASGI middleware holding an admission slot for the whole response, streamed
+    bodies included; refused requests get 503 with Retry-After
+    """
+
+    def __init__(self, app, controller: "AdmissionController" = None):
+        self.app = app
+        self.controller = controller or admission_controller
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self.controller.is_exempt(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        priority = self.controller.classify(scope["path"])
+        reason = await self.controller.acquire(priority)
+        if reason is not None:
+            admission_rejected_total.inc(priority=priority, reason=reason)
+            logger.warning(f"Refused {scope['method']} {scope['path']} ({priority}): {reason}")
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": "Server is busy, please retry shortly"},
+                headers={"Retry-After": str(settings.ADMISSION_RETRY_AFTER_SECONDS)}
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release()
+
+# Global admission controller instance
+admission_controller = AdmissionController()
+metrics.register_collector(admission_controller.metric_lines)
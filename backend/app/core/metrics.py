@@ -0,0 +1,243 @@
+"""
+Metrics
+Process-local counters, gauges and histograms rendered in the Prometheus text
+exposition format by GET /metrics.
+
+Writers never take a lock: every thread updates its own shard of a metric and
+a scrape adds the shards up. Copying a plain dict is atomic under the GIL, so a
+scrape sees each shard either before or after a concurrent update.
+"""
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from typing import Callable, Dict, Iterable, List, Tuple
+import math
+import threading
+import time
+
+LabelValues = Tuple[str, ...]
+
+# Request latency buckets in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+class _ShardedValues:
+    """Per-thread dicts of key -> number, summed on read"""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[Dict] = []
+        self._shards_lock = threading.Lock()  # Only taken the first time a thread writes
+
+    def _shard(self) -> Dict:
+        shard = getattr(self._local, "values", None)
+        if shard is None:
+            shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+            self._local.values = shard
+        return shard
+
+    def add(self, key, amount: float):
+        shard = self._shard()
+        shard[key] = shard.get(key, 0) + amount
+
+    def totals(self) -> Dict:
+        totals: Dict = {}
+        for shard in list(self._shards):
+            for key, value in dict(shard).items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+class Metric:
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._values = _ShardedValues()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for key, value in sorted(self._values.totals().items()):
+            lines.append(f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}")
+        return lines
+
+class Counter(Metric):
+    metric_type = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        self._values.add(self._key(labels), amount)
+
+class Gauge(Metric):
+    """Gauge changed with inc/dec; the shards hold deltas, so threads may inc and dec independently"""
+    metric_type = "gauge"
+
+    def inc(self, amount: float = 1, **labels):
+        self._values.add(self._key(labels), amount)
+
+    def dec(self, amount: float = 1, **labels):
+        self._values.add(self._key(labels), -amount)
+
+class Histogram(Metric):
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = (), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self._values.add((key, index), 1)
+                break
+        self._values.add((key, "sum"), value)
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        series: Dict[LabelValues, Dict] = {}
+        for (key, slot), value in self._values.totals().items():
+            series.setdefault(key, {})[slot] = value
+        for key, slots in sorted(series.items()):
+            cumulative = 0
+            for index, bound in enumerate(self.buckets):
+                cumulative += slots.get(index, 0)
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, key, le)} {cumulative}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(slots.get('sum', 0))}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+class MetricsRegistry:
+    """Registered metrics plus collectors that read values at scrape time"""
+
+    def __init__(self):
+        self._metrics: List[Metric] = []
+        self._collectors: List[Callable[[], List[str]]] = []
+        self.started_at = time.time()
+
+    def counter(self, name: str, documentation: str, labels: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labels))
+
+    def gauge(self, name: str, documentation: str, labels: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labels))
+
+    def histogram(self, name: str, documentation: str, labels: Iterable[str] = (), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labels, buckets))
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], List[str]]):
+        """collector returns exposition lines (HELP/TYPE included) computed on each scrape"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines = [
+            "# HELP process_start_time_seconds Start time of the process since unix epoch in seconds",
+            "# TYPE process_start_time_seconds gauge",
+            f"process_start_time_seconds {self.started_at:.3f}",
+        ]
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+def gauge_lines(name: str, documentation: str, samples: List[Tuple[Dict[str, str], float]]) -> List[str]:
+    """Exposition lines for a gauge whose values are read at scrape time"""
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} gauge"]
+    for labels, value in samples:
+        lines.append(f"{name}{_format_labels(labels.keys(), labels.values())} {_format_value(value)}")
+    return lines
+
+def counter_lines(name: str, documentation: str, samples: List[Tuple[Dict[str, str], float]]) -> List[str]:
+    """Exposition lines for a counter maintained elsewhere and read at scrape time"""
+    lines = gauge_lines(name, documentation, samples)
+    lines[1] = f"# TYPE {name} counter"
+    return lines
+
+# Global registry and the metrics shared across the app
+metrics = MetricsRegistry()
+
+http_requests_total = metrics.counter(
+    "http_requests_total", "HTTP requests by method, route template and status code", ("method", "route", "status")
+)
+http_request_duration_seconds = metrics.histogram(
+    "http_request_duration_seconds", "HTTP request latency by method and route template", ("method", "route")
+)
+http_requests_in_progress = metrics.gauge(
+    "http_requests_in_progress", "HTTP requests currently being served", ("method",)
+)
+http_request_db_queries_total = metrics.counter(
+    "http_request_db_queries_total", "SQL statements run while serving requests, by route template", ("route",)
+)
+db_statements_total = metrics.counter(
+    "db_statements_total", "SQL statements executed by the process (requests and background work)"
+)
+cache_requests_total = metrics.counter(
+    "cache_requests_total", "Cache lookups by cache and result (hit, stale or miss)", ("cache", "result")
+)
+
+def record_cache_lookup(cache: str, result: str):
+    """Count a cache lookup; result is "hit", "stale" or "miss" """
+    cache_requests_total.inc(cache=cache, result=result)
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    db_statements_total.inc()
+
+_pool_engines: List[Engine] = []
+
+def _pool_lines() -> List[str]:
+    """Connection pool gauges of every installed engine, read from the pools on each scrape"""
+    readers = {
+        "size": ("Connections the pool keeps open", lambda pool: pool.size()),
+        "checked_out": ("Connections currently in use", lambda pool: pool.checkedout()),
+        "checked_in": ("Idle connections held by the pool", lambda pool: pool.checkedin()),
+        # QueuePool.overflow() counts up from -pool_size; only connections beyond the pool are overflow
+        "overflow": ("Connections open beyond the pool size", lambda pool: max(pool.overflow(), 0)),
+        "max_overflow": ("Connections allowed beyond the pool size", lambda pool: pool._max_overflow),
+    }
+    lines = []
+    for name, (documentation, read) in readers.items():
+        samples = []
+        for engine in _pool_engines:
+            try:
+                samples.append(({"database": engine.url.database or engine.dialect.name}, read(engine.pool)))
+            except AttributeError:
+                continue  # Pool classes without a fixed size (NullPool, StaticPool)
+        if samples:
+            lines.extend(gauge_lines(f"db_pool_{name}", documentation, samples))
+    return lines
+
+metrics.register_collector(_pool_lines)
+
+def install_metrics(engine: Engine):
+    """Count statements on an engine and report its pool (once)"""
+    if engine in _pool_engines:
+        return
+    event.listen(engine, "after_cursor_execute", _count_statement)
+    _pool_engines.append(engine)
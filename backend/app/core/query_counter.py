@@ -0,0 +1,145 @@
+"""
+Query Counter
+Counts SQL statements and database time per request through SQLAlchemy engine
+events, and spots N+1 patterns: the same statement run many times with
+different parameters.
+
+Only statements executed while a tracker is active are recorded (the request
+middleware opens one per request); background jobs and startup are untouched.
+assert_max_queries tracks every thread instead, since test clients run the app
+on a thread of their own.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from typing import Dict, Iterator, List, Optional, Tuple
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class StatementStats:
+    """Executions of one SQL string"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.parameter_sets = set()
+
+class QueryStats:
+    """Statements run inside one tracker (usually one request)"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.statements: Dict[str, StatementStats] = {}
+        # Sync endpoints and their dependencies may run on different pool threads
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, parameters, elapsed: float):
+        with self._lock:
+            self.count += 1
+            self.total_time += elapsed
+            stats = self.statements.setdefault(statement, StatementStats())
+            stats.count += 1
+            stats.total_time += elapsed
+            stats.parameter_sets.add(hash(repr(parameters)))
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_time * 1000
+
+    def n_plus_one_candidates(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statements run at least threshold times with more than one parameter set, most frequent first"""
+        with self._lock:
+            candidates = [
+                (statement, stats.count)
+                for statement, stats in self.statements.items()
+                if stats.count >= threshold and len(stats.parameter_sets) > 1
+            ]
+        return sorted(candidates, key=lambda item: item[1], reverse=True)
+
+    def summary(self, limit: int = 5) -> str:
+        """Most frequent statements, for log and assertion messages"""
+        with self._lock:
+            top = sorted(self.statements.items(), key=lambda item: item[1].count, reverse=True)[:limit]
+        return "\n".join(f"  {stats.count}x {shorten_statement(statement)}" for statement, stats in top)
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+_global_trackers: List[QueryStats] = []
+_installed_engines = set()
+
+def shorten_statement(statement: str, length: int = 200) -> str:
+    statement = " ".join(statement.split())
+    return statement if len(statement) <= length else statement[:length] + "..."
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None or _global_trackers:
+        conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("query_start_times")
+    if not start_times:
+        return
+    elapsed = time.perf_counter() - start_times.pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, parameters, elapsed)
+    for tracker in list(_global_trackers):
+        tracker.record(statement, parameters, elapsed)
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute; drop its start time
+    conn = exception_context.connection
+    start_times = conn.info.get("query_start_times") if conn is not None else None
+    if start_times:
+        start_times.pop()
+
+def install_query_counter(engine: Engine):
+    """Attach the counting listeners to an engine (once)"""
+    if id(engine) in _installed_engines:
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+    _installed_engines.add(id(engine))
+
+def get_query_stats() -> Optional[QueryStats]:
+    """Stats of the active tracker, if any"""
+    return _current_stats.get()
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Record every statement executed in this context (and threads it is copied to)"""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+@contextmanager
+def assert_max_queries(max_queries: int, engine: Optional[Engine] = None) -> Iterator[QueryStats]:
+    """
+    Fail when the block runs more than max_queries statements; locks in a query
+    budget for an endpoint in tests
+
+    Usage:
+    with assert_max_queries(3, engine):
+        client.get("/meeting-programs/")
+    """
+    if engine is not None:
+        install_query_counter(engine)
+    stats = QueryStats()
+    _global_trackers.append(stats)
+    try:
+        yield stats
+    finally:
+        _global_trackers.remove(stats)
+    if stats.count > max_queries:
+        raise AssertionError(
+            f"Expected at most {max_queries} queries, {stats.count} were run:\n{stats.summary()}"
+        )
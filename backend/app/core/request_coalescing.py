@@ -0,0 +1,143 @@
+"""
+Request Coalescing
+Single-flight execution for expensive read endpoints: while one request
+computes a result, identical requests arriving meanwhile wait for it and
+return the same result instead of running the same queries again.
+
+Requests are identical when they hit the same route with the same parsed
+parameters (defaults applied) and the same access scope, so users whose role
+rules select the same rows share a computation and nobody sees rows they could
+not see on their own. Nothing is kept once the computation finishes; a
+response cache can sit inside or outside the coalesced function.
+"""
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import functools
+import inspect
+import logging
+import threading
+
+from config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+coalesced_requests_total = metrics.counter(
+    "coalesced_requests_total", "Coalesced endpoint calls by route and role (leader computed, follower shared)",
+    ("route", "role")
+)
+
+_KEY_TYPES = (str, int, float, bool, date, datetime, Enum, type(None))
+
+class _Flight:
+    """One computation in progress"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+def _fresh_error(error: BaseException) -> BaseException:
+    """
+    A copy of a shared exception for one follower to raise, so concurrent raises do
+    not keep rewriting the same object's __traceback__ and __context__. Built
+    without calling __init__, whose signature varies (HTTPException takes keywords).
+    """
+    try:
+        fresh = type(error).__new__(type(error))
+        fresh.args = error.args
+        fresh.__dict__.update(error.__dict__)
+        return fresh
+    except Exception:
+        return RuntimeError(f"Coalesced computation failed: {error!r}")
+
+class RequestCoalescer:
+    """Runs at most one computation per key at a time; concurrent callers share its outcome"""
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+    def run(self, key: Hashable, compute: Callable[[], Any], route: str = "") -> Any:
+        """Return compute()'s result, joining an identical computation already running"""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+
+        if not leader:
+            if flight.done.wait(settings.COALESCE_WAIT_TIMEOUT_SECONDS):
+                coalesced_requests_total.inc(route=route, role="follower")
+                if flight.error is not None:
+                    raise _fresh_error(flight.error) from flight.error
+                return flight.result
+            # The leader is taking too long; stop waiting and compute independently
+            logger.warning(f"Coalesced request for {route} gave up waiting after {settings.COALESCE_WAIT_TIMEOUT_SECONDS}s")
+            return compute()
+
+        coalesced_requests_total.inc(route=route, role="leader")
+        try:
+            flight.result = compute()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+def _normalise(value: Any) -> Optional[Hashable]:
+    if isinstance(value, _KEY_TYPES):
+        return value
+    if isinstance(value, (list, tuple, set, frozenset)) and all(isinstance(item, _KEY_TYPES) for item in value):
+        return tuple(sorted(value, key=repr)) if isinstance(value, (set, frozenset)) else tuple(value)
+    return None  # Sessions, users, requests and other injected objects are not parameters
+
+def coalesce_key(route: str, params: Dict[str, Any], scope: str = "public") -> Tuple:
+    """(route, normalised parameters, access scope) identifying identical requests"""
+    normalised = []
+    for name, value in sorted(params.items()):
+        key_value = _normalise(value)
+        if key_value is not None or value is None:
+            normalised.append((name, key_value))
+    return route, tuple(normalised), scope
+
+def coalesce(route: str, scope: Optional[Callable[..., str]] = None):
+    """
+    Decorator for sync route functions sharing one execution between concurrent
+    identical calls. scope(**arguments) returns the access scope of the caller
+    (see access_scope_key); endpoints without per-user filtering leave it out.
+
+    Usage:
+    @router.get("/dashboard/stats")
+    @coalesce("/dashboard/stats")
+    def get_dashboard_stats(db: Session = Depends(get_session)):
+    """
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            raise TypeError("coalesce works on sync route functions, which run on worker threads")
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not settings.REQUEST_COALESCING_ENABLED:
+                return func(*args, **kwargs)
+            arguments = signature.bind(*args, **kwargs)
+            arguments.apply_defaults()
+            caller_scope = scope(**arguments.arguments) if scope else "public"
+            key = coalesce_key(route, arguments.arguments, caller_scope)
+            return request_coalescer.run(key, lambda: func(*args, **kwargs), route)
+        return wrapper
+    return decorator
+
+# Global request coalescer instance
+request_coalescer = RequestCoalescer()
@@ -11,6 +11,14 @@ import logging
 from typing import Callable
 import json
 
+from config import settings
+from app.core.query_counter import track_queries, get_query_stats, shorten_statement
+from app.core.metrics import (
+    http_requests_total, http_request_duration_seconds, http_requests_in_progress, http_request_db_queries_total
+)
+from app.core.request_profiler import request_profiler
+from app.core.tracing import tracer
+
 logger = logging.getLogger(__name__)
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
@@ -55,6 +63,122 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 content={"detail": "Internal server error"}
             )
 
+class QueryCountMiddleware(BaseHTTPMiddleware):
+    """
+    Count SQL statements and database time per request; logs requests over the
+    thresholds and N+1 candidates, and adds X-DB-* headers in debug mode
+    """
+    
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        with track_queries() as stats:
+            response = await call_next(request)
+        
+        if settings.DEBUG:
+            response.headers["X-DB-Query-Count"] = str(stats.count)
+            response.headers["X-DB-Time-Ms"] = f"{stats.total_ms:.1f}"
+        
+        endpoint = f"{request.method} {request.url.path}"
+        if stats.count > settings.SLOW_REQUEST_QUERY_COUNT or stats.total_ms > settings.SLOW_REQUEST_DB_MS:
+            logger.warning(
+                f"Heavy database use: {endpoint} ran {stats.count} queries in {stats.total_ms:.1f}ms\n{stats.summary()}"
+            )
+        for statement, count in stats.n_plus_one_candidates(settings.N_PLUS_ONE_THRESHOLD):
+            logger.warning(f"Possible N+1 in {endpoint}: {count}x {shorten_statement(statement)}")
+        
+        return response
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """
+    Record request counts, latency and in-flight requests per route template
+    (/citizen-issues/{issue_id}, not the concrete path) for /metrics
+    """
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        method = request.method
+        http_requests_in_progress.inc(method=method)
+        start_time = time.perf_counter()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            elapsed = time.perf_counter() - start_time
+            http_requests_in_progress.dec(method=method)
+            # The router stores the matched route in the shared scope; unmatched paths share one label
+            route = request.scope.get("route")
+            route_label = getattr(route, "path", None) or "unmatched"
+            http_requests_total.inc(method=method, route=route_label, status=str(status_code))
+            http_request_duration_seconds.observe(elapsed, method=method, route=route_label)
+            stats = get_query_stats()
+            if stats is not None and stats.count:
+                http_request_db_queries_total.inc(stats.count, route=route_label)
+
+class ProfilingMiddleware:
+    """
+    Profile requests sent by a Super Admin with the X-Profile header, or a sampled
+    fraction of all requests; the profile id is returned in X-Profile-Id. Plain ASGI,
+    so requests that are not profiled go straight through to the app.
+    """
+
+    def __init__(self, app, profiler=None):
+        self.app = app
+        self.profiler = profiler or request_profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        self.profiler.requests_in_flight += 1
+        try:
+            request = Request(scope)
+            trigger = self.profiler.trigger(request)
+            if trigger is None:
+                await self.app(scope, receive, send)
+                return
+
+            with self.profiler.profile(request, trigger) as profile:
+                if profile is None:
+                    await self.app(scope, receive, send)
+                    return
+
+                async def send_with_profile_id(message):
+                    if message["type"] == "http.response.start":
+                        profile.status_code = message["status"]
+                        message.setdefault("headers", []).append((b"x-profile-id", profile.id.encode()))
+                    await send(message)
+
+                await self.app(scope, receive, send_with_profile_id)
+                # The router stores the matched route in the shared scope
+                profile.route = getattr(scope.get("route"), "path", None)
+        finally:
+            self.profiler.requests_in_flight -= 1
+
+class TracingMiddleware(BaseHTTPMiddleware):
+    """
+    Open the server span of each request, continuing an incoming traceparent;
+    CRUD and external call spans nest under it. Sampled requests return X-Trace-Id.
+    """
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        with tracer.span(
+            f"{request.method} {request.url.path}",
+            kind="server",
+            attributes={"http.request.method": request.method, "url.path": request.url.path},
+            traceparent=request.headers.get("traceparent")
+        ) as span:
+            response = await call_next(request)
+            if span.recording:
+                route = getattr(request.scope.get("route"), "path", None)
+                if route:
+                    span.name = f"{request.method} {route}"
+                span.set_attributes({"http.route": route, "http.response.status_code": response.status_code})
+                if response.status_code >= 500:
+                    span.status = "error"
+                response.headers["X-Trace-Id"] = span.trace_id
+            return response
+
 class CORSMiddleware:
     """Custom CORS middleware with additional security headers"""
     
@@ -0,0 +1,242 @@
+"""
+Request Profiler
+On-demand sampling profiler for single requests. A Super Admin asks for a
+profile with the X-Profile header, or PROFILE_SAMPLE_RATE picks a fraction of
+requests; every other request only pays for the trigger check.
+
+While a request is profiled a background thread samples the stacks of the
+event loop thread and the worker threads that run sync endpoints every
+PROFILE_SAMPLE_INTERVAL_MS. Samples are kept as collapsed stacks and can be
+exported in speedscope's format. Worker threads cannot be told apart per
+request, so other requests running at the same time end up in the profile too;
+each profile records how many were in flight.
+"""
+
+from collections import Counter, deque
+from contextlib import contextmanager
+from datetime import datetime
+from fastapi import Request
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+import logging
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+
+from config import settings
+from app.core.security import jwt_manager, cookie_manager
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile"
+WORKER_THREAD_PREFIX = "AnyIO worker thread"
+
+Frame = Tuple[str, str, int]  # (file, function, first line)
+
+# Leaf frames of a thread that is waiting rather than working
+_IDLE_LEAVES = {
+    ("threading.py", "wait"),
+    ("selectors.py", "select"),
+    ("queue.py", "get"),
+}
+
+def _short_path(filename: str) -> str:
+    for path in sorted(sys.path, key=len, reverse=True):
+        if path and filename.startswith(path + os.sep):
+            return filename[len(path) + 1:]
+    return filename
+
+class RequestProfile:
+    """Samples of one profiled request"""
+
+    def __init__(self, method: str, path: str, trigger: str, interval_ms: float):
+        self.id = uuid.uuid4().hex[:16]
+        self.method = method
+        self.path = path
+        self.route: Optional[str] = None
+        self.trigger = trigger
+        self.interval_ms = interval_ms
+        self.status_code: Optional[int] = None
+        self.started_at = datetime.utcnow()
+        self.duration_ms = 0.0
+        self.max_concurrent_requests = 1
+        self.stacks: Counter = Counter()  # (thread label, frame, frame, ...) -> samples
+
+    @property
+    def sample_count(self) -> int:
+        return sum(self.stacks.values())
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status_code": self.status_code,
+            "trigger": self.trigger,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration_ms, 1),
+            "interval_ms": self.interval_ms,
+            "samples": self.sample_count,
+            "max_concurrent_requests": self.max_concurrent_requests
+        }
+
+    @staticmethod
+    def _frame_name(frame: Frame) -> str:
+        filename, function, line = frame
+        return f"{function} ({_short_path(filename)}:{line})"
+
+    def collapsed(self) -> str:
+        """Brendan Gregg's collapsed stack format: "thread;outer;inner count" per line"""
+        lines = []
+        for (thread, *frames), count in self.stacks.most_common():
+            names = [thread] + [self._frame_name(frame).replace(";", ":") for frame in frames]
+            lines.append(f"{';'.join(names)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def speedscope(self) -> Dict[str, Any]:
+        """speedscope file format, one sampled profile per thread"""
+        frame_index: Dict[Frame, int] = {}
+        frames: List[Dict[str, Any]] = []
+        by_thread: Dict[str, Dict[str, list]] = {}
+        for (thread, *stack), count in self.stacks.items():
+            indexes = []
+            for frame in stack:
+                if frame not in frame_index:
+                    frame_index[frame] = len(frames)
+                    frames.append({"name": frame[1], "file": _short_path(frame[0]), "line": frame[2]})
+                indexes.append(frame_index[frame])
+            thread_samples = by_thread.setdefault(thread, {"samples": [], "weights": []})
+            thread_samples["samples"].append(indexes)
+            thread_samples["weights"].append(count * self.interval_ms)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": f"{self.method} {self.path}",
+            "exporter": settings.APP_NAME,
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": thread,
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": sum(samples["weights"]),
+                    "samples": samples["samples"],
+                    "weights": samples["weights"]
+                }
+                for thread, samples in by_thread.items()
+            ]
+        }
+
+class _StackSampler(threading.Thread):
+    """Samples the request's threads until stopped or PROFILE_MAX_SECONDS pass"""
+
+    def __init__(self, profile: RequestProfile, loop_thread_id: int, profiler: "RequestProfiler"):
+        super().__init__(name=f"request-profiler-{profile.id}", daemon=True)
+        self.profile = profile
+        self.loop_thread_id = loop_thread_id
+        self.profiler = profiler
+        self.stopped = threading.Event()
+
+    def _thread_labels(self) -> Dict[int, str]:
+        labels = {self.loop_thread_id: "event-loop"}
+        for thread in threading.enumerate():
+            if thread.name.startswith(WORKER_THREAD_PREFIX) and thread.ident is not None:
+                labels[thread.ident] = "worker"
+        return labels
+
+    def run(self):
+        interval = self.profile.interval_ms / 1000
+        deadline = time.monotonic() + settings.PROFILE_MAX_SECONDS
+        while not self.stopped.wait(interval) and time.monotonic() < deadline:
+            labels = self._thread_labels()
+            for thread_id, frame in sys._current_frames().items():
+                label = labels.get(thread_id)
+                if label is None:
+                    continue
+                stack: List[Frame] = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append((code.co_filename, code.co_name, code.co_firstlineno))
+                    frame = frame.f_back
+                leaf_file, leaf_function, _ = stack[0]
+                if (os.path.basename(leaf_file), leaf_function) in _IDLE_LEAVES:
+                    continue
+                stack.reverse()
+                self.profile.stacks[(label, *stack)] += 1
+            self.profile.max_concurrent_requests = max(
+                self.profile.max_concurrent_requests, self.profiler.requests_in_flight
+            )
+
+class RequestProfiler:
+    """Decides which requests to profile and keeps the latest profiles in memory"""
+
+    def __init__(self):
+        self._profiles: Deque[RequestProfile] = deque(maxlen=settings.PROFILE_MAX_STORED)
+        self._lock = threading.Lock()
+        self._active = 0
+        self.requests_in_flight = 0  # Kept by the middleware; only read while profiling
+
+    def trigger(self, request: Request) -> Optional[str]:
+        """Why a request should be profiled ("header" or "sampled"), or None"""
+        if PROFILE_HEADER.lower() in request.headers:
+            return "header" if self._is_super_admin(request) else None
+        if settings.PROFILE_SAMPLE_RATE > 0 and random.random() < settings.PROFILE_SAMPLE_RATE:
+            return "sampled"
+        return None
+
+    @staticmethod
+    def _is_super_admin(request: Request) -> bool:
+        # Checked from the signed token alone so that the trigger needs no database access
+        authorization = request.headers.get("Authorization", "")
+        token = authorization[7:] if authorization.lower().startswith("bearer ") else cookie_manager.get_token_from_cookies(request)
+        payload = jwt_manager.decode_token(token) if token else None
+        return bool(
+            payload and payload.get("type") == "access" and str(payload.get("sub", "")).startswith("superadmin_")
+        )
+
+    @contextmanager
+    def profile(self, request: Request, trigger: str) -> Iterator[Optional[RequestProfile]]:
+        """Sample the current request; yields None when too many profiles are already running"""
+        with self._lock:
+            if self._active >= settings.PROFILE_MAX_CONCURRENT:
+                profile = None
+            else:
+                self._active += 1
+                profile = RequestProfile(request.method, request.url.path, trigger, settings.PROFILE_SAMPLE_INTERVAL_MS)
+        if profile is None:
+            logger.info(f"Skipping profile of {request.method} {request.url.path}: profiler busy")
+            yield None
+            return
+
+        sampler = _StackSampler(profile, threading.get_ident(), self)
+        start_time = time.perf_counter()
+        sampler.start()
+        try:
+            yield profile
+        finally:
+            sampler.stopped.set()
+            sampler.join()
+            profile.duration_ms = (time.perf_counter() - start_time) * 1000
+            with self._lock:
+                self._active -= 1
+                self._profiles.append(profile)
+            logger.info(
+                f"Profiled {profile.method} {profile.path} [{profile.id}]: "
+                f"{profile.duration_ms:.0f}ms, {profile.sample_count} samples"
+            )
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Stored profiles, newest first"""
+        with self._lock:
+            profiles = list(self._profiles)
+        return [profile.summary() for profile in reversed(profiles)]
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        with self._lock:
+            return next((profile for profile in self._profiles if profile.id == profile_id), None)
+
+# Global request profiler instance
+request_profiler = RequestProfiler()
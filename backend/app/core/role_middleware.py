@@ -12,6 +12,8 @@ from database import get_session
 from app.core.auth import get_current_user
 from app.models.user import User
 from app.utils.role_permissions import role_permissions, Permission
+from app.core.access_predicates import apply_access_filter
+from sqlalchemy import false
 
 logger = logging.getLogger(__name__)
 
@@ -163,53 +165,15 @@ def get_accessible_issues_query(user: User, db: Session):
     Returns:
         SQLModel query object filtered by user permissions
     """
+    from sqlmodel import select
+    from app.models.citizen_issues import CitizenIssue
+    
     try:
-        from sqlmodel import select
-        from app.models.citizen_issues import CitizenIssue
-        
-        user_role = getattr(user, 'role', None)
-        if hasattr(user_role, 'name'):
-            user_role = user_role.name
-        elif not user_role:
-            user_role = "assistant"  # Default fallback
-        
-        user_tenant_id = getattr(user, 'tenant_id', None)
-        user_id = str(user.id)
-        
-        # Build query based on role
-        if role_permissions.has_permission(user_role, Permission.VIEW_ALL_ISSUES):
-            # Super Admin can see all issues
-            return select(CitizenIssue)
-        
-        elif role_permissions.has_permission(user_role, Permission.VIEW_TENANT_ISSUES):
-            # Admin can see all issues in their tenant
-            if user_tenant_id:
-                return select(CitizenIssue).where(CitizenIssue.tenant_id == user_tenant_id)
-            else:
-                # No tenant assigned, return empty query
-                return select(CitizenIssue).where(CitizenIssue.id == None)
-        
-        elif role_permissions.has_permission(user_role, Permission.VIEW_ASSIGNED_ISSUES):
-            # Field Agent/Assistant can see issues they created or are assigned to
-            return select(CitizenIssue).where(
-                (CitizenIssue.created_by == user_id) | 
-                (CitizenIssue.assigned_to == user_id)
-            )
-        
-        elif role_permissions.has_permission(user_role, Permission.VIEW_OWN_ISSUES):
-            # Regular users can only see issues they created
-            return select(CitizenIssue).where(CitizenIssue.created_by == user_id)
-        
-        else:
-            # No permissions, return empty query
-            return select(CitizenIssue).where(CitizenIssue.id == None)
-            
+        return apply_access_filter(select(CitizenIssue), user, CitizenIssue, "view")
     except Exception as e:
         logger.error(f"Error building accessible issues query: {e}")
         # Return empty query on error
-        from sqlmodel import select
-        from app.models.citizen_issues import CitizenIssue
-        return select(CitizenIssue).where(CitizenIssue.id == None)
+        return select(CitizenIssue).where(false())
 
 # Convenience functions for common permission checks
 def require_super_admin():
@@ -0,0 +1,175 @@
+"""
+Slow Query Log
+Records statements slower than SLOW_QUERY_THRESHOLD_MS, grouped by fingerprint
+(the SQL with literals and IN lists normalised away), and captures the EXPLAIN
+plan of each new SELECT fingerprint on a background thread.
+
+Fingerprints are kept in memory per process; the top ones by total time show
+which queries deserve an index next.
+"""
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import hashlib
+import logging
+import queue
+import re
+import threading
+import time
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\?|:\w+")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+
+def fingerprint_statement(statement: str) -> str:
+    """Normalise SQL so executions differing only in values share a fingerprint"""
+    sql = " ".join(statement.split())
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    # IN (?, ?, ?) of any length
+    return _VALUE_LIST.sub("(...)", sql)
+
+class SlowQueryFingerprint:
+    """Aggregated slow executions of one fingerprint"""
+
+    def __init__(self, fingerprint_id: str, fingerprint: str, statement: str):
+        self.id = fingerprint_id
+        self.fingerprint = fingerprint
+        self.example = statement
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.first_seen = datetime.utcnow()
+        self.last_seen = self.first_seen
+        self.explain: Optional[List[Dict[str, Any]]] = None
+        self.explain_error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "fingerprint": self.fingerprint,
+            "example": self.example,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 1),
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 1),
+            "first_seen": self.first_seen,
+            "last_seen": self.last_seen,
+            "explain": self.explain,
+            "explain_error": self.explain_error
+        }
+
+class SlowQueryLog:
+    """Engine listener collecting slow statements; EXPLAIN runs off the request thread"""
+
+    def __init__(self):
+        self._threshold_ms = settings.SLOW_QUERY_THRESHOLD_MS
+        self._max_fingerprints = settings.SLOW_QUERY_MAX_FINGERPRINTS
+        self._fingerprints: Dict[str, SlowQueryFingerprint] = {}
+        self._lock = threading.Lock()
+        self._explain_queue: "queue.Queue" = queue.Queue(maxsize=100)
+        self._explain_thread: Optional[threading.Thread] = None
+        self._local = threading.local()  # Marks the explain thread's own statements
+        self._engines = set()
+
+    def install(self, engine: Engine):
+        """Attach the timing listeners to an engine (once)"""
+        if id(engine) in self._engines:
+            return
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+        self._engines.add(id(engine))
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_start_times", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        start_times = conn.info.get("slow_query_start_times")
+        if not start_times:
+            return
+        elapsed_ms = (time.perf_counter() - start_times.pop()) * 1000
+        if elapsed_ms >= self._threshold_ms and not getattr(self._local, "explaining", False):
+            self.record(conn.engine, statement, None if executemany else parameters, elapsed_ms)
+
+    def _handle_error(self, exception_context):
+        conn = exception_context.connection
+        start_times = conn.info.get("slow_query_start_times") if conn is not None else None
+        if start_times:
+            start_times.pop()
+
+    def record(self, engine: Engine, statement: str, parameters, elapsed_ms: float):
+        fingerprint = fingerprint_statement(statement)
+        fingerprint_id = hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:16]
+        with self._lock:
+            entry = self._fingerprints.get(fingerprint_id)
+            is_new = entry is None
+            if is_new:
+                if len(self._fingerprints) >= self._max_fingerprints:
+                    # Forget the fingerprint that has cost the least so far
+                    cheapest = min(self._fingerprints.values(), key=lambda item: item.total_ms)
+                    del self._fingerprints[cheapest.id]
+                entry = SlowQueryFingerprint(fingerprint_id, fingerprint, statement)
+                self._fingerprints[fingerprint_id] = entry
+            entry.count += 1
+            entry.total_ms += elapsed_ms
+            entry.max_ms = max(entry.max_ms, elapsed_ms)
+            entry.last_seen = datetime.utcnow()
+
+        logger.warning(f"Slow query ({elapsed_ms:.0f}ms) [{fingerprint_id}]: {fingerprint[:300]}")
+        if is_new and parameters is not None and statement.lstrip()[:6].upper() == "SELECT":
+            self._queue_explain(engine, entry, statement, parameters)
+
+    def _queue_explain(self, engine: Engine, entry: SlowQueryFingerprint, statement: str, parameters):
+        if self._explain_thread is None or not self._explain_thread.is_alive():
+            with self._lock:
+                if self._explain_thread is None or not self._explain_thread.is_alive():
+                    self._explain_thread = threading.Thread(
+                        target=self._explain_loop, name="slow-query-explain", daemon=True
+                    )
+                    self._explain_thread.start()
+        try:
+            self._explain_queue.put_nowait((engine, entry, statement, parameters))
+        except queue.Full:
+            entry.explain_error = "Skipped: EXPLAIN queue full"
+
+    def _explain_loop(self):
+        self._local.explaining = True
+        while True:
+            engine, entry, statement, parameters = self._explain_queue.get()
+            try:
+                entry.explain = self.explain(engine, statement, parameters)
+            except Exception as e:
+                entry.explain_error = str(e)[:500]
+                logger.info(f"EXPLAIN failed for slow query {entry.id}: {e}")
+            finally:
+                self._explain_queue.task_done()
+
+    @staticmethod
+    def explain(engine: Engine, statement: str, parameters) -> List[Dict[str, Any]]:
+        """Plan of a statement, run with the original driver-level parameters"""
+        prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+        with engine.connect() as conn:
+            result = conn.exec_driver_sql(prefix + statement, parameters)
+            return [dict(row._mapping) for row in result]
+
+    def top(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Fingerprints with the highest total time first"""
+        with self._lock:
+            entries = sorted(self._fingerprints.values(), key=lambda item: item.total_ms, reverse=True)[:limit]
+        return [entry.to_dict() for entry in entries]
+
+    def reset(self):
+        with self._lock:
+            self._fingerprints.clear()
+
+# Global slow query log instance
+slow_query_log = SlowQueryLog()
@@ -0,0 +1,407 @@
+"""
+Tracing
+Lightweight spans around requests, CRUD functions and external calls
+(geocoding, SMTP, translation), so a slow request can be split into SQL,
+Python and I/O time.
+
+Spans follow the OpenTelemetry data model: a server span per request (continuing
+an incoming W3C traceparent), child spans through a context variable, and export
+as JSON lines to a file or as OTLP/JSON to a collector, batched on a background
+thread. The sampling decision is made once per trace; unsampled and disabled
+traces share a no-op span and record nothing.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+import functools
+import importlib
+import inspect
+import json
+import logging
+import pkgutil
+import queue
+import random
+import sys
+import threading
+import time
+import urllib.request
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+
+class Span:
+    """A timed operation with attributes; ended by the tracer"""
+    recording = True
+
+    def __init__(self, name: str, trace_id: str, parent_span_id: Optional[str], kind: str = "internal",
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = "%016x" % random.getrandbits(64)
+        self.parent_span_id = parent_span_id
+        self.kind = kind
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.status = "ok"
+        self.status_message: Optional[str] = None
+        self.start_time_ns = time.time_ns()
+        self._start_perf_ns = time.perf_counter_ns()
+        self.end_time_ns: Optional[int] = None
+
+    def set_attribute(self, key: str, value: Any):
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def record_exception(self, error: BaseException):
+        self.status = "error"
+        self.status_message = f"{type(error).__name__}: {error}"[:500]
+
+    def end(self):
+        self.end_time_ns = self.start_time_ns + (time.perf_counter_ns() - self._start_perf_ns)
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_time_ns or time.time_ns()) - self.start_time_ns) / 1e6
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time_ns": self.start_time_ns,
+            "end_time_ns": self.end_time_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "status_message": self.status_message,
+            "attributes": self.attributes
+        }
+
+    def to_otlp(self) -> Dict[str, Any]:
+        status = {"code": 2, "message": self.status_message} if self.status == "error" else {"code": 1}
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id or "",
+            "name": self.name,
+            "kind": SPAN_KINDS.get(self.kind, 1),
+            "startTimeUnixNano": str(self.start_time_ns),
+            "endTimeUnixNano": str(self.end_time_ns),
+            "attributes": [_otlp_attribute(key, value) for key, value in self.attributes.items()],
+            "status": status
+        }
+
+class NonRecordingSpan:
+    """Stands in for spans of disabled or unsampled traces"""
+    recording = False
+    trace_id = None
+    span_id = None
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        pass
+
+    def record_exception(self, error: BaseException):
+        pass
+
+NON_RECORDING_SPAN = NonRecordingSpan()
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+# ===== EXPORTERS =====
+
+class FileSpanExporter:
+    """Appends spans as JSON lines"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def export(self, spans: List[Span]):
+        with open(self.path, "a", encoding="utf-8") as f:
+            for span in spans:
+                f.write(json.dumps(span.to_dict(), default=str) + "\n")
+
+class OTLPHttpSpanExporter:
+    """Posts spans to an OTLP/HTTP collector in the JSON encoding"""
+
+    def __init__(self, endpoint: str, service_name: str, timeout: float = 5):
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.service_name = service_name
+        self.timeout = timeout
+
+    def export(self, spans: List[Span]):
+        payload = {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": __name__},
+                    "spans": [span.to_otlp() for span in spans]
+                }]
+            }]
+        }
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(payload, default=str).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+class BatchSpanProcessor:
+    """Queues ended spans and exports them in batches off the request path"""
+
+    def __init__(self, exporter, max_queue_size: int = 2048, batch_size: int = 256, flush_interval: float = 2.0):
+        self.exporter = exporter
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)  # Spans, and Events marking flushes
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, span: Span):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+                    self._thread.start()
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            batch: List[Span] = []
+            flushed: Optional[threading.Event] = None
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if isinstance(item, threading.Event):
+                    flushed = item
+                    break
+                batch.append(item)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= self.batch_size or remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if batch:
+                self._export(batch)
+            if flushed is not None:
+                flushed.set()
+
+    def _export(self, batch: List[Span]):
+        try:
+            self.exporter.export(batch)
+        except Exception as e:
+            logger.warning(f"Failed to export {len(batch)} spans: {e}")
+
+    def flush(self, timeout: float = 5.0):
+        """Export every span submitted so far (e.g. at shutdown), waiting up to timeout seconds"""
+        if self._thread is None:
+            return
+        flushed = threading.Event()
+        try:
+            self._queue.put(flushed, timeout=timeout)
+        except queue.Full:
+            return
+        flushed.wait(timeout)
+
+# ===== TRACER =====
+
+_current_span: ContextVar[Optional[Any]] = ContextVar("current_span", default=None)
+
+class Tracer:
+    """Creates spans and hands ended ones to the exporter"""
+
+    def __init__(self):
+        self.enabled = settings.TRACING_ENABLED
+        self.sample_rate = settings.TRACING_SAMPLE_RATE
+        self._processor: Optional[BatchSpanProcessor] = None
+
+    @property
+    def processor(self) -> BatchSpanProcessor:
+        if self._processor is None:
+            if settings.TRACING_EXPORTER == "otlp":
+                exporter = OTLPHttpSpanExporter(settings.TRACING_OTLP_ENDPOINT, settings.APP_NAME)
+            else:
+                exporter = FileSpanExporter(settings.TRACING_FILE_PATH)
+            self._processor = BatchSpanProcessor(exporter)
+        return self._processor
+
+    def current_span(self):
+        return _current_span.get() or NON_RECORDING_SPAN
+
+    @contextmanager
+    def span(self, name: str, kind: str = "internal", attributes: Optional[Dict[str, Any]] = None,
+             traceparent: Optional[str] = None) -> Iterator[Any]:
+        """
+        Time a block as a child of the current span. A span without a parent
+        starts a trace (continuing traceparent when given) and decides sampling.
+        """
+        parent = _current_span.get()
+        if not self.enabled or parent is NON_RECORDING_SPAN:
+            yield NON_RECORDING_SPAN
+            return
+
+        if parent is not None:
+            span = Span(name, parent.trace_id, parent.span_id, kind, attributes)
+        else:
+            remote = parse_traceparent(traceparent) if traceparent else None
+            if remote:
+                trace_id, parent_span_id, sampled = remote
+            else:
+                trace_id, parent_span_id = "%032x" % random.getrandbits(128), None
+                sampled = self.sample_rate >= 1 or random.random() < self.sample_rate
+            if not sampled:
+                token = _current_span.set(NON_RECORDING_SPAN)
+                try:
+                    yield NON_RECORDING_SPAN
+                finally:
+                    _current_span.reset(token)
+                return
+            span = Span(name, trace_id, parent_span_id, kind, attributes)
+
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+            self.processor.submit(span)
+
+    def traced(self, name: Optional[str] = None, kind: str = "internal",
+               attributes: Optional[Callable[..., Dict[str, Any]]] = None, record_rows: bool = False):
+        """
+        Decorator opening a span around every call of a function (sync or async).
+        attributes(*args, **kwargs) may add span attributes from the arguments;
+        record_rows adds the length of list results as db.row_count.
+        """
+        def decorator(func):
+            span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+            def start(args, kwargs):
+                span_attributes = {"code.function": func.__qualname__, "code.namespace": func.__module__}
+                if attributes:
+                    span_attributes.update(attributes(*args, **kwargs))
+                return self.span(span_name, kind, span_attributes)
+
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    if not self.enabled:
+                        return await func(*args, **kwargs)
+                    with start(args, kwargs) as span:
+                        result = await func(*args, **kwargs)
+                        if record_rows:
+                            _record_rows(span, result)
+                        return result
+                async_wrapper.__traced__ = True
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with start(args, kwargs) as span:
+                    result = func(*args, **kwargs)
+                    if record_rows:
+                        _record_rows(span, result)
+                    return result
+            wrapper.__traced__ = True
+            return wrapper
+        return decorator
+
+def _record_rows(span, result):
+    """Row counts of list results (or (rows, total) pairs)"""
+    if not span.recording:
+        return
+    if isinstance(result, list):
+        span.set_attribute("db.row_count", len(result))
+    elif isinstance(result, tuple) and result and isinstance(result[0], list):
+        span.set_attribute("db.row_count", len(result[0]))
+
+def _tenant_attributes(func) -> Optional[Callable[..., Dict[str, Any]]]:
+    """
+    Span attributes for the tenant a CRUD call works on, read from its tenant_id
+    or current_user argument. Positions are resolved once from the signature.
+    """
+    parameters = list(inspect.signature(func).parameters)
+    for name, read in (("tenant_id", lambda value: value), ("current_user", lambda value: getattr(value, "tenant_id", None))):
+        if name not in parameters:
+            continue
+        position = parameters.index(name)
+
+        def attributes(*args, _name=name, _position=position, _read=read, **kwargs):
+            value = kwargs.get(_name) if _name in kwargs else (args[_position] if _position < len(args) else None)
+            tenant_id = _read(value) if value is not None else None
+            return {"tenant.id": tenant_id} if isinstance(tenant_id, str) else {}
+        return attributes
+    return None
+
+def parse_traceparent(header: str):
+    """(trace_id, parent_span_id, sampled) from a W3C traceparent header, or None when malformed"""
+    parts = header.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16 or len(parts[3]) != 2:
+        return None
+    try:
+        int(parts[1], 16), int(parts[2], 16)
+        flags = int(parts[3], 16)
+    except ValueError:
+        return None
+    if parts[1] == "0" * 32 or parts[2] == "0" * 16:
+        return None
+    return parts[1], parts[2], bool(flags & 1)
+
+def instrument_crud(package_name: str = "app.crud") -> int:
+    """
+    Wrap every function defined in the CRUD modules in a span, and rebind the
+    names routes and services imported with "from app.crud.x import f". Call
+    once, after the routers are imported. Returns the number of functions wrapped.
+    """
+    package = importlib.import_module(package_name)
+    replacements: Dict[int, Callable] = {}
+    for module_info in pkgutil.iter_modules(package.__path__):
+        module = importlib.import_module(f"{package_name}.{module_info.name}")
+        for attribute, value in list(vars(module).items()):
+            if (inspect.isfunction(value) and value.__module__ == module.__name__
+                    and not attribute.startswith("_") and not getattr(value, "__traced__", False)):
+                wrapped = tracer.traced(f"crud.{module_info.name}.{value.__name__}", attributes=_tenant_attributes(value), record_rows=True)(value)
+                replacements[id(value)] = wrapped
+                setattr(module, attribute, wrapped)
+
+    for module_name, module in list(sys.modules.items()):
+        if module is None or not (module_name == "app" or module_name.startswith("app.") or module_name == "main"):
+            continue
+        for attribute, value in list(vars(module).items()):
+            wrapped = replacements.get(id(value))
+            if wrapped is not None:
+                setattr(module, attribute, wrapped)
+    return len(replacements)
+
+# Global tracer instance
+tracer = Tracer()
@@ -1,14 +1,27 @@
 # app/crud/citizen_issues_crud.py - FIXED VERSION
-from sqlmodel import Session, select
-from typing import List, Optional
+from sqlmodel import Session, select, or_
+from sqlalchemy import update, delete, exists, insert
+from typing import Any, Dict, IO, List, Optional, Tuple
+from types import SimpleNamespace
+from datetime import datetime
 import logging
 import json
+import csv
+import uuid
 from app.models.citizen_issues import CitizenIssue
+from app.models.Issue_category import IssueCategory
+from app.models.area import Area
+from app.models.visit import Visit
+from app.models.visit_issue import VisitIssue
+from app.core.access_predicates import build_access_predicate, classify_access
 from app.schemas.citizen_issues_schema import CitizenIssueCreate, CitizenIssueUpdate
 from app.utils.geo import generate_citizen_issue_geojson, geojson_to_string, validate_coordinates
 from app.utils.geo import get_coordinates
 from fastapi import HTTPException, status
 from app.models.user import User
+from app.services.job_service import job_runner
+from config import settings
+from app.crud.content_translation_crud import enqueue_pretranslation, enqueue_pretranslation_many, delete_translations
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -17,6 +30,17 @@ logger = logging.getLogger(__name__)
 VALID_STATUSES = ["Open", "In Progress", "Pending", "Resolved"]
 VALID_PRIORITIES = ["Low", "Medium", "High", "Urgent"]
 
+# Fields the bulk update endpoint may change, and those embedded in the stored GeoJSON
+BULK_UPDATE_FIELDS = ("status", "priority", "assigned_to", "category_id", "area_id", "action_taken")
+GEOJSON_FIELDS = ("status", "priority")
+
+# CSV columns understood by the bulk import; assigned_to, category and area take a name or an id
+IMPORT_COLUMNS = (
+    "title", "description", "location", "latitude", "longitude", "status",
+    "priority", "assigned_to", "category", "area", "action_taken"
+)
+IMPORT_MAX_LENGTHS = {"title": 255, "description": 255, "location": 255}
+
 class ValidationError(Exception):
     """Custom exception for validation errors"""
     pass
@@ -113,6 +137,84 @@ def generate_geojson_for_issue(
         logger.error(f"Error generating GeoJSON for issue {issue.id}: {e}")
         return None
 
+def build_compact_geojson(db_issue: CitizenIssue) -> Optional[str]:
+    """Compact GeoJSON string stored on the issue, None without coordinates"""
+    try:
+        if not (db_issue.latitude and db_issue.longitude):
+            logger.debug("No coordinates available, skipping GeoJSON generation")
+            return None
+
+        compact_geojson = {
+            "type": "Feature",
+            "geometry": {
+                "type": "Point",
+                "coordinates": [float(db_issue.longitude), float(db_issue.latitude)]
+            },
+            "properties": {
+                "id": db_issue.id,
+                "title": db_issue.title[:100] if db_issue.title else "",  # Truncate title
+                "status": db_issue.status or "Open",
+                "priority": db_issue.priority or "Medium"
+            }
+        }
+
+        geojson_data = json.dumps(compact_geojson, separators=(',', ':'))  # Compact JSON
+
+        # Check if GeoJSON data is too long for the database column
+        if len(geojson_data) > 5000:  # More conservative limit
+            logger.warning(f"GeoJSON data too long ({len(geojson_data)} chars), skipping storage for issue {db_issue.id}")
+            return None
+        return geojson_data
+    except Exception as e:
+        logger.warning(f"Could not generate GeoJSON for issue {db_issue.id}: {e}")
+        return None
+
+def enqueue_issue_geocoding(issue_id: str) -> Optional[str]:
+    """Queue a geocode_issue job; failure to queue never fails the request"""
+    if not settings.GEOCODING_ENABLED:
+        return None
+    try:
+        return job_runner.enqueue("geocode_issue", {"issue_id": issue_id})
+    except Exception as e:
+        logger.warning(f"Could not queue geocoding for issue {issue_id}: {e}")
+        return None
+
+def enqueue_issue_geocoding_many(issue_ids: List[str]) -> int:
+    """Queue geocode_issue jobs for many issues in one insert; returns the number queued"""
+    if not settings.GEOCODING_ENABLED or not issue_ids:
+        return 0
+    try:
+        return len(job_runner.enqueue_many("geocode_issue", [{"issue_id": issue_id} for issue_id in issue_ids]))
+    except Exception as e:
+        logger.warning(f"Could not queue geocoding for {len(issue_ids)} issues: {e}")
+        return 0
+
+def geocode_citizen_issue(db: Session, issue_id: str) -> Optional[CitizenIssue]:
+    """
+    Resolve coordinates for an issue's location and refresh its GeoJSON.
+    Runs from the geocode_issue background job.
+    """
+    db_issue = db.get(CitizenIssue, issue_id)
+    if not db_issue:
+        logger.warning(f"Citizen issue {issue_id} no longer exists, skipping geocoding")
+        return None
+    if not db_issue.location or (db_issue.latitude and db_issue.longitude):
+        return db_issue
+
+    lat, lon = get_coordinates(db_issue.location)
+    if not (lat and lon):
+        logger.warning(f"Geocoding returned no coordinates for location '{db_issue.location}'")
+        return db_issue
+
+    db_issue.latitude = lat
+    db_issue.longitude = lon
+    db_issue.geojson_data = build_compact_geojson(db_issue)
+    db.add(db_issue)
+    db.commit()
+    db.refresh(db_issue)
+    logger.info(f"Got coordinates for location '{db_issue.location}': {lat}, {lon}")
+    return db_issue
+
 def create_citizen_issue(db: Session, issue_in: CitizenIssueCreate, current_user_id: str = None) -> CitizenIssue:
     """Create a new citizen issue with comprehensive validation, error handling, and RBAC"""
     try:
@@ -183,75 +285,26 @@ def create_citizen_issue(db: Session, issue_in: CitizenIssueCreate, current_user
             else:
                 issue_data["action_taken"] = action_taken
 
-        # --- Handle geocoding with timeout protection ---
-        if issue_data.get("location") and not (issue_data.get("latitude") and issue_data.get("longitude")):
-            try:
-                # Set a reasonable timeout for geocoding
-                import concurrent.futures
-                
-                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                    future = executor.submit(get_coordinates, issue_data["location"])
-                    try:
-                        lat, lon = future.result(timeout=10)  # 10 second timeout
-                        if lat and lon:
-                            issue_data["latitude"] = lat
-                            issue_data["longitude"] = lon
-                            logger.info(f"Got coordinates for location '{issue_data['location']}': {lat}, {lon}")
-                        else:
-                            logger.warning(f"Geocoding returned no coordinates for location '{issue_data['location']}'")
-                    except concurrent.futures.TimeoutError:
-                        logger.warning(f"Geocoding timeout for location '{issue_data['location']}' - coordinates can be added manually")
-                    except Exception as e:
-                        logger.warning(f"Geocoding error for location '{issue_data['location']}': {e}")
-                        
-            except Exception as e:
-                logger.warning(f"Could not get coordinates for location '{issue_data['location']}': {e}")
-                logger.info("Coordinates can be added manually if needed")
-        else:
+        # --- Geocoding runs as a background job once the issue is stored ---
+        needs_geocoding = bool(issue_data.get("location")) and not (issue_data.get("latitude") and issue_data.get("longitude"))
+        if not needs_geocoding:
             logger.info("Skipping geocoding - coordinates already provided or no location specified")
 
         # --- Create the issue with GeoJSON in single transaction ---
         db_issue = CitizenIssue(**issue_data)
         
         # Generate compact GeoJSON data before committing
-        try:
-            if db_issue.latitude and db_issue.longitude:
-                # Create a compact GeoJSON for storage
-                compact_geojson = {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [float(db_issue.longitude), float(db_issue.latitude)]
-                    },
-                    "properties": {
-                        "id": db_issue.id,
-                        "title": db_issue.title[:100] if db_issue.title else "",  # Truncate title
-                        "status": db_issue.status or "Open",
-                        "priority": db_issue.priority or "Medium"
-                    }
-                }
-                
-                geojson_data = json.dumps(compact_geojson, separators=(',', ':'))  # Compact JSON
-                
-                # Check if GeoJSON data is too long for the database column
-                if len(geojson_data) > 5000:  # More conservative limit
-                    logger.warning(f"GeoJSON data too long ({len(geojson_data)} chars), skipping storage")
-                    db_issue.geojson_data = None
-                else:
-                    db_issue.geojson_data = geojson_data
-                    logger.debug(f"Generated compact GeoJSON for issue ({len(geojson_data)} chars)")
-            else:
-                db_issue.geojson_data = None
-                logger.debug("No coordinates available, skipping GeoJSON generation")
-        except Exception as e:
-            logger.warning(f"Could not generate GeoJSON for issue: {e}")
-            db_issue.geojson_data = None
+        db_issue.geojson_data = build_compact_geojson(db_issue)
         
         db.add(db_issue)
         db.commit()
         db.refresh(db_issue)
         
         logger.info(f"Created citizen issue with ID: {db_issue.id} by user: {current_user_id}")
+
+        if needs_geocoding:
+            enqueue_issue_geocoding(db_issue.id)
+        enqueue_pretranslation(db, "citizen_issue", db_issue)
         return db_issue
 
     except HTTPException:
@@ -371,17 +424,8 @@ def update_citizen_issue(db: Session, issue_id: str, issue_update: CitizenIssueU
                 issue_data["assigned_to"] = None
                 logger.info("Issue unassigned")
         
-        # --- Get coordinates from location if location updated ---
-        if "location" in issue_data and issue_data["location"]:
-            if not issue_data.get("latitude") and not issue_data.get("longitude"):
-                try:
-                    lat, lon = get_coordinates(issue_data["location"])
-                    if lat and lon:
-                        issue_data["latitude"] = lat
-                        issue_data["longitude"] = lon
-                        logger.info(f"Updated coordinates for location '{issue_data['location']}': {lat}, {lon}")
-                except Exception as e:
-                    logger.warning(f"Could not get coordinates for updated location '{issue_data['location']}': {e}")
+        # --- Geocode the new location in the background if no coordinates were given ---
+        needs_geocoding = bool(issue_data.get("location")) and not issue_data.get("latitude") and not issue_data.get("longitude")
 
         # --- Apply updates ---
         for key, value in issue_data.items():
@@ -392,38 +436,7 @@ def update_citizen_issue(db: Session, issue_id: str, issue_update: CitizenIssueU
         relevant_fields = coordinate_fields + ["title", "description", "priority", "status", "assigned_to", "action_taken"]
         
         if any(field in issue_data for field in relevant_fields):
-            try:
-                if db_issue.latitude and db_issue.longitude:
-                    # Create a compact GeoJSON for storage
-                    compact_geojson = {
-                        "type": "Feature",
-                        "geometry": {
-                            "type": "Point",
-                            "coordinates": [float(db_issue.longitude), float(db_issue.latitude)]
-                        },
-                        "properties": {
-                            "id": db_issue.id,
-                            "title": db_issue.title[:100] if db_issue.title else "",  # Truncate title
-                            "status": db_issue.status or "Open",
-                            "priority": db_issue.priority or "Medium"
-                        }
-                    }
-                    
-                    geojson_data = json.dumps(compact_geojson, separators=(',', ':'))  # Compact JSON
-                    
-                    # Check if GeoJSON data is too long for the database column
-                    if len(geojson_data) > 5000:  # More conservative limit
-                        logger.warning(f"GeoJSON data too long ({len(geojson_data)} chars), skipping storage for issue {db_issue.id}")
-                        db_issue.geojson_data = None
-                    else:
-                        db_issue.geojson_data = geojson_data
-                        logger.debug(f"Regenerated compact GeoJSON for updated issue {db_issue.id} ({len(geojson_data)} chars)")
-                else:
-                    db_issue.geojson_data = None
-                    logger.debug(f"No coordinates available for issue {db_issue.id}, skipping GeoJSON generation")
-            except Exception as e:
-                logger.warning(f"Could not regenerate GeoJSON for updated issue {db_issue.id}: {e}")
-                db_issue.geojson_data = None
+            db_issue.geojson_data = build_compact_geojson(db_issue)
         
         # --- Commit all changes in single transaction ---
         db.add(db_issue)
@@ -431,6 +444,11 @@ def update_citizen_issue(db: Session, issue_id: str, issue_update: CitizenIssueU
         db.refresh(db_issue)
         
         logger.info(f"Successfully updated citizen issue {issue_id} by user {current_user_id}")
+
+        if needs_geocoding:
+            enqueue_issue_geocoding(db_issue.id)
+        if "title" in issue_data or "description" in issue_data:
+            enqueue_pretranslation(db, "citizen_issue", db_issue)
         return db_issue
 
     except HTTPException:
@@ -452,6 +470,7 @@ def delete_citizen_issue(db: Session, issue_id: str) -> bool:
             logger.warning(f"Citizen issue {issue_id} not found for deletion")
             return False
         
+        delete_translations(db, "citizen_issue", [issue_id])
         db.delete(db_issue)
         db.commit()
         logger.info(f"Successfully deleted citizen issue {issue_id}")
@@ -465,6 +484,350 @@ def delete_citizen_issue(db: Session, issue_id: str) -> bool:
             detail="Failed to delete citizen issue"
         )
 
+def _id_chunks(ids: List[str], chunk_size: Optional[int]):
+    size = max(1, chunk_size or settings.BULK_OPERATION_CHUNK_SIZE)
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+def normalize_bulk_updates(db: Session, updates: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate bulk update values the same way update_citizen_issue does"""
+    invalid_fields = set(updates) - set(BULK_UPDATE_FIELDS)
+    if invalid_fields:
+        raise ValidationError(
+            f"Invalid fields for bulk update: {', '.join(sorted(invalid_fields))}. "
+            f"Allowed fields: {', '.join(BULK_UPDATE_FIELDS)}"
+        )
+
+    values = dict(updates)
+    if "status" in values:
+        values["status"] = validate_status(values["status"])
+    if "priority" in values:
+        values["priority"] = validate_priority(values["priority"])
+    if "action_taken" in values:
+        action_taken = (values["action_taken"] or "").strip()
+        values["action_taken"] = action_taken[:1000] or None
+    if values.get("assigned_to"):
+        assigned_user = get_user_by_name_or_id(db, str(values["assigned_to"]))
+        if not assigned_user:
+            raise ValidationError(f"Assigned user '{values['assigned_to']}' does not exist")
+        values["assigned_to"] = assigned_user.id
+    elif "assigned_to" in values:
+        values["assigned_to"] = None
+    return values
+
+def bulk_update_citizen_issues(
+    db: Session,
+    user: User,
+    issue_ids: List[str],
+    updates: Dict[str, Any],
+    chunk_size: Optional[int] = None
+) -> Dict[str, str]:
+    """
+    Apply the same updates to many issues with one UPDATE per chunk of ids
+
+    The access rules are compiled into the WHERE clause, so issues the user may
+    not edit are never touched. Stored GeoJSON is rebuilt for the updated rows
+    when a field it embeds changes.
+
+    Returns:
+        Issue id -> "updated", "forbidden" or "not_found", in request order
+    """
+    values = normalize_bulk_updates(db, updates)
+    ids = list(dict.fromkeys(str(issue_id) for issue_id in issue_ids))
+    outcomes = {issue_id: "not_found" for issue_id in ids}
+    if not ids or not values:
+        return outcomes
+
+    allowed = build_access_predicate(user, CitizenIssue, "edit")
+    rebuild_geojson = any(field in values for field in GEOJSON_FIELDS)
+    now = datetime.utcnow()
+
+    try:
+        for chunk in _id_chunks(ids, chunk_size):
+            found = classify_access(db, user, CitizenIssue, chunk, "edit")
+            editable = [issue_id for issue_id, permitted in found.items() if permitted]
+            for issue_id, permitted in found.items():
+                outcomes[issue_id] = "updated" if permitted else "forbidden"
+            if not editable:
+                continue
+
+            statement = update(CitizenIssue).where(CitizenIssue.id.in_(editable))
+            if allowed is not None:
+                statement = statement.where(allowed)
+            db.execute(
+                statement.values(**values, updated_at=now),
+                execution_options={"synchronize_session": False}
+            )
+
+            if rebuild_geojson:
+                rows = db.exec(
+                    select(
+                        CitizenIssue.id, CitizenIssue.title, CitizenIssue.status,
+                        CitizenIssue.priority, CitizenIssue.latitude, CitizenIssue.longitude
+                    ).where(CitizenIssue.id.in_(editable))
+                ).all()
+                params = [{"id": row.id, "geojson_data": build_compact_geojson(row)} for row in rows]
+                if params:
+                    # executemany keyed on the primary key
+                    db.execute(update(CitizenIssue), params)
+
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    logger.info(
+        f"Bulk updated {sum(1 for outcome in outcomes.values() if outcome == 'updated')} of "
+        f"{len(ids)} citizen issues ({', '.join(values)}) by user {user.id}"
+    )
+    return outcomes
+
+def bulk_delete_citizen_issues(
+    db: Session,
+    user: User,
+    issue_ids: List[str],
+    chunk_size: Optional[int] = None
+) -> Dict[str, str]:
+    """
+    Delete many issues with one DELETE per chunk of ids, restricted by the access rules
+
+    Issues still referenced by visits are kept, since removing them would
+    violate the visit foreign keys.
+
+    Returns:
+        Issue id -> "deleted", "forbidden", "in_use" or "not_found", in request order
+    """
+    ids = list(dict.fromkeys(str(issue_id) for issue_id in issue_ids))
+    outcomes = {issue_id: "not_found" for issue_id in ids}
+    if not ids:
+        return outcomes
+
+    allowed = build_access_predicate(user, CitizenIssue, "delete")
+    in_use = or_(
+        exists().where(Visit.citizen_issue_id == CitizenIssue.id),
+        exists().where(VisitIssue.issue_id == CitizenIssue.id)
+    )
+
+    try:
+        for chunk in _id_chunks(ids, chunk_size):
+            found = classify_access(db, user, CitizenIssue, chunk, "delete")
+            candidates = [issue_id for issue_id, permitted in found.items() if permitted]
+            for issue_id, permitted in found.items():
+                outcomes[issue_id] = "deleted" if permitted else "forbidden"
+            if not candidates:
+                continue
+
+            referenced = db.exec(
+                select(CitizenIssue.id).where(CitizenIssue.id.in_(candidates), in_use)
+            ).all()
+            for issue_id in referenced:
+                outcomes[str(issue_id)] = "in_use"
+
+            statement = delete(CitizenIssue).where(CitizenIssue.id.in_(candidates), ~in_use)
+            if allowed is not None:
+                statement = statement.where(allowed)
+            db.execute(statement, execution_options={"synchronize_session": False})
+            delete_translations(db, "citizen_issue", [
+                issue_id for issue_id in candidates if outcomes[issue_id] == "deleted"
+            ])
+
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    logger.info(
+        f"Bulk deleted {sum(1 for outcome in outcomes.values() if outcome == 'deleted')} of "
+        f"{len(ids)} citizen issues by user {user.id}"
+    )
+    return outcomes
+
+def _parse_coordinate(value: Optional[str], name: str) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        raise ValidationError(f"{name} '{value}' is not a number")
+
+def _prepare_import_row(row: Dict[str, Optional[str]]) -> Dict[str, Any]:
+    """Validate one CSV row into column values, raising ValidationError on the first problem"""
+    values = {column: (row.get(column) or "").strip() or None for column in IMPORT_COLUMNS}
+
+    if not values["title"]:
+        raise ValidationError("Title is required")
+    for column, max_length in IMPORT_MAX_LENGTHS.items():
+        if values[column] and len(values[column]) > max_length:
+            raise ValidationError(f"{column} is longer than {max_length} characters")
+
+    values["status"] = validate_status(values["status"])
+    values["priority"] = validate_priority(values["priority"])
+
+    latitude = _parse_coordinate(values["latitude"], "Latitude")
+    longitude = _parse_coordinate(values["longitude"], "Longitude")
+    if (latitude is None) != (longitude is None):
+        raise ValidationError("Latitude and longitude must be given together")
+    if latitude is not None and not validate_coordinates(latitude, longitude):
+        raise ValidationError(f"Coordinates {latitude}, {longitude} are out of range")
+    values["latitude"], values["longitude"] = latitude, longitude
+
+    if values["action_taken"]:
+        values["action_taken"] = values["action_taken"][:1000]
+    return values
+
+# Marks a name shared by several records in an import lookup table
+AMBIGUOUS_REFERENCE = object()
+
+def _lookup_by_id_or_name(db: Session, model: Any, keys: set, *conditions) -> Dict[str, Any]:
+    """Map lowercased ids and names to record ids with one query; shared names map to AMBIGUOUS_REFERENCE"""
+    if not keys:
+        return {}
+    rows = db.exec(
+        select(model.id, model.name).where(or_(model.id.in_(keys), model.name.in_(keys)), *conditions)
+    ).all()
+    lookup = {}
+    for record_id, name in rows:
+        key = name.lower()
+        lookup[key] = AMBIGUOUS_REFERENCE if key in lookup and lookup[key] != record_id else record_id
+    # An exact id always wins over a name
+    for record_id, _ in rows:
+        lookup[str(record_id).lower()] = record_id
+    return lookup
+
+def _resolve_reference(lookup: Dict[str, Any], value: Optional[str], label: str) -> Optional[str]:
+    if value is None:
+        return None
+    record_id = lookup.get(value.lower())
+    if record_id is None:
+        raise ValidationError(f"Unknown {label} '{value}'")
+    if record_id is AMBIGUOUS_REFERENCE:
+        raise ValidationError(f"More than one {label} is named '{value}'; use the id instead")
+    return record_id
+
+def _import_issue_batch(
+    db: Session,
+    batch: List[Tuple[int, Dict[str, Optional[str]]]],
+    tenant_id: str,
+    current_user_id: str,
+    assignee_id: Optional[str],
+    report: Dict[str, Any]
+):
+    """Validate, resolve and insert one batch of CSV rows in a single transaction"""
+    def fail(line: int, error: str):
+        report["failed"] += 1
+        report["errors"].append({"line": line, "error": error})
+
+    prepared = []
+    for line, row in batch:
+        try:
+            prepared.append((line, _prepare_import_row(row)))
+        except ValidationError as e:
+            fail(line, str(e))
+
+    # One lookup table per referenced model for the whole batch
+    users = _lookup_by_id_or_name(
+        db, User, {values["assigned_to"] for _, values in prepared if values["assigned_to"]}, User.tenant_id == tenant_id
+    )
+    categories = _lookup_by_id_or_name(db, IssueCategory, {values["category"] for _, values in prepared if values["category"]})
+    areas = _lookup_by_id_or_name(
+        db, Area, {values["area"] for _, values in prepared if values["area"]}, Area.tenant_id == tenant_id
+    )
+
+    now = datetime.utcnow()
+    issues, lines, needs_geocoding = [], [], []
+    for line, values in prepared:
+        try:
+            issue = {
+                "id": str(uuid.uuid4()),
+                "title": values["title"],
+                "description": values["description"],
+                "location": values["location"],
+                "latitude": values["latitude"],
+                "longitude": values["longitude"],
+                "status": values["status"],
+                "priority": values["priority"],
+                "action_taken": values["action_taken"],
+                "assigned_to": assignee_id or _resolve_reference(users, values["assigned_to"], "assignee"),
+                "category_id": _resolve_reference(categories, values["category"], "category"),
+                "area_id": _resolve_reference(areas, values["area"], "area"),
+                "created_by": current_user_id,
+                "tenant_id": tenant_id,
+                "created_at": now,
+                "updated_at": now,
+            }
+        except ValidationError as e:
+            fail(line, str(e))
+            continue
+        issue["geojson_data"] = build_compact_geojson(SimpleNamespace(**issue))
+        issues.append(issue)
+        lines.append(line)
+        if issue["location"] and issue["latitude"] is None:
+            needs_geocoding.append(issue["id"])
+
+    if not issues:
+        return
+    try:
+        # executemany of the whole batch
+        db.execute(insert(CitizenIssue), issues)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error storing imported issues from lines {lines[0]}-{lines[-1]}: {e}")
+        for line in lines:
+            fail(line, "Could not be stored")
+        return
+
+    report["imported"] += len(issues)
+    report["geocoding_queued"] += enqueue_issue_geocoding_many(needs_geocoding)
+    enqueue_pretranslation_many(db, "citizen_issue", tenant_id, [issue["id"] for issue in issues])
+
+def import_citizen_issues_csv(
+    db: Session,
+    stream: IO[str],
+    tenant_id: str,
+    current_user_id: str,
+    assignee_id: Optional[str] = None,
+    batch_size: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Import citizen issues from a CSV text stream, reading it row by row
+
+    Rows are validated and inserted in batches of IMPORT_BATCH_SIZE, each in its
+    own transaction, so a bad batch never undoes the ones before it. Issues with
+    a location but no coordinates are geocoded in the background.
+
+    Args:
+        stream: CSV with a header row using the IMPORT_COLUMNS names
+        assignee_id: Assign every imported issue to this user, ignoring the assigned_to column
+
+    Returns:
+        {"total_rows", "imported", "failed", "geocoding_queued", "errors": [{"line", "error"}]}
+    """
+    reader = csv.DictReader(stream)
+    fieldnames = [(name or "").strip().lower() for name in (reader.fieldnames or [])]
+    if "title" not in fieldnames:
+        raise ValidationError("CSV must have a header row with a title column")
+    reader.fieldnames = fieldnames
+
+    size = max(1, batch_size or settings.IMPORT_BATCH_SIZE)
+    report = {"total_rows": 0, "imported": 0, "failed": 0, "geocoding_queued": 0, "errors": []}
+    batch = []
+    for row in reader:
+        report["total_rows"] += 1
+        batch.append((reader.line_num, row))
+        if len(batch) >= size:
+            _import_issue_batch(db, batch, tenant_id, current_user_id, assignee_id, report)
+            batch = []
+    if batch:
+        _import_issue_batch(db, batch, tenant_id, current_user_id, assignee_id, report)
+    report["errors"].sort(key=lambda error: error["line"])
+
+    logger.info(
+        f"Imported {report['imported']} of {report['total_rows']} citizen issues "
+        f"for tenant {tenant_id} by user {current_user_id}"
+    )
+    return report
+
 def get_citizen_issues_geojson(db: Session, skip: int = 0, limit: int = 100) -> dict:
     """Get all citizen issues as a GeoJSON FeatureCollection with proper error handling"""
     try:
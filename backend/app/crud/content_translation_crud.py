@@ -0,0 +1,238 @@
+from sqlmodel import Session, select, and_
+from sqlalchemy import delete
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+import logging
+
+from config import settings
+from app.models.content_translation import ContentTranslation
+from app.models.tenant import Tenant
+from app.models.citizen_issues import CitizenIssue
+from app.models.received_letter import ReceivedLetter
+from app.models.sent_letter import SentLetter
+from app.models.sent_grievance_letter import SentGrievanceLetter
+from app.services.translation_service import text_hash
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Entity type -> (model, fields translated at write time)
+TRANSLATABLE_ENTITIES = {
+    "citizen_issue": (CitizenIssue, ("title", "description")),
+    "received_letter": (ReceivedLetter, ("subject",)),
+    "sent_letter": (SentLetter, ("subject",)),
+    "sent_grievance_letter": (SentGrievanceLetter, ("subject",)),
+}
+
+# User.language_preference stores names; translations are keyed by code
+LANGUAGE_CODES = {
+    "english": "en",
+    "hindi": "hi",
+    "marathi": "mr",
+    "bengali": "bn",
+    "gujarati": "gu",
+    "punjabi": "pa",
+    "tamil": "ta",
+    "telugu": "te",
+    "kannada": "kn",
+    "malayalam": "ml",
+    "urdu": "ur",
+}
+
+def normalize_language(language: Optional[str]) -> Optional[str]:
+    """Map a language name or code to a lowercase code"""
+    if not language or not language.strip():
+        return None
+    value = language.strip().lower()
+    return LANGUAGE_CODES.get(value, value[:10])
+
+def resolve_content_language(lang: Optional[str], user: Any) -> Optional[str]:
+    """Language to localize a response into: the requested one, else the user's preference"""
+    return lang or getattr(user, "language_preference", None)
+
+def get_tenant_languages(db: Session, tenant_id: Optional[str]) -> List[str]:
+    """Languages a tenant opted into for pre-translation, excluding the source language"""
+    if not tenant_id:
+        return []
+    tenant = db.get(Tenant, tenant_id)
+    if not tenant or not tenant.translation_languages:
+        return []
+
+    languages = []
+    for item in tenant.translation_languages.split(","):
+        code = normalize_language(item)
+        if code and code != settings.CONTENT_SOURCE_LANGUAGE and code not in languages:
+            languages.append(code)
+    return languages
+
+def enqueue_pretranslation(db: Session, entity_type: str, entity: Any) -> Optional[str]:
+    """
+    Queue translation of an entity's text fields if its tenant opted in.
+    Never fails the write that triggered it.
+    """
+    if not settings.TRANSLATION_ENABLED:
+        return None
+    try:
+        if not get_tenant_languages(db, getattr(entity, "tenant_id", None)):
+            return None
+        from app.services.job_service import job_runner
+        return job_runner.enqueue_unique("pretranslate_content", {
+            "entity_type": entity_type,
+            "entity_id": entity.id
+        })
+    except Exception as e:
+        logger.warning(f"Could not queue pre-translation for {entity_type} {getattr(entity, 'id', None)}: {e}")
+        return None
+
+def enqueue_pretranslation_many(db: Session, entity_type: str, tenant_id: Optional[str], entity_ids: List[Any]) -> int:
+    """Queue translation of many new entities of one tenant in one insert; returns the number queued"""
+    if not settings.TRANSLATION_ENABLED or not entity_ids:
+        return 0
+    try:
+        if not get_tenant_languages(db, tenant_id):
+            return 0
+        from app.services.job_service import job_runner
+        return len(job_runner.enqueue_many("pretranslate_content", [
+            {"entity_type": entity_type, "entity_id": entity_id} for entity_id in entity_ids
+        ]))
+    except Exception as e:
+        logger.warning(f"Could not queue pre-translation for {len(entity_ids)} {entity_type} records: {e}")
+        return 0
+
+def delete_translations(db: Session, entity_type: str, entity_ids: List[Any]) -> None:
+    """Remove stored translations of deleted entities; the caller commits together with the delete"""
+    if not entity_ids:
+        return
+    db.execute(
+        delete(ContentTranslation).where(
+            and_(
+                ContentTranslation.entity_type == entity_type,
+                ContentTranslation.entity_id.in_([str(entity_id) for entity_id in entity_ids])
+            )
+        ),
+        execution_options={"synchronize_session": False}
+    )
+
+def pretranslate_entity(db: Session, entity_type: str, entity_id: Any) -> int:
+    """
+    Translate an entity's text fields into its tenant's languages and store them.
+    Fields whose stored translation is still current are skipped.
+
+    Returns:
+        Number of translations written
+    """
+    from app.services.translation_service import translation_service
+
+    model, fields = TRANSLATABLE_ENTITIES[entity_type]
+    entity = db.get(model, entity_id)
+    if not entity:
+        logger.info(f"{entity_type} {entity_id} no longer exists, skipping pre-translation")
+        return 0
+
+    languages = get_tenant_languages(db, entity.tenant_id)
+    sources = {field: getattr(entity, field) for field in fields if getattr(entity, field, None)}
+    if not languages or not sources:
+        return 0
+
+    existing = {
+        (row.field, row.language): row
+        for row in db.exec(
+            select(ContentTranslation).where(
+                and_(
+                    ContentTranslation.entity_type == entity_type,
+                    ContentTranslation.entity_id == str(entity_id)
+                )
+            )
+        ).all()
+    }
+    hashes = {field: text_hash(value) for field, value in sources.items()}
+
+    written = 0
+    for language in languages:
+        stale = [
+            field for field in sources
+            if (field, language) not in existing or existing[(field, language)].source_hash != hashes[field]
+        ]
+        if not stale:
+            continue
+
+        translated = translation_service.translate_batch(
+            [sources[field] for field in stale], settings.CONTENT_SOURCE_LANGUAGE, language
+        )
+        for field in stale:
+            row = existing.get((field, language))
+            if row is None:
+                row = ContentTranslation(
+                    entity_type=entity_type,
+                    entity_id=str(entity_id),
+                    field=field,
+                    language=language,
+                    tenant_id=entity.tenant_id,
+                    source_hash=hashes[field],
+                    translated_text=translated[sources[field]]
+                )
+            else:
+                row.source_hash = hashes[field]
+                row.translated_text = translated[sources[field]]
+                row.updated_at = datetime.utcnow()
+            db.add(row)
+            written += 1
+
+    db.commit()
+    logger.info(f"Stored {written} translations for {entity_type} {entity_id}")
+    return written
+
+def get_stored_translations(
+    db: Session,
+    entity_type: str,
+    entity_ids: List[Any],
+    language: str
+) -> Dict[str, Dict[str, ContentTranslation]]:
+    """Stored translations for a page of entities in one query: {entity_id: {field: row}}"""
+    if not entity_ids:
+        return {}
+
+    rows = db.exec(
+        select(ContentTranslation).where(
+            and_(
+                ContentTranslation.entity_type == entity_type,
+                ContentTranslation.language == language,
+                ContentTranslation.entity_id.in_([str(entity_id) for entity_id in entity_ids])
+            )
+        )
+    ).all()
+
+    translations: Dict[str, Dict[str, ContentTranslation]] = {}
+    for row in rows:
+        translations.setdefault(row.entity_id, {})[row.field] = row
+    return translations
+
+def localize_records(db: Session, entity_type: str, records: List[Any], language: Optional[str]) -> List[Any]:
+    """
+    Replace translatable fields of response records (dicts or schema objects) with
+    their stored translations. Missing or outdated translations keep the original text.
+    """
+    language = normalize_language(language)
+    if not records or not language or language == settings.CONTENT_SOURCE_LANGUAGE:
+        return records
+
+    def read(record, key):
+        return record.get(key) if isinstance(record, dict) else getattr(record, key, None)
+
+    translations = get_stored_translations(db, entity_type, [read(record, "id") for record in records], language)
+    if not translations:
+        return records
+
+    _, fields = TRANSLATABLE_ENTITIES[entity_type]
+    for record in records:
+        stored = translations.get(str(read(record, "id")), {})
+        for field in fields:
+            row = stored.get(field)
+            value = read(record, field)
+            if row is None or not value or row.source_hash != text_hash(value):
+                continue
+            if isinstance(record, dict):
+                record[field] = row.translated_text
+            else:
+                setattr(record, field, row.translated_text)
+    return records
@@ -0,0 +1,137 @@
+from sqlmodel import Session, func
+from sqlalchemy import update
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+import logging
+
+from app.models.received_letter import ReceivedLetter, LetterStatus, LetterPriority
+from app.models.sent_letter import SentLetter, SentLetterStatus, SentLetterPriority
+from app.models.sent_grievance_letter import SentGrievanceLetter, SentGrievanceLetterStatus, SentGrievanceLetterPriority
+from app.models.letter_followup import FollowUpLetterType
+from app.models.user import User
+from app.core.access_predicates import build_access_predicate, classify_access, get_principal_role_name
+from app.utils.role_permissions import role_permissions, UserRole
+from app.crud.letter_followup_crud import sync_letter_followups
+from config import settings
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Entity -> (status enum, priority enum, date stamped by a status change, status that stamps it,
+#            whether an existing date is kept, follow-up type)
+BULK_LETTER_TABLES = {
+    ReceivedLetter: (LetterStatus, LetterPriority, "response_date", LetterStatus.REPLIED, True, None),
+    SentLetter: (
+        SentLetterStatus, SentLetterPriority, "response_received_date", SentLetterStatus.RESPONSE_RECEIVED,
+        True, FollowUpLetterType.SENT_LETTER
+    ),
+    SentGrievanceLetter: (
+        SentGrievanceLetterStatus, SentGrievanceLetterPriority, "closure_date", SentGrievanceLetterStatus.CLOSED,
+        False, FollowUpLetterType.SENT_GRIEVANCE_LETTER
+    ),
+}
+
+BULK_LETTER_FIELDS = ("status", "priority", "assigned_to")
+
+def normalize_letter_updates(db: Session, entity: Any, user: User, updates: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate bulk changes for a letter type and turn them into column values,
+    including the date the single-letter status endpoints stamp
+
+    Only a Super Admin may assign letters to users outside their own tenant.
+
+    Raises:
+        ValueError: Unknown field, status, priority or assignee
+    """
+    status_enum, priority_enum, date_field, stamping_status, keep_existing, _ = BULK_LETTER_TABLES[entity]
+
+    invalid_fields = set(updates) - set(BULK_LETTER_FIELDS)
+    if invalid_fields:
+        raise ValueError(
+            f"Invalid fields for bulk update: {', '.join(sorted(invalid_fields))}. "
+            f"Allowed fields: {', '.join(BULK_LETTER_FIELDS)}"
+        )
+
+    values = {}
+    try:
+        if updates.get("status") is not None:
+            values["status"] = status_enum(updates["status"])
+        if updates.get("priority") is not None:
+            values["priority"] = priority_enum(updates["priority"])
+    except ValueError as e:
+        raise ValueError(f"Invalid value for {entity.__tablename__}: {str(e)}")
+
+    if "assigned_to" in updates:
+        assigned_to = updates["assigned_to"]
+        if assigned_to:
+            assignee = db.get(User, str(assigned_to))
+            is_super_admin = role_permissions._normalize_role_name(get_principal_role_name(user)) == UserRole.SUPER_ADMIN
+            if not assignee or (not is_super_admin and (not user.tenant_id or assignee.tenant_id != user.tenant_id)):
+                raise ValueError(f"Assigned user '{assigned_to}' does not exist")
+        values["assigned_to"] = str(assigned_to) if assigned_to else None
+
+    if values.get("status") == stamping_status:
+        stamped = getattr(entity, date_field)
+        now = datetime.utcnow()
+        values[date_field] = func.coalesce(stamped, now) if keep_existing else now
+    return values
+
+def bulk_update_letters(
+    db: Session,
+    entity: Any,
+    user: User,
+    letter_ids: List[int],
+    updates: Dict[str, Any],
+    chunk_size: Optional[int] = None
+) -> Dict[int, str]:
+    """
+    Apply the same status / priority / assignment change to many letters with
+    one UPDATE ... WHERE id IN (...) AND <access predicate> per chunk of ids
+
+    Args:
+        entity: ReceivedLetter, SentLetter or SentGrievanceLetter
+        updates: Any of status, priority and assigned_to (None unassigns)
+
+    Returns:
+        Letter id -> "updated", "forbidden" or "not_found", in request order
+    """
+    values = normalize_letter_updates(db, entity, user, updates)
+    followup_type = BULK_LETTER_TABLES[entity][5]
+    ids = list(dict.fromkeys(int(letter_id) for letter_id in letter_ids))
+    outcomes = {letter_id: "not_found" for letter_id in ids}
+    if not ids or not values:
+        return outcomes
+
+    allowed = build_access_predicate(user, entity, "edit")
+    size = max(1, chunk_size or settings.BULK_OPERATION_CHUNK_SIZE)
+    values["updated_at"] = datetime.utcnow()
+    values["updated_by"] = str(user.id)
+
+    try:
+        for start in range(0, len(ids), size):
+            chunk = ids[start:start + size]
+            found = classify_access(db, user, entity, chunk, "edit")
+            editable = [letter_id for letter_id, permitted in found.items() if permitted]
+            for letter_id, permitted in found.items():
+                outcomes[letter_id] = "updated" if permitted else "forbidden"
+            if not editable:
+                continue
+
+            statement = update(entity).where(entity.id.in_(editable))
+            if allowed is not None:
+                statement = statement.where(allowed)
+            db.execute(statement.values(**values), execution_options={"synchronize_session": False})
+
+            if followup_type and ("status" in values or "assigned_to" in values):
+                sync_letter_followups(db, followup_type, editable)
+
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    logger.info(
+        f"Bulk updated {sum(1 for outcome in outcomes.values() if outcome == 'updated')} of "
+        f"{len(ids)} {entity.__tablename__} by user {user.id}"
+    )
+    return outcomes
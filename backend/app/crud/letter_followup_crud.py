@@ -0,0 +1,229 @@
+from sqlmodel import Session, select, and_, or_, func
+from sqlalchemy import update, delete, exists
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
+import logging
+
+from app.models.letter_followup import LetterFollowUp, FollowUpLetterType
+from app.models.sent_letter import SentLetter, SentLetterStatus
+from app.models.sent_grievance_letter import SentGrievanceLetter, SentGrievanceLetterStatus
+from app.models.user import User
+from app.services.job_service import job_runner
+from config import settings
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Letter type -> (model, status that ends the follow-up)
+FOLLOWUP_SOURCES = {
+    FollowUpLetterType.SENT_LETTER: (SentLetter, SentLetterStatus.CLOSED),
+    FollowUpLetterType.SENT_GRIEVANCE_LETTER: (SentGrievanceLetter, SentGrievanceLetterStatus.CLOSED),
+}
+
+def _letter_type(letter: Any) -> FollowUpLetterType:
+    for letter_type, (model, _) in FOLLOWUP_SOURCES.items():
+        if isinstance(letter, model):
+            return letter_type
+    raise ValueError(f"Letters of type {type(letter).__name__} have no follow-ups")
+
+def _as_datetime(value) -> datetime:
+    if isinstance(value, datetime):
+        # Stored naive in UTC like every other timestamp
+        return value.replace(tzinfo=None)
+    return datetime.combine(value, datetime.min.time())
+
+def sync_letter_followup(db: Session, letter: Any) -> Optional[LetterFollowUp]:
+    """
+    Bring the letter's follow-up row in line with its follow_up_date, status and
+    assignee. Moving the due date re-arms the notification; the caller commits.
+    """
+    if letter.id is None:
+        db.flush()
+    letter_type = _letter_type(letter)
+    _, closed_status = FOLLOWUP_SOURCES[letter_type]
+
+    row = db.exec(
+        select(LetterFollowUp).where(and_(
+            LetterFollowUp.letter_type == letter_type,
+            LetterFollowUp.letter_id == letter.id
+        ))
+    ).first()
+
+    if letter.follow_up_date is None or letter.status == closed_status:
+        if row is not None:
+            db.delete(row)
+        return None
+
+    due_at = _as_datetime(letter.follow_up_date)
+    if row is None:
+        row = LetterFollowUp(letter_type=letter_type, letter_id=letter.id, due_at=due_at)
+    elif row.due_at != due_at:
+        row.due_at = due_at
+        row.notified_at = None
+    row.tenant_id = letter.tenant_id
+    row.assignee_id = letter.assigned_to or letter.created_by
+    row.subject = (letter.subject or "")[:500]
+    row.updated_at = datetime.utcnow()
+    db.add(row)
+    return row
+
+def sync_letter_followups(db: Session, letter_type: FollowUpLetterType, letter_ids: List[int]):
+    """
+    Set-based sync_letter_followup for letters changed by a bulk UPDATE; the
+    caller commits. Only status and assignee changes are covered, the due
+    date is left as it is.
+    """
+    if not letter_ids:
+        return
+    model, closed_status = FOLLOWUP_SOURCES[letter_type]
+    same_letters = and_(LetterFollowUp.letter_type == letter_type, LetterFollowUp.letter_id.in_(letter_ids))
+
+    # Closed letters lose their follow-up
+    finished = select(model.id).where(and_(
+        model.id.in_(letter_ids),
+        or_(model.status == closed_status, model.follow_up_date.is_(None))
+    ))
+    db.execute(
+        delete(LetterFollowUp).where(same_letters, LetterFollowUp.letter_id.in_(finished)),
+        execution_options={"synchronize_session": False}
+    )
+
+    # The rest follow the letter's current assignee
+    assignee = (
+        select(func.coalesce(model.assigned_to, model.created_by))
+        .where(model.id == LetterFollowUp.letter_id)
+        .scalar_subquery()
+    )
+    db.execute(
+        update(LetterFollowUp).where(same_letters).values(assignee_id=assignee, updated_at=datetime.utcnow()),
+        execution_options={"synchronize_session": False}
+    )
+
+    # Reopened letters get their follow-up back
+    reopened = db.exec(
+        select(model)
+        .where(and_(
+            model.id.in_(letter_ids),
+            model.status != closed_status,
+            model.follow_up_date.isnot(None),
+            ~exists().where(and_(LetterFollowUp.letter_type == letter_type, LetterFollowUp.letter_id == model.id))
+        ))
+        .execution_options(populate_existing=True)
+    ).all()
+    for letter in reopened:
+        sync_letter_followup(db, letter)
+
+def remove_letter_followup(db: Session, letter: Any):
+    """Drop the follow-up of a letter that is being deleted; the caller commits"""
+    row = db.exec(
+        select(LetterFollowUp).where(and_(
+            LetterFollowUp.letter_type == _letter_type(letter),
+            LetterFollowUp.letter_id == letter.id
+        ))
+    ).first()
+    if row is not None:
+        db.delete(row)
+
+def followup_letters_query(
+    letter_type: FollowUpLetterType,
+    due_before: Optional[datetime] = None,
+    due_from: Optional[datetime] = None,
+    tenant_id: Optional[str] = None
+):
+    """Select open letters of one type with a follow-up in [due_from, due_before), soonest first"""
+    model, _ = FOLLOWUP_SOURCES[letter_type]
+    query = select(model).join(
+        LetterFollowUp,
+        and_(LetterFollowUp.letter_type == letter_type, LetterFollowUp.letter_id == model.id)
+    )
+    if tenant_id:
+        query = query.where(LetterFollowUp.tenant_id == tenant_id)
+    if due_from is not None:
+        query = query.where(LetterFollowUp.due_at >= due_from)
+    if due_before is not None:
+        query = query.where(LetterFollowUp.due_at < due_before)
+    return query.order_by(LetterFollowUp.due_at)
+
+def get_due_followups(
+    db: Session,
+    user_id: str,
+    days_ahead: int = 7,
+    include_overdue: bool = True,
+    limit: int = 100
+) -> List[LetterFollowUp]:
+    """Follow-ups assigned to a user that are due within days_ahead (and overdue ones)"""
+    now = datetime.utcnow()
+    query = select(LetterFollowUp).where(and_(
+        LetterFollowUp.assignee_id == user_id,
+        LetterFollowUp.due_at <= now + timedelta(days=days_ahead)
+    ))
+    if not include_overdue:
+        query = query.where(LetterFollowUp.due_at >= now)
+    return db.exec(query.order_by(LetterFollowUp.due_at).limit(limit)).all()
+
+def get_unnotified_due_followups(db: Session, now: datetime, limit: int) -> List[LetterFollowUp]:
+    """Follow-ups that have come due and not been announced yet"""
+    return db.exec(
+        select(LetterFollowUp)
+        .where(and_(
+            LetterFollowUp.notified_at.is_(None),
+            LetterFollowUp.due_at <= now
+        ))
+        .order_by(LetterFollowUp.due_at)
+        .limit(limit)
+    ).all()
+
+def get_assignee_contacts(db: Session, user_ids: List[str]) -> Dict[str, Tuple[str, str]]:
+    """Map user id -> (email, name) for the given assignees"""
+    ids = list({user_id for user_id in user_ids if user_id})
+    if not ids:
+        return {}
+    rows = db.exec(select(User.id, User.email, User.name).where(User.id.in_(ids))).all()
+    return {str(user_id): (email, name) for user_id, email, name in rows if email}
+
+def mark_followups_notified(db: Session, followups: List[LetterFollowUp], notified_at: datetime):
+    """Flag follow-ups as announced; the caller commits together with the queued notices"""
+    for followup in followups:
+        followup.notified_at = notified_at
+        db.add(followup)
+
+def schedule_followup_sweep(delay_minutes: Optional[float] = None) -> Optional[str]:
+    """Queue the next follow-up sweep; failure to queue is logged, never raised"""
+    interval = settings.FOLLOWUP_SWEEP_INTERVAL_MINUTES if delay_minutes is None else delay_minutes
+    if interval <= 0:
+        return None
+    try:
+        return job_runner.enqueue_unique(
+            "sweep_letter_followups",
+            run_after=datetime.utcnow() + timedelta(minutes=interval)
+        )
+    except Exception as e:
+        logger.error(f"Failed to schedule follow-up sweep: {str(e)}")
+        return None
+
+def backfill_letter_followups(db: Session, batch_size: int = 500) -> int:
+    """Create follow-up rows for every open sent and grievance letter with a follow-up date"""
+    processed = 0
+    for letter_type, (model, closed_status) in FOLLOWUP_SOURCES.items():
+        last_id = None
+        while True:
+            query = (
+                select(model)
+                .where(and_(model.follow_up_date.isnot(None), model.status != closed_status))
+                .order_by(model.id)
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                query = query.where(model.id > last_id)
+            letters = db.exec(query).all()
+            if not letters:
+                break
+
+            for letter in letters:
+                sync_letter_followup(db, letter)
+            db.commit()
+
+            processed += len(letters)
+            last_id = letters[-1].id
+            logger.info(f"Backfilled follow-ups for {processed} letters")
+    return processed
@@ -0,0 +1,118 @@
+from sqlmodel import Session, select, func, and_
+from sqlalchemy import case, false
+from typing import Any, Dict, Optional
+from datetime import datetime, timedelta
+import logging
+
+from app.models.received_letter import ReceivedLetter, LetterStatus, LetterPriority
+from app.models.sent_letter import SentLetter, SentLetterStatus, SentLetterPriority
+from app.models.sent_grievance_letter import SentGrievanceLetter, SentGrievanceLetterStatus, SentGrievanceLetterPriority
+from app.models.user import User
+from app.core.access_predicates import build_access_predicate
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# Entity -> (status enum, priority enum, name of the due date column, closed status)
+LETTER_TABLES = {
+    ReceivedLetter: (LetterStatus, LetterPriority, "due_date", LetterStatus.CLOSED),
+    SentLetter: (SentLetterStatus, SentLetterPriority, "follow_up_date", SentLetterStatus.CLOSED),
+    SentGrievanceLetter: (SentGrievanceLetterStatus, SentGrievanceLetterPriority, "follow_up_date", SentGrievanceLetterStatus.CLOSED),
+}
+
+def _count_when(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+def letter_scope_predicate(
+    entity: Any,
+    user: Optional[User] = None,
+    tenant_id: Optional[str] = None,
+    all_tenants: bool = False
+):
+    """
+    WHERE clause limiting statistics to what the caller may see
+
+    With a user the shared access rules apply; otherwise tenant_id narrows to one
+    tenant. With neither nothing is counted unless all_tenants asks for every letter.
+    """
+    if user is not None:
+        return build_access_predicate(user, entity, "view")
+    if tenant_id:
+        return entity.tenant_id == tenant_id
+    if all_tenants:
+        return None
+    return false()
+
+def count_letters(
+    db: Session,
+    entity: Any,
+    predicate=None,
+    now: Optional[datetime] = None,
+    extra: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Count letters by status and priority, plus overdue and due-within-a-week
+    follow-ups, with conditional aggregation in a single query
+
+    Args:
+        entity: ReceivedLetter, SentLetter or SentGrievanceLetter
+        predicate: Access filter from letter_scope_predicate (None counts everything)
+        now: Reference time for the overdue / due-this-week windows
+        extra: Additional named conditions to count in the same query
+
+    Returns:
+        {"total", "status": {enum: n}, "priority": {enum: n}, "overdue", "due_this_week", **extra}
+    """
+    status_enum, priority_enum, due_field, closed_status = LETTER_TABLES[entity]
+    due_date = getattr(entity, due_field)
+    now = now or datetime.utcnow()
+    week_from_now = now + timedelta(days=7)
+    still_open = entity.status != closed_status
+
+    columns = [func.count(entity.id).label("total")]
+    columns += [_count_when(entity.status == member).label(f"status_{member.name}") for member in status_enum]
+    columns += [_count_when(entity.priority == member).label(f"priority_{member.name}") for member in priority_enum]
+    columns.append(_count_when(and_(due_date < now, still_open)).label("overdue"))
+    columns.append(_count_when(and_(due_date >= now, due_date <= week_from_now, still_open)).label("due_this_week"))
+    for name, condition in (extra or {}).items():
+        columns.append(_count_when(condition).label(f"extra_{name}"))
+
+    query = select(*columns)
+    if predicate is not None:
+        query = query.where(predicate)
+    row = db.exec(query).one()._mapping
+
+    result = {
+        "total": int(row["total"] or 0),
+        "status": {member: int(row[f"status_{member.name}"]) for member in status_enum},
+        "priority": {member: int(row[f"priority_{member.name}"]) for member in priority_enum},
+        "overdue": int(row["overdue"]),
+        "due_this_week": int(row["due_this_week"]),
+    }
+    for name in (extra or {}):
+        result[name] = int(row[f"extra_{name}"])
+    return result
+
+def get_letters_overview(db: Session, user: User) -> Dict[str, int]:
+    """Totals across received, sent and grievance letters for the letters dashboard (three queries)"""
+    now = datetime.utcnow()
+    received = count_letters(db, ReceivedLetter, letter_scope_predicate(ReceivedLetter, user), now)
+    grievance = count_letters(db, SentGrievanceLetter, letter_scope_predicate(SentGrievanceLetter, user), now)
+    sent = count_letters(
+        db, SentLetter, letter_scope_predicate(SentLetter, user), now,
+        extra={
+            # Only letters still awaiting a reply count as overdue follow-ups on this dashboard
+            "overdue_awaiting": and_(
+                SentLetter.follow_up_date < now,
+                SentLetter.status == SentLetterStatus.AWAITING_RESPONSE
+            )
+        }
+    )
+    return {
+        "total_received": received["total"],
+        "total_sent_public_interest": sent["total"],
+        "total_sent_public_grievance": grievance["total"],
+        "awaiting_response": sent["status"][SentLetterStatus.AWAITING_RESPONSE],
+        "response_received": sent["status"][SentLetterStatus.RESPONSE_RECEIVED],
+        "overdue_followups": sent["overdue_awaiting"],
+    }
@@ -0,0 +1,261 @@
+from sqlmodel import Session, select, and_, func
+from sqlalchemy import case
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime
+import logging
+import json
+
+from app.models.meeting_program import MeetingProgram
+from app.models.meeting_participant import MeetingParticipant, ParticipantRole, ParticipantRSVP
+from app.models.user import User
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+def participants_from_meeting(meeting: MeetingProgram) -> List[Tuple[str, Optional[str], Optional[str]]]:
+    """
+    Derive (role, user_id, name) participant entries from a meeting's JSON
+    participants and its assigned user
+    """
+    entries = []
+    seen = set()
+
+    def add(role: str, user_id: Optional[str], name: Optional[str]):
+        key = (role, user_id, None if user_id else name)
+        if key in seen or not (user_id or name):
+            return
+        seen.add(key)
+        entries.append((role, user_id, name))
+
+    if meeting.user_id:
+        add(ParticipantRole.ASSIGNEE, meeting.user_id, None)
+
+    participants = meeting.participants
+    if isinstance(participants, str):
+        try:
+            participants = json.loads(participants)
+        except json.JSONDecodeError:
+            logger.warning(f"Unparseable participants on meeting {meeting.id}")
+            participants = []
+
+    for participant in participants or []:
+        if isinstance(participant, dict):
+            # New format: objects with a name, optionally linked to a user
+            user_id = participant.get('user_id') or participant.get('id')
+            add(ParticipantRole.PARTICIPANT, str(user_id) if user_id else None, participant.get('name'))
+        elif isinstance(participant, str):
+            # Old format: list of user IDs
+            add(ParticipantRole.PARTICIPANT, participant, None)
+
+    return entries
+
+def sync_meeting_participants(db: Session, meeting: MeetingProgram) -> List[MeetingParticipant]:
+    """
+    Bring meeting_participants rows in line with the meeting's participants.
+    Existing rows keep their RSVP and attendance; the caller commits.
+    """
+    existing = db.exec(
+        select(MeetingParticipant).where(MeetingParticipant.meeting_id == meeting.id)
+    ).all()
+    existing_by_key = {
+        (row.role, row.user_id, None if row.user_id else row.name): row
+        for row in existing
+    }
+
+    rows = []
+    for role, user_id, name in participants_from_meeting(meeting):
+        key = (role, user_id, None if user_id else name)
+        row = existing_by_key.pop(key, None)
+        if row is None:
+            row = MeetingParticipant(meeting_id=meeting.id, user_id=user_id, name=name, role=role)
+            db.add(row)
+        elif name and row.name != name:
+            row.name = name
+            row.updated_at = datetime.utcnow()
+            db.add(row)
+        rows.append(row)
+
+    for stale in existing_by_key.values():
+        db.delete(stale)
+
+    return rows
+
+def backfill_meeting_participants(db: Session, batch_size: int = 500) -> int:
+    """Populate meeting_participants from the JSON participants of all meetings"""
+    processed = 0
+    last_id = None
+    while True:
+        query = select(MeetingProgram).order_by(MeetingProgram.id).limit(batch_size)
+        if last_id is not None:
+            query = query.where(MeetingProgram.id > last_id)
+        meetings = db.exec(query).all()
+        if not meetings:
+            break
+
+        for meeting in meetings:
+            sync_meeting_participants(db, meeting)
+        db.commit()
+
+        processed += len(meetings)
+        last_id = meetings[-1].id
+        logger.info(f"Backfilled participants for {processed} meetings")
+
+    return processed
+
+def participant_meetings_query(user_id: str, base_query=None):
+    """Select meetings a user participates in (as assignee or listed participant)"""
+    if base_query is None:
+        base_query = select(MeetingProgram)
+    return base_query.where(
+        MeetingProgram.id.in_(
+            select(MeetingParticipant.meeting_id).where(MeetingParticipant.user_id == user_id)
+        )
+    )
+
+def get_participant_meetings(
+    db: Session,
+    user_id: str,
+    skip: int = 0,
+    limit: int = 100,
+    status_filter: Optional[str] = None,
+    date_from: Optional[datetime] = None
+) -> List[MeetingProgram]:
+    """Get meetings a user participates in, most recent first"""
+    query = participant_meetings_query(user_id)
+    if status_filter:
+        query = query.where(MeetingProgram.status == status_filter)
+    if date_from:
+        query = query.where(MeetingProgram.scheduled_date >= date_from)
+    query = query.order_by(MeetingProgram.scheduled_date.desc()).offset(skip).limit(limit)
+    return db.exec(query).all()
+
+def _person_responses_query(*conditions):
+    """
+    One row per (meeting, person): an assignee who is also listed as a participant
+    has two rows, which record the same responses and must count once
+    """
+    person = func.coalesce(MeetingParticipant.user_id, MeetingParticipant.name)
+    return (
+        select(
+            MeetingParticipant.meeting_id.label("meeting_id"),
+            func.max(case((MeetingParticipant.rsvp == ParticipantRSVP.ACCEPTED, 1), else_=0)).label("accepted"),
+            func.max(case((MeetingParticipant.rsvp == ParticipantRSVP.DECLINED, 1), else_=0)).label("declined"),
+            func.max(case((MeetingParticipant.rsvp == ParticipantRSVP.PENDING, 1), else_=0)).label("pending"),
+            func.max(case((MeetingParticipant.attended == True, 1), else_=0)).label("attended"),
+        )
+        .where(*conditions)
+        .group_by(MeetingParticipant.meeting_id, person)
+        .subquery()
+    )
+
+def get_participation_summary(db: Session, user_id: str) -> Dict[str, Any]:
+    """Count a user's meetings by RSVP and attendance in one aggregate query"""
+    responses = _person_responses_query(MeetingParticipant.user_id == user_id)
+    row = db.exec(
+        select(
+            func.count(responses.c.meeting_id),
+            func.sum(responses.c.accepted),
+            func.sum(responses.c.declined),
+            func.sum(responses.c.pending),
+            func.sum(responses.c.attended),
+            func.sum(case((MeetingProgram.status == "Done", 1), else_=0)),
+            func.sum(case((MeetingProgram.status == "Upcoming", 1), else_=0)),
+        )
+        .select_from(responses)
+        .join(MeetingProgram, MeetingProgram.id == responses.c.meeting_id)
+    ).one()
+
+    total, accepted, declined, pending, attended, done, upcoming = (int(value or 0) for value in row)
+    return {
+        "total_meetings": total,
+        "accepted": accepted,
+        "declined": declined,
+        "pending": pending,
+        "attended": attended,
+        "completed_meetings": done,
+        "upcoming_meetings": upcoming,
+        "attendance_rate": (attended / done * 100) if done > 0 else None
+    }
+
+def get_meeting_attendance_counts(db: Session, meeting_ids: List[str]) -> Dict[str, Dict[str, int]]:
+    """Invited/accepted/declined/attended people for several meetings in one query"""
+    if not meeting_ids:
+        return {}
+
+    responses = _person_responses_query(MeetingParticipant.meeting_id.in_(meeting_ids))
+    rows = db.exec(
+        select(
+            responses.c.meeting_id,
+            func.count(),
+            func.sum(responses.c.accepted),
+            func.sum(responses.c.declined),
+            func.sum(responses.c.attended),
+        )
+        .group_by(responses.c.meeting_id)
+    ).all()
+
+    counts = {
+        meeting_id: {"invited": 0, "accepted": 0, "declined": 0, "attended": 0}
+        for meeting_id in meeting_ids
+    }
+    for meeting_id, invited, accepted, declined, attended in rows:
+        counts[meeting_id] = {
+            "invited": int(invited or 0),
+            "accepted": int(accepted or 0),
+            "declined": int(declined or 0),
+            "attended": int(attended or 0)
+        }
+    return counts
+
+def get_meeting_participant_contacts(db: Session, meeting_ids: List[str]) -> Dict[str, List[Tuple[str, Optional[str]]]]:
+    """(email, name) of linked users for several meetings in one query, skipping declined RSVPs"""
+    if not meeting_ids:
+        return {}
+
+    rows = db.exec(
+        select(MeetingParticipant.meeting_id, User.email, User.name)
+        .join(User, User.id == MeetingParticipant.user_id)
+        .where(
+            and_(
+                MeetingParticipant.meeting_id.in_(meeting_ids),
+                MeetingParticipant.rsvp != ParticipantRSVP.DECLINED
+            )
+        )
+    ).all()
+
+    contacts: Dict[str, List[Tuple[str, Optional[str]]]] = {}
+    for meeting_id, email, name in rows:
+        meeting_contacts = contacts.setdefault(meeting_id, [])
+        if email and all(email != known for known, _ in meeting_contacts):
+            meeting_contacts.append((email, name))
+    return contacts
+
+def update_participant_response(
+    db: Session,
+    meeting_id: str,
+    user_id: str,
+    rsvp: Optional[ParticipantRSVP] = None,
+    attended: Optional[bool] = None
+) -> List[MeetingParticipant]:
+    """Record a user's RSVP and/or attendance on all their rows for a meeting"""
+    rows = db.exec(
+        select(MeetingParticipant).where(
+            and_(
+                MeetingParticipant.meeting_id == meeting_id,
+                MeetingParticipant.user_id == user_id
+            )
+        )
+    ).all()
+
+    for row in rows:
+        if rsvp is not None:
+            row.rsvp = rsvp
+        if attended is not None:
+            row.attended = attended
+        row.updated_at = datetime.utcnow()
+        db.add(row)
+
+    db.commit()
+    for row in rows:
+        db.refresh(row)
+    return rows
@@ -8,6 +8,10 @@ from fastapi import HTTPException, status
 from app.models.meeting_program import MeetingProgram
 from app.models.user import User
 from app.models.role import Role
+from app.crud.meeting_participant_crud import sync_meeting_participants
+from app.core.access_predicates import (
+    apply_access_filter, resolve_access_scope, field_agent_ids_subquery
+)
 from app.schemas.meeting_program_schema import MeetingProgramCreate, MeetingProgramUpdate, MeetingProgramKPIs, MeetingProgramStats
 
 # Setup logging
@@ -104,6 +108,11 @@ def create_meeting_program(db: Session, meeting_data: MeetingProgramCreate, curr
         )
         
         db.add(db_meeting)
+        db.flush()
+        
+        # Keep the normalised participants table in step with the JSON column
+        sync_meeting_participants(db, db_meeting)
+        
         db.commit()
         db.refresh(db_meeting)
         
@@ -219,6 +228,8 @@ def update_meeting_program(db: Session, meeting_id: str, meeting_data: MeetingPr
         meeting.updated_at = datetime.utcnow()
         
         db.add(meeting)
+        if 'participants' in update_data or 'user_id' in update_data:
+            sync_meeting_participants(db, meeting)
         db.commit()
         db.refresh(meeting)
         
@@ -315,38 +326,7 @@ def get_meeting_program_kpis(db: Session, tenant_id: Optional[str] = None, curre
         
         # Apply role-based filtering
         if current_user:
-            user_role = getattr(current_user, 'role', None)
-            role_name = user_role.name if hasattr(user_role, 'name') else str(user_role) if user_role else None
-            
-            if role_name == "SuperAdmin":
-                # Super Admin can see all meetings
-                pass
-            elif role_name == "Admin":
-                # Admin can see meetings they created and meetings assigned to Field Agents in their tenant
-                base_query = base_query.where(
-                    and_(
-                        MeetingProgram.tenant_id == current_user.tenant_id,
-                        or_(
-                            MeetingProgram.created_by == current_user.id,  # Meetings created by admin
-                            MeetingProgram.user_id.in_(  # Meetings assigned to Field Agents in their tenant
-                                select(User.id).where(
-                                    and_(
-                                        User.tenant_id == current_user.tenant_id,
-                                        User.role_id.in_(
-                                            select(Role.id).where(Role.name == "FieldAgent")
-                                        )
-                                    )
-                                )
-                            )
-                        )
-                    )
-                )
-            elif role_name == "FieldAgent":
-                # Field Agent can only see meetings assigned to them
-                base_query = base_query.where(MeetingProgram.user_id == current_user.id)
-            else:
-                # Other roles - no access
-                base_query = base_query.where(MeetingProgram.id == None)
+            base_query = apply_access_filter(base_query, current_user, MeetingProgram, "view")
         elif tenant_id:
             # Fallback to tenant-based filtering if no user context
             base_query = base_query.where(MeetingProgram.tenant_id == tenant_id)
@@ -423,20 +403,11 @@ def get_meeting_program_kpis(db: Session, tenant_id: Optional[str] = None, curre
             meetings_assigned_to_me = len(db.exec(assigned_to_me_query).all())
             
             # Meetings assigned to Field Agents in admin's tenant
-            if role_name == "Admin" and current_user.tenant_id:
+            if resolve_access_scope(current_user, MeetingProgram, "view") == "tenant" and current_user.tenant_id:
                 field_agent_meetings_query = select(MeetingProgram).where(
                     and_(
                         MeetingProgram.tenant_id == current_user.tenant_id,
-                        MeetingProgram.user_id.in_(
-                            select(User.id).where(
-                                and_(
-                                    User.tenant_id == current_user.tenant_id,
-                                    User.role_id.in_(
-                                        select(Role.id).where(Role.name == "FieldAgent")
-                                    )
-                                )
-                            )
-                        )
+                        MeetingProgram.user_id.in_(field_agent_ids_subquery(current_user.tenant_id))
                     )
                 )
                 meetings_assigned_to_field_agents = len(db.exec(field_agent_meetings_query).all())
@@ -467,38 +438,7 @@ def get_meeting_program_stats(db: Session, tenant_id: Optional[str] = None, curr
         
         # Apply role-based filtering
         if current_user:
-            user_role = getattr(current_user, 'role', None)
-            role_name = user_role.name if hasattr(user_role, 'name') else str(user_role) if user_role else None
-            
-            if role_name == "SuperAdmin":
-                # Super Admin can see all meetings
-                pass
-            elif role_name == "Admin":
-                # Admin can see meetings they created and meetings assigned to Field Agents in their tenant
-                base_query = base_query.where(
-                    and_(
-                        MeetingProgram.tenant_id == current_user.tenant_id,
-                        or_(
-                            MeetingProgram.created_by == current_user.id,  # Meetings created by admin
-                            MeetingProgram.user_id.in_(  # Meetings assigned to Field Agents in their tenant
-                                select(User.id).where(
-                                    and_(
-                                        User.tenant_id == current_user.tenant_id,
-                                        User.role_id.in_(
-                                            select(Role.id).where(Role.name == "FieldAgent")
-                                        )
-                                    )
-                                )
-                            )
-                        )
-                    )
-                )
-            elif role_name == "FieldAgent":
-                # Field Agent can only see meetings assigned to them
-                base_query = base_query.where(MeetingProgram.user_id == current_user.id)
-            else:
-                # Other roles - no access
-                base_query = base_query.where(MeetingProgram.id == None)
+            base_query = apply_access_filter(base_query, current_user, MeetingProgram, "view")
         elif tenant_id:
             # Fallback to tenant-based filtering if no user context
             base_query = base_query.where(MeetingProgram.tenant_id == tenant_id)
@@ -615,37 +555,24 @@ def get_meeting_program_stats(db: Session, tenant_id: Optional[str] = None, curr
         logger.error(f"Error getting meeting program stats: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to get meeting program stats")
 
-def send_meeting_reminders(db: Session, tenant_id: Optional[str] = None) -> List[MeetingProgram]:
-    """Send reminders for upcoming meetings"""
-    try:
-        # Get meetings that need reminders (scheduled within 24 hours and reminder not sent)
-        tomorrow = datetime.now() + timedelta(days=1)
-        
-        query = select(MeetingProgram).where(
-            and_(
-                MeetingProgram.scheduled_date <= tomorrow,
-                MeetingProgram.status == "Upcoming",
-                MeetingProgram.reminder_sent == False
-            )
+def get_meetings_due_for_reminder(db: Session, user: User) -> List[MeetingProgram]:
+    """Upcoming meetings in the next 24 hours without a reminder, limited to those the user may edit"""
+    now = datetime.now()
+    query = select(MeetingProgram).where(
+        and_(
+            MeetingProgram.scheduled_date >= now,
+            MeetingProgram.scheduled_date <= now + timedelta(days=1),
+            MeetingProgram.status == "Upcoming",
+            MeetingProgram.reminder_sent == False
         )
-        
-        if tenant_id:
-            query = query.where(MeetingProgram.tenant_id == tenant_id)
-        
-        meetings_needing_reminders = db.exec(query).all()
-        
-        # Mark reminders as sent
-        for meeting in meetings_needing_reminders:
-            meeting.reminder_sent = True
-            meeting.reminder_date = datetime.utcnow()
-            db.add(meeting)
-        
-        db.commit()
-        
-        logger.info(f"Sent reminders for {len(meetings_needing_reminders)} meetings")
-        return meetings_needing_reminders
-        
-    except Exception as e:
-        logger.error(f"Error sending meeting reminders: {e}")
-        db.rollback()
-        return []
+    )
+    query = apply_access_filter(query, user, MeetingProgram, "edit")
+    return db.exec(query).all()
+
+def mark_meeting_reminders_sent(db: Session, meetings: List[MeetingProgram]) -> None:
+    """Flag reminders as sent; the caller commits together with the queued emails"""
+    reminder_date = datetime.utcnow()
+    for meeting in meetings:
+        meeting.reminder_sent = True
+        meeting.reminder_date = reminder_date
+        db.add(meeting)
@@ -4,6 +4,9 @@ from datetime import datetime, timedelta
 import logging
 from app.models.received_letter import ReceivedLetter, LetterStatus, LetterPriority, LetterCategory
 from app.schemas.received_letter_schema import ReceivedLetterCreate, ReceivedLetterUpdate, LetterFilters, LetterStatistics
+from app.crud.content_translation_crud import enqueue_pretranslation, delete_translations
+from app.crud.letter_statistics_crud import count_letters, letter_scope_predicate
+from app.models.user import User
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +31,7 @@ def create_received_letter(db: Session, letter_data: ReceivedLetterCreate, user_
         db.commit()
         db.refresh(db_letter)
         logger.info(f"Created received letter with ID: {db_letter.id}")
+        enqueue_pretranslation(db, "received_letter", db_letter)
         return db_letter
     except Exception as e:
         db.rollback()
@@ -62,6 +66,43 @@ def get_all_received_letters(
         logger.error(f"Error fetching received letters: {str(e)}")
         raise
 
+def apply_received_letter_filters(query, filters: LetterFilters):
+    """Apply the search, status, priority, category, assignee and received date filters to a query"""
+    # Apply search filter
+    if filters.search:
+        search_term = f"%{filters.search}%"
+        query = query.where(
+            or_(
+                ReceivedLetter.sender.ilike(search_term),
+                ReceivedLetter.subject.ilike(search_term),
+                ReceivedLetter.content.ilike(search_term),
+                ReceivedLetter.category.ilike(search_term)
+            )
+        )
+
+    # Apply status filter
+    if filters.status:
+        query = query.where(ReceivedLetter.status == filters.status)
+
+    # Apply priority filter
+    if filters.priority:
+        query = query.where(ReceivedLetter.priority == filters.priority)
+
+    # Apply category filter
+    if filters.category:
+        query = query.where(ReceivedLetter.category == filters.category)
+
+    # Apply assigned_to filter
+    if filters.assigned_to:
+        query = query.where(ReceivedLetter.assigned_to == filters.assigned_to)
+
+    # Apply date range filters
+    if filters.date_from:
+        query = query.where(ReceivedLetter.received_date >= filters.date_from)
+    if filters.date_to:
+        query = query.where(ReceivedLetter.received_date <= filters.date_to)
+    return query
+
 def get_filtered_received_letters(
     db: Session, 
     filters: LetterFilters, 
@@ -75,39 +116,7 @@ def get_filtered_received_letters(
         if tenant_id:
             query = query.where(ReceivedLetter.tenant_id == tenant_id)
         
-        # Apply search filter
-        if filters.search:
-            search_term = f"%{filters.search}%"
-            query = query.where(
-                or_(
-                    ReceivedLetter.sender.ilike(search_term),
-                    ReceivedLetter.subject.ilike(search_term),
-                    ReceivedLetter.content.ilike(search_term),
-                    ReceivedLetter.category.ilike(search_term)
-                )
-            )
-        
-        # Apply status filter
-        if filters.status:
-            query = query.where(ReceivedLetter.status == filters.status)
-        
-        # Apply priority filter
-        if filters.priority:
-            query = query.where(ReceivedLetter.priority == filters.priority)
-        
-        # Apply category filter
-        if filters.category:
-            query = query.where(ReceivedLetter.category == filters.category)
-        
-        # Apply assigned_to filter
-        if filters.assigned_to:
-            query = query.where(ReceivedLetter.assigned_to == filters.assigned_to)
-        
-        # Apply date range filters
-        if filters.date_from:
-            query = query.where(ReceivedLetter.received_date >= filters.date_from)
-        if filters.date_to:
-            query = query.where(ReceivedLetter.received_date <= filters.date_to)
+        query = apply_received_letter_filters(query, filters)
         
         # Get total count for pagination
         total_query = select(func.count()).select_from(query.subquery())
@@ -156,6 +165,8 @@ def update_received_letter(
         db.commit()
         db.refresh(db_letter)
         logger.info(f"Updated received letter with ID: {letter_id}")
+        if "subject" in update_data:
+            enqueue_pretranslation(db, "received_letter", db_letter)
         return db_letter
     except Exception as e:
         db.rollback()
@@ -169,6 +180,7 @@ def delete_received_letter(db: Session, letter_id: int, tenant_id: Optional[str]
         if not db_letter:
             return False
         
+        delete_translations(db, "received_letter", [db_letter.id])
         db.delete(db_letter)
         db.commit()
         logger.info(f"Deleted received letter with ID: {letter_id}")
@@ -178,118 +190,20 @@ def delete_received_letter(db: Session, letter_id: int, tenant_id: Optional[str]
         logger.error(f"Error deleting received letter {letter_id}: {str(e)}")
         raise
 
-def get_letter_statistics(db: Session, tenant_id: Optional[str] = None, user_id: Optional[str] = None, user_role: Optional[str] = None) -> LetterStatistics:
-    """Get statistics for received letters with role-based filtering"""
+def get_letter_statistics(db: Session, tenant_id: Optional[str] = None, user: Optional[User] = None) -> LetterStatistics:
+    """Get statistics for received letters in one query, filtered by the user's access scope"""
     try:
-        base_query = select(ReceivedLetter)
-        
-        # Apply role-based filtering
-        if user_role == "super_admin":
-            # Super admin sees all letters
-            pass
-        elif user_role == "admin" and tenant_id:
-            # Admin sees letters they created + letters assigned to their Field Agents
-            from app.models.user import User
-            from app.models.role import Role
-            
-            # Get Field Agent IDs in the same tenant
-            field_agent_ids = db.exec(
-                select(User.id).where(
-                    and_(
-                        User.tenant_id == tenant_id,
-                        User.role_id.in_(
-                            select(Role.id).where(Role.name == "FieldAgent")
-                        )
-                    )
-                )
-            ).all()
-            
-            # Filter for letters created by admin OR assigned to their Field Agents
-            base_query = base_query.where(
-                or_(
-                    ReceivedLetter.created_by == user_id,
-                    ReceivedLetter.assigned_to.in_([str(fa_id) for fa_id in field_agent_ids])
-                )
-            )
-        elif user_role in ["field_agent", "assistant"] and user_id:
-            # Field agents see only their assigned letters
-            base_query = base_query.where(ReceivedLetter.assigned_to == user_id)
-        elif user_role == "regular_user" and user_id:
-            # Regular users see only their created letters
-            base_query = base_query.where(ReceivedLetter.created_by == user_id)
-        elif tenant_id:
-            # Fallback to tenant filtering if provided
-            base_query = base_query.where(ReceivedLetter.tenant_id == tenant_id)
-        
-        # Total letters
-        total_letters = db.exec(select(func.count()).select_from(base_query.subquery())).first() or 0
-        
-        # Status counts
-        new_letters = db.exec(
-            select(func.count()).select_from(
-                base_query.where(ReceivedLetter.status == LetterStatus.NEW).subquery()
-            )
-        ).first() or 0
-        
-        under_review = db.exec(
-            select(func.count()).select_from(
-                base_query.where(ReceivedLetter.status == LetterStatus.UNDER_REVIEW).subquery()
-            )
-        ).first() or 0
-        
-        replied = db.exec(
-            select(func.count()).select_from(
-                base_query.where(ReceivedLetter.status == LetterStatus.REPLIED).subquery()
-            )
-        ).first() or 0
-        
-        closed = db.exec(
-            select(func.count()).select_from(
-                base_query.where(ReceivedLetter.status == LetterStatus.CLOSED).subquery()
-            )
-        ).first() or 0
-        
-        # Priority counts
-        high_priority = db.exec(
-            select(func.count()).select_from(
-                base_query.where(ReceivedLetter.priority == LetterPriority.HIGH).subquery()
-            )
-        ).first() or 0
-        
-        medium_priority = db.exec(
-            select(func.count()).select_from(
-                base_query.where(ReceivedLetter.priority == LetterPriority.MEDIUM).subquery()
-            )
-        ).first() or 0
-        
-        low_priority = db.exec(
-            select(func.count()).select_from(
-                base_query.where(ReceivedLetter.priority == LetterPriority.LOW).subquery()
-            )
-        ).first() or 0
-        
-        # Overdue letters (due_date is past and status is not closed)
-        overdue_letters = db.exec(
-            select(func.count()).select_from(
-                base_query.where(
-                    and_(
-                        ReceivedLetter.due_date < datetime.utcnow(),
-                        ReceivedLetter.status != LetterStatus.CLOSED
-                    )
-                ).subquery()
-            )
-        ).first() or 0
-        
+        counts = count_letters(db, ReceivedLetter, letter_scope_predicate(ReceivedLetter, user, tenant_id))
         return LetterStatistics(
-            total_letters=total_letters,
-            new_letters=new_letters,
-            under_review=under_review,
-            replied=replied,
-            closed=closed,
-            high_priority=high_priority,
-            medium_priority=medium_priority,
-            low_priority=low_priority,
-            overdue_letters=overdue_letters
+            total_letters=counts["total"],
+            new_letters=counts["status"][LetterStatus.NEW],
+            under_review=counts["status"][LetterStatus.UNDER_REVIEW],
+            replied=counts["status"][LetterStatus.REPLIED],
+            closed=counts["status"][LetterStatus.CLOSED],
+            high_priority=counts["priority"][LetterPriority.HIGH],
+            medium_priority=counts["priority"][LetterPriority.MEDIUM],
+            low_priority=counts["priority"][LetterPriority.LOW],
+            overdue_letters=counts["overdue"]
         )
     except Exception as e:
         logger.error(f"Error fetching letter statistics: {str(e)}")
@@ -0,0 +1,111 @@
+from sqlmodel import Session, select
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta
+import hashlib
+import json
+import logging
+
+from config import settings
+from app.models.report_result import ReportResult, ReportStatus
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+def report_cache_key(report_key: str, tenant_id: Optional[str], params: Dict[str, Any]) -> str:
+    """Stable key of one report / tenant / parameter combination"""
+    raw = json.dumps([report_key, tenant_id, params], sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def get_or_create_report_result(
+    db: Session,
+    report_key: str,
+    tenant_id: Optional[str],
+    params: Dict[str, Any]
+) -> ReportResult:
+    """Load the cached result for a report, creating an empty pending one on first use"""
+    cache_key = report_cache_key(report_key, tenant_id, params)
+    result = db.exec(select(ReportResult).where(ReportResult.cache_key == cache_key)).first()
+    if result:
+        return result
+
+    result = ReportResult(
+        cache_key=cache_key,
+        report_key=report_key,
+        tenant_id=tenant_id,
+        params=json.dumps(params, sort_keys=True, default=str)
+    )
+    db.add(result)
+    try:
+        db.commit()
+    except IntegrityError:
+        # Another request created it first
+        db.rollback()
+        return db.exec(select(ReportResult).where(ReportResult.cache_key == cache_key)).one()
+    db.refresh(result)
+    return result
+
+def get_report_result(db: Session, result_id: str) -> Optional[ReportResult]:
+    return db.get(ReportResult, result_id)
+
+def set_report_job(db: Session, result: ReportResult, job_id: str) -> ReportResult:
+    result.job_id = job_id
+    db.add(result)
+    db.commit()
+    db.refresh(result)
+    return result
+
+def decode_report_rows(result: ReportResult) -> List[Dict[str, Any]]:
+    return json.loads(result.rows) if result.rows else []
+
+def decode_report_params(result: ReportResult) -> Dict[str, Any]:
+    return json.loads(result.params) if result.params else {}
+
+def store_report_rows(
+    db: Session,
+    result: ReportResult,
+    rows: List[Dict[str, Any]],
+    started_at: datetime,
+    full: bool
+) -> ReportResult:
+    """
+    Save freshly computed rows. started_at becomes the watermark: rows changed
+    after the refresh began are picked up by the next one.
+    """
+    result.rows = json.dumps(rows, default=str)
+    result.row_count = len(rows)
+    result.status = ReportStatus.READY
+    result.error = None
+    result.generated_at = started_at
+    result.expires_at = started_at + timedelta(minutes=settings.REPORT_CACHE_TTL_MINUTES)
+    result.watermark = started_at
+    if full:
+        result.full_refresh_at = started_at
+    db.add(result)
+    db.commit()
+    db.refresh(result)
+    return result
+
+def record_report_failure(db: Session, result_id: str, error: str):
+    """Mark the last refresh as failed, keeping the previous rows"""
+    db.rollback()
+    result = db.get(ReportResult, result_id)
+    if not result:
+        return
+    result.status = ReportStatus.FAILED
+    result.error = error[:2000]
+    db.add(result)
+    db.commit()
+
+def purge_expired_report_results(db: Session, now: Optional[datetime] = None) -> int:
+    """Delete results that expired more than REPORT_RETENTION_DAYS ago"""
+    cutoff = (now or datetime.utcnow()) - timedelta(days=settings.REPORT_RETENTION_DAYS)
+    deleted = db.execute(
+        delete(ReportResult).where(ReportResult.expires_at < cutoff),
+        execution_options={"synchronize_session": False}
+    ).rowcount
+    db.commit()
+    if deleted:
+        logger.info(f"Purged {deleted} expired report results")
+    return deleted
@@ -5,8 +5,7 @@ import logging
 from app.models.sent_grievance_letter import (
     SentGrievanceLetter, 
     SentGrievanceLetterStatus, 
-    SentGrievanceLetterPriority, 
-    SentGrievanceLetterCategory
+    SentGrievanceLetterPriority
 )
 from app.schemas.sent_grievance_letter_schema import (
     SentGrievanceLetterCreate, 
@@ -15,6 +14,11 @@ from app.schemas.sent_grievance_letter_schema import (
     SentGrievanceLetterStatistics
 )
 from app.models.citizen_issues import CitizenIssue
+from app.crud.content_translation_crud import enqueue_pretranslation, delete_translations
+from app.crud.letter_statistics_crud import count_letters, letter_scope_predicate
+from app.crud.letter_followup_crud import sync_letter_followup, remove_letter_followup, followup_letters_query
+from app.models.letter_followup import FollowUpLetterType
+from app.models.user import User
 
 logger = logging.getLogger(__name__)
 
@@ -49,9 +53,11 @@ def create_sent_grievance_letter(
             updated_by=user_id
         )
         db.add(db_letter)
+        sync_letter_followup(db, db_letter)
         db.commit()
         db.refresh(db_letter)
         logger.info(f"Created sent grievance letter with ID: {db_letter.id}")
+        enqueue_pretranslation(db, "sent_grievance_letter", db_letter)
         return db_letter
     except Exception as e:
         db.rollback()
@@ -90,6 +96,48 @@ def get_all_sent_grievance_letters(
         logger.error(f"Error fetching sent grievance letters: {str(e)}")
         raise
 
+def apply_sent_grievance_letter_filters(query, filters: SentGrievanceLetterFilters):
+    """Apply the search, status, priority, category, grievance, assignee and sent date filters to a query"""
+    # Apply search filter
+    if filters.search:
+        search_term = f"%{filters.search}%"
+        query = query.where(
+            or_(
+                SentGrievanceLetter.recipient_name.ilike(search_term),
+                SentGrievanceLetter.recipient_organization.ilike(search_term),
+                SentGrievanceLetter.subject.ilike(search_term),
+                SentGrievanceLetter.content.ilike(search_term),
+                SentGrievanceLetter.category.ilike(search_term)
+            )
+        )
+
+    # Apply status filter
+    if filters.status:
+        query = query.where(SentGrievanceLetter.status == filters.status)
+
+    # Apply priority filter
+    if filters.priority:
+        query = query.where(SentGrievanceLetter.priority == filters.priority)
+
+    # Apply category filter
+    if filters.category:
+        query = query.where(SentGrievanceLetter.category == filters.category)
+
+    # Apply grievance_id filter
+    if filters.grievance_id:
+        query = query.where(SentGrievanceLetter.grievance_id == filters.grievance_id)
+
+    # Apply assigned_to filter
+    if filters.assigned_to:
+        query = query.where(SentGrievanceLetter.assigned_to == filters.assigned_to)
+
+    # Apply date range filters
+    if filters.date_from:
+        query = query.where(SentGrievanceLetter.sent_date >= filters.date_from)
+    if filters.date_to:
+        query = query.where(SentGrievanceLetter.sent_date <= filters.date_to)
+    return query
+
 def get_filtered_sent_grievance_letters(
     db: Session, 
     filters: SentGrievanceLetterFilters, 
@@ -103,44 +151,7 @@ def get_filtered_sent_grievance_letters(
         if tenant_id:
             query = query.where(SentGrievanceLetter.tenant_id == tenant_id)
         
-        # Apply search filter
-        if filters.search:
-            search_term = f"%{filters.search}%"
-            query = query.where(
-                or_(
-                    SentGrievanceLetter.recipient_name.ilike(search_term),
-                    SentGrievanceLetter.recipient_organization.ilike(search_term),
-                    SentGrievanceLetter.subject.ilike(search_term),
-                    SentGrievanceLetter.content.ilike(search_term),
-                    SentGrievanceLetter.category.ilike(search_term)
-                )
-            )
-        
-        # Apply status filter
-        if filters.status:
-            query = query.where(SentGrievanceLetter.status == filters.status)
-        
-        # Apply priority filter
-        if filters.priority:
-            query = query.where(SentGrievanceLetter.priority == filters.priority)
-        
-        # Apply category filter
-        if filters.category:
-            query = query.where(SentGrievanceLetter.category == filters.category)
-        
-        # Apply grievance_id filter
-        if filters.grievance_id:
-            query = query.where(SentGrievanceLetter.grievance_id == filters.grievance_id)
-        
-        # Apply assigned_to filter
-        if filters.assigned_to:
-            query = query.where(SentGrievanceLetter.assigned_to == filters.assigned_to)
-        
-        # Apply date range filters
-        if filters.date_from:
-            query = query.where(SentGrievanceLetter.sent_date >= filters.date_from)
-        if filters.date_to:
-            query = query.where(SentGrievanceLetter.sent_date <= filters.date_to)
+        query = apply_sent_grievance_letter_filters(query, filters)
         
         # Get total count for pagination
         total_query = select(func.count()).select_from(query.subquery())
@@ -189,9 +200,12 @@ def update_sent_grievance_letter(
             setattr(db_letter, field, value)
         
         db.add(db_letter)
+        sync_letter_followup(db, db_letter)
         db.commit()
         db.refresh(db_letter)
         logger.info(f"Updated sent grievance letter with ID: {db_letter.id}")
+        if "subject" in update_data:
+            enqueue_pretranslation(db, "sent_grievance_letter", db_letter)
         return db_letter
     except Exception as e:
         db.rollback()
@@ -213,6 +227,8 @@ def delete_sent_grievance_letter(
         if not db_letter:
             return False
         
+        remove_letter_followup(db, db_letter)
+        delete_translations(db, "sent_grievance_letter", [db_letter.id])
         db.delete(db_letter)
         db.commit()
         logger.info(f"Deleted sent grievance letter with ID: {letter_id}")
@@ -224,108 +240,44 @@ def delete_sent_grievance_letter(
 
 def get_sent_grievance_letter_statistics(
     db: Session, 
-    tenant_id: Optional[str] = None
+    tenant_id: Optional[str] = None,
+    user: Optional[User] = None
 ) -> SentGrievanceLetterStatistics:
-    """Get statistics for sent grievance letters"""
+    """Get statistics for sent grievance letters, filtered by the user's access scope"""
     try:
-        base_query = select(SentGrievanceLetter)
-        if tenant_id:
-            base_query = base_query.where(SentGrievanceLetter.tenant_id == tenant_id)
-        
-        # Total letters
-        total_letters = db.exec(select(func.count()).select_from(base_query.subquery())).first() or 0
-        
-        # Status counts
-        awaiting = db.exec(
-            select(func.count()).select_from(
-                base_query.where(SentGrievanceLetter.status == SentGrievanceLetterStatus.AWAITING).subquery()
-            )
-        ).first() or 0
-        
-        response_received = db.exec(
-            select(func.count()).select_from(
-                base_query.where(SentGrievanceLetter.status == SentGrievanceLetterStatus.RESPONSE_RECEIVED).subquery()
-            )
-        ).first() or 0
-        
-        closed = db.exec(
-            select(func.count()).select_from(
-                base_query.where(SentGrievanceLetter.status == SentGrievanceLetterStatus.CLOSED).subquery()
-            )
-        ).first() or 0
-        
-        # Priority counts
-        high_priority = db.exec(
-            select(func.count()).select_from(
-                base_query.where(SentGrievanceLetter.priority == SentGrievanceLetterPriority.HIGH).subquery()
-            )
-        ).first() or 0
-        
-        medium_priority = db.exec(
-            select(func.count()).select_from(
-                base_query.where(SentGrievanceLetter.priority == SentGrievanceLetterPriority.MEDIUM).subquery()
-            )
-        ).first() or 0
-        
-        low_priority = db.exec(
-            select(func.count()).select_from(
-                base_query.where(SentGrievanceLetter.priority == SentGrievanceLetterPriority.LOW).subquery()
-            )
-        ).first() or 0
-        
-        # Overdue follow-ups
+        predicate = letter_scope_predicate(SentGrievanceLetter, user, tenant_id)
         today = datetime.now(timezone.utc).date()
-        overdue_followups = db.exec(
-            select(func.count()).select_from(
-                base_query.where(
-                    and_(
-                        SentGrievanceLetter.follow_up_date < today,
-                        SentGrievanceLetter.status != SentGrievanceLetterStatus.CLOSED
-                    )
-                ).subquery()
-            )
-        ).first() or 0
-        
-        # Follow-ups due this week
-        week_from_now = today + timedelta(days=7)
-        followups_due_this_week = db.exec(
-            select(func.count()).select_from(
-                base_query.where(
-                    and_(
-                        SentGrievanceLetter.follow_up_date >= today,
-                        SentGrievanceLetter.follow_up_date <= week_from_now,
-                        SentGrievanceLetter.status != SentGrievanceLetterStatus.CLOSED
-                    )
-                ).subquery()
-            )
-        ).first() or 0
+        counts = count_letters(db, SentGrievanceLetter, predicate, now=today)
         
-        # Average closure time
-        closed_letters = db.exec(
-            base_query.where(
-                and_(
-                    SentGrievanceLetter.status == SentGrievanceLetterStatus.CLOSED,
-                    SentGrievanceLetter.closure_date.isnot(None)
-                )
+        # Average closure time (only the two dates are loaded)
+        closure_query = select(SentGrievanceLetter.sent_date, SentGrievanceLetter.closure_date).where(
+            and_(
+                SentGrievanceLetter.status == SentGrievanceLetterStatus.CLOSED,
+                SentGrievanceLetter.closure_date.isnot(None)
             )
-        ).all()
+        )
+        if predicate is not None:
+            closure_query = closure_query.where(predicate)
+        closure_dates = db.exec(closure_query).all()
         
         average_closure_time_days = None
-        if closed_letters:
-            total_days = 0
-            for letter in closed_letters:
-                if letter.closure_date and letter.sent_date:
-                    days = (letter.closure_date - letter.sent_date).days
-                    total_days += days
-            average_closure_time_days = total_days / len(closed_letters)
+        if closure_dates:
+            total_days = sum(
+                (closure_date - sent_date).days
+                for sent_date, closure_date in closure_dates
+                if closure_date and sent_date
+            )
+            average_closure_time_days = total_days / len(closure_dates)
         
         # Top categories
+        category_query = select(
+            SentGrievanceLetter.category,
+            func.count(SentGrievanceLetter.id).label('count')
+        )
+        if predicate is not None:
+            category_query = category_query.where(predicate)
         category_counts = db.exec(
-            select(
-                SentGrievanceLetter.category,
-                func.count(SentGrievanceLetter.id).label('count')
-            )
-            .select_from(base_query.subquery())
+            category_query
             .group_by(SentGrievanceLetter.category)
             .order_by(desc('count'))
             .limit(5)
@@ -337,15 +289,15 @@ def get_sent_grievance_letter_statistics(
         ]
         
         return SentGrievanceLetterStatistics(
-            total_letters=total_letters,
-            awaiting=awaiting,
-            response_received=response_received,
-            closed=closed,
-            high_priority=high_priority,
-            medium_priority=medium_priority,
-            low_priority=low_priority,
-            overdue_followups=overdue_followups,
-            followups_due_this_week=followups_due_this_week,
+            total_letters=counts["total"],
+            awaiting=counts["status"][SentGrievanceLetterStatus.AWAITING],
+            response_received=counts["status"][SentGrievanceLetterStatus.RESPONSE_RECEIVED],
+            closed=counts["status"][SentGrievanceLetterStatus.CLOSED],
+            high_priority=counts["priority"][SentGrievanceLetterPriority.HIGH],
+            medium_priority=counts["priority"][SentGrievanceLetterPriority.MEDIUM],
+            low_priority=counts["priority"][SentGrievanceLetterPriority.LOW],
+            overdue_followups=counts["overdue"],
+            followups_due_this_week=counts["due_this_week"],
             average_closure_time_days=average_closure_time_days,
             top_categories=top_categories
         )
@@ -389,18 +341,12 @@ def get_overdue_followups(
     db: Session, 
     tenant_id: Optional[str] = None
 ) -> List[SentGrievanceLetter]:
-    """Get overdue follow-up letters"""
+    """Get overdue follow-up letters (read from the follow-up schedule)"""
     try:
-        today = datetime.utcnow().date()
-        query = select(SentGrievanceLetter).where(
-            and_(
-                SentGrievanceLetter.follow_up_date < today,
-                SentGrievanceLetter.status != SentGrievanceLetterStatus.CLOSED
-            )
+        today = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+        query = followup_letters_query(
+            FollowUpLetterType.SENT_GRIEVANCE_LETTER, due_before=today, tenant_id=tenant_id
         )
-        if tenant_id:
-            query = query.where(SentGrievanceLetter.tenant_id == tenant_id)
-        query = query.order_by(SentGrievanceLetter.follow_up_date)
         return db.exec(query).all()
     except Exception as e:
         logger.error(f"Error fetching overdue followups: {str(e)}")
@@ -410,20 +356,12 @@ def get_followups_due_this_week(
     db: Session, 
     tenant_id: Optional[str] = None
 ) -> List[SentGrievanceLetter]:
-    """Get follow-ups due this week"""
+    """Get follow-ups due this week (read from the follow-up schedule)"""
     try:
-        today = datetime.utcnow().date()
-        week_from_now = today + timedelta(days=7)
-        query = select(SentGrievanceLetter).where(
-            and_(
-                SentGrievanceLetter.follow_up_date >= today,
-                SentGrievanceLetter.follow_up_date <= week_from_now,
-                SentGrievanceLetter.status != SentGrievanceLetterStatus.CLOSED
-            )
+        today = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+        query = followup_letters_query(
+            FollowUpLetterType.SENT_GRIEVANCE_LETTER, due_from=today, due_before=today + timedelta(days=7), tenant_id=tenant_id
         )
-        if tenant_id:
-            query = query.where(SentGrievanceLetter.tenant_id == tenant_id)
-        query = query.order_by(SentGrievanceLetter.follow_up_date)
         return db.exec(query).all()
     except Exception as e:
         logger.error(f"Error fetching followups due this week: {str(e)}")
@@ -451,6 +389,7 @@ def assign_sent_grievance_letter_to_user(
         db_letter.updated_at = datetime.utcnow()
         
         db.add(db_letter)
+        sync_letter_followup(db, db_letter)
         db.commit()
         db.refresh(db_letter)
         logger.info(f"Assigned sent grievance letter {letter_id} to user {assigned_user_id}")
@@ -486,6 +425,7 @@ def update_sent_grievance_letter_status(
             db_letter.closure_date = datetime.utcnow()
         
         db.add(db_letter)
+        sync_letter_followup(db, db_letter)
         db.commit()
         db.refresh(db_letter)
         logger.info(f"Updated sent grievance letter {letter_id} status to {status}")
@@ -519,6 +459,7 @@ def record_response_received(
         db_letter.updated_at = datetime.utcnow()
         
         db.add(db_letter)
+        sync_letter_followup(db, db_letter)
         db.commit()
         db.refresh(db_letter)
         logger.info(f"Recorded response for sent grievance letter {letter_id}")
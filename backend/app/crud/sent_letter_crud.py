@@ -4,6 +4,11 @@ from datetime import datetime, timedelta
 import logging
 from app.models.sent_letter import SentLetter, SentLetterStatus, SentLetterPriority, SentLetterCategory
 from app.schemas.sent_letter_schema import SentLetterCreate, SentLetterUpdate, SentLetterFilters, SentLetterStatistics
+from app.crud.content_translation_crud import enqueue_pretranslation, delete_translations
+from app.crud.letter_statistics_crud import count_letters, letter_scope_predicate
+from app.crud.letter_followup_crud import sync_letter_followup, remove_letter_followup, followup_letters_query
+from app.models.letter_followup import FollowUpLetterType
+from app.models.user import User
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +30,11 @@ def create_sent_letter(db: Session, letter_data: SentLetterCreate, user_id: str,
             updated_by=user_id
         )
         db.add(db_letter)
+        sync_letter_followup(db, db_letter)
         db.commit()
         db.refresh(db_letter)
         logger.info(f"Created sent letter with ID: {db_letter.id}")
+        enqueue_pretranslation(db, "sent_letter", db_letter)
         return db_letter
     except Exception as e:
         db.rollback()
@@ -62,6 +69,44 @@ def get_all_sent_letters(
         logger.error(f"Error fetching sent letters: {str(e)}")
         raise
 
+def apply_sent_letter_filters(query, filters: SentLetterFilters):
+    """Apply the search, status, priority, category, assignee and sent date filters to a query"""
+    # Apply search filter
+    if filters.search:
+        search_term = f"%{filters.search}%"
+        query = query.where(
+            or_(
+                SentLetter.recipient_name.ilike(search_term),
+                SentLetter.recipient_organization.ilike(search_term),
+                SentLetter.subject.ilike(search_term),
+                SentLetter.content.ilike(search_term),
+                SentLetter.category.ilike(search_term)
+            )
+        )
+
+    # Apply status filter
+    if filters.status:
+        query = query.where(SentLetter.status == filters.status)
+
+    # Apply priority filter
+    if filters.priority:
+        query = query.where(SentLetter.priority == filters.priority)
+
+    # Apply category filter
+    if filters.category:
+        query = query.where(SentLetter.category == filters.category)
+
+    # Apply assigned_to filter
+    if filters.assigned_to:
+        query = query.where(SentLetter.assigned_to == filters.assigned_to)
+
+    # Apply date range filters
+    if filters.date_from:
+        query = query.where(SentLetter.sent_date >= filters.date_from)
+    if filters.date_to:
+        query = query.where(SentLetter.sent_date <= filters.date_to)
+    return query
+
 def get_filtered_sent_letters(
     db: Session, 
     filters: SentLetterFilters, 
@@ -95,71 +140,14 @@ def get_filtered_sent_letters(
             # Fallback to tenant filtering if provided
             query = query.where(SentLetter.tenant_id == tenant_id)
         
-        # Apply search filter
-        if filters.search:
-            search_term = f"%{filters.search}%"
-            query = query.where(
-                or_(
-                    SentLetter.recipient_name.ilike(search_term),
-                    SentLetter.recipient_organization.ilike(search_term),
-                    SentLetter.subject.ilike(search_term),
-                    SentLetter.content.ilike(search_term),
-                    SentLetter.category.ilike(search_term)
-                )
-            )
-        
-        # Apply status filter
-        if filters.status:
-            query = query.where(SentLetter.status == filters.status)
-        
-        # Apply priority filter
-        if filters.priority:
-            query = query.where(SentLetter.priority == filters.priority)
-        
-        # Apply category filter
-        if filters.category:
-            query = query.where(SentLetter.category == filters.category)
-        
-        # Apply assigned_to filter
-        if filters.assigned_to:
-            query = query.where(SentLetter.assigned_to == filters.assigned_to)
-        
-        # Apply date range filters
-        if filters.date_from:
-            query = query.where(SentLetter.sent_date >= filters.date_from)
-        if filters.date_to:
-            query = query.where(SentLetter.sent_date <= filters.date_to)
+        query = apply_sent_letter_filters(query, filters)
         
         # Get total count for pagination
         count_query = select(func.count(SentLetter.id))
         if tenant_id:
             count_query = count_query.where(SentLetter.tenant_id == tenant_id)
         
-        # Apply same filters as main query
-        if filters.search:
-            search_term = f"%{filters.search}%"
-            count_query = count_query.where(
-                or_(
-                    SentLetter.recipient_name.ilike(search_term),
-                    SentLetter.recipient_organization.ilike(search_term),
-                    SentLetter.subject.ilike(search_term),
-                    SentLetter.content.ilike(search_term),
-                    SentLetter.category.ilike(search_term)
-                )
-            )
-        
-        if filters.status:
-            count_query = count_query.where(SentLetter.status == filters.status)
-        if filters.priority:
-            count_query = count_query.where(SentLetter.priority == filters.priority)
-        if filters.category:
-            count_query = count_query.where(SentLetter.category == filters.category)
-        if filters.assigned_to:
-            count_query = count_query.where(SentLetter.assigned_to == filters.assigned_to)
-        if filters.date_from:
-            count_query = count_query.where(SentLetter.sent_date >= filters.date_from)
-        if filters.date_to:
-            count_query = count_query.where(SentLetter.sent_date <= filters.date_to)
+        count_query = apply_sent_letter_filters(count_query, filters)
         
         total = db.exec(count_query).first()
         
@@ -203,9 +191,12 @@ def update_sent_letter(
             setattr(db_letter, field, value)
         
         db.add(db_letter)
+        sync_letter_followup(db, db_letter)
         db.commit()
         db.refresh(db_letter)
         logger.info(f"Updated sent letter with ID: {letter_id}")
+        if "subject" in update_data:
+            enqueue_pretranslation(db, "sent_letter", db_letter)
         return db_letter
     except Exception as e:
         db.rollback()
@@ -219,6 +210,8 @@ def delete_sent_letter(db: Session, letter_id: int, tenant_id: Optional[str] = N
         if not db_letter:
             return False
         
+        remove_letter_followup(db, db_letter)
+        delete_translations(db, "sent_letter", [db_letter.id])
         db.delete(db_letter)
         db.commit()
         logger.info(f"Deleted sent letter with ID: {letter_id}")
@@ -228,105 +221,25 @@ def delete_sent_letter(db: Session, letter_id: int, tenant_id: Optional[str] = N
         logger.error(f"Error deleting sent letter {letter_id}: {str(e)}")
         raise
 
-def get_sent_letter_statistics(db: Session, tenant_id: Optional[str] = None, user_id: Optional[str] = None, user_role: Optional[str] = None) -> SentLetterStatistics:
-    """Get statistics for sent letters with role-based filtering"""
+def get_sent_letter_statistics(
+    db: Session,
+    tenant_id: Optional[str] = None,
+    user: Optional[User] = None,
+    all_tenants: bool = False
+) -> SentLetterStatistics:
+    """Get statistics for sent letters in one query, filtered by the user's access scope"""
     try:
-        base_query = select(SentLetter)
-        
-        # Apply role-based filtering
-        if user_role == "super_admin":
-            # Super admin sees all letters
-            pass
-        elif user_role == "admin" and tenant_id:
-            # Admin sees letters from their tenant
-            base_query = base_query.where(SentLetter.tenant_id == tenant_id)
-        elif user_role in ["field_agent", "assistant"] and user_id:
-            # Field agents see only their assigned/created letters
-            base_query = base_query.where(
-                or_(
-                    SentLetter.assigned_to == user_id,
-                    SentLetter.created_by == user_id
-                )
-            )
-        elif user_role == "regular_user" and user_id:
-            # Regular users see only their created letters
-            base_query = base_query.where(SentLetter.created_by == user_id)
-        elif tenant_id:
-            # Fallback to tenant filtering if provided
-            base_query = base_query.where(SentLetter.tenant_id == tenant_id)
-        
-        # Total letters
-        total_query = select(func.count(SentLetter.id))
-        if tenant_id:
-            total_query = total_query.where(SentLetter.tenant_id == tenant_id)
-        total_letters = db.exec(total_query).first()
-        
-        # Status counts
-        awaiting_query = select(func.count(SentLetter.id)).where(SentLetter.status == SentLetterStatus.AWAITING_RESPONSE)
-        if tenant_id:
-            awaiting_query = awaiting_query.where(SentLetter.tenant_id == tenant_id)
-        awaiting_response = db.exec(awaiting_query).first()
-        
-        response_query = select(func.count(SentLetter.id)).where(SentLetter.status == SentLetterStatus.RESPONSE_RECEIVED)
-        if tenant_id:
-            response_query = response_query.where(SentLetter.tenant_id == tenant_id)
-        response_received = db.exec(response_query).first()
-        
-        closed_query = select(func.count(SentLetter.id)).where(SentLetter.status == SentLetterStatus.CLOSED)
-        if tenant_id:
-            closed_query = closed_query.where(SentLetter.tenant_id == tenant_id)
-        closed = db.exec(closed_query).first()
-        
-        # Priority counts
-        high_query = select(func.count(SentLetter.id)).where(SentLetter.priority == SentLetterPriority.HIGH)
-        if tenant_id:
-            high_query = high_query.where(SentLetter.tenant_id == tenant_id)
-        high_priority = db.exec(high_query).first()
-        
-        medium_query = select(func.count(SentLetter.id)).where(SentLetter.priority == SentLetterPriority.MEDIUM)
-        if tenant_id:
-            medium_query = medium_query.where(SentLetter.tenant_id == tenant_id)
-        medium_priority = db.exec(medium_query).first()
-        
-        low_query = select(func.count(SentLetter.id)).where(SentLetter.priority == SentLetterPriority.LOW)
-        if tenant_id:
-            low_query = low_query.where(SentLetter.tenant_id == tenant_id)
-        low_priority = db.exec(low_query).first()
-        
-        # Overdue follow-ups (follow_up_date is past and status is not closed)
-        overdue_query = select(func.count(SentLetter.id)).where(
-            and_(
-                SentLetter.follow_up_date < datetime.utcnow(),
-                SentLetter.status != SentLetterStatus.CLOSED
-            )
-        )
-        if tenant_id:
-            overdue_query = overdue_query.where(SentLetter.tenant_id == tenant_id)
-        overdue_followups = db.exec(overdue_query).first()
-        
-        # Follow-ups due this week
-        week_from_now = datetime.utcnow() + timedelta(days=7)
-        week_query = select(func.count(SentLetter.id)).where(
-            and_(
-                SentLetter.follow_up_date >= datetime.utcnow(),
-                SentLetter.follow_up_date <= week_from_now,
-                SentLetter.status != SentLetterStatus.CLOSED
-            )
-        )
-        if tenant_id:
-            week_query = week_query.where(SentLetter.tenant_id == tenant_id)
-        followups_due_this_week = db.exec(week_query).first()
-        
+        counts = count_letters(db, SentLetter, letter_scope_predicate(SentLetter, user, tenant_id, all_tenants))
         return SentLetterStatistics(
-            total_letters=total_letters,
-            awaiting_response=awaiting_response,
-            response_received=response_received,
-            closed=closed,
-            high_priority=high_priority,
-            medium_priority=medium_priority,
-            low_priority=low_priority,
-            overdue_followups=overdue_followups,
-            followups_due_this_week=followups_due_this_week
+            total_letters=counts["total"],
+            awaiting_response=counts["status"][SentLetterStatus.AWAITING_RESPONSE],
+            response_received=counts["status"][SentLetterStatus.RESPONSE_RECEIVED],
+            closed=counts["status"][SentLetterStatus.CLOSED],
+            high_priority=counts["priority"][SentLetterPriority.HIGH],
+            medium_priority=counts["priority"][SentLetterPriority.MEDIUM],
+            low_priority=counts["priority"][SentLetterPriority.LOW],
+            overdue_followups=counts["overdue"],
+            followups_due_this_week=counts["due_this_week"]
         )
     except Exception as e:
         logger.error(f"Error fetching sent letter statistics: {str(e)}")
@@ -357,36 +270,23 @@ def get_sent_letters_by_priority(db: Session, priority: SentLetterPriority, tena
         raise
 
 def get_overdue_followups(db: Session, tenant_id: Optional[str] = None) -> List[SentLetter]:
-    """Get sent letters with overdue follow-ups"""
+    """Get sent letters with overdue follow-ups (read from the follow-up schedule)"""
     try:
-        query = select(SentLetter).where(
-            and_(
-                SentLetter.follow_up_date < datetime.utcnow(),
-                SentLetter.status != SentLetterStatus.CLOSED
-            )
+        query = followup_letters_query(
+            FollowUpLetterType.SENT_LETTER, due_before=datetime.utcnow(), tenant_id=tenant_id
         )
-        if tenant_id:
-            query = query.where(SentLetter.tenant_id == tenant_id)
-        query = query.order_by(SentLetter.follow_up_date)
         return db.exec(query).all()
     except Exception as e:
         logger.error(f"Error fetching overdue followups: {str(e)}")
         raise
 
 def get_followups_due_this_week(db: Session, tenant_id: Optional[str] = None) -> List[SentLetter]:
-    """Get sent letters with follow-ups due this week"""
+    """Get sent letters with follow-ups due this week (read from the follow-up schedule)"""
     try:
-        week_from_now = datetime.utcnow() + timedelta(days=7)
-        query = select(SentLetter).where(
-            and_(
-                SentLetter.follow_up_date >= datetime.utcnow(),
-                SentLetter.follow_up_date <= week_from_now,
-                SentLetter.status != SentLetterStatus.CLOSED
-            )
+        now = datetime.utcnow()
+        query = followup_letters_query(
+            FollowUpLetterType.SENT_LETTER, due_from=now, due_before=now + timedelta(days=7), tenant_id=tenant_id
         )
-        if tenant_id:
-            query = query.where(SentLetter.tenant_id == tenant_id)
-        query = query.order_by(SentLetter.follow_up_date)
         return db.exec(query).all()
     except Exception as e:
         logger.error(f"Error fetching followups due this week: {str(e)}")
@@ -404,6 +304,7 @@ def assign_sent_letter_to_user(db: Session, letter_id: int, user_id: str, assign
         db_letter.updated_by = user_id
         
         db.add(db_letter)
+        sync_letter_followup(db, db_letter)
         db.commit()
         db.refresh(db_letter)
         logger.info(f"Assigned sent letter {letter_id} to user {assigned_user_id}")
@@ -429,6 +330,7 @@ def update_sent_letter_status(db: Session, letter_id: int, status: SentLetterSta
             db_letter.response_received_date = datetime.utcnow()
         
         db.add(db_letter)
+        sync_letter_followup(db, db_letter)
         db.commit()
         db.refresh(db_letter)
         logger.info(f"Updated sent letter {letter_id} status to {status}")
@@ -452,6 +354,7 @@ def record_response_received(db: Session, letter_id: int, response_content: str,
         db_letter.updated_by = user_id
         
         db.add(db_letter)
+        sync_letter_followup(db, db_letter)
         db.commit()
         db.refresh(db_letter)
         logger.info(f"Recorded response received for sent letter {letter_id}")
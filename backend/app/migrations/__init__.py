@@ -0,0 +1,12 @@
+# app/migrations/__init__.py
+# Versioned schema migrations; importing the package registers every migration
+
+from .runner import (
+    SchemaVersionError,
+    check_schema_version,
+    get_schema_version,
+    get_status,
+    latest_version,
+    upgrade,
+)
+from . import versions
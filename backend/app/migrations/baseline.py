@@ -0,0 +1,352 @@
+"""
+Baseline Schema
+The tables as they stood when versioned migrations were introduced, frozen so that
+migration 1 creates the same schema however the models change later. Never edit
+this file; every later schema change is a migration of its own in versions.py.
+
+tenant.translation_languages is left out (migration 2 adds it), and
+schema_migrations is created by the runner.
+"""
+
+from sqlalchemy import (
+    MetaData, Table, Column, ForeignKey, Index, UniqueConstraint,
+    Boolean, Date, DateTime, Enum, Float, Integer, String, Text, Time, func
+)
+from sqlmodel import AutoString
+
+baseline_metadata = MetaData()
+
+Table(
+    'background_jobs', baseline_metadata,
+    Column('id', String(36), primary_key=True),
+    Column('job_type', AutoString(100), nullable=False, index=True),
+    Column('payload', Text, nullable=True),
+    Column('status', Enum('QUEUED', 'RUNNING', 'SUCCEEDED', 'FAILED', name='jobstatus'), nullable=False),
+    Column('attempts', Integer, nullable=False),
+    Column('max_attempts', Integer, nullable=False),
+    Column('run_after', DateTime, nullable=False),
+    Column('last_error', Text, nullable=True),
+    Column('locked_by', AutoString(100), nullable=True),
+    Column('locked_at', DateTime, nullable=True),
+    Column('created_at', DateTime, nullable=False, server_default=func.now()),
+    Column('updated_at', DateTime, nullable=False, server_default=func.now()),
+    Column('finished_at', DateTime, nullable=True),
+    Index('ix_background_jobs_status_run_after', 'status', 'run_after')
+)
+
+Table(
+    'content_translations', baseline_metadata,
+    Column('id', String(36), primary_key=True),
+    Column('entity_type', AutoString(50), nullable=False),
+    Column('entity_id', AutoString(36), nullable=False),
+    Column('field', AutoString(50), nullable=False),
+    Column('language', AutoString(10), nullable=False),
+    Column('source_hash', AutoString(64), nullable=False),
+    Column('translated_text', Text, nullable=False),
+    Column('tenant_id', AutoString(36), nullable=True, index=True),
+    Column('created_at', DateTime, nullable=False, server_default=func.now()),
+    Column('updated_at', DateTime, nullable=False, server_default=func.now()),
+    Index('ix_content_translations_lookup', 'entity_type', 'language', 'entity_id'),
+    UniqueConstraint('entity_type', 'entity_id', 'field', 'language', name='uq_content_translations_field_language')
+)
+
+Table(
+    'issue_categories', baseline_metadata,
+    Column('id', String(36), primary_key=True),
+    Column('name', AutoString, nullable=False, index=True, unique=True)
+)
+
+Table(
+    'outbound_emails', baseline_metadata,
+    Column('id', String(36), primary_key=True),
+    Column('to_email', AutoString(255), nullable=False),
+    Column('subject', AutoString(255), nullable=False),
+    Column('body', Text, nullable=True),
+    Column('sensitive', Boolean, nullable=False),
+    Column('status', Enum('QUEUED', 'SENDING', 'SENT', 'FAILED', name='outboundemailstatus'), nullable=False),
+    Column('attempts', Integer, nullable=False),
+    Column('max_attempts', Integer, nullable=False),
+    Column('next_attempt_at', DateTime, nullable=False),
+    Column('last_error', Text, nullable=True),
+    Column('claim_token', AutoString(36), nullable=True),
+    Column('claimed_at', DateTime, nullable=True),
+    Column('created_at', DateTime, nullable=False, server_default=func.now()),
+    Column('updated_at', DateTime, nullable=False, server_default=func.now()),
+    Column('sent_at', DateTime, nullable=True),
+    Index('ix_outbound_emails_status_next_attempt', 'status', 'next_attempt_at')
+)
+
+Table(
+    'permissions', baseline_metadata,
+    Column('id', String(36), primary_key=True),
+    Column('name', AutoString, nullable=False, index=True, unique=True),
+    Column('display_name', AutoString, nullable=False),
+    Column('category', Enum('SYSTEM', 'TENANT', 'USER', 'ISSUE', 'VISIT', 'AREA', 'REPORT', 'SETTINGS', name='permissioncategory'), nullable=False, index=True),
+    Column('description', AutoString, nullable=True),
+    Column('is_active', Boolean, nullable=False, index=True),
+    Column('is_system_permission', Boolean, nullable=False),
+    Column('scope', AutoString, nullable=False, index=True),
+    Column('created_at', DateTime, nullable=False, server_default=func.now()),
+    Column('updated_at', DateTime, nullable=False, server_default=func.now())
+)
+
+Table(
+    'received_letters', baseline_metadata,
+    Column('id', Integer, primary_key=True),
+    Column('sender', AutoString(255), nullable=False),
+    Column('sender_email', AutoString(255), nullable=True),
+    Column('sender_phone', AutoString(20), nullable=True),
+    Column('sender_address', AutoString(500), nullable=True),
+    Column('subject', AutoString(500), nullable=False),
+    Column('content', Text, nullable=True),
+    Column('category', Enum('EDUCATION', 'HEALTH', 'INFRASTRUCTURE', 'POLICY', 'BUSINESS', 'ENVIRONMENT', 'SOCIAL_WELFARE', 'OTHER', name='lettercategory'), nullable=False),
+    Column('priority', Enum('HIGH', 'MEDIUM', 'LOW', name='letterpriority'), nullable=False),
+    Column('status', Enum('NEW', 'UNDER_REVIEW', 'REPLIED', 'CLOSED', name='letterstatus'), nullable=False),
+    Column('received_date', DateTime, nullable=False),
+    Column('due_date', DateTime, nullable=True),
+    Column('assigned_to', AutoString, nullable=True),
+    Column('response_content', Text, nullable=True),
+    Column('response_date', DateTime, nullable=True),
+    Column('attachments', AutoString(2000), nullable=True),
+    Column('notes', AutoString, nullable=True),
+    Column('tenant_id', AutoString, nullable=True),
+    Column('created_at', DateTime, nullable=False),
+    Column('updated_at', DateTime, nullable=False),
+    Column('created_by', AutoString, nullable=True),
+    Column('updated_by', AutoString, nullable=True)
+)
+
+Table(
+    'roles', baseline_metadata,
+    Column('id', String(36), primary_key=True),
+    Column('name', AutoString, nullable=False, index=True, unique=True),
+    Column('role_type', Enum('SUPER_ADMIN', 'ADMIN', 'MEMBER', name='roletype'), nullable=False, index=True),
+    Column('scope', Enum('GLOBAL', 'TENANT', 'AREA', name='rolescope'), nullable=False, index=True),
+    Column('description', AutoString, nullable=True),
+    Column('is_active', Boolean, nullable=False, index=True),
+    Column('is_system_role', Boolean, nullable=False),
+    Column('parent_role_id', AutoString, ForeignKey('roles.id'), nullable=True),
+    Column('created_at', DateTime, nullable=False, server_default=func.now()),
+    Column('updated_at', DateTime, nullable=False, server_default=func.now())
+)
+
+Table(
+    'sent_grievance_letters', baseline_metadata,
+    Column('id', Integer, primary_key=True),
+    Column('grievance_id', AutoString, nullable=False),
+    Column('recipient_name', AutoString(255), nullable=False),
+    Column('recipient_email', AutoString(255), nullable=True),
+    Column('recipient_phone', AutoString(20), nullable=True),
+    Column('recipient_address', AutoString(500), nullable=True),
+    Column('recipient_organization', AutoString(255), nullable=True),
+    Column('subject', AutoString(500), nullable=False),
+    Column('content', Text, nullable=True),
+    Column('category', Enum('EDUCATION', 'HEALTH', 'INFRASTRUCTURE', 'POLICY', 'BUSINESS', 'ENVIRONMENT', 'SOCIAL_WELFARE', 'PUBLIC_SAFETY', 'TRANSPORTATION', 'UTILITIES', 'OTHER', name='sentgrievancelettercategory'), nullable=False),
+    Column('priority', Enum('HIGH', 'MEDIUM', 'LOW', name='sentgrievanceletterpriority'), nullable=False),
+    Column('status', Enum('AWAITING', 'RESPONSE_RECEIVED', 'CLOSED', name='sentgrievanceletterstatus'), nullable=False),
+    Column('sent_date', DateTime, nullable=False),
+    Column('follow_up_date', DateTime, nullable=True),
+    Column('response_received_date', DateTime, nullable=True),
+    Column('response_content', Text, nullable=True),
+    Column('closure_date', DateTime, nullable=True),
+    Column('assigned_to', AutoString, nullable=True),
+    Column('attachments', AutoString, nullable=True),
+    Column('notes', Text, nullable=True),
+    Column('tenant_id', AutoString, nullable=True),
+    Column('created_at', DateTime, nullable=False),
+    Column('updated_at', DateTime, nullable=False),
+    Column('created_by', AutoString, nullable=True),
+    Column('updated_by', AutoString, nullable=True)
+)
+
+Table(
+    'sent_letters', baseline_metadata,
+    Column('id', Integer, primary_key=True),
+    Column('recipient_name', AutoString(255), nullable=False),
+    Column('recipient_email', AutoString(255), nullable=True),
+    Column('recipient_phone', AutoString(20), nullable=True),
+    Column('recipient_address', AutoString(500), nullable=True),
+    Column('recipient_organization', AutoString(255), nullable=True),
+    Column('subject', AutoString(500), nullable=False),
+    Column('content', Text, nullable=True),
+    Column('category', Enum('EDUCATION', 'HEALTH', 'INFRASTRUCTURE', 'POLICY', 'BUSINESS', 'ENVIRONMENT', 'SOCIAL_WELFARE', 'PUBLIC_SAFETY', 'TRANSPORTATION', 'UTILITIES', 'OTHER', name='sentlettercategory'), nullable=False),
+    Column('priority', Enum('HIGH', 'MEDIUM', 'LOW', name='sentletterpriority'), nullable=False),
+    Column('status', Enum('AWAITING_RESPONSE', 'RESPONSE_RECEIVED', 'CLOSED', name='sentletterstatus'), nullable=False),
+    Column('sent_date', DateTime, nullable=False),
+    Column('follow_up_date', DateTime, nullable=True),
+    Column('response_received_date', DateTime, nullable=True),
+    Column('response_content', Text, nullable=True),
+    Column('assigned_to', AutoString, nullable=True),
+    Column('attachments', AutoString, nullable=True),
+    Column('documents', AutoString, nullable=True),
+    Column('notes', AutoString, nullable=True),
+    Column('tenant_id', AutoString, nullable=True),
+    Column('created_at', DateTime, nullable=False),
+    Column('updated_at', DateTime, nullable=False),
+    Column('created_by', AutoString, nullable=True),
+    Column('updated_by', AutoString, nullable=True)
+)
+
+Table(
+    'tenant', baseline_metadata,
+    Column('id', String(36), primary_key=True),
+    Column('name', AutoString, nullable=False, index=True, unique=True),
+    Column('email', AutoString, nullable=False, index=True, unique=True),
+    Column('phone', AutoString, nullable=True),
+    Column('password', AutoString, nullable=False),
+    Column('plain_password', AutoString, nullable=True),
+    Column('status', Enum('ACTIVE', 'INACTIVE', name='tenantstatus'), nullable=False, index=True),
+    Column('created_at', DateTime, nullable=False, server_default=func.now()),
+    Column('updated_at', DateTime, nullable=False, server_default=func.now())
+)
+
+Table(
+    'translation_cache', baseline_metadata,
+    Column('id', String(36), primary_key=True),
+    Column('source_lang', AutoString(10), nullable=False),
+    Column('target_lang', AutoString(10), nullable=False),
+    Column('text_hash', AutoString(64), nullable=False),
+    Column('source_text', Text, nullable=False),
+    Column('translated_text', Text, nullable=False),
+    Column('created_at', DateTime, nullable=False, server_default=func.now()),
+    UniqueConstraint('source_lang', 'target_lang', 'text_hash', name='uq_translation_cache_lookup')
+)
+
+Table(
+    'areas', baseline_metadata,
+    Column('id', String(36), primary_key=True),
+    Column('name', AutoString, nullable=False, index=True),
+    Column('description', AutoString, nullable=True),
+    Column('tenant_id', AutoString, ForeignKey('tenant.id'), nullable=False, index=True),
+    Column('geojson_data', AutoString, nullable=True),
+    Column('latitude', Float, nullable=True),
+    Column('longitude', Float, nullable=True),
+    Column('is_active', Boolean, nullable=False, index=True),
+    Column('created_at', DateTime, nullable=False, server_default=func.now()),
+    Column('updated_at', DateTime, nullable=False, server_default=func.now())
+)
+
+Table(
+    'role_permissions', baseline_metadata,
+    Column('id', String(36), primary_key=True),
+    Column('role_id', AutoString, ForeignKey('roles.id'), nullable=False, index=True),
+    Column('permission_id', AutoString, ForeignKey('permissions.id'), nullable=False, index=True),
+    Column('created_at', DateTime, nullable=False, server_default=func.now())
+)
+
+Table(
+    'users', baseline_metadata,
+    Column('id', String(36), primary_key=True),
+    Column('name', AutoString, nullable=False),
+    Column('email', AutoString, nullable=False, index=True, unique=True),
+    Column('password_hash', AutoString, nullable=False),
+    Column('plain_password', AutoString, nullable=True),
+    Column('phone', AutoString, nullable=True),
+    Column('profile_picture', AutoString, nullable=True),
+    Column('status', AutoString, nullable=True, index=True),
+    Column('language_preference', AutoString, nullable=True),
+    Column('role_id', AutoString, ForeignKey('roles.id'), nullable=True, index=True),
+    Column('tenant_id', AutoString, ForeignKey('tenant.id'), nullable=True, index=True),
+    Column('created_at', DateTime, nullable=False),
+    Column('updated_at', DateTime, nullable=False)
+)
+
+Table(
+    'citizen_issues', baseline_metadata,
+    Column('id', String(36), primary_key=True),
+    Column('title', AutoString, nullable=False, index=True),
+    Column('description', AutoString, nullable=True),
+    Column('status', AutoString, nullable=True, index=True),
+    Column('priority', AutoString, nullable=True, index=True),
+    Column('category_id', AutoString, ForeignKey('issue_categories.id'), nullable=True, index=True),
+    Column('created_by', AutoString, ForeignKey('users.id'), nullable=True, index=True),
+    Column('assigned_to', AutoString, ForeignKey('users.id'), nullable=True, index=True),
+    Column('area_id', AutoString, ForeignKey('areas.id'), nullable=True, index=True),
+    Column('tenant_id', AutoString, ForeignKey('tenant.id'), nullable=False, index=True),
+    Column('location', AutoString, nullable=True),
+    Column('latitude', Float, nullable=True),
+    Column('longitude', Float, nullable=True),
+    Column('geojson_data', AutoString, nullable=True),
+    Column('action_taken', AutoString, nullable=True),
+    Column('created_at', DateTime, nullable=False, server_default=func.now()),
+    Column('updated_at', DateTime, nullable=False, server_default=func.now())
+)
+
+Table(
+    'meeting_programs', baseline_metadata,
+    Column('id', String(36), primary_key=True),
+    Column('created_at', DateTime, nullable=False),
+    Column('updated_at', DateTime, nullable=False),
+    Column('title', AutoString, nullable=False, index=True),
+    Column('description', Text, nullable=True),
+    Column('agenda', Text, nullable=True),
+    Column('venue', AutoString, nullable=True),
+    Column('scheduled_date', DateTime, nullable=False, index=True),
+    Column('start_time', AutoString, nullable=True),
+    Column('end_time', AutoString, nullable=True),
+    Column('meeting_type', AutoString, nullable=False, index=True),
+    Column('status', AutoString, nullable=False, index=True),
+    Column('participants', Text, nullable=True),
+    Column('expected_attendance', Integer, nullable=True),
+    Column('actual_attendance', Integer, nullable=True),
+    Column('reminder_sent', Boolean, nullable=False),
+    Column('reminder_date', DateTime, nullable=True),
+    Column('minutes', Text, nullable=True),
+    Column('minutes_uploaded_at', DateTime, nullable=True),
+    Column('created_by', AutoString, ForeignKey('users.id'), nullable=True, index=True),
+    Column('tenant_id', AutoString, ForeignKey('tenant.id'), nullable=True, index=True),
+    Column('user_id', AutoString, ForeignKey('users.id'), nullable=True, index=True)
+)
+
+Table(
+    'super_admins', baseline_metadata,
+    Column('id', String(36), primary_key=True),
+    Column('name', AutoString, nullable=False, index=True),
+    Column('email', AutoString, nullable=False, index=True, unique=True),
+    Column('password_hash', AutoString, nullable=False),
+    Column('is_active', Boolean, nullable=False, index=True),
+    Column('created_by', AutoString, ForeignKey('users.id'), nullable=True, index=True),
+    Column('created_at', DateTime, nullable=False, server_default=func.now()),
+    Column('updated_at', DateTime, nullable=False, server_default=func.now())
+)
+
+Table(
+    'meeting_participants', baseline_metadata,
+    Column('id', String(36), primary_key=True),
+    Column('meeting_id', String(36), ForeignKey('meeting_programs.id', ondelete='CASCADE'), nullable=False),
+    Column('user_id', String(36), ForeignKey('users.id', ondelete='CASCADE'), nullable=True),
+    Column('name', AutoString(255), nullable=True),
+    Column('role', Enum('ASSIGNEE', 'PARTICIPANT', name='participantrole'), nullable=False),
+    Column('rsvp', Enum('PENDING', 'ACCEPTED', 'DECLINED', name='participantrsvp'), nullable=False, index=True),
+    Column('attended', Boolean, nullable=True),
+    Column('created_at', DateTime, nullable=False, server_default=func.now()),
+    Column('updated_at', DateTime, nullable=False, server_default=func.now()),
+    Index('ix_meeting_participants_meeting_role', 'meeting_id', 'role'),
+    Index('ix_meeting_participants_user_meeting', 'user_id', 'meeting_id')
+)
+
+Table(
+    'visits', baseline_metadata,
+    Column('id', String(36), primary_key=True),
+    Column('citizen_issue_id', AutoString, ForeignKey('citizen_issues.id'), nullable=False, index=True),
+    Column('assistant_id', AutoString, ForeignKey('users.id'), nullable=True, index=True),
+    Column('area_id', AutoString, ForeignKey('areas.id'), nullable=True, index=True),
+    Column('tenant_id', AutoString, ForeignKey('tenant.id'), nullable=False, index=True),
+    Column('visit_reason', AutoString, nullable=True),
+    Column('location', AutoString, nullable=True),
+    Column('priority', AutoString, nullable=True),
+    Column('visit_date', Date, nullable=False, index=True),
+    Column('visit_time', Time, nullable=True),
+    Column('status', AutoString, nullable=False, index=True),
+    Column('notes', AutoString, nullable=True),
+    Column('created_at', DateTime, nullable=False, server_default=func.now()),
+    Column('updated_at', DateTime, nullable=False, server_default=func.now())
+)
+
+Table(
+    'visit_issues', baseline_metadata,
+    Column('id', String(36), primary_key=True),
+    Column('visit_id', AutoString, ForeignKey('visits.id'), nullable=False, index=True),
+    Column('issue_id', AutoString, ForeignKey('citizen_issues.id'), nullable=False, index=True),
+    Column('created_at', DateTime, nullable=False, server_default=func.now())
+)
@@ -0,0 +1,159 @@
+"""
+Schema Migration Runner
+Versioned, explicitly applied schema changes tracked in the schema_migrations table
+
+Migrations are applied by `python migrate.py upgrade`, never on API startup. At
+startup the API only reads the current version (one row) and refuses to serve if
+it does not match the latest migration it ships with.
+
+MySQL commits DDL implicitly, so a migration that fails halfway cannot be rolled
+back. Every migration must therefore be safe to re-run: use the *_if_missing
+helpers below rather than bare CREATE / ALTER statements.
+"""
+
+from sqlalchemy import inspect, text, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from typing import Callable, Dict, List, Optional
+import logging
+import time
+
+from app.models.schema_migration import SchemaMigration
+
+logger = logging.getLogger(__name__)
+
+class SchemaVersionError(Exception):
+    """Raised when the database schema version does not match the application"""
+    pass
+
+class Migration:
+    """A single schema change identified by a strictly increasing version"""
+
+    def __init__(self, version: int, name: str, upgrade: Callable[[Engine], None]):
+        self.version = version
+        self.name = name
+        self.upgrade = upgrade
+
+MIGRATIONS: Dict[int, Migration] = {}
+
+def migration(version: int, name: str):
+    """Register a migration; the decorated function receives the engine"""
+    def decorator(upgrade_fn: Callable[[Engine], None]):
+        if version in MIGRATIONS:
+            raise ValueError(f"Duplicate migration version {version}")
+        MIGRATIONS[version] = Migration(version, name, upgrade_fn)
+        return upgrade_fn
+    return decorator
+
+def latest_version() -> int:
+    return max(MIGRATIONS) if MIGRATIONS else 0
+
+def get_migrations() -> List[Migration]:
+    return [MIGRATIONS[version] for version in sorted(MIGRATIONS)]
+
+# ----- Idempotent DDL helpers -----
+
+def add_column_if_missing(engine: Engine, table: str, column: str, ddl: str) -> bool:
+    """Run `ALTER TABLE <table> ADD COLUMN <column> <ddl>` unless the column exists"""
+    existing = {col["name"] for col in inspect(engine).get_columns(table)}
+    if column in existing:
+        return False
+    with engine.begin() as connection:
+        connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+    logger.info(f"Added column {table}.{column}")
+    return True
+
+def create_index_if_missing(engine: Engine, table: str, name: str, columns: List[str]) -> bool:
+    """Create a (non-unique) index unless one with this name already exists"""
+    existing = {index["name"] for index in inspect(engine).get_indexes(table)}
+    if name in existing:
+        return False
+    with engine.begin() as connection:
+        connection.execute(text(f"CREATE INDEX {name} ON {table} ({', '.join(columns)})"))
+    logger.info(f"Created index {name} on {table}")
+    return True
+
+def drop_index_if_exists(engine: Engine, table: str, name: str) -> bool:
+    existing = {index["name"] for index in inspect(engine).get_indexes(table)}
+    if name not in existing:
+        return False
+    with engine.begin() as connection:
+        if engine.dialect.name == "mysql":
+            connection.execute(text(f"DROP INDEX {name} ON {table}"))
+        else:
+            connection.execute(text(f"DROP INDEX {name}"))
+    logger.info(f"Dropped index {name} on {table}")
+    return True
+
+# ----- Version tracking -----
+
+def get_schema_version(engine: Engine) -> Optional[int]:
+    """Current schema version, or None when schema_migrations does not exist yet"""
+    try:
+        with engine.connect() as connection:
+            version = connection.execute(select(func.max(SchemaMigration.version))).scalar()
+    except (OperationalError, ProgrammingError):
+        # Table missing: the database predates versioned migrations
+        return None
+    return version or 0
+
+def check_schema_version(engine: Engine) -> int:
+    """
+    Verify the database is at the version this code expects
+
+    Raises:
+        SchemaVersionError: when the schema is missing, behind or ahead of the code
+    """
+    expected = latest_version()
+    current = get_schema_version(engine)
+    if current is None:
+        raise SchemaVersionError(
+            f"Database has no schema_migrations table; run `python migrate.py upgrade` (expected version {expected})"
+        )
+    if current < expected:
+        raise SchemaVersionError(
+            f"Database schema is at version {current}, code expects {expected}; run `python migrate.py upgrade`"
+        )
+    if current > expected:
+        raise SchemaVersionError(
+            f"Database schema is at version {current}, newer than this code ({expected}); deploy the matching release"
+        )
+    return current
+
+def upgrade(engine: Engine, target: Optional[int] = None) -> List[Migration]:
+    """Apply pending migrations in order up to target (default: latest); returns those applied"""
+    SchemaMigration.__table__.create(engine, checkfirst=True)
+    current = get_schema_version(engine) or 0
+    target = latest_version() if target is None else target
+
+    applied = []
+    for pending in get_migrations():
+        if pending.version <= current or pending.version > target:
+            continue
+        started = time.monotonic()
+        logger.info(f"Applying migration {pending.version}: {pending.name}")
+        pending.upgrade(engine)
+        with engine.begin() as connection:
+            connection.execute(
+                SchemaMigration.__table__.insert().values(version=pending.version, name=pending.name)
+            )
+        logger.info(f"Applied migration {pending.version} in {time.monotonic() - started:.1f}s")
+        applied.append(pending)
+    return applied
+
+def get_status(engine: Engine) -> List[Dict]:
+    """Every known migration with whether and when it was applied"""
+    applied: Dict[int, object] = {}
+    if get_schema_version(engine) is not None:
+        with engine.connect() as connection:
+            rows = connection.execute(select(SchemaMigration.version, SchemaMigration.applied_at)).all()
+        applied = {version: applied_at for version, applied_at in rows}
+    return [
+        {
+            "version": item.version,
+            "name": item.name,
+            "applied": item.version in applied,
+            "applied_at": applied.get(item.version)
+        }
+        for item in get_migrations()
+    ]
@@ -0,0 +1,93 @@
+"""
+Schema Migrations
+Append new migrations at the bottom with the next version number; never edit or
+renumber one that has shipped.
+"""
+
+from sqlmodel import Session
+from sqlalchemy.engine import Engine
+
+from app.migrations.runner import migration, add_column_if_missing, create_index_if_missing, drop_index_if_exists
+
+@migration(1, "initial_schema")
+def initial_schema(engine: Engine):
+    """Create any missing baseline tables; existing databases keep their tables untouched"""
+    from app.migrations.baseline import baseline_metadata
+
+    baseline_metadata.create_all(engine, checkfirst=True)
+
+@migration(2, "tenant_translation_languages")
+def tenant_translation_languages(engine: Engine):
+    """Languages each tenant pre-translates content into (write-time translation)"""
+    add_column_if_missing(engine, "tenant", "translation_languages", "VARCHAR(100) NULL")
+
+@migration(3, "backfill_meeting_participants")
+def backfill_meeting_participants(engine: Engine):
+    """Populate meeting_participants from the legacy MeetingProgram.participants JSON"""
+    from app.crud.meeting_participant_crud import backfill_meeting_participants as backfill
+
+    with Session(engine) as session:
+        backfill(session)
+
+# tenant_id leads because nearly every letter query is tenant-scoped; status/priority
+# next for the filtered lists and statistics, created_at last to serve the sort
+LETTER_INDEXES = {
+    "received_letters": [
+        ("ix_received_letters_tenant_created", ["tenant_id", "created_at"]),
+        ("ix_received_letters_tenant_status_created", ["tenant_id", "status", "created_at"]),
+        ("ix_received_letters_tenant_priority_created", ["tenant_id", "priority", "created_at"]),
+        ("ix_received_letters_tenant_due_date", ["tenant_id", "due_date"]),
+        ("ix_received_letters_assigned_status", ["assigned_to", "status"]),
+        ("ix_received_letters_created_by_status", ["created_by", "status"]),
+    ],
+    "sent_letters": [
+        ("ix_sent_letters_tenant_created", ["tenant_id", "created_at"]),
+        ("ix_sent_letters_tenant_status_created", ["tenant_id", "status", "created_at"]),
+        ("ix_sent_letters_tenant_priority_created", ["tenant_id", "priority", "created_at"]),
+        ("ix_sent_letters_tenant_follow_up", ["tenant_id", "follow_up_date"]),
+        ("ix_sent_letters_assigned_status", ["assigned_to", "status"]),
+        ("ix_sent_letters_created_by_status", ["created_by", "status"]),
+    ],
+    "sent_grievance_letters": [
+        ("ix_sent_grievance_letters_tenant_created", ["tenant_id", "created_at"]),
+        ("ix_sent_grievance_letters_tenant_status_created", ["tenant_id", "status", "created_at"]),
+        ("ix_sent_grievance_letters_tenant_priority_created", ["tenant_id", "priority", "created_at"]),
+        ("ix_sent_grievance_letters_tenant_follow_up", ["tenant_id", "follow_up_date"]),
+        ("ix_sent_grievance_letters_assigned_status", ["assigned_to", "status"]),
+        ("ix_sent_grievance_letters_created_by_status", ["created_by", "status"]),
+        ("ix_sent_grievance_letters_grievance", ["grievance_id"]),
+    ],
+}
+
+@migration(4, "letter_composite_indexes")
+def letter_composite_indexes(engine: Engine):
+    """Indexes for the hot filters on received, sent and grievance letters"""
+    for table, indexes in LETTER_INDEXES.items():
+        for name, columns in indexes:
+            create_index_if_missing(engine, table, name, columns)
+
+@migration(5, "letter_followups")
+def letter_followups(engine: Engine):
+    """Follow-up schedule for open sent and grievance letters, filled from their follow_up_date"""
+    from app.models.letter_followup import LetterFollowUp
+    from app.crud.letter_followup_crud import backfill_letter_followups
+
+    LetterFollowUp.__table__.create(engine, checkfirst=True)
+    with Session(engine) as session:
+        backfill_letter_followups(session)
+
+@migration(6, "report_results")
+def report_results(engine: Engine):
+    """Cache table for generated reports"""
+    from app.models.report_result import ReportResult
+
+    ReportResult.__table__.create(engine, checkfirst=True)
+
+# Overdue and due-this-week follow-ups are read from letter_followups since
+# migration 5; follow_up_date only appears inside the statistics' CASE counts,
+# which scan the tenant's rows through the (tenant_id, created_at) index anyway
+@migration(7, "drop_letter_follow_up_indexes")
+def drop_letter_follow_up_indexes(engine: Engine):
+    """Drop the (tenant_id, follow_up_date) indexes no query uses any more"""
+    drop_index_if_exists(engine, "sent_letters", "ix_sent_letters_tenant_follow_up")
+    drop_index_if_exists(engine, "sent_grievance_letters", "ix_sent_grievance_letters_tenant_follow_up")
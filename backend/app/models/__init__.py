@@ -3,6 +3,13 @@
 
 from .received_letter import ReceivedLetter, LetterStatus, LetterPriority, LetterCategory
 from .meeting_program import MeetingProgram
+from .meeting_participant import MeetingParticipant, ParticipantRole, ParticipantRSVP
+from .background_job import BackgroundJob, JobStatus
+from .outbound_email import OutboundEmail, OutboundEmailStatus
+from .translation_cache import TranslationCacheEntry
+from .content_translation import ContentTranslation
 
 
 
+from .schema_migration import SchemaMigration
+from .letter_followup import LetterFollowUp, FollowUpLetterType
@@ -0,0 +1,43 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime
+from sqlalchemy.sql import func
+from enum import Enum
+import uuid
+from sqlalchemy import String, Column, Text, Index
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+class BackgroundJob(SQLModel, table=True):
+    """Persistent background job, claimed and executed by the in-process job runner"""
+    __tablename__ = "background_jobs"
+    __table_args__ = (
+        # Poller scans due jobs: WHERE status = 'queued' AND run_after <= now ORDER BY run_after
+        Index("ix_background_jobs_status_run_after", "status", "run_after"),
+    )
+
+    id: Optional[str] = Field(
+        default_factory=lambda: str(uuid.uuid4()),
+        sa_column=Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    )
+
+    job_type: str = Field(max_length=100, index=True, nullable=False)
+    payload: Optional[str] = Field(default=None, sa_column=Column(Text))  # JSON encoded
+    status: JobStatus = Field(default=JobStatus.QUEUED, nullable=False)
+
+    attempts: int = Field(default=0)
+    max_attempts: int = Field(default=3)
+    run_after: datetime = Field(default_factory=datetime.utcnow)
+    last_error: Optional[str] = Field(default=None, sa_column=Column(Text))
+
+    # Lease held by the worker currently running the job
+    locked_by: Optional[str] = Field(default=None, max_length=100)
+    locked_at: Optional[datetime] = Field(default=None)
+
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
+    updated_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": func.now(), "server_default": func.now()})
+    finished_at: Optional[datetime] = Field(default=None)
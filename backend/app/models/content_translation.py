@@ -0,0 +1,32 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime
+from sqlalchemy.sql import func
+import uuid
+from sqlalchemy import String, Column, Text, UniqueConstraint, Index
+
+class ContentTranslation(SQLModel, table=True):
+    """Stored translation of one field of an issue or letter, produced at write time"""
+    __tablename__ = "content_translations"
+    __table_args__ = (
+        UniqueConstraint("entity_type", "entity_id", "field", "language", name="uq_content_translations_field_language"),
+        # List pages load all translations for a page of entities in one language
+        Index("ix_content_translations_lookup", "entity_type", "language", "entity_id"),
+    )
+
+    id: Optional[str] = Field(
+        default_factory=lambda: str(uuid.uuid4()),
+        sa_column=Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    )
+
+    entity_type: str = Field(max_length=50, nullable=False)  # citizen_issue, received_letter, ...
+    entity_id: str = Field(max_length=36, nullable=False)
+    field: str = Field(max_length=50, nullable=False)
+    language: str = Field(max_length=10, nullable=False)
+    # SHA-256 of the source text; a mismatch means the record changed since translation
+    source_hash: str = Field(max_length=64, nullable=False)
+    translated_text: str = Field(sa_column=Column(Text, nullable=False))
+    tenant_id: Optional[str] = Field(default=None, max_length=36, index=True)
+
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
+    updated_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": func.now(), "server_default": func.now()})
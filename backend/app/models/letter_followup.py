@@ -0,0 +1,42 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime
+from sqlalchemy.sql import func
+from enum import Enum
+import uuid
+from sqlalchemy import String, Column, Index, UniqueConstraint
+
+class FollowUpLetterType(str, Enum):
+    SENT_LETTER = "sent_letter"
+    SENT_GRIEVANCE_LETTER = "sent_grievance_letter"
+
+class LetterFollowUp(SQLModel, table=True):
+    """
+    Pending follow-up for an open sent / grievance letter, mirrored from its
+    follow_up_date. Closed letters and letters without a date have no row.
+    """
+    __tablename__ = "letter_followups"
+    __table_args__ = (
+        UniqueConstraint("letter_type", "letter_id", name="uq_letter_followups_letter"),
+        Index("ix_letter_followups_tenant_due", "tenant_id", "due_at"),
+        Index("ix_letter_followups_assignee_due", "assignee_id", "due_at"),
+        Index("ix_letter_followups_notified_due", "notified_at", "due_at"),
+    )
+
+    id: Optional[str] = Field(
+        default_factory=lambda: str(uuid.uuid4()),
+        sa_column=Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    )
+
+    letter_type: FollowUpLetterType = Field(nullable=False)
+    letter_id: int = Field(nullable=False)
+    tenant_id: Optional[str] = Field(default=None, max_length=255)
+    # assigned_to, or the creator when the letter is unassigned
+    assignee_id: Optional[str] = Field(default=None, max_length=255)
+    subject: Optional[str] = Field(default=None, max_length=500)
+    due_at: datetime = Field(nullable=False)
+    # Set by the sweeper once the overdue notice is queued; cleared when due_at moves
+    notified_at: Optional[datetime] = Field(default=None)
+
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
+    updated_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": func.now(), "server_default": func.now()})
@@ -0,0 +1,47 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime
+from sqlalchemy.sql import func
+from enum import Enum
+import uuid
+from sqlalchemy import String, Column, ForeignKey, Index
+
+class ParticipantRole(str, Enum):
+    """How a participant is attached to a meeting"""
+    ASSIGNEE = "assignee"        # Field agent the meeting is assigned to (MeetingProgram.user_id)
+    PARTICIPANT = "participant"  # Listed in the meeting's participants
+
+class ParticipantRSVP(str, Enum):
+    PENDING = "pending"
+    ACCEPTED = "accepted"
+    DECLINED = "declined"
+
+class MeetingParticipant(SQLModel, table=True):
+    """Normalised meeting <-> participant link, mirrored from MeetingProgram.participants"""
+    __tablename__ = "meeting_participants"
+    __table_args__ = (
+        Index("ix_meeting_participants_user_meeting", "user_id", "meeting_id"),
+        Index("ix_meeting_participants_meeting_role", "meeting_id", "role"),
+    )
+
+    id: Optional[str] = Field(
+        default_factory=lambda: str(uuid.uuid4()),
+        sa_column=Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    )
+
+    meeting_id: str = Field(
+        sa_column=Column(String(36), ForeignKey("meeting_programs.id", ondelete="CASCADE"), nullable=False)
+    )
+    # Null for participants entered by name only
+    user_id: Optional[str] = Field(
+        default=None,
+        sa_column=Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
+    )
+    name: Optional[str] = Field(default=None, max_length=255)
+
+    role: ParticipantRole = Field(default=ParticipantRole.PARTICIPANT, nullable=False)
+    rsvp: ParticipantRSVP = Field(default=ParticipantRSVP.PENDING, nullable=False, index=True)
+    attended: Optional[bool] = Field(default=None)
+
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
+    updated_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": func.now(), "server_default": func.now()})
@@ -0,0 +1,46 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime
+from sqlalchemy.sql import func
+from enum import Enum
+import uuid
+from sqlalchemy import String, Column, Text, Index
+
+class OutboundEmailStatus(str, Enum):
+    QUEUED = "queued"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+class OutboundEmail(SQLModel, table=True):
+    """Persistent outbound mail queue drained in batches by the email delivery job"""
+    __tablename__ = "outbound_emails"
+    __table_args__ = (
+        # Delivery scans due messages: WHERE status = 'queued' AND next_attempt_at <= now
+        Index("ix_outbound_emails_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+    id: Optional[str] = Field(
+        default_factory=lambda: str(uuid.uuid4()),
+        sa_column=Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    )
+
+    to_email: str = Field(max_length=255, nullable=False)
+    subject: str = Field(max_length=255, nullable=False)
+    body: Optional[str] = Field(default=None, sa_column=Column(Text))
+    # Body is cleared once sent (e.g. it carries a password reset token)
+    sensitive: bool = Field(default=False)
+
+    status: OutboundEmailStatus = Field(default=OutboundEmailStatus.QUEUED, nullable=False)
+    attempts: int = Field(default=0)
+    max_attempts: int = Field(default=5)
+    next_attempt_at: datetime = Field(default_factory=datetime.utcnow)
+    last_error: Optional[str] = Field(default=None, sa_column=Column(Text))
+
+    # Set while a delivery run holds the message
+    claim_token: Optional[str] = Field(default=None, max_length=36)
+    claimed_at: Optional[datetime] = Field(default=None)
+
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
+    updated_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": func.now(), "server_default": func.now()})
+    sent_at: Optional[datetime] = Field(default=None)
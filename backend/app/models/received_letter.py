@@ -1,5 +1,5 @@
 from sqlmodel import SQLModel, Field, DateTime
-from sqlalchemy import Column, Text
+from sqlalchemy import Column, Text, Index
 from datetime import datetime
 from typing import Optional
 from enum import Enum
@@ -27,6 +27,15 @@ class LetterCategory(str, Enum):
 
 class ReceivedLetter(SQLModel, table=True):
     __tablename__ = "received_letters"
+    # Composite indexes match the list, statistics and overdue query shapes in the letter CRUD modules
+    __table_args__ = (
+        Index("ix_received_letters_tenant_created", "tenant_id", "created_at"),
+        Index("ix_received_letters_tenant_status_created", "tenant_id", "status", "created_at"),
+        Index("ix_received_letters_tenant_priority_created", "tenant_id", "priority", "created_at"),
+        Index("ix_received_letters_tenant_due_date", "tenant_id", "due_date"),
+        Index("ix_received_letters_assigned_status", "assigned_to", "status"),
+        Index("ix_received_letters_created_by_status", "created_by", "status"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     sender: str = Field(max_length=255, description="Name of the sender")
@@ -0,0 +1,48 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime
+from sqlalchemy.sql import func
+from enum import Enum
+import uuid
+from sqlalchemy import String, Column, Text, Index
+
+class ReportStatus(str, Enum):
+    PENDING = "pending"  # Never computed yet
+    READY = "ready"
+    FAILED = "failed"    # Last run failed; rows still hold the previous result, if any
+
+class ReportResult(SQLModel, table=True):
+    """
+    Cached output of one report for one tenant and parameter set, refreshed by the
+    run_report background job and served until it expires
+    """
+    __tablename__ = "report_results"
+    __table_args__ = (
+        Index("ix_report_results_expires_at", "expires_at"),
+    )
+
+    id: Optional[str] = Field(
+        default_factory=lambda: str(uuid.uuid4()),
+        sa_column=Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    )
+
+    # SHA-256 of report key, tenant and parameters
+    cache_key: str = Field(max_length=64, unique=True, nullable=False)
+    report_key: str = Field(max_length=100, nullable=False)
+    tenant_id: Optional[str] = Field(default=None, max_length=255)  # Null: every tenant
+    params: Optional[str] = Field(default=None, sa_column=Column(Text))  # JSON encoded
+
+    status: ReportStatus = Field(default=ReportStatus.PENDING, nullable=False)
+    rows: Optional[str] = Field(default=None, sa_column=Column(Text(length=16777215)))  # JSON list, MEDIUMTEXT on MySQL
+    row_count: int = Field(default=0)
+    error: Optional[str] = Field(default=None, sa_column=Column(Text))
+    job_id: Optional[str] = Field(default=None, max_length=36)  # Latest refresh job
+
+    generated_at: Optional[datetime] = Field(default=None)
+    expires_at: Optional[datetime] = Field(default=None)
+    # Rows changed after this were not seen by the last refresh
+    watermark: Optional[datetime] = Field(default=None)
+    full_refresh_at: Optional[datetime] = Field(default=None)
+
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
+    updated_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": func.now(), "server_default": func.now()})
@@ -0,0 +1,12 @@
+from sqlmodel import SQLModel, Field
+from datetime import datetime
+from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer
+
+class SchemaMigration(SQLModel, table=True):
+    """One row per applied schema migration; the highest version is the schema version"""
+    __tablename__ = "schema_migrations"
+
+    version: int = Field(sa_column=Column(Integer, primary_key=True, autoincrement=False))
+    name: str = Field(max_length=100, nullable=False)
+    applied_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
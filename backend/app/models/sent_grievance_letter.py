@@ -1,5 +1,5 @@
 from sqlmodel import SQLModel, Field, DateTime
-from sqlalchemy import Column, Text, String
+from sqlalchemy import Column, Text, String, Index
 from datetime import datetime
 from typing import Optional
 from enum import Enum
@@ -29,6 +29,15 @@ class SentGrievanceLetterCategory(str, Enum):
 
 class SentGrievanceLetter(SQLModel, table=True):
     __tablename__ = "sent_grievance_letters"
+    # Composite indexes match the list, statistics and overdue query shapes in the letter CRUD modules
+    __table_args__ = (
+        Index("ix_sent_grievance_letters_tenant_created", "tenant_id", "created_at"),
+        Index("ix_sent_grievance_letters_tenant_status_created", "tenant_id", "status", "created_at"),
+        Index("ix_sent_grievance_letters_tenant_priority_created", "tenant_id", "priority", "created_at"),
+        Index("ix_sent_grievance_letters_assigned_status", "assigned_to", "status"),
+        Index("ix_sent_grievance_letters_created_by_status", "created_by", "status"),
+        Index("ix_sent_grievance_letters_grievance", "grievance_id"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     grievance_id: str = Field(description="Reference to citizen issue/grievance ID")
@@ -1,5 +1,5 @@
 from sqlmodel import SQLModel, Field, DateTime
-from sqlalchemy import Column, Text
+from sqlalchemy import Column, Text, Index
 from datetime import datetime
 from typing import Optional
 from enum import Enum
@@ -29,6 +29,14 @@ class SentLetterCategory(str, Enum):
 
 class SentLetter(SQLModel, table=True):
     __tablename__ = "sent_letters"
+    # Composite indexes match the list, statistics and overdue query shapes in the letter CRUD modules
+    __table_args__ = (
+        Index("ix_sent_letters_tenant_created", "tenant_id", "created_at"),
+        Index("ix_sent_letters_tenant_status_created", "tenant_id", "status", "created_at"),
+        Index("ix_sent_letters_tenant_priority_created", "tenant_id", "priority", "created_at"),
+        Index("ix_sent_letters_assigned_status", "assigned_to", "status"),
+        Index("ix_sent_letters_created_by_status", "created_by", "status"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     recipient_name: str = Field(max_length=255, description="Name of the recipient")
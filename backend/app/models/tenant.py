@@ -25,6 +25,8 @@ class Tenant(SQLModel, table=True):
     password: str = Field(nullable=False)  # This stores the hashed password
     plain_password: Optional[str] = None  # Store plain password for admin viewing
     status: TenantStatus = Field(default=TenantStatus.ACTIVE, nullable=False, index=True)
+    # Comma-separated language codes (e.g. "hi,mr") issues and letters are pre-translated into
+    translation_languages: Optional[str] = Field(default=None, max_length=100)
     
     created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
     updated_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": func.now(), "server_default": func.now()})
@@ -0,0 +1,26 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime
+from sqlalchemy.sql import func
+import uuid
+from sqlalchemy import String, Column, Text, UniqueConstraint
+
+class TranslationCacheEntry(SQLModel, table=True):
+    """Persisted machine translation, keyed by language pair and SHA-256 of the source text"""
+    __tablename__ = "translation_cache"
+    __table_args__ = (
+        UniqueConstraint("source_lang", "target_lang", "text_hash", name="uq_translation_cache_lookup"),
+    )
+
+    id: Optional[str] = Field(
+        default_factory=lambda: str(uuid.uuid4()),
+        sa_column=Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    )
+
+    source_lang: str = Field(max_length=10, nullable=False)
+    target_lang: str = Field(max_length=10, nullable=False)
+    text_hash: str = Field(max_length=64, nullable=False)
+    source_text: str = Field(sa_column=Column(Text, nullable=False))
+    translated_text: str = Field(sa_column=Column(Text, nullable=False))
+
+    created_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"server_default": func.now()})
@@ -16,6 +16,7 @@ from app.schemas.auth_schema import (
     PasswordResetConfirm, PasswordChangeRequest, AuthResponse
 )
 from app.services.auth_service import auth_service
+from app.services.email_service import email_service
 from app.core.auth import get_current_user
 from typing import Union
 from app.core.security import audit_logger, security_middleware, cookie_manager
@@ -231,8 +232,11 @@ async def request_password_reset(
             client_ip=client_ip
         )
         
-        # In a real implementation, you would send this token via email
-        # For now, we'll return it in the response (NOT recommended for production)
+        # Queue the token for email delivery; empty token means unknown email
+        if reset_token:
+            email_service.send_password_reset_email(payload.email, reset_token)
+
+        # In debug mode the token is also returned for convenience (NOT for production)
         if settings.DEBUG:
             return AuthResponse(
                 success=True,
@@ -1,23 +1,27 @@
 # app/routes/citizen_issue_routes.py - FIXED VERSION
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, UploadFile, File
 from sqlmodel import Session, select, and_, or_, desc
 from typing import List, Optional
 from datetime import datetime
 import logging
+import io
 from database import get_session
 from app.core.auth import get_current_user
 
 from app.schemas.citizen_issues_schema import CitizenIssueCreate, CitizenIssueRead, CitizenIssueUpdate
 from app.crud.citizen_issues_crud import (
-    create_citizen_issue, get_citizen_issue, get_all_citizen_issues, 
-    update_citizen_issue, delete_citizen_issue, get_citizen_issues_geojson,
-    get_field_agent_issues
+    create_citizen_issue, update_citizen_issue, delete_citizen_issue,
+    get_field_agent_issues, bulk_update_citizen_issues, bulk_delete_citizen_issues,
+    import_citizen_issues_csv, ValidationError
 )
 from app.core.role_middleware import (
-    get_accessible_issues_query, can_access_issue, require_permission,
-    require_role, Permission
+    get_accessible_issues_query, can_access_issue, require_permission, Permission
 )
-from app.utils.role_permissions import role_permissions
+from app.core.access_predicates import apply_access_filter, build_access_predicate, resolve_access_scope
+from app.services.export_service import export_service, ExportError
+from app.core.request_coalescing import coalesce
+from app.crud.content_translation_crud import localize_records, resolve_content_language
+from app.utils.role_permissions import role_permissions, UserRole
 from app.models.citizen_issues import CitizenIssue
 from app.models.user import User
 from app.models.Issue_category import IssueCategory
@@ -62,6 +66,14 @@ def get_user_role_name(user: User) -> str:
         logger.error(f"Error getting user role for user {user.id}: {e}")
         return "assistant"  # Safe fallback
 
+def get_normalized_role(user: User) -> UserRole:
+    """Role of a user as a UserRole, whatever spelling the roles table uses ("FieldAgent", "field_agent", ...)"""
+    return role_permissions._normalize_role_name(get_user_role_name(user))
+
+def is_field_agent(user: User) -> bool:
+    """Field Agents and assistants may only work on issues assigned to themselves"""
+    return get_normalized_role(user) in (UserRole.FIELD_AGENT, UserRole.ASSISTANT)
+
 def check_issue_access(user: User, issue: CitizenIssue) -> bool:
     """Check if user has access to a specific issue based on role and ownership"""
     try:
@@ -100,39 +112,115 @@ def check_issue_access(user: User, issue: CitizenIssue) -> bool:
         logger.error(f"Error checking issue access: {e}")
         return False
 
-def get_filtered_query(current_user: User, base_query=None):
-    """Get properly filtered query based on user role - SECURE VERSION"""
-    if base_query is None:
-        base_query = select(CitizenIssue)
+def resolve_new_issue_tenant(db: Session, current_user: User, requested_tenant_id: Optional[str] = None) -> str:
+    """Pick the tenant new issues are created in, based on the creator's role"""
+    user_role = get_normalized_role(current_user)
+    user_tenant_id = getattr(current_user, 'tenant_id', None)
+
+    if user_role == UserRole.SUPER_ADMIN:
+        # Super Admin can create issues for any tenant
+        if requested_tenant_id:
+            from app.models.tenant import Tenant
+            if not db.get(Tenant, requested_tenant_id):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Tenant {requested_tenant_id} not found"
+                )
+            return requested_tenant_id
+        # If no tenant specified, use user's tenant or create system tenant
+        if user_tenant_id:
+            return user_tenant_id
+        from app.models.tenant import Tenant
+        system_tenant = db.exec(select(Tenant).where(Tenant.name == "System")).first()
+        if not system_tenant:
+            system_tenant = Tenant(
+                name="System",
+                email="system@admin.com",
+                password="system_password_hash_placeholder"
+            )
+            db.add(system_tenant)
+            db.commit()
+            db.refresh(system_tenant)
+        return system_tenant.id
+
+    if user_role == UserRole.ADMIN:
+        # Admin can only create issues for their tenant
+        if not user_tenant_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Tenant assignment required for admin role"
+            )
+        return user_tenant_id
+
+    # Field Agents and others use their assigned tenant
+    if user_tenant_id:
+        return user_tenant_id
+    # Try to find default tenant
+    from app.models.tenant import Tenant
+    default_tenant = db.exec(select(Tenant).limit(1)).first()
+    if default_tenant:
+        return default_tenant.id
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="No tenant available. Please contact administrator."
+    )
+
+def apply_issue_filters(
+    query,
+    current_user: User,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    category_id: Optional[str] = None,
+    area_id: Optional[str] = None,
+    assigned_to: Optional[str] = None,
+    search: Optional[str] = None,
+    tenant_id: Optional[str] = None
+):
+    """Apply the /filtered query parameters to an issue query"""
+    # Super Admin can filter by tenant
+    if tenant_id and role_permissions.can_switch_tenants(getattr(current_user.role, 'name', 'unknown')):
+        query = query.where(CitizenIssue.tenant_id == tenant_id)
+        logger.info(f"Super Admin filtering by tenant: {tenant_id}")
     
-    user_role = get_user_role_name(current_user)
-    logger.debug(f"Applying security filter for role: {user_role}")
+    conditions = []
     
-    if user_role == "super_admin":
-        logger.debug("Super admin - no filter applied")
-        return base_query
+    if status:
+        conditions.append(CitizenIssue.status == status)
     
-    elif user_role in ["tenant", "tenant_admin"]:
-        # Tenant users see only issues from their tenant
-        if not hasattr(current_user, 'tenant_id') or not current_user.tenant_id:
-            logger.error(f"Tenant user {current_user.id} has no tenant_id - denying access")
-            raise SecurityError("User has no valid tenant assignment")
-        
-        logger.debug(f"Tenant filter - showing issues from tenant_id: {current_user.tenant_id}")
-        # Join with User table to filter by creator's tenant
-        return (
-            select(CitizenIssue)
-            .join(User, CitizenIssue.created_by == User.id)
-            .where(User.tenant_id == current_user.tenant_id)
-        )
+    if priority:
+        conditions.append(CitizenIssue.priority == priority)
+    
+    if category_id:
+        conditions.append(CitizenIssue.category_id == category_id)
     
-    elif user_role == "assistant":
-        logger.debug(f"Assistant filter - showing issues created by user_id: {current_user.id}")
-        return base_query.where(CitizenIssue.created_by == current_user.id)
+    if area_id:
+        conditions.append(CitizenIssue.area_id == area_id)
+    
+    if assigned_to:
+        conditions.append(CitizenIssue.assigned_to == assigned_to)
+    
+    if search:
+        conditions.append(or_(
+            CitizenIssue.title.ilike(f"%{search}%"),
+            CitizenIssue.description.ilike(f"%{search}%"),
+            CitizenIssue.location.ilike(f"%{search}%")
+        ))
+    
+    if conditions:
+        query = query.where(and_(*conditions))
+    return query
+
+def get_filtered_query(current_user: User, base_query=None):
+    """Get properly filtered query based on user role - SECURE VERSION"""
+    if base_query is None:
+        base_query = select(CitizenIssue)
     
-    else:
+    if resolve_access_scope(current_user, CitizenIssue, "view") is None:
+        user_role = get_user_role_name(current_user)
         logger.error(f"Unknown role '{user_role}' - denying access")
         raise SecurityError(f"Access denied for role: {user_role}")
+    
+    return apply_access_filter(base_query, current_user, CitizenIssue, "view")
 
 def transform_issue_for_frontend(issue: CitizenIssue, db: Session) -> dict:
     """Transform backend issue data to frontend-expected format with proper error handling"""
@@ -415,40 +503,10 @@ def get_filtered_citizen_issues(
         # Start with role-based filtered query
         query = get_accessible_issues_query(current_user, db)
         
-        # Super Admin can filter by tenant
-        if tenant_id and role_permissions.can_switch_tenants(getattr(current_user.role, 'name', 'unknown')):
-            query = query.where(CitizenIssue.tenant_id == tenant_id)
-            logger.info(f"Super Admin filtering by tenant: {tenant_id}")
-        
-        # Apply filters
-        conditions = []
-        
-        if status:
-            conditions.append(CitizenIssue.status == status)
-        
-        if priority:
-            conditions.append(CitizenIssue.priority == priority)
-        
-        if category_id:
-            conditions.append(CitizenIssue.category_id == category_id)
-        
-        if area_id:
-            conditions.append(CitizenIssue.area_id == area_id)
-        
-        if assigned_to:
-            conditions.append(CitizenIssue.assigned_to == assigned_to)
-        
-        if search:
-            search_condition = or_(
-                CitizenIssue.title.ilike(f"%{search}%"),
-                CitizenIssue.description.ilike(f"%{search}%"),
-                CitizenIssue.location.ilike(f"%{search}%")
-            )
-            conditions.append(search_condition)
-        
-        # Apply all conditions
-        if conditions:
-            query = query.where(and_(*conditions))
+        query = apply_issue_filters(
+            query, current_user, status=status, priority=priority, category_id=category_id,
+            area_id=area_id, assigned_to=assigned_to, search=search, tenant_id=tenant_id
+        )
         
         # Add ordering by most recent first
         query = query.order_by(desc(CitizenIssue.created_at))
@@ -480,6 +538,39 @@ def get_filtered_citizen_issues(
             detail="Failed to fetch filtered issues"
         )
 
+@router.get("/export")
+def export_citizen_issues(
+    request: Request,
+    format: str = Query("csv", description="Export format: csv or xlsx"),
+    status_filter: Optional[str] = Query(None, alias="status", description="Filter by status"),
+    priority: Optional[str] = Query(None, description="Filter by priority"),
+    category_id: Optional[str] = Query(None, description="Filter by category ID"),
+    area_id: Optional[str] = Query(None, description="Filter by area ID"),
+    assigned_to: Optional[str] = Query(None, description="Filter by assigned user ID"),
+    search: Optional[str] = Query(None, description="Search in title and description"),
+    tenant_id: Optional[str] = Query(None, description="Filter by tenant ID (Super Admin only)"),
+    current_user: User = Depends(get_current_user)
+):
+    """Download every issue the user can see, matching the /filtered parameters, as CSV or XLSX"""
+    try:
+        query = export_service.export_query(
+            CitizenIssue,
+            where=[build_access_predicate(current_user, CitizenIssue, "view")]
+        )
+        query = apply_issue_filters(
+            query, current_user, status=status_filter, priority=priority, category_id=category_id,
+            area_id=area_id, assigned_to=assigned_to, search=search, tenant_id=tenant_id
+        )
+        return export_service.response(query, "citizen_issues", format, request.headers.get("accept-encoding"))
+    except ExportError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error exporting citizen issues: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to export issues"
+        )
+
 @router.post("/bulk-update", response_model=dict)
 def bulk_update_issues(
     issue_ids: List[str],
@@ -495,75 +586,23 @@ def bulk_update_issues(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="Updates must be a dictionary"
             )
-        
-        # Define allowed fields for bulk updates
-        allowed_fields = {
-            'status', 'priority', 'assigned_to', 'category_id', 
-            'area_id', 'action_taken'
-        }
-        
-        # Validate that only allowed fields are being updated
-        invalid_fields = set(updates.keys()) - allowed_fields
-        if invalid_fields:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Invalid fields for bulk update: {', '.join(invalid_fields)}. Allowed fields: {', '.join(allowed_fields)}"
-            )
-        
-        # Validate field values
-        if 'status' in updates and updates['status'] not in ["Open", "In Progress", "Pending", "Resolved"]:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Invalid status: {updates['status']}. Allowed values: Open, In Progress, Pending, Resolved"
-            )
-        
-        if 'priority' in updates and updates['priority'] not in ["Low", "Medium", "High", "Urgent"]:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Invalid priority: {updates['priority']}. Allowed values: Low, Medium, High, Urgent"
-            )
-        
-        user_role = get_user_role_name(current_user)
-        updated_count = 0
-        failed_count = 0
-        
-        for issue_id in issue_ids:
-            try:
-                issue = db.get(CitizenIssue, issue_id)
-                if not issue:
-                    failed_count += 1
-                    continue
-                
-                # Check access
-                if not check_issue_access(current_user, issue):
-                    failed_count += 1
-                    continue
-                
-                # Apply updates
-                for field, value in updates.items():
-                    if hasattr(issue, field):
-                        setattr(issue, field, value)
-                
-                db.add(issue)
-                updated_count += 1
-                
-            except Exception as e:
-                logger.error(f"Error updating issue {issue_id}: {e}")
-                failed_count += 1
-        
-        db.commit()
-        
+
+        results = bulk_update_citizen_issues(db, current_user, issue_ids, updates)
+        updated_count = sum(1 for outcome in results.values() if outcome == "updated")
+
         return {
             "message": "Bulk update completed",
             "updated_count": updated_count,
-            "failed_count": failed_count,
-            "total_processed": len(issue_ids)
+            "failed_count": len(results) - updated_count,
+            "total_processed": len(results),
+            "results": results
         }
-        
+
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
         logger.error(f"Error in bulk update: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -578,46 +617,69 @@ def bulk_delete_issues(
 ):
     """Bulk delete multiple issues"""
     try:
-        user_role = get_user_role_name(current_user)
-        deleted_count = 0
-        failed_count = 0
-        
-        for issue_id in issue_ids:
-            try:
-                issue = db.get(CitizenIssue, issue_id)
-                if not issue:
-                    failed_count += 1
-                    continue
-                
-                # Check access (only creator or super admin can delete)
-                if user_role != "super_admin" and issue.created_by != current_user.id:
-                    failed_count += 1
-                    continue
-                
-                db.delete(issue)
-                deleted_count += 1
-                
-            except Exception as e:
-                logger.error(f"Error deleting issue {issue_id}: {e}")
-                failed_count += 1
-        
-        db.commit()
-        
+        results = bulk_delete_citizen_issues(db, current_user, issue_ids)
+        deleted_count = sum(1 for outcome in results.values() if outcome == "deleted")
+
         return {
             "message": "Bulk delete completed",
             "deleted_count": deleted_count,
-            "failed_count": failed_count,
-            "total_processed": len(issue_ids)
+            "failed_count": len(results) - deleted_count,
+            "total_processed": len(results),
+            "results": results
         }
-        
+
     except Exception as e:
-        db.rollback()
         logger.error(f"Error in bulk delete: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to perform bulk delete"
         )
 
+@router.post("/import", response_model=dict)
+def import_issues_csv(
+    file: UploadFile = File(..., description="CSV with a header row; title is required"),
+    tenant_id: Optional[str] = Query(None, description="Target tenant (super admins only)"),
+    db: Session = Depends(get_session),
+    current_user: User = Depends(require_permission(Permission.CREATE_ISSUES))
+):
+    """
+    Bulk import citizen issues from a CSV upload
+
+    Columns: title, description, location, latitude, longitude, status, priority,
+    assigned_to, category, area, action_taken. Rows that fail validation are
+    skipped and listed in the returned error report.
+    """
+    try:
+        target_tenant_id = resolve_new_issue_tenant(db, current_user, tenant_id)
+
+        # Field Agents can only assign issues to themselves
+        assignee_id = current_user.id if is_field_agent(current_user) else None
+
+        # Read the spooled upload row by row instead of loading it into memory
+        stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+        try:
+            report = import_citizen_issues_csv(db, stream, target_tenant_id, current_user.id, assignee_id)
+        finally:
+            stream.detach()
+
+        return {"message": "Import completed", **report}
+
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="CSV file must be UTF-8 encoded"
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error importing citizen issues: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to import citizen issues"
+        )
+
 # ===== EXISTING ENDPOINTS =====
 
 @router.post("/", response_model=CitizenIssueRead, status_code=status.HTTP_201_CREATED)
@@ -630,62 +692,14 @@ def create_citizen_issue_route(
     logger.info(f"Creating citizen issue for user: {current_user.email} (role: {getattr(current_user.role, 'name', 'unknown')})")
     
     try:
-        # Get user role and tenant info
-        user_role = getattr(current_user.role, 'name', 'assistant')
-        user_tenant_id = getattr(current_user, 'tenant_id', None)
-        
         # Prepare issue data
         issue_data = issue_in.model_dump()
         
         # Handle tenant assignment based on role
-        if user_role in ["super_admin", "superadmin"]:
-            # Super Admin can create issues for any tenant
-            if not issue_data.get('tenant_id'):
-                # If no tenant specified, use user's tenant or create system tenant
-                if user_tenant_id:
-                    issue_data['tenant_id'] = user_tenant_id
-                else:
-                    # Create system tenant if needed
-                    from app.models.tenant import Tenant
-                    system_tenant = db.exec(select(Tenant).where(Tenant.name == "System")).first()
-                    if not system_tenant:
-                        system_tenant = Tenant(
-                            name="System",
-                            email="system@admin.com",
-                            password="system_password_hash_placeholder"
-                        )
-                        db.add(system_tenant)
-                        db.commit()
-                        db.refresh(system_tenant)
-                    issue_data['tenant_id'] = system_tenant.id
-                    
-        elif user_role in ["admin", "tenant_admin"]:
-            # Admin can only create issues for their tenant
-            if not user_tenant_id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Tenant assignment required for admin role"
-                )
-            issue_data['tenant_id'] = user_tenant_id
-            
-        else:
-            # Field Agents and others use their assigned tenant
-            if user_tenant_id:
-                issue_data['tenant_id'] = user_tenant_id
-            else:
-                # Try to find default tenant
-                from app.models.tenant import Tenant
-                default_tenant = db.exec(select(Tenant).limit(1)).first()
-                if default_tenant:
-                    issue_data['tenant_id'] = default_tenant.id
-                else:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="No tenant available. Please contact administrator."
-                    )
+        issue_data['tenant_id'] = resolve_new_issue_tenant(db, current_user, issue_data.get('tenant_id'))
         
         # Field Agents can only assign issues to themselves
-        if user_role in ["field_agent", "assistant"]:
+        if is_field_agent(current_user):
             issue_data['assigned_to'] = current_user.id
         
         logger.info(f"Creating issue with data: {issue_data}")
@@ -712,6 +726,7 @@ def create_citizen_issue_route(
 def read_all_citizen_issues_route(
     skip: int = 0,
     limit: int = 100,
+    lang: Optional[str] = Query(None, description="Return stored translations of text fields in this language (defaults to the user's language preference)"),
     db: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
@@ -743,6 +758,12 @@ def read_all_citizen_issues_route(
                 logger.error(f"Error transforming issue {issue.id}: {transform_error}")
                 continue
 
+        lang = resolve_content_language(lang, current_user)
+        if lang:
+            localize_records(db, "citizen_issue", transformed_issues, lang)
+            for transformed in transformed_issues:
+                transformed["issue"] = transformed.get("title") or transformed["issue"]
+
         logger.info(f"Returning {len(transformed_issues)} transformed issues")
         return transformed_issues
 
@@ -958,8 +979,7 @@ def update_citizen_issue_route(
             )
         
         # Field Agents can only update certain fields
-        user_role = getattr(current_user.role, 'name', 'assistant')
-        if user_role in ["field_agent", "assistant"]:
+        if is_field_agent(current_user):
             # Remove fields that Field Agents shouldn't modify
             restricted_fields = ['tenant_id', 'created_by', 'assigned_to']
             update_data = issue_update.model_dump(exclude_unset=True)
@@ -1037,6 +1057,7 @@ def delete_citizen_issue_route(
         )
 
 @router.get("/geojson/all", response_model=dict)
+@coalesce("/citizen-issues/geojson/all")
 def get_citizen_issues_geojson_route(
     skip: int = 0, 
     limit: int = 100, 
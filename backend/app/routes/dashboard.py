@@ -8,11 +8,13 @@ from app.models.citizen_issues import CitizenIssue
 from app.models.user import User
 from app.models.visit import Visit
 from app.crud.sent_letter_crud import get_sent_letter_statistics
+from app.core.request_coalescing import coalesce
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 @router.get("/dashboard/stats", response_model=Dict[str, Any])
+@coalesce("/dashboard/stats")
 def get_dashboard_stats(
     db: Session = Depends(get_session)
 ):
@@ -64,8 +66,8 @@ def get_dashboard_stats(
             .limit(5)
         ).all()
         
-        # Get sent letters statistics
-        sent_letters_stats = get_sent_letter_statistics(db, None)
+        # Get sent letters statistics (across all tenants, like the figures above)
+        sent_letters_stats = get_sent_letter_statistics(db, all_tenants=True)
         
         return {
             "total_issues": total_issues,
@@ -143,6 +145,7 @@ def get_category_stats(
         )
 
 @router.get("/dashboard/stats/public", response_model=Dict[str, Any])
+@coalesce("/dashboard/stats/public")
 def get_dashboard_stats_public(
     db: Session = Depends(get_session)
 ):
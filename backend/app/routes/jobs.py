@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Dict, Any
+import logging
+
+from app.core.auth import get_current_user
+from app.models.user import User
+from app.services.job_service import job_runner
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/jobs", tags=["Background Jobs"])
+
+@router.get("/{job_id}", response_model=Dict[str, Any])
+def get_job_status(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Get the status of a background job (payload is never returned)"""
+    role_name = current_user.role.name if current_user.role else None
+    if role_name not in ("SuperAdmin", "Admin"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only administrators can view background jobs"
+        )
+
+    try:
+        job = job_runner.get_job(job_id)
+    except Exception as e:
+        logger.error(f"Error fetching job {job_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to fetch job"
+        )
+
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+
+    return {
+        "id": job.id,
+        "job_type": job.job_type,
+        "status": job.status,
+        "attempts": job.attempts,
+        "max_attempts": job.max_attempts,
+        "run_after": job.run_after,
+        "last_error": job.last_error.splitlines()[0] if job.last_error else None,
+        "created_at": job.created_at,
+        "finished_at": job.finished_at
+    }
@@ -7,6 +7,9 @@ import logging
 from database import get_session
 from app.core.auth import get_current_user
 from app.utils.role_permissions import role_permissions
+from app.core.access_predicates import apply_access_filter
+from app.crud.letter_statistics_crud import get_letters_overview
+from sqlalchemy import false
 
 from app.models.received_letter import ReceivedLetter, LetterStatus, LetterPriority, LetterCategory
 from app.models.sent_letter import SentLetter, SentLetterStatus, SentLetterPriority, SentLetterCategory
@@ -15,7 +18,7 @@ from app.models.user import User
 from app.models.role import Role
 
 from app.schemas.received_letter_schema import (
-    ReceivedLetterCreate, ReceivedLetterRead, ReceivedLetterUpdate
+    ReceivedLetterCreate, ReceivedLetterUpdate
 )
 from app.schemas.sent_letter_schema import (
     SentLetterCreate, SentLetterRead, SentLetterUpdate
@@ -33,10 +36,19 @@ from app.crud.sent_letter_crud import (
 from app.crud.sent_grievance_letter_crud import (
     create_sent_grievance_letter, get_sent_grievance_letter, update_sent_grievance_letter, delete_sent_grievance_letter
 )
+from app.crud.letter_followup_crud import get_due_followups
+from app.schemas.letter_followup_schema import LetterFollowUpRead
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/letters", tags=["Letters"])
 
+# Letter type -> model class
+LETTER_MODELS = {
+    "received": ReceivedLetter,
+    "sent_public_interest": SentLetter,
+    "sent_public_grievance": SentGrievanceLetter,
+}
+
 def check_letter_access(user: User, letter: Any, letter_type: str) -> bool:
     """Check if user has access to a specific letter based on role and permissions"""
     if not user or not letter:
@@ -65,40 +77,11 @@ def get_filtered_letter_query(current_user: User, base_query, letter_type: str):
     if base_query is None:
         return base_query
     
-    user_role = getattr(current_user, 'role', None)
-    if not user_role:
-        return base_query.filter(False)  # Return no results
-    
-    role_name = user_role.name if hasattr(user_role, 'name') else str(user_role)
-    
-    # Super Admin can see all letters
-    if role_permissions.can_view_letters(role_name, None, None, None, None):
-        return base_query
-    
-    # Get the model class based on letter type
-    if letter_type == "received":
-        model_class = ReceivedLetter
-    elif letter_type == "sent_public_interest":
-        model_class = SentLetter
-    elif letter_type == "sent_public_grievance":
-        model_class = SentGrievanceLetter
-    else:
-        return base_query.filter(False)  # Return no results
-    
-    # Admin can see letters from their tenant
-    if role_permissions.can_view_letters(role_name, None, current_user.tenant_id, None, None):
-        return base_query.filter(model_class.tenant_id == current_user.tenant_id)
-    
-    # Field Agent can only see letters assigned to them
-    if role_permissions.can_view_letters(role_name, None, None, None, current_user.id):
-        return base_query.filter(
-            or_(
-                model_class.assigned_to == current_user.id,
-                model_class.created_by == current_user.id
-            )
-        )
+    model_class = LETTER_MODELS.get(letter_type)
+    if model_class is None:
+        return base_query.filter(false())  # Return no results
     
-    return base_query.filter(False)  # Return no results
+    return apply_access_filter(base_query, current_user, model_class, "view")
 
 # Received Letters Endpoints - MOVED TO DEDICATED ROUTER
 # @router.get("/received", response_model=List[ReceivedLetterRead])
@@ -712,6 +695,30 @@ def delete_sent_letter_public_grievance(
             detail=f"Failed to delete letter: {str(e)}"
         )
 
+# Follow-up Endpoints
+@router.get("/followups/due", response_model=List[LetterFollowUpRead])
+def get_my_due_followups(
+    days_ahead: int = Query(7, ge=0, le=90, description="Include follow-ups due within this many days"),
+    include_overdue: bool = Query(True, description="Include follow-ups already past due"),
+    limit: int = Query(100, ge=1, le=500),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_session)
+):
+    """Get sent and grievance letter follow-ups assigned to the current user, soonest first"""
+    try:
+        now = datetime.utcnow()
+        followups = get_due_followups(db, str(current_user.id), days_ahead, include_overdue, limit)
+        return [
+            LetterFollowUpRead.model_validate(followup).model_copy(update={"overdue": followup.due_at < now})
+            for followup in followups
+        ]
+    except Exception as e:
+        logger.error(f"Error fetching due follow-ups: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch follow-ups: {str(e)}"
+        )
+
 # Letter Statistics Endpoint
 @router.get("/statistics")
 def get_letters_statistics(
@@ -725,162 +732,8 @@ def get_letters_statistics(
         if not user_role:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User role not found")
         
-        role_name = user_role.name if hasattr(user_role, 'name') else str(user_role)
-        
-        # Initialize statistics
-        stats = {
-            "total_received": 0,
-            "total_sent_public_interest": 0,
-            "total_sent_public_grievance": 0,
-            "awaiting_response": 0,
-            "response_received": 0,
-            "overdue_followups": 0
-        }
-        
-        # Super Admin can see all statistics
-        if role_permissions.can_view_letters(role_name, None, None, None, None):
-            # Count all letters
-            stats["total_received"] = db.exec(select(func.count(ReceivedLetter.id))).first()
-            stats["total_sent_public_interest"] = db.exec(select(func.count(SentLetter.id))).first()
-            stats["total_sent_public_grievance"] = db.exec(select(func.count(SentGrievanceLetter.id))).first()
-            
-            # Count by status
-            stats["awaiting_response"] = db.exec(
-                select(func.count(SentLetter.id)).where(SentLetter.status == SentLetterStatus.AWAITING_RESPONSE)
-            ).first()
-            
-            stats["response_received"] = db.exec(
-                select(func.count(SentLetter.id)).where(SentLetter.status == SentLetterStatus.RESPONSE_RECEIVED)
-            ).first()
-            
-            # Count overdue followups (simplified logic)
-            today = datetime.utcnow()
-            stats["overdue_followups"] = db.exec(
-                select(func.count(SentLetter.id)).where(
-                    and_(
-                        SentLetter.follow_up_date < today,
-                        SentLetter.status == SentLetterStatus.AWAITING_RESPONSE
-                    )
-                )
-            ).first()
-        
-        # Admin can see tenant statistics
-        elif role_permissions.can_view_letters(role_name, None, current_user.tenant_id, None, None):
-            # Count tenant letters
-            stats["total_received"] = db.exec(
-                select(func.count(ReceivedLetter.id)).where(ReceivedLetter.tenant_id == current_user.tenant_id)
-            ).first()
-            
-            stats["total_sent_public_interest"] = db.exec(
-                select(func.count(SentLetter.id)).where(SentLetter.tenant_id == current_user.tenant_id)
-            ).first()
-            
-            stats["total_sent_public_grievance"] = db.exec(
-                select(func.count(SentGrievanceLetter.id)).where(SentGrievanceLetter.tenant_id == current_user.tenant_id)
-            ).first()
-            
-            # Count by status for tenant
-            stats["awaiting_response"] = db.exec(
-                select(func.count(SentLetter.id)).where(
-                    and_(
-                        SentLetter.tenant_id == current_user.tenant_id,
-                        SentLetter.status == SentLetterStatus.AWAITING_RESPONSE
-                    )
-                )
-            ).first()
-            
-            stats["response_received"] = db.exec(
-                select(func.count(SentLetter.id)).where(
-                    and_(
-                        SentLetter.tenant_id == current_user.tenant_id,
-                        SentLetter.status == SentLetterStatus.RESPONSE_RECEIVED
-                    )
-                )
-            ).first()
-            
-            # Count overdue followups for tenant
-            today = datetime.utcnow()
-            stats["overdue_followups"] = db.exec(
-                select(func.count(SentLetter.id)).where(
-                    and_(
-                        SentLetter.tenant_id == current_user.tenant_id,
-                        SentLetter.follow_up_date < today,
-                        SentLetter.status == SentLetterStatus.AWAITING_RESPONSE
-                    )
-                )
-            ).first()
-        
-        # Field Agent can only see their own statistics
-        elif role_permissions.can_view_letters(role_name, None, None, None, current_user.id):
-            # Count own letters
-            stats["total_received"] = db.exec(
-                select(func.count(ReceivedLetter.id)).where(
-                    or_(
-                        ReceivedLetter.assigned_to == current_user.id,
-                        ReceivedLetter.created_by == current_user.id
-                    )
-                )
-            ).first()
-            
-            stats["total_sent_public_interest"] = db.exec(
-                select(func.count(SentLetter.id)).where(
-                    or_(
-                        SentLetter.assigned_to == current_user.id,
-                        SentLetter.created_by == current_user.id
-                    )
-                )
-            ).first()
-            
-            stats["total_sent_public_grievance"] = db.exec(
-                select(func.count(SentGrievanceLetter.id)).where(
-                    or_(
-                        SentGrievanceLetter.assigned_to == current_user.id,
-                        SentGrievanceLetter.created_by == current_user.id
-                    )
-                )
-            ).first()
-            
-            # Count own letters by status
-            stats["awaiting_response"] = db.exec(
-                select(func.count(SentLetter.id)).where(
-                    and_(
-                        or_(
-                            SentLetter.assigned_to == current_user.id,
-                            SentLetter.created_by == current_user.id
-                        ),
-                        SentLetter.status == SentLetterStatus.AWAITING_RESPONSE
-                    )
-                )
-            ).first()
-            
-            stats["response_received"] = db.exec(
-                select(func.count(SentLetter.id)).where(
-                    and_(
-                        or_(
-                            SentLetter.assigned_to == current_user.id,
-                            SentLetter.created_by == current_user.id
-                        ),
-                        SentLetter.status == SentLetterStatus.RESPONSE_RECEIVED
-                    )
-                )
-            ).first()
-            
-            # Count own overdue followups
-            today = datetime.utcnow()
-            stats["overdue_followups"] = db.exec(
-                select(func.count(SentLetter.id)).where(
-                    and_(
-                        or_(
-                            SentLetter.assigned_to == current_user.id,
-                            SentLetter.created_by == current_user.id
-                        ),
-                        SentLetter.follow_up_date < today,
-                        SentLetter.status == SentLetterStatus.AWAITING_RESPONSE
-                    )
-                )
-            ).first()
-        
-        return stats
+        # One aggregate query per letter table, each scoped by the shared access rules
+        return get_letters_overview(db, current_user)
         
     except HTTPException:
         raise
@@ -7,6 +7,7 @@ import logging
 from database import get_session
 from app.core.auth import get_current_user
 from app.utils.role_permissions import role_permissions
+from app.core.access_predicates import apply_access_filter
 
 from app.models.sent_letter import SentLetter, SentLetterStatus, SentLetterPriority, SentLetterCategory
 from app.models.user import User
@@ -14,6 +15,7 @@ from app.models.user import User
 from app.schemas.sent_letter_schema import SentLetterRead
 
 from app.crud.sent_letter_crud import get_sent_letter
+from app.crud.letter_statistics_crud import count_letters, letter_scope_predicate
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/sent-letters-legacy", tags=["Sent Letters Legacy"])
@@ -23,30 +25,7 @@ def get_filtered_letter_query(current_user: User, base_query, letter_type: str):
     if base_query is None:
         return base_query
     
-    user_role = getattr(current_user, 'role', None)
-    if not user_role:
-        return base_query.filter(False)  # Return no results
-    
-    role_name = user_role.name if hasattr(user_role, 'name') else str(user_role)
-    
-    # Super Admin can see all letters
-    if role_permissions.can_view_letters(role_name, None, None, None, None):
-        return base_query
-    
-    # Admin can see letters from their tenant
-    if role_permissions.can_view_letters(role_name, None, current_user.tenant_id, None, None):
-        return base_query.filter(SentLetter.tenant_id == current_user.tenant_id)
-    
-    # Field Agent can only see letters assigned to them
-    if role_permissions.can_view_letters(role_name, None, None, None, current_user.id):
-        return base_query.filter(
-            or_(
-                SentLetter.assigned_to == current_user.id,
-                SentLetter.created_by == current_user.id
-            )
-        )
-    
-    return base_query.filter(False)  # Return no results
+    return apply_access_filter(base_query, current_user, SentLetter, "view")
 
 @router.get("", response_model=List[SentLetterRead])
 def get_sent_letters_legacy(
@@ -112,131 +91,23 @@ def get_sent_letters_statistics_legacy(
         if not user_role:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User role not found")
         
-        role_name = user_role.name if hasattr(user_role, 'name') else str(user_role)
-        
-        # Initialize statistics
+        today = datetime.utcnow()
+        counts = count_letters(
+            db, SentLetter, letter_scope_predicate(SentLetter, current_user), today,
+            extra={
+                "overdue_awaiting": and_(
+                    SentLetter.follow_up_date < today,
+                    SentLetter.status == SentLetterStatus.AWAITING_RESPONSE
+                )
+            }
+        )
         stats = {
-            "total_letters": 0,
-            "awaiting_response": 0,
-            "response_received": 0,
-            "overdue_letters": 0
+            "total_letters": counts["total"],
+            "awaiting_response": counts["status"][SentLetterStatus.AWAITING_RESPONSE],
+            "response_received": counts["status"][SentLetterStatus.RESPONSE_RECEIVED],
+            "overdue_letters": counts["overdue_awaiting"]
         }
         
-        # Super Admin can see all statistics
-        if role_permissions.can_view_letters(role_name, None, None, None, None):
-            # Count all letters
-            stats["total_letters"] = db.exec(select(func.count(SentLetter.id))).first()
-            
-            # Count by status
-            stats["awaiting_response"] = db.exec(
-                select(func.count(SentLetter.id)).where(SentLetter.status == SentLetterStatus.AWAITING_RESPONSE)
-            ).first()
-            
-            stats["response_received"] = db.exec(
-                select(func.count(SentLetter.id)).where(SentLetter.status == SentLetterStatus.RESPONSE_RECEIVED)
-            ).first()
-            
-            # Count overdue followups
-            today = datetime.utcnow()
-            stats["overdue_letters"] = db.exec(
-                select(func.count(SentLetter.id)).where(
-                    and_(
-                        SentLetter.follow_up_date < today,
-                        SentLetter.status == SentLetterStatus.AWAITING_RESPONSE
-                    )
-                )
-            ).first()
-        
-        # Admin can see tenant statistics
-        elif role_permissions.can_view_letters(role_name, None, current_user.tenant_id, None, None):
-            # Count tenant letters
-            stats["total_letters"] = db.exec(
-                select(func.count(SentLetter.id)).where(SentLetter.tenant_id == current_user.tenant_id)
-            ).first()
-            
-            # Count by status for tenant
-            stats["awaiting_response"] = db.exec(
-                select(func.count(SentLetter.id)).where(
-                    and_(
-                        SentLetter.tenant_id == current_user.tenant_id,
-                        SentLetter.status == SentLetterStatus.AWAITING_RESPONSE
-                    )
-                )
-            ).first()
-            
-            stats["response_received"] = db.exec(
-                select(func.count(SentLetter.id)).where(
-                    and_(
-                        SentLetter.tenant_id == current_user.tenant_id,
-                        SentLetter.status == SentLetterStatus.RESPONSE_RECEIVED
-                    )
-                )
-            ).first()
-            
-            # Count overdue followups for tenant
-            today = datetime.utcnow()
-            stats["overdue_letters"] = db.exec(
-                select(func.count(SentLetter.id)).where(
-                    and_(
-                        SentLetter.tenant_id == current_user.tenant_id,
-                        SentLetter.follow_up_date < today,
-                        SentLetter.status == SentLetterStatus.AWAITING_RESPONSE
-                    )
-                )
-            ).first()
-        
-        # Field Agent can only see their own statistics
-        elif role_permissions.can_view_letters(role_name, None, None, None, current_user.id):
-            # Count own letters
-            stats["total_letters"] = db.exec(
-                select(func.count(SentLetter.id)).where(
-                    or_(
-                        SentLetter.assigned_to == current_user.id,
-                        SentLetter.created_by == current_user.id
-                    )
-                )
-            ).first()
-            
-            # Count own letters by status
-            stats["awaiting_response"] = db.exec(
-                select(func.count(SentLetter.id)).where(
-                    and_(
-                        or_(
-                            SentLetter.assigned_to == current_user.id,
-                            SentLetter.created_by == current_user.id
-                        ),
-                        SentLetter.status == SentLetterStatus.AWAITING_RESPONSE
-                    )
-                )
-            ).first()
-            
-            stats["response_received"] = db.exec(
-                select(func.count(SentLetter.id)).where(
-                    and_(
-                        or_(
-                            SentLetter.assigned_to == current_user.id,
-                            SentLetter.created_by == current_user.id
-                        ),
-                        SentLetter.status == SentLetterStatus.RESPONSE_RECEIVED
-                    )
-                )
-            ).first()
-            
-            # Count own overdue followups
-            today = datetime.utcnow()
-            stats["overdue_letters"] = db.exec(
-                select(func.count(SentLetter.id)).where(
-                    and_(
-                        or_(
-                            SentLetter.assigned_to == current_user.id,
-                            SentLetter.created_by == current_user.id
-                        ),
-                        SentLetter.follow_up_date < today,
-                        SentLetter.status == SentLetterStatus.AWAITING_RESPONSE
-                    )
-                )
-            ).first()
-        
         return stats
         
     except HTTPException:
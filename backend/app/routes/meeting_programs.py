@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlmodel import Session, select, and_, or_
+from sqlalchemy.orm import selectinload
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 import logging
@@ -7,51 +8,108 @@ import json
 from database import get_session
 from app.core.auth import get_current_user
 from app.utils.role_permissions import role_permissions
+from app.core.access_predicates import apply_access_filter, build_access_predicate, access_scope_key, resolve_access_scope
+from app.core.request_coalescing import coalesce
+from app.services.export_service import export_service, ExportError
+from app.services.job_service import job_runner
 
 from app.schemas.meeting_program_schema import (
     MeetingProgramCreate, MeetingProgramRead, MeetingProgramUpdate,
-    MeetingProgramKPIs, MeetingProgramStats
+    MeetingProgramKPIs, MeetingProgramStats, MeetingParticipantRead,
+    MeetingParticipantResponseUpdate, MeetingParticipationSummary, MeetingAttendanceCounts
 )
 from app.crud.meeting_program_crud import (
     create_meeting_program, get_meeting_program, get_all_meeting_programs,
     update_meeting_program, delete_meeting_program, get_upcoming_meetings_today,
-    get_upcoming_meetings_week, get_meeting_program_kpis, get_meeting_program_stats,
-    send_meeting_reminders
+    get_upcoming_meetings_week, get_meeting_program_kpis, get_meeting_program_stats
+)
+from app.crud.meeting_participant_crud import (
+    get_participant_meetings, get_participation_summary, get_meeting_attendance_counts,
+    update_participant_response
 )
 
 from app.models.meeting_program import MeetingProgram
+from app.models.meeting_participant import ParticipantRSVP
 from app.models.user import User
 from app.models.role import Role
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+def decode_participants(participants: Any) -> List[Any]:
+    """Decode participants JSON (or an already decoded list) into a list"""
+    if not participants:
+        return []
+    if isinstance(participants, str):
+        try:
+            participants = json.loads(participants)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Error parsing participants: {e}")
+            return []
+    return participants if isinstance(participants, list) else []
+
+def load_user_names(db: Session, user_ids) -> Dict[str, str]:
+    """Load names for a set of user IDs with a single IN query"""
+    user_ids = [user_id for user_id in set(user_ids) if user_id]
+    if not user_ids:
+        return {}
+    rows = db.exec(select(User.id, User.name).where(User.id.in_(user_ids))).all()
+    return {user_id: name for user_id, name in rows}
+
+def participant_names(participants: List[Any], user_names: Dict[str, str]) -> List[str]:
+    """Map decoded participants to names - objects with names or legacy user IDs"""
+    names = []
+    for participant in participants:
+        if isinstance(participant, dict) and 'name' in participant:
+            # New format: list of objects with names
+            names.append(participant['name'])
+        elif isinstance(participant, str) and participant in user_names:
+            # Old format: list of user IDs
+            names.append(user_names[participant])
+    return names
+
 def parse_participants(participants_json: str, db: Session) -> List[str]:
     """Parse participants JSON and return list of participant names"""
-    if not participants_json:
-        return []
-    
     try:
-        # Parse participants JSON - could be list of objects with names or list of user IDs
-        participant_data = json.loads(participants_json)
-        participant_names = []
-        
-        if isinstance(participant_data, list):
-            for participant in participant_data:
-                if isinstance(participant, dict) and 'name' in participant:
-                    # New format: list of objects with names
-                    participant_names.append(participant['name'])
-                elif isinstance(participant, str):
-                    # Old format: list of user IDs
-                    user = db.get(User, participant)
-                    if user:
-                        participant_names.append(user.name)
-        
-        return participant_names
-    except (json.JSONDecodeError, Exception) as e:
+        participants = decode_participants(participants_json)
+        user_ids = [p for p in participants if isinstance(p, str)]
+        return participant_names(participants, load_user_names(db, user_ids))
+    except Exception as e:
         logger.warning(f"Error parsing participants: {e}")
         return []
 
+def build_meeting_page(meetings: List[MeetingProgram], db: Session) -> List[MeetingProgramRead]:
+    """
+    Convert a page of meetings to response format, resolving the assignee and
+    participant names for the whole page with one user query
+    """
+    responses = [MeetingProgramRead.model_validate(meeting) for meeting in meetings]
+    
+    # Participants are decoded once by MeetingProgramRead; gather every referenced user
+    user_ids = set()
+    for meeting, response in zip(meetings, responses):
+        if meeting.user_id:
+            user_ids.add(meeting.user_id)
+        user_ids.update(p for p in decode_participants(response.participants) if isinstance(p, str))
+    user_names = load_user_names(db, user_ids)
+    
+    for meeting, response in zip(meetings, responses):
+        # Add frontend-compatible fields
+        response.date = meeting.scheduled_date.strftime("%Y-%m-%d")
+        if meeting.start_time and meeting.end_time:
+            response.time = f"{meeting.start_time} - {meeting.end_time}"
+        
+        # Creator is eager-loaded by the listing query
+        if meeting.creator:
+            response.creator_name = meeting.creator.name
+        
+        if meeting.user_id:
+            response.assigned_user_name = user_names.get(meeting.user_id)
+        
+        response.participant_names = participant_names(decode_participants(response.participants), user_names)
+    
+    return responses
+
 router = APIRouter(prefix="/meeting-programs", tags=["Meeting Programs"])
 
 def check_meeting_access(user: User, meeting: MeetingProgram) -> bool:
@@ -94,29 +152,26 @@ def get_filtered_meeting_query(current_user: User, base_query=None):
     if base_query is None:
         base_query = select(MeetingProgram)
     
-    user_role = getattr(current_user, 'role', None)
-    if not user_role:
-        return base_query.filter(MeetingProgram.id == None)  # Return no results
-    
-    # Extract role name from role object
-    role_name = user_role.name if hasattr(user_role, 'name') else str(user_role)
-    
-    # Super Admin can see all meetings
-    if role_permissions.can_view_meetings(role_name, None, None, None, None):
-        return base_query
-    
-    # Admin can see meetings they created and meetings assigned to Field Agents in their tenant
-    if role_permissions.can_view_meetings(role_name, current_user.tenant_id, current_user.tenant_id, None, None):
-        # For now, let's filter by tenant and then apply additional filtering in Python
-        # This is simpler and more reliable
-        return base_query.filter(MeetingProgram.tenant_id == current_user.tenant_id)
-    
-    # Field Agent can only see meetings assigned to them
-    if role_permissions.can_view_meetings(role_name, None, None, current_user.id, current_user.id):
-        return base_query.filter(MeetingProgram.user_id == current_user.id)
-    
-    # Default: no access
-    return base_query.filter(MeetingProgram.id == None)
+    # Admin tenant/Field Agent rules are compiled into SQL so pagination sees only visible rows
+    return apply_access_filter(base_query, current_user, MeetingProgram, "view")
+
+def apply_meeting_filters(
+    query,
+    status: Optional[str] = None,
+    meeting_type: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None
+):
+    """Apply the status, type and scheduled date filters of the meeting list"""
+    if status:
+        query = query.where(MeetingProgram.status == status)
+    if meeting_type:
+        query = query.where(MeetingProgram.meeting_type == meeting_type)
+    if date_from:
+        query = query.where(MeetingProgram.scheduled_date >= date_from)
+    if date_to:
+        query = query.where(MeetingProgram.scheduled_date <= date_to)
+    return query
 
 @router.post("/", response_model=MeetingProgramRead, status_code=status.HTTP_201_CREATED)
 async def create_meeting(
@@ -184,6 +239,34 @@ async def create_meeting(
             detail="Failed to create meeting program"
         )
 
+@router.get("/export")
+def export_meetings(
+    request: Request,
+    format: str = Query("csv", description="Export format: csv or xlsx"),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    meeting_type: Optional[str] = Query(None),
+    date_from: Optional[datetime] = Query(None),
+    date_to: Optional[datetime] = Query(None),
+    current_user: User = Depends(get_current_user)
+):
+    """Download every meeting program the user can see, matching the list filters, as CSV or XLSX"""
+    try:
+        query = export_service.export_query(
+            MeetingProgram,
+            where=[build_access_predicate(current_user, MeetingProgram, "view")],
+            order_by=[MeetingProgram.scheduled_date, MeetingProgram.id]
+        )
+        query = apply_meeting_filters(query, status_filter, meeting_type, date_from, date_to)
+        return export_service.response(query, "meeting_programs", format, request.headers.get("accept-encoding"))
+    except ExportError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in export_meetings endpoint: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to export meeting programs"
+        )
+
 @router.get("/{meeting_id}", response_model=MeetingProgramRead)
 async def get_meeting(
     meeting_id: str,
@@ -253,79 +336,15 @@ async def get_meetings(
         filtered_query = get_filtered_meeting_query(current_user, base_query)
         
         # Apply additional filters
-        if status:
-            filtered_query = filtered_query.filter(MeetingProgram.status == status)
-        if meeting_type:
-            filtered_query = filtered_query.filter(MeetingProgram.meeting_type == meeting_type)
-        if date_from:
-            filtered_query = filtered_query.filter(MeetingProgram.scheduled_date >= date_from)
-        if date_to:
-            filtered_query = filtered_query.filter(MeetingProgram.scheduled_date <= date_to)
+        filtered_query = apply_meeting_filters(filtered_query, status, meeting_type, date_from, date_to)
         
         # Execute query with pagination
+        filtered_query = filtered_query.options(selectinload(MeetingProgram.creator))
         result = db.exec(filtered_query.offset(skip).limit(limit))
         meetings = result.all()
         
-        # Apply additional role-based filtering for Admin users and Field Agents
-        filtered_meetings = []
-        user_role = getattr(current_user, 'role', None)
-        role_name = user_role.name if hasattr(user_role, 'name') else str(user_role) if user_role else None
-        
-        for meeting in meetings:
-            # For Admin users, only show meetings they created or meetings assigned to Field Agents
-            if role_name == "Admin":
-                # Check if admin created the meeting
-                if meeting.created_by == current_user.id:
-                    filtered_meetings.append(meeting)
-                    continue
-                
-                # Check if meeting is assigned to a Field Agent in their tenant
-                if meeting.user_id:
-                    assigned_user = db.get(User, meeting.user_id)
-                    if assigned_user and assigned_user.tenant_id == current_user.tenant_id:
-                        # Check if assigned user is a Field Agent
-                        if assigned_user.role and assigned_user.role.name == "FieldAgent":
-                            filtered_meetings.append(meeting)
-                            continue
-            
-            # For Field Agents, only show meetings assigned to them
-            elif role_name == "FieldAgent":
-                if meeting.user_id == current_user.id:
-                    filtered_meetings.append(meeting)
-                    continue
-            
-            # For Super Admin, include all meetings
-            elif role_name == "SuperAdmin":
-                filtered_meetings.append(meeting)
-            
-            # For other roles, no access
-        
         # Convert to response format
-        response_data = []
-        for meeting in filtered_meetings:
-            meeting_response = MeetingProgramRead.model_validate(meeting)
-            
-            # Add frontend-compatible fields
-            meeting_response.date = meeting.scheduled_date.strftime("%Y-%m-%d")
-            if meeting.start_time and meeting.end_time:
-                meeting_response.time = f"{meeting.start_time} - {meeting.end_time}"
-            
-            # Get creator name
-            if meeting.creator:
-                meeting_response.creator_name = meeting.creator.name
-            
-            # Get assigned user name
-            if meeting.user_id:
-                assigned_user = db.get(User, meeting.user_id)
-                if assigned_user:
-                    meeting_response.assigned_user_name = assigned_user.name
-            
-            # Get participant names from the parsed participants data
-            meeting_response.participant_names = parse_participants(meeting.participants, db)
-            
-            response_data.append(meeting_response)
-        
-        return response_data
+        return build_meeting_page(meetings, db)
         
     except Exception as e:
         logger.error(f"Error in get_meetings endpoint: {e}")
@@ -484,59 +503,10 @@ async def get_today_meetings(
                 MeetingProgram.status == "Upcoming"
             )
         )
-        meetings = db.exec(today_query).all()
-        
-        # Apply additional role-based filtering for Admin users and Field Agents
-        filtered_meetings = []
-        user_role = getattr(current_user, 'role', None)
-        role_name = user_role.name if hasattr(user_role, 'name') else str(user_role) if user_role else None
-        
-        for meeting in meetings:
-            # For Admin users, only show meetings they created or meetings assigned to Field Agents
-            if role_name == "Admin":
-                # Check if admin created the meeting
-                if meeting.created_by == current_user.id:
-                    filtered_meetings.append(meeting)
-                    continue
-                
-                # Check if meeting is assigned to a Field Agent in their tenant
-                if meeting.user_id:
-                    assigned_user = db.get(User, meeting.user_id)
-                    if assigned_user and assigned_user.tenant_id == current_user.tenant_id:
-                        # Check if assigned user is a Field Agent
-                        if assigned_user.role and assigned_user.role.name == "FieldAgent":
-                            filtered_meetings.append(meeting)
-                            continue
-            
-            # For Field Agents, only show meetings assigned to them
-            elif role_name == "FieldAgent":
-                if meeting.user_id == current_user.id:
-                    filtered_meetings.append(meeting)
-                    continue
-            
-            # For Super Admin, include all meetings
-            elif role_name == "SuperAdmin":
-                filtered_meetings.append(meeting)
-            
-            # For other roles, no access
+        meetings = db.exec(today_query.options(selectinload(MeetingProgram.creator))).all()
         
         # Convert to response format
-        response_data = []
-        for meeting in filtered_meetings:
-            meeting_response = MeetingProgramRead.model_validate(meeting)
-            
-            # Add frontend-compatible fields
-            meeting_response.date = meeting.scheduled_date.strftime("%Y-%m-%d")
-            if meeting.start_time and meeting.end_time:
-                meeting_response.time = f"{meeting.start_time} - {meeting.end_time}"
-            
-            # Get creator name
-            if meeting.creator:
-                meeting_response.creator_name = meeting.creator.name
-            
-            response_data.append(meeting_response)
-        
-        return response_data
+        return build_meeting_page(meetings, db)
         
     except Exception as e:
         logger.error(f"Error in get_today_meetings endpoint: {e}")
@@ -566,59 +536,10 @@ async def get_week_meetings(
                 MeetingProgram.status == "Upcoming"
             )
         )
-        meetings = db.exec(week_query).all()
-        
-        # Apply additional role-based filtering for Admin users and Field Agents
-        filtered_meetings = []
-        user_role = getattr(current_user, 'role', None)
-        role_name = user_role.name if hasattr(user_role, 'name') else str(user_role) if user_role else None
-        
-        for meeting in meetings:
-            # For Admin users, only show meetings they created or meetings assigned to Field Agents
-            if role_name == "Admin":
-                # Check if admin created the meeting
-                if meeting.created_by == current_user.id:
-                    filtered_meetings.append(meeting)
-                    continue
-                
-                # Check if meeting is assigned to a Field Agent in their tenant
-                if meeting.user_id:
-                    assigned_user = db.get(User, meeting.user_id)
-                    if assigned_user and assigned_user.tenant_id == current_user.tenant_id:
-                        # Check if assigned user is a Field Agent
-                        if assigned_user.role and assigned_user.role.name == "FieldAgent":
-                            filtered_meetings.append(meeting)
-                            continue
-            
-            # For Field Agents, only show meetings assigned to them
-            elif role_name == "FieldAgent":
-                if meeting.user_id == current_user.id:
-                    filtered_meetings.append(meeting)
-                    continue
-            
-            # For Super Admin, include all meetings
-            elif role_name == "SuperAdmin":
-                filtered_meetings.append(meeting)
-            
-            # For other roles, no access
+        meetings = db.exec(week_query.options(selectinload(MeetingProgram.creator))).all()
         
         # Convert to response format
-        response_data = []
-        for meeting in filtered_meetings:
-            meeting_response = MeetingProgramRead.model_validate(meeting)
-            
-            # Add frontend-compatible fields
-            meeting_response.date = meeting.scheduled_date.strftime("%Y-%m-%d")
-            if meeting.start_time and meeting.end_time:
-                meeting_response.time = f"{meeting.start_time} - {meeting.end_time}"
-            
-            # Get creator name
-            if meeting.creator:
-                meeting_response.creator_name = meeting.creator.name
-            
-            response_data.append(meeting_response)
-        
-        return response_data
+        return build_meeting_page(meetings, db)
         
     except Exception as e:
         logger.error(f"Error in get_week_meetings endpoint: {e}")
@@ -627,8 +548,13 @@ async def get_week_meetings(
             detail="Failed to get week's meetings"
         )
 
+def meeting_scope(current_user: User, **_) -> str:
+    return access_scope_key(current_user, MeetingProgram)
+
+# Sync so the queries run on a worker thread and concurrent calls can share them
 @router.get("/dashboard/kpis", response_model=MeetingProgramKPIs)
-async def get_meeting_kpis(
+@coalesce("/meeting-programs/dashboard/kpis", scope=meeting_scope)
+def get_meeting_kpis(
     db: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
@@ -646,7 +572,8 @@ async def get_meeting_kpis(
         )
 
 @router.get("/dashboard/stats", response_model=MeetingProgramStats)
-async def get_meeting_stats(
+@coalesce("/meeting-programs/dashboard/stats", scope=meeting_scope)
+def get_meeting_stats(
     db: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
@@ -740,21 +667,20 @@ async def send_reminders(
     db: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
-    """Send reminders for upcoming meetings"""
+    """Queue a background job that sends reminders for the upcoming meetings the user may edit"""
     try:
-        # Get reminders with role-based filtering
-        # For now, we'll use the existing function but filter results based on user access
-        if current_user.role and current_user.role.name == "SuperAdmin":
-            meetings_with_reminders = send_meeting_reminders(db, None)
-        elif current_user.role and current_user.role.name == "Admin":
-            meetings_with_reminders = send_meeting_reminders(db, current_user.tenant_id)
-        else:
-            # Field Agent - only their assigned meetings
-            meetings_with_reminders = send_meeting_reminders(db, None)
-        
+        if resolve_access_scope(current_user, MeetingProgram, "edit") is None:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not allowed to send meeting reminders"
+            )
+
+        # The job applies the caller's edit scope when selecting meetings
+        job_id = job_runner.enqueue("send_meeting_reminders", {"user_id": current_user.id})
+
         return {
-            "message": f"Reminders sent for {len(meetings_with_reminders)} meetings",
-            "meetings_count": len(meetings_with_reminders)
+            "message": "Meeting reminders queued",
+            "job_id": job_id
         }
         
     except HTTPException:
@@ -822,4 +748,106 @@ async def upload_meeting_minutes(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to upload meeting minutes"
         )
- 
\ No newline at end of file
+ 
+@router.get("/my/meetings", response_model=List[MeetingProgramRead])
+async def get_my_meetings(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    date_from: Optional[datetime] = Query(None),
+    db: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Get meetings the current user is assigned to or listed as a participant in"""
+    try:
+        meetings = get_participant_meetings(
+            db, str(current_user.id), skip=skip, limit=limit,
+            status_filter=status_filter, date_from=date_from
+        )
+        return build_meeting_page(meetings, db)
+        
+    except Exception as e:
+        logger.error(f"Error in get_my_meetings endpoint: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get your meetings"
+        )
+
+@router.get("/my/participation", response_model=MeetingParticipationSummary)
+async def get_my_participation(
+    db: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Get RSVP and attendance counts for the current user"""
+    try:
+        return get_participation_summary(db, str(current_user.id))
+        
+    except Exception as e:
+        logger.error(f"Error in get_my_participation endpoint: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get participation summary"
+        )
+
+@router.get("/{meeting_id}/attendance", response_model=MeetingAttendanceCounts)
+async def get_meeting_attendance(
+    meeting_id: str,
+    db: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Get invited/accepted/declined/attended counts for a meeting"""
+    try:
+        meeting = get_meeting_program(db, meeting_id)
+        if not meeting:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Meeting program not found"
+            )
+        
+        if not check_meeting_access(current_user, meeting):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied to this meeting program"
+            )
+        
+        counts = get_meeting_attendance_counts(db, [meeting_id])[meeting_id]
+        return MeetingAttendanceCounts(meeting_id=meeting_id, **counts)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in get_meeting_attendance endpoint: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to get meeting attendance"
+        )
+
+@router.put("/{meeting_id}/response", response_model=List[MeetingParticipantRead])
+async def update_my_meeting_response(
+    meeting_id: str,
+    response_data: MeetingParticipantResponseUpdate,
+    db: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Record the current user's RSVP and/or attendance for a meeting"""
+    try:
+        participant_rows = update_participant_response(
+            db, meeting_id, str(current_user.id),
+            rsvp=ParticipantRSVP(response_data.rsvp) if response_data.rsvp else None,
+            attended=response_data.attended
+        )
+        if not participant_rows:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="You are not a participant of this meeting program"
+            )
+        return participant_rows
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in update_my_meeting_response endpoint: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to update meeting response"
+        )
@@ -0,0 +1,53 @@
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import PlainTextResponse
+from typing import List
+import hmac
+import logging
+
+from config import settings
+from app.core.metrics import metrics, counter_lines, gauge_lines
+
+logger = logging.getLogger(__name__)
+router = APIRouter(tags=["Metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+def translation_cache_lines() -> List[str]:
+    """Translation cache counters, read from the service's own stats on each scrape"""
+    if not settings.TRANSLATION_ENABLED:
+        return []
+    from app.services.translation_service import translation_service
+
+    stats = translation_service.get_stats()
+    lookups = [
+        ({"result": "hit"}, stats["memory_hits"] + stats["db_hits"] + stats["deduplicated"]),
+        ({"result": "miss"}, stats["misses"]),
+    ]
+    return (
+        counter_lines("translation_cache_requests_total", "Translation lookups by result", lookups)
+        + gauge_lines("translation_cache_entries", "Translations held in memory", [({}, stats["memory_entries"])])
+    )
+
+metrics.register_collector(translation_cache_lines)
+
+def check_metrics_token(request: Request):
+    if not settings.METRICS_TOKEN:
+        if settings.METRICS_ALLOW_UNAUTHENTICATED:
+            return
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Metrics token not configured")
+    authorization = request.headers.get("Authorization", "")
+    if not hmac.compare_digest(authorization, f"Bearer {settings.METRICS_TOKEN}"):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def get_metrics(request: Request):
+    """Request, database pool and cache metrics in the Prometheus text format"""
+    check_metrics_token(request)
+    try:
+        return PlainTextResponse(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+    except Exception as e:
+        logger.error(f"Error rendering metrics: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to render metrics"
+        )
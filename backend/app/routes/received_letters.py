@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlmodel import Session, select, or_, and_
 from typing import List, Optional
 from datetime import datetime
@@ -11,15 +11,19 @@ from app.models.role import Role
 from app.models.received_letter import ReceivedLetter, LetterStatus, LetterPriority, LetterCategory
 from app.schemas.received_letter_schema import (
     ReceivedLetterCreate, ReceivedLetterRead, ReceivedLetterUpdate, 
-    ReceivedLetterList, LetterStatistics, LetterFilters
+    ReceivedLetterList, LetterStatistics, LetterFilters, ReceivedLetterBulkUpdate
 )
 from app.crud.received_letter_crud import (
     create_received_letter, get_received_letter, get_all_received_letters,
-    get_filtered_received_letters, update_received_letter, delete_received_letter,
+    apply_received_letter_filters, update_received_letter, delete_received_letter,
     get_letter_statistics, get_letters_by_status, get_letters_by_priority,
     get_overdue_letters, assign_letter_to_user, update_letter_status
 )
+from app.crud.letter_bulk_crud import bulk_update_letters
 from app.utils.role_permissions import RolePermissions
+from app.core.access_predicates import apply_access_filter, build_access_predicate
+from app.services.export_service import export_service, ExportError
+from app.crud.content_translation_crud import localize_records, resolve_content_language
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/letters/received", tags=["Received Letters"])
@@ -55,44 +59,7 @@ def get_filtered_letter_query(current_user: User, base_query, db: Session, lette
     if base_query is None:
         return base_query
     
-    user_role = get_user_role_name(current_user)
-    
-    # Super Admin can see all letters
-    if user_role == "super_admin":
-        return base_query
-    
-    # Admin can see letters they created + letters assigned to their Field Agents
-    if user_role == "admin":
-        if hasattr(current_user, 'tenant_id') and current_user.tenant_id:
-            # Get Field Agent IDs in the same tenant
-            field_agent_ids = db.exec(
-                select(User.id).where(
-                    and_(
-                        User.tenant_id == current_user.tenant_id,
-                        User.role_id.in_(
-                            select(Role.id).where(Role.name == "FieldAgent")
-                        )
-                    )
-                )
-            ).all()
-            
-            # Filter for letters created by admin OR assigned to their Field Agents
-            return base_query.filter(
-                or_(
-                    ReceivedLetter.created_by == str(current_user.id),
-                    ReceivedLetter.assigned_to.in_([str(fa_id) for fa_id in field_agent_ids])
-                )
-            )
-        else:
-            # If no tenant_id, only show letters created by admin
-            return base_query.filter(ReceivedLetter.created_by == str(current_user.id))
-    
-    # Field Agent can only see letters assigned to them
-    if user_role in ["field_agent", "assistant"]:
-        return base_query.filter(ReceivedLetter.assigned_to == str(current_user.id))
-    
-    # Regular users can only see letters they created
-    return base_query.filter(ReceivedLetter.created_by == str(current_user.id))
+    return apply_access_filter(base_query, current_user, ReceivedLetter, "view")
 
 # Test endpoint that doesn't require authentication
 @router.get("/test", response_model=dict)
@@ -134,6 +101,7 @@ def get_letters(
     date_to: Optional[datetime] = Query(None, description="Filter by received date to"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    lang: Optional[str] = Query(None, description="Return stored translations of text fields in this language (defaults to the user's language preference)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_session)
 ):
@@ -188,13 +156,15 @@ def get_letters(
         
         total_pages = (total + per_page - 1) // per_page
         
-        return ReceivedLetterList(
+        letter_list = ReceivedLetterList(
             letters=letters,
             total=total,
             page=page,
             per_page=per_page,
             total_pages=total_pages
         )
+        localize_records(db, "received_letter", letter_list.letters, resolve_content_language(lang, current_user))
+        return letter_list
         
     except Exception as e:
         logger.error(f"Error fetching letters: {str(e)}")
@@ -220,6 +190,45 @@ def get_all_letters(
             detail=f"Failed to fetch letters: {str(e)}"
         )
 
+@router.get("/export")
+def export_letters(
+    request: Request,
+    format: str = Query("csv", description="Export format: csv or xlsx"),
+    search: Optional[str] = Query(None, description="Search term for sender, subject, content, or category"),
+    status_filter: Optional[LetterStatus] = Query(None, alias="status", description="Filter by letter status"),
+    priority: Optional[LetterPriority] = Query(None, description="Filter by letter priority"),
+    category: Optional[LetterCategory] = Query(None, description="Filter by letter category"),
+    assigned_to: Optional[str] = Query(None, description="Filter by assigned user ID"),
+    date_from: Optional[datetime] = Query(None, description="Filter by received date from"),
+    date_to: Optional[datetime] = Query(None, description="Filter by received date to"),
+    current_user: User = Depends(get_current_user)
+):
+    """Download every received letter the user can see, matching the filters, as CSV or XLSX"""
+    try:
+        filters = LetterFilters(
+            search=search,
+            status=status_filter,
+            priority=priority,
+            category=category,
+            assigned_to=assigned_to,
+            date_from=date_from,
+            date_to=date_to
+        )
+        query = export_service.export_query(
+            ReceivedLetter,
+            where=[build_access_predicate(current_user, ReceivedLetter, "view")]
+        )
+        query = apply_received_letter_filters(query, filters)
+        return export_service.response(query, "received_letters", format, request.headers.get("accept-encoding"))
+    except ExportError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error exporting received letters: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to export letters"
+        )
+
 @router.get("/{letter_id}", response_model=ReceivedLetterRead)
 def get_letter(
     letter_id: int,
@@ -455,14 +464,7 @@ def get_statistics(
 ):
     """Get letter statistics with role-based filtering"""
     try:
-        # Get user role and tenant_id for filtering
-        user_role = get_user_role_name(current_user)
-        tenant_id = None
-        
-        if user_role == "admin" and hasattr(current_user, 'tenant_id'):
-            tenant_id = current_user.tenant_id
-        
-        stats = get_letter_statistics(db, tenant_id, str(current_user.id), user_role)
+        stats = get_letter_statistics(db, user=current_user)
         return stats
     except Exception as e:
         logger.error(f"Error fetching letter statistics: {str(e)}")
@@ -518,6 +520,34 @@ def get_overdue_letters_route(
             detail=f"Failed to fetch overdue letters: {str(e)}"
         )
 
+@router.post("/bulk-update", response_model=dict)
+def bulk_update_letters_route(
+    bulk_update: ReceivedLetterBulkUpdate,
+    db: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Change status, priority and/or assignee of many received letters at once"""
+    try:
+        updates = bulk_update.model_dump(exclude_unset=True, exclude={"letter_ids"})
+        results = bulk_update_letters(db, ReceivedLetter, current_user, bulk_update.letter_ids, updates)
+        updated_count = sum(1 for outcome in results.values() if outcome == "updated")
+
+        return {
+            "message": "Bulk update completed",
+            "updated_count": updated_count,
+            "failed_count": len(results) - updated_count,
+            "total_processed": len(results),
+            "results": results
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in bulk update of received letters: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to perform bulk update"
+        )
+
 @router.post("/{letter_id}/assign", response_model=ReceivedLetterRead)
 def assign_letter(
     letter_id: int,
@@ -0,0 +1,142 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlmodel import Session
+from typing import List, Optional
+from datetime import datetime
+import logging
+
+from database import get_session
+from app.core.auth import get_current_user
+from app.core.access_predicates import get_principal_role_name
+from app.models.user import User
+from app.models.report_result import ReportResult, ReportStatus
+from app.schemas.report_schema import ReportDefinitionRead, ReportResultRead
+from app.crud.report_crud import decode_report_rows, decode_report_params
+from app.services.report_services import report_service
+from app.utils.role_permissions import role_permissions
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/reports", tags=["Reports"])
+
+def resolve_report_tenant(current_user: User, requested_tenant_id: Optional[str] = None) -> Optional[str]:
+    """
+    Tenant a report runs for. Admins only see their own tenant; users who can
+    switch tenants may pick one, or leave it out to report across all tenants.
+    """
+    role_name = get_principal_role_name(current_user)
+    if not role_permissions.can_view_reports(role_name):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to view reports"
+        )
+    if role_permissions.can_switch_tenants(role_name):
+        return requested_tenant_id
+
+    tenant_id = getattr(current_user, 'tenant_id', None)
+    if not tenant_id or (requested_tenant_id and requested_tenant_id != tenant_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Reports are limited to your own tenant"
+        )
+    return tenant_id
+
+def get_report_definition_or_404(report_key: str):
+    definition = report_service.get_definition(report_key)
+    if not definition:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown report: {report_key}")
+    return definition
+
+def build_report_params(date_from: Optional[datetime], date_to: Optional[datetime]) -> dict:
+    params = {}
+    if date_from:
+        params["date_from"] = date_from.isoformat()
+    if date_to:
+        params["date_to"] = date_to.isoformat()
+    return params
+
+def to_result_read(result: ReportResult, stale: bool = False) -> ReportResultRead:
+    return ReportResultRead(
+        report_key=result.report_key,
+        tenant_id=result.tenant_id,
+        params=decode_report_params(result),
+        status=result.status,
+        stale=stale,
+        rows=decode_report_rows(result),
+        row_count=result.row_count,
+        generated_at=result.generated_at,
+        expires_at=result.expires_at,
+        job_id=result.job_id,
+        error=result.error
+    )
+
+@router.get("/", response_model=List[ReportDefinitionRead])
+def list_reports(current_user: User = Depends(get_current_user)):
+    """List the available reports"""
+    resolve_report_tenant(current_user)
+    return [
+        ReportDefinitionRead(
+            key=definition.key,
+            title=definition.title,
+            description=definition.description,
+            dimensions=definition.dimensions,
+            metrics=definition.metrics
+        )
+        for definition in report_service.definitions()
+    ]
+
+@router.get("/{report_key}", response_model=ReportResultRead)
+def get_report(
+    report_key: str,
+    response: Response,
+    tenant_id: Optional[str] = Query(None, description="Tenant to report on (tenant switchers only; omit for all)"),
+    date_from: Optional[datetime] = Query(None, description="Only records created from this date"),
+    date_to: Optional[datetime] = Query(None, description="Only records created up to this date"),
+    db: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get the cached result of a report. A missing or expired result is refreshed in
+    the background: expired rows are returned with stale=true, and a report that
+    was never computed returns 202 with no rows until its job finishes.
+    """
+    get_report_definition_or_404(report_key)
+    report_tenant_id = resolve_report_tenant(current_user, tenant_id)
+    try:
+        result, stale = report_service.get_result(
+            db, report_key, report_tenant_id, build_report_params(date_from, date_to)
+        )
+    except Exception as e:
+        logger.error(f"Error loading report {report_key}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to load report"
+        )
+
+    if result.rows is None and result.status != ReportStatus.FAILED:
+        response.status_code = status.HTTP_202_ACCEPTED
+    return to_result_read(result, stale)
+
+@router.post("/{report_key}/refresh", response_model=ReportResultRead, status_code=status.HTTP_202_ACCEPTED)
+def refresh_report(
+    report_key: str,
+    tenant_id: Optional[str] = Query(None, description="Tenant to report on (tenant switchers only; omit for all)"),
+    date_from: Optional[datetime] = Query(None, description="Only records created from this date"),
+    date_to: Optional[datetime] = Query(None, description="Only records created up to this date"),
+    full: bool = Query(False, description="Recompute every period instead of only the changed ones"),
+    db: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Queue a refresh of a report now, without waiting for its cached result to expire"""
+    get_report_definition_or_404(report_key)
+    report_tenant_id = resolve_report_tenant(current_user, tenant_id)
+    try:
+        result, _ = report_service.get_result(
+            db, report_key, report_tenant_id, build_report_params(date_from, date_to)
+        )
+        result = report_service.request_refresh(db, result, full)
+        return to_result_read(result)
+    except Exception as e:
+        logger.error(f"Error queueing refresh of report {report_key}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to queue report refresh"
+        )
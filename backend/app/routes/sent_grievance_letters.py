@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlmodel import Session, select, and_, or_
 from typing import List, Optional
 from datetime import datetime
@@ -8,7 +8,11 @@ from database import get_session
 from app.core.auth import get_current_user
 from app.models.user import User
 from app.models.citizen_issues import CitizenIssue
+from app.core.access_predicates import apply_access_filter, build_access_predicate
+from app.services.export_service import export_service, ExportError
+from app.crud.content_translation_crud import localize_records, resolve_content_language
 from app.models.sent_grievance_letter import (
+    SentGrievanceLetter,
     SentGrievanceLetterStatus, 
     SentGrievanceLetterPriority, 
     SentGrievanceLetterCategory
@@ -19,13 +23,15 @@ from app.schemas.sent_grievance_letter_schema import (
     SentGrievanceLetterUpdate, 
     SentGrievanceLetterList, 
     SentGrievanceLetterStatistics, 
-    SentGrievanceLetterFilters
+    SentGrievanceLetterFilters,
+    SentGrievanceLetterBulkUpdate
 )
 from app.crud.sent_grievance_letter_crud import (
     create_sent_grievance_letter, 
     get_sent_grievance_letter, 
     get_all_sent_grievance_letters,
     get_filtered_sent_grievance_letters, 
+    apply_sent_grievance_letter_filters,
     update_sent_grievance_letter, 
     delete_sent_grievance_letter,
     get_sent_grievance_letter_statistics, 
@@ -37,6 +43,7 @@ from app.crud.sent_grievance_letter_crud import (
     update_sent_grievance_letter_status, 
     record_response_received
 )
+from app.crud.letter_bulk_crud import bulk_update_letters
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/sent-grievance-letters", tags=["Sent Letters - Public Grievance"])
@@ -89,31 +96,9 @@ def check_letter_access(user: User, letter, letter_type: str = "sent_grievance")
 def get_filtered_letter_query(current_user: User, base_query=None):
     """Get query with role-based filtering for letters"""
     if base_query is None:
-        from app.models.sent_grievance_letter import SentGrievanceLetter
         base_query = select(SentGrievanceLetter)
     
-    user_role = get_user_role_name(current_user)
-    
-    # Super Admin can see all letters
-    if user_role == "super_admin":
-        return base_query
-    
-    # Admin can see letters from their tenant
-    if user_role in ["admin", "tenant_admin"]:
-        if hasattr(current_user, 'tenant_id') and current_user.tenant_id:
-            return base_query.where(SentGrievanceLetter.tenant_id == current_user.tenant_id)
-        return base_query.filter(False)  # Return no results if no tenant
-    
-    # Field Agent can only see letters they created or are assigned to
-    if user_role in ["field_agent", "assistant", "FieldAgent"]:
-        return base_query.filter(
-            or_(
-                SentGrievanceLetter.created_by == current_user.id,
-                SentGrievanceLetter.assigned_to == current_user.id
-            )
-        )
-    
-    return base_query.filter(False)  # Return no results for unknown roles
+    return apply_access_filter(base_query, current_user, SentGrievanceLetter, "view")
 
 # Test endpoint that doesn't require authentication
 @router.get("/test", response_model=dict)
@@ -242,6 +227,7 @@ def get_letters_authenticated(
     date_to: Optional[datetime] = Query(None, description="Filter by sent date to"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    lang: Optional[str] = Query(None, description="Return stored translations of text fields in this language (defaults to the user's language preference)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_session)
 ):
@@ -307,8 +293,11 @@ def get_letters_authenticated(
             "total_pages": (total + per_page - 1) // per_page
         }
         
+        letter_list = SentGrievanceLetterList(**result)
+        localize_records(db, "sent_grievance_letter", letter_list.letters, resolve_content_language(lang, current_user))
+
         logger.info(f"Returning {len(letters)} letters out of {total} total for user {current_user.email}")
-        return SentGrievanceLetterList(**result)
+        return letter_list
         
     except Exception as e:
         logger.error(f"Error fetching sent grievance letters: {str(e)}")
@@ -414,6 +403,47 @@ def get_accessible_citizen_issues(
             detail=f"Failed to fetch accessible citizen issues: {str(e)}"
         )
 
+@router.get("/export")
+def export_letters(
+    request: Request,
+    format: str = Query("csv", description="Export format: csv or xlsx"),
+    search: Optional[str] = Query(None, description="Search term for recipient, organization, subject, content, or category"),
+    status_filter: Optional[SentGrievanceLetterStatus] = Query(None, alias="status", description="Filter by letter status"),
+    priority: Optional[SentGrievanceLetterPriority] = Query(None, description="Filter by letter priority"),
+    category: Optional[SentGrievanceLetterCategory] = Query(None, description="Filter by letter category"),
+    grievance_id: Optional[str] = Query(None, description="Filter by grievance ID"),
+    assigned_to: Optional[str] = Query(None, description="Filter by assigned user ID"),
+    date_from: Optional[datetime] = Query(None, description="Filter by sent date from"),
+    date_to: Optional[datetime] = Query(None, description="Filter by sent date to"),
+    current_user: User = Depends(get_current_user)
+):
+    """Download every sent grievance letter the user can see, matching the filters, as CSV or XLSX"""
+    try:
+        filters = SentGrievanceLetterFilters(
+            search=search,
+            status=status_filter,
+            priority=priority,
+            category=category,
+            grievance_id=grievance_id,
+            assigned_to=assigned_to,
+            date_from=date_from,
+            date_to=date_to
+        )
+        query = export_service.export_query(
+            SentGrievanceLetter,
+            where=[build_access_predicate(current_user, SentGrievanceLetter, "view")]
+        )
+        query = apply_sent_grievance_letter_filters(query, filters)
+        return export_service.response(query, "sent_grievance_letters", format, request.headers.get("accept-encoding"))
+    except ExportError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error exporting sent grievance letters: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to export sent grievance letters"
+        )
+
 @router.get("/{letter_id}", response_model=SentGrievanceLetterRead)
 def get_letter(
     letter_id: int,
@@ -495,11 +525,12 @@ def delete_letter(
 
 @router.get("/statistics/overview", response_model=SentGrievanceLetterStatistics)
 def get_statistics(
+    current_user: User = Depends(get_current_user),
     db: Session = Depends(get_session)
 ):
-    """Get statistics for sent grievance letters"""
+    """Get statistics for sent grievance letters with role-based filtering"""
     try:
-        stats = get_sent_grievance_letter_statistics(db, None)
+        stats = get_sent_grievance_letter_statistics(db, user=current_user)
         return stats
     except Exception as e:
         logger.error(f"Error fetching sent grievance letter statistics: {str(e)}")
@@ -570,6 +601,34 @@ def get_followups_due_this_week_endpoint(
             detail=f"Failed to fetch followups due this week: {str(e)}"
         )
 
+@router.post("/bulk-update", response_model=dict)
+def bulk_update_letters_route(
+    bulk_update: SentGrievanceLetterBulkUpdate,
+    db: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Change status, priority and/or assignee of many sent grievance letters at once"""
+    try:
+        updates = bulk_update.model_dump(exclude_unset=True, exclude={"letter_ids"})
+        results = bulk_update_letters(db, SentGrievanceLetter, current_user, bulk_update.letter_ids, updates)
+        updated_count = sum(1 for outcome in results.values() if outcome == "updated")
+
+        return {
+            "message": "Bulk update completed",
+            "updated_count": updated_count,
+            "failed_count": len(results) - updated_count,
+            "total_processed": len(results),
+            "results": results
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in bulk update of sent grievance letters: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to perform bulk update"
+        )
+
 @router.post("/{letter_id}/assign", response_model=SentGrievanceLetterRead)
 def assign_letter(
     letter_id: int,
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlmodel import Session
 from typing import List, Optional
 from datetime import datetime
@@ -6,20 +6,24 @@ import logging
 
 from database import get_session
 from app.core.auth import get_current_user
-from app.models.sent_letter import SentLetterStatus, SentLetterPriority, SentLetterCategory
+from app.models.sent_letter import SentLetter, SentLetterStatus, SentLetterPriority, SentLetterCategory
 from app.schemas.sent_letter_schema import (
     SentLetterCreate, SentLetterRead, SentLetterUpdate, 
-    SentLetterList, SentLetterStatistics, SentLetterFilters
+    SentLetterList, SentLetterStatistics, SentLetterFilters, SentLetterBulkUpdate
 )
 from app.crud.sent_letter_crud import (
     create_sent_letter, get_sent_letter, get_all_sent_letters,
-    get_filtered_sent_letters, update_sent_letter, delete_sent_letter,
+    get_filtered_sent_letters, apply_sent_letter_filters, update_sent_letter, delete_sent_letter,
     get_sent_letter_statistics, get_sent_letters_by_status, get_sent_letters_by_priority,
     get_overdue_followups, get_followups_due_this_week, assign_sent_letter_to_user, 
     update_sent_letter_status, record_response_received
 )
+from app.crud.letter_bulk_crud import bulk_update_letters
 from app.models.user import User
 from app.utils.role_permissions import RolePermissions
+from app.crud.content_translation_crud import localize_records, resolve_content_language
+from app.core.access_predicates import build_access_predicate
+from app.services.export_service import export_service, ExportError
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/sent-letters", tags=["Sent Letters - Public Interest"])
@@ -90,6 +94,7 @@ def get_letters(
     date_to: Optional[datetime] = Query(None, description="Filter by sent date to"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    lang: Optional[str] = Query(None, description="Return stored translations of text fields in this language (defaults to the user's language preference)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_session)
 ):
@@ -114,7 +119,9 @@ def get_letters(
         user_role = get_user_role_name(current_user)
         
         result = get_filtered_sent_letters(db, filters, tenant_id, str(current_user.id), user_role)
-        return SentLetterList(**result)
+        letter_list = SentLetterList(**result)
+        localize_records(db, "sent_letter", letter_list.letters, resolve_content_language(lang, current_user))
+        return letter_list
     except Exception as e:
         logger.error(f"Error fetching sent letters: {str(e)}")
         raise HTTPException(
@@ -147,11 +154,7 @@ def get_statistics(
 ):
     """Get sent letter statistics for dashboard KPIs with role-based filtering"""
     try:
-        # Get user role and tenant_id for filtering
-        user_role = get_user_role_name(current_user)
-        tenant_id = current_user.tenant_id if hasattr(current_user, 'tenant_id') else None
-        
-        stats = get_sent_letter_statistics(db, tenant_id, str(current_user.id), user_role)
+        stats = get_sent_letter_statistics(db, user=current_user)
         return stats
     except Exception as e:
         logger.error(f"Error fetching sent letter statistics: {str(e)}")
@@ -162,11 +165,12 @@ def get_statistics(
 
 @router.get("/statistics/overview", response_model=SentLetterStatistics)
 def get_statistics_overview(
+    current_user: User = Depends(get_current_user),
     db: Session = Depends(get_session)
 ):
-    """Get sent letter statistics for dashboard KPIs (alternative endpoint)"""
+    """Get sent letter statistics for dashboard KPIs (alternative endpoint) with role-based filtering"""
     try:
-        stats = get_sent_letter_statistics(db, None)
+        stats = get_sent_letter_statistics(db, user=current_user)
         return stats
     except Exception as e:
         logger.error(f"Error fetching sent letter statistics: {str(e)}")
@@ -191,7 +195,7 @@ def get_statuses():
     return [status.value for status in SentLetterStatus]
 
 @router.get("/overdue-followups", response_model=List[SentLetterRead])
-def get_overdue_followups(
+def get_overdue_followups_endpoint(
     db: Session = Depends(get_session)
 ):
     """Get all sent letters with overdue follow-ups"""
@@ -206,7 +210,7 @@ def get_overdue_followups(
         )
 
 @router.get("/followups-due-this-week", response_model=List[SentLetterRead])
-def get_followups_due_this_week(
+def get_followups_due_this_week_endpoint(
     db: Session = Depends(get_session)
 ):
     """Get all sent letters with follow-ups due this week"""
@@ -297,6 +301,45 @@ def get_statuses_list():
     """Get list of available sent letter statuses (alternative endpoint)"""
     return [status.value for status in SentLetterStatus]
 
+@router.get("/export")
+def export_letters(
+    request: Request,
+    format: str = Query("csv", description="Export format: csv or xlsx"),
+    search: Optional[str] = Query(None, description="Search term for recipient, organization, subject, content, or category"),
+    status_filter: Optional[SentLetterStatus] = Query(None, alias="status", description="Filter by letter status"),
+    priority: Optional[SentLetterPriority] = Query(None, description="Filter by letter priority"),
+    category: Optional[SentLetterCategory] = Query(None, description="Filter by letter category"),
+    assigned_to: Optional[str] = Query(None, description="Filter by assigned user ID"),
+    date_from: Optional[datetime] = Query(None, description="Filter by sent date from"),
+    date_to: Optional[datetime] = Query(None, description="Filter by sent date to"),
+    current_user: User = Depends(get_current_user)
+):
+    """Download every sent letter the user can see, matching the filters, as CSV or XLSX"""
+    try:
+        filters = SentLetterFilters(
+            search=search,
+            status=status_filter,
+            priority=priority,
+            category=category,
+            assigned_to=assigned_to,
+            date_from=date_from,
+            date_to=date_to
+        )
+        query = export_service.export_query(
+            SentLetter,
+            where=[build_access_predicate(current_user, SentLetter, "view")]
+        )
+        query = apply_sent_letter_filters(query, filters)
+        return export_service.response(query, "sent_letters", format, request.headers.get("accept-encoding"))
+    except ExportError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error exporting sent letters: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to export sent letters"
+        )
+
 # Now the /{letter_id} routes
 @router.get("/{letter_id}", response_model=SentLetterRead)
 def get_letter(
@@ -486,6 +529,34 @@ def delete_letter(
             detail=f"Failed to delete sent letter: {str(e)}"
         )
 
+@router.post("/bulk-update", response_model=dict)
+def bulk_update_letters_route(
+    bulk_update: SentLetterBulkUpdate,
+    db: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """Change status, priority and/or assignee of many sent letters at once"""
+    try:
+        updates = bulk_update.model_dump(exclude_unset=True, exclude={"letter_ids"})
+        results = bulk_update_letters(db, SentLetter, current_user, bulk_update.letter_ids, updates)
+        updated_count = sum(1 for outcome in results.values() if outcome == "updated")
+
+        return {
+            "message": "Bulk update completed",
+            "updated_count": updated_count,
+            "failed_count": len(results) - updated_count,
+            "total_processed": len(results),
+            "results": results
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in bulk update of sent letters: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to perform bulk update"
+        )
+
 @router.post("/{letter_id}/assign", response_model=SentLetterRead)
 def assign_letter(
     letter_id: int,
@@ -1,8 +1,9 @@
 # app/routes/super_admin_routes.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import JSONResponse, PlainTextResponse
 from sqlmodel import Session, select
 from sqlalchemy.orm import selectinload # For loading relationships
-from typing import List
+from typing import Any, Dict, List
 
 from app.schemas.superadmin_schema import SuperAdminCreate, SuperAdminRead, SuperAdminUpdate, SuperAdminPasswordUpdate, UserReadForSuperAdmin
 from app.schemas.user_schema import UserCreate, UserRead, UserReadWithPassword
@@ -22,6 +23,8 @@ from app.models.tenant import Tenant
 # MISSING IMPORT - Add this
 from app.utils.password_utils import verify_password  # Or wherever your verify_password function is located
 from app.core.auth import get_current_user
+from app.core.slow_query_log import slow_query_log
+from app.core.request_profiler import request_profiler
 from app.models.user import User
 from app.models.tenant import Tenant
 from app.models.superadmin import SuperAdmin
@@ -54,6 +57,56 @@ def require_super_admin_or_admin_access(current_user):
 
 # ===== SPECIFIC ROUTES (must come before parameterized routes) =====
 
+@router.get("/slow-queries", response_model=List[Dict[str, Any]])
+def get_slow_queries_route(
+    limit: int = Query(20, ge=1, le=500, description="Number of fingerprints to return"),
+    current_user = Depends(get_current_user)
+):
+    """
+    Slowest query fingerprints of this process by total time, with their EXPLAIN
+    plans - Super Admin access only
+    """
+    if get_user_role_name(current_user) not in ("super_admin", "superadmin"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only Super Admins can view slow queries"
+        )
+    return slow_query_log.top(limit)
+
+def require_super_admin_profiles(current_user):
+    if get_user_role_name(current_user) not in ("super_admin", "superadmin"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only Super Admins can view request profiles"
+        )
+
+@router.get("/profiles", response_model=List[Dict[str, Any]])
+def list_request_profiles_route(current_user = Depends(get_current_user)):
+    """
+    Request profiles stored by this process, newest first - Super Admin access only.
+    Send a request with the X-Profile header to profile it.
+    """
+    require_super_admin_profiles(current_user)
+    return request_profiler.list()
+
+@router.get("/profiles/{profile_id}")
+def get_request_profile_route(
+    profile_id: str,
+    format: str = Query("speedscope", pattern="^(speedscope|collapsed)$", description="speedscope JSON or collapsed stacks"),
+    current_user = Depends(get_current_user)
+):
+    """Download a request profile for speedscope or flame graph tools - Super Admin access only"""
+    require_super_admin_profiles(current_user)
+    profile = request_profiler.get(profile_id)
+    if not profile:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    if format == "collapsed":
+        return PlainTextResponse(profile.collapsed())
+    return JSONResponse(
+        profile.speedscope(),
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile.id}.speedscope.json"'}
+    )
+
 @router.get("/all-tenants", response_model=List[TenantRead])
 def get_all_tenants_route(
     skip: int = 0, 
@@ -1,8 +1,10 @@
-# backend/app/routes/translate.py
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel
-from typing import Union, List, Dict
-import argostranslate.translate
+from typing import Union, List, Dict, Any
+from app.services.translation_service import translation_service
+from app.services.translation_workers import translation_workers
+from app.core.role_middleware import require_super_admin
+from app.models.user import User
 
 router = APIRouter()
 
@@ -12,17 +14,14 @@ class TranslateRequest(BaseModel):
     target_lang: str
 
 @router.post("/translate")
-def translate_text(req: TranslateRequest):
+async def translate_text(req: TranslateRequest):
     try:
         if isinstance(req.text, list):
-            result: Dict[str, str] = {}
-            for item in req.text:
-                translated = argostranslate.translate.translate(
-                    item, req.source_lang, req.target_lang)
-                result[item] = translated
+            result: Dict[str, str] = await translation_service.translate_batch_async(
+                req.text, req.source_lang, req.target_lang)
             return {"translations": result}
         else:
-            translated = argostranslate.translate.translate(
+            translated = await translation_service.translate_async(
                 req.text, req.source_lang, req.target_lang)
             return {"translatedText": translated}
     except Exception as e:
@@ -30,3 +29,11 @@ def translate_text(req: TranslateRequest):
         if isinstance(req.text, list):
             return {"translations": {item: item for item in req.text}}
         return {"translatedText": req.text}
+
+@router.get("/translate/stats", response_model=Dict[str, Any])
+def translation_cache_stats(current_user: User = Depends(require_super_admin())):
+    """Translation cache hit metrics and worker pool state for this process (Super Admin only)"""
+    stats = translation_service.get_stats()
+    stats["workers"] = translation_workers.size if translation_workers.running else 0
+    stats["language_pairs"] = [f"{source}-{target}" for source, target in translation_workers.language_pairs]
+    return stats
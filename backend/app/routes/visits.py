@@ -1,13 +1,18 @@
 # Fixed visit_routes.py
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, text
+from typing import List, Optional
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from sqlmodel import Session, select, text
 import traceback
 
 from database import get_session
 from app.core.auth import get_current_user
 from app.models.user import User
+from app.models.visit import Visit
+from app.models.citizen_issues import CitizenIssue
+from app.core.access_predicates import build_access_predicate
+from app.services.export_service import export_service, ExportError
 from app.schemas.visit_schema import VisitCreate, VisitRead, VisitUpdate
 from app.crud.visit_crud import (
     create_visit, get_all_visits, get_visit_by_id, update_visit, delete_visit,
@@ -100,6 +105,37 @@ def visit_stats_route(
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Error fetching stats: {str(e)}")
 
+@router.get("/export")
+def export_visits_route(
+    request: Request,
+    format: str = Query("csv", description="Export format: csv or xlsx"),
+    status_filter: Optional[str] = Query(None, alias="status", description="Filter by visit status"),
+    date_from: Optional[date] = Query(None, description="Filter by visit date from"),
+    date_to: Optional[date] = Query(None, description="Filter by visit date to"),
+    current_user: User = Depends(get_current_user)
+):
+    """Download the visits of every issue the user can see as CSV or XLSX"""
+    try:
+        conditions = []
+        issue_predicate = build_access_predicate(current_user, CitizenIssue, "view")
+        if issue_predicate is not None:
+            conditions.append(Visit.citizen_issue_id.in_(select(CitizenIssue.id).where(issue_predicate)))
+        if status_filter:
+            conditions.append(Visit.status == status_filter)
+        if date_from:
+            conditions.append(Visit.visit_date >= date_from)
+        if date_to:
+            conditions.append(Visit.visit_date <= date_to)
+
+        query = export_service.export_query(Visit, where=conditions, order_by=[Visit.visit_date, Visit.id])
+        return export_service.response(query, "visits", format, request.headers.get("accept-encoding"))
+    except ExportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        print("🔥 Error exporting visits:", e)
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Error exporting visits: {str(e)}")
+
 # ✅ Main CRUD endpoints (these should come AFTER the specific endpoints)
 @router.post("/", response_model=VisitRead, status_code=status.HTTP_201_CREATED)
 def create_visit_route(
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+class LetterFollowUpRead(BaseModel):
+    id: str
+    letter_type: str              # "sent_letter" or "sent_grievance_letter"
+    letter_id: int
+    tenant_id: Optional[str] = None
+    assignee_id: Optional[str] = None
+    subject: Optional[str] = None
+    due_at: datetime
+    overdue: bool = False
+    notified_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -164,3 +164,46 @@ class MeetingProgramStats(BaseModel):
     monthly_trends: List[Dict[str, Any]]      # List of {month, total, completed, cancelled}
     attendance_metrics: Dict[str, Any]        # {avg_expected, avg_actual, attendance_rate}
     recent_activity: List[Dict[str, Any]]     # List of recent activities
+
+# Participation schemas
+class MeetingParticipantRead(BaseModel):
+    id: str
+    meeting_id: str
+    user_id: Optional[str] = None
+    name: Optional[str] = None
+    role: str
+    rsvp: str
+    attended: Optional[bool] = None
+    updated_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+class MeetingParticipantResponseUpdate(BaseModel):
+    rsvp: Optional[str] = None
+    attended: Optional[bool] = None
+    
+    @validator('rsvp')
+    def validate_rsvp(cls, v):
+        if v is not None:
+            valid_rsvps = ["pending", "accepted", "declined"]
+            if v not in valid_rsvps:
+                raise ValueError(f'RSVP must be one of: {", ".join(valid_rsvps)}')
+        return v
+
+class MeetingParticipationSummary(BaseModel):
+    total_meetings: int
+    accepted: int
+    declined: int
+    pending: int
+    attended: int
+    completed_meetings: int
+    upcoming_meetings: int
+    attendance_rate: Optional[float]
+
+class MeetingAttendanceCounts(BaseModel):
+    meeting_id: str
+    invited: int
+    accepted: int
+    declined: int
+    attended: int
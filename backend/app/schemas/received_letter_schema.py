@@ -179,3 +179,10 @@ class LetterFilters(BaseModel):
     page: int = 1
     per_page: int = 20
 
+
+# Schema for bulk status / priority / assignment changes
+class ReceivedLetterBulkUpdate(BaseModel):
+    letter_ids: List[int]
+    status: Optional[LetterStatus] = None
+    priority: Optional[LetterPriority] = None
+    assigned_to: Optional[str] = None  # Sent as null to unassign
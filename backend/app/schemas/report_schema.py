@@ -0,0 +1,28 @@
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+class ReportDefinitionRead(BaseModel):
+    key: str
+    title: str
+    description: str
+    dimensions: List[str]         # Row keys, "period" (YYYY-MM of creation) first
+    metrics: List[str]
+
+class ReportParams(BaseModel):
+    # Restrict to records created in this range (inclusive)
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+
+class ReportResultRead(BaseModel):
+    report_key: str
+    tenant_id: Optional[str] = None
+    params: Dict[str, Any] = {}
+    status: str                   # "pending", "ready" or "failed"
+    stale: bool = False           # Expired; a refresh has been queued
+    rows: List[Dict[str, Any]] = []
+    row_count: int = 0
+    generated_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+    job_id: Optional[str] = None
+    error: Optional[str] = None
@@ -94,3 +94,9 @@ class SentGrievanceLetterStatistics(BaseModel):
     followups_due_this_week: int
     average_closure_time_days: Optional[float] = None
     top_categories: List[dict]
+
+class SentGrievanceLetterBulkUpdate(BaseModel):
+    letter_ids: List[int]
+    status: Optional[SentGrievanceLetterStatus] = None
+    priority: Optional[SentGrievanceLetterPriority] = None
+    assigned_to: Optional[str] = None  # Sent as null to unassign
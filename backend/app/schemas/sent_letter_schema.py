@@ -188,3 +188,10 @@ class SentLetterFilters(BaseModel):
     date_to: Optional[datetime] = None
     page: int = 1
     per_page: int = 20
+
+# Schema for bulk status / priority / assignment changes
+class SentLetterBulkUpdate(BaseModel):
+    letter_ids: List[int]
+    status: Optional[SentLetterStatus] = None
+    priority: Optional[SentLetterPriority] = None
+    assigned_to: Optional[str] = None  # Sent as null to unassign
@@ -31,6 +31,7 @@ class TenantUpdate(BaseModel):
     phone: Optional[str] = None
     password: Optional[str] = None
     status: Optional[TenantStatusType] = None
+    translation_languages: Optional[str] = None  # Comma-separated language codes, e.g. "hi,mr"
     
     @validator('password')
     def validate_password(cls, v):
@@ -50,6 +51,7 @@ class TenantRead(BaseModel):
     email: str
     phone: Optional[str] = None
     status: TenantStatusType
+    translation_languages: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
@@ -1,146 +1,553 @@
 """
 Email Service
-Simple email service for password reset and notifications
+Queued email delivery for password reset and notifications
+
+Messages are written to the outbound_emails table and delivered in batches by the
+deliver_outbound_emails background job over pooled, authenticated SMTP connections
+(or the file/console transport in development and tests).
 """
 
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Optional
+from sqlmodel import Session, select, update, and_, func
+from sqlalchemy import event
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
 import logging
+import queue
+import threading
+import time
+import uuid
 
 from config import settings
+from app.models.outbound_email import OutboundEmail, OutboundEmailStatus
+from app.core.tracing import tracer
+
+if TYPE_CHECKING:
+    # smtplib and email.mime are imported when mail is first delivered
+    import smtplib
+    from email.mime.multipart import MIMEMultipart
 
 logger = logging.getLogger(__name__)
 
+# Messages stuck in "sending" longer than this (delivery run died) are requeued
+SENDING_LEASE = timedelta(minutes=10)
+
+class ConsoleTransport:
+    """Logs messages instead of sending them"""
+
+    def send_batch(self, messages: List["MIMEMultipart"]) -> List[Optional[str]]:
+        for msg in messages:
+            logger.info(f"[console email] To: {msg['To']} | Subject: {msg['Subject']}\n{msg.as_string()}")
+        return [None] * len(messages)
+
+    def close(self):
+        pass
+
+class FileTransport:
+    """Writes each message to an .eml file in a directory"""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+
+    def send_batch(self, messages: List["MIMEMultipart"]) -> List[Optional[str]]:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        errors = []
+        for msg in messages:
+            try:
+                filename = f"{datetime.utcnow().strftime('%Y%m%d%H%M%S%f')}-{uuid.uuid4().hex[:8]}.eml"
+                (self.directory / filename).write_text(msg.as_string(), encoding="utf-8")
+                errors.append(None)
+            except OSError as e:
+                errors.append(str(e))
+        return errors
+
+    def close(self):
+        pass
+
+class SMTPTransport:
+    """
+    SMTP transport with a small pool of authenticated connections.
+
+    A batch is sent over one connection, so STARTTLS and login happen once per
+    pooled connection rather than once per message.
+    """
+
+    def __init__(self, host: str, port: int, user: str, password: str, use_tls: bool = True,
+                 pool_size: int = 2, timeout: int = 30, max_idle_seconds: int = 60):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.max_idle_seconds = max_idle_seconds
+        self._idle: "queue.LifoQueue[Tuple[smtplib.SMTP, float]]" = queue.LifoQueue(maxsize=pool_size)
+        self._slots = threading.BoundedSemaphore(pool_size)
+
+    def _connect(self) -> "smtplib.SMTP":
+        import smtplib
+
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.use_tls:
+            server.starttls()
+        server.login(self.user, self.password)
+        logger.debug(f"Opened SMTP connection to {self.host}:{self.port}")
+        return server
+
+    @staticmethod
+    def _quit(server: "smtplib.SMTP"):
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    def _acquire(self) -> "smtplib.SMTP":
+        import smtplib
+
+        self._slots.acquire()
+        try:
+            while True:
+                try:
+                    server, last_used = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._connect()
+
+                if time.monotonic() - last_used > self.max_idle_seconds:
+                    self._quit(server)
+                    continue
+                try:
+                    if server.noop()[0] == 250:
+                        return server
+                except smtplib.SMTPException:
+                    pass
+                except OSError:
+                    pass
+                server.close()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _release(self, server: "smtplib.SMTP", broken: bool = False):
+        try:
+            if broken:
+                server.close()
+            else:
+                try:
+                    self._idle.put_nowait((server, time.monotonic()))
+                except queue.Full:
+                    self._quit(server)
+        finally:
+            self._slots.release()
+
+    @tracer.traced("smtp.send_batch", kind="client",
+                   attributes=lambda self, messages: {"server.address": self.host, "smtp.messages": len(messages)})
+    def send_batch(self, messages: List["MIMEMultipart"]) -> List[Optional[str]]:
+        """Send messages over one pooled connection; returns an error (or None) per message"""
+        import smtplib
+
+        if not messages:
+            return []
+
+        server = self._acquire()
+        errors: List[Optional[str]] = []
+        broken = False
+        try:
+            for msg in messages:
+                try:
+                    server.send_message(msg)
+                    errors.append(None)
+                except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+                    # Rejected message, the session is still usable
+                    errors.append(str(e))
+                except (smtplib.SMTPException, OSError) as e:
+                    broken = True
+                    errors.extend([f"SMTP connection lost: {e}"] * (len(messages) - len(errors)))
+                    break
+        finally:
+            self._release(server, broken)
+        return errors
+
+    def close(self):
+        while True:
+            try:
+                server, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._quit(server)
+
 class EmailService:
-    """Simple email service for sending notifications"""
-    
+    """Email service queuing notifications for batched background delivery"""
+
     def __init__(self):
         self.smtp_host = settings.SMTP_HOST
         self.smtp_port = settings.SMTP_PORT
         self.smtp_user = settings.SMTP_USER
         self.smtp_password = settings.SMTP_PASSWORD
         self.smtp_tls = settings.SMTP_TLS
-    
+        self.from_email = settings.EMAIL_FROM or settings.SMTP_USER
+        self.transport_name = settings.EMAIL_TRANSPORT.lower()
+        self.batch_size = settings.EMAIL_BATCH_SIZE
+        self.max_attempts = settings.EMAIL_MAX_ATTEMPTS
+        self.retry_base_seconds = settings.EMAIL_RETRY_BASE_SECONDS
+        self._transport = None
+        self._engine = None
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from database import engine
+            self._engine = engine
+        return self._engine
+
+    @property
+    def transport(self):
+        if self._transport is None:
+            if self.transport_name == "console":
+                self._transport = ConsoleTransport()
+            elif self.transport_name == "file":
+                self._transport = FileTransport(settings.EMAIL_FILE_DIR)
+            else:
+                self._transport = SMTPTransport(
+                    self.smtp_host, self.smtp_port, self.smtp_user, self.smtp_password,
+                    use_tls=self.smtp_tls,
+                    pool_size=settings.SMTP_POOL_SIZE,
+                    timeout=settings.SMTP_TIMEOUT_SECONDS,
+                    max_idle_seconds=settings.SMTP_MAX_IDLE_SECONDS
+                )
+        return self._transport
+
+    def is_configured(self) -> bool:
+        """Whether mail can be delivered (SMTP needs credentials, file/console always can)"""
+        if self.transport_name in ("console", "file"):
+            return True
+        return bool(self.smtp_user and self.smtp_password)
+
+    def close(self):
+        """Close pooled connections"""
+        if self._transport is not None:
+            self._transport.close()
+
+    # ----- Queueing -----
+
+    def queue_emails(self, messages: Iterable[Tuple[str, str, str]], sensitive: bool = False,
+                     session: Optional[Session] = None) -> int:
+        """
+        Queue (to_email, subject, body) messages for background delivery
+
+        Args:
+            session: Add the messages to this session instead, so they are committed
+                together with the caller's changes; delivery is scheduled after that commit
+
+        Returns:
+            Number of messages queued (0 when email is not configured)
+        """
+        if not self.is_configured():
+            logger.warning("SMTP credentials not configured, skipping email send")
+            return 0
+
+        rows = [
+            OutboundEmail(
+                to_email=to_email,
+                subject=subject,
+                body=body,
+                sensitive=sensitive,
+                max_attempts=self.max_attempts
+            )
+            for to_email, subject, body in messages
+        ]
+        if not rows:
+            return 0
+
+        if session is not None:
+            session.add_all(rows)
+            event.listen(session, "after_commit", lambda _session: self._schedule_delivery(), once=True)
+            logger.info(f"Added {len(rows)} emails to the caller's transaction")
+            return len(rows)
+
+        with Session(self.engine) as own_session:
+            own_session.add_all(rows)
+            own_session.commit()
+
+        self._schedule_delivery()
+        logger.info(f"Queued {len(rows)} emails for delivery")
+        return len(rows)
+
+    def queue_email(self, to_email: str, subject: str, body: str, sensitive: bool = False) -> bool:
+        """Queue a single message for background delivery"""
+        return self.queue_emails([(to_email, subject, body)], sensitive=sensitive) == 1
+
+    def _schedule_delivery(self, run_after: Optional[datetime] = None):
+        from app.services.job_service import job_runner
+        try:
+            job_runner.enqueue_unique("deliver_outbound_emails", run_after=run_after)
+        except Exception as e:
+            # Messages stay queued and go out with the next delivery run
+            logger.error(f"Could not schedule email delivery: {e}")
+
+    # ----- Delivery -----
+
+    def _build_message(self, email: OutboundEmail) -> "MIMEMultipart":
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+
+        msg = MIMEMultipart()
+        msg['From'] = self.from_email
+        msg['To'] = email.to_email
+        msg['Subject'] = email.subject
+        msg.attach(MIMEText(email.body or "", 'plain'))
+        return msg
+
+    def _claim_batch(self, session: Session) -> List[OutboundEmail]:
+        now = datetime.utcnow()
+        due_ids = session.exec(
+            select(OutboundEmail.id)
+            .where(and_(
+                OutboundEmail.status == OutboundEmailStatus.QUEUED,
+                OutboundEmail.next_attempt_at <= now
+            ))
+            .order_by(OutboundEmail.next_attempt_at)
+            .limit(self.batch_size)
+        ).all()
+        if not due_ids:
+            return []
+
+        claim_token = str(uuid.uuid4())
+        session.exec(
+            update(OutboundEmail)
+            .where(and_(
+                OutboundEmail.id.in_(due_ids),
+                OutboundEmail.status == OutboundEmailStatus.QUEUED
+            ))
+            .values(
+                status=OutboundEmailStatus.SENDING,
+                claim_token=claim_token,
+                claimed_at=now,
+                attempts=OutboundEmail.attempts + 1
+            )
+        )
+        session.commit()
+        return session.exec(
+            select(OutboundEmail).where(OutboundEmail.claim_token == claim_token)
+        ).all()
+
+    def _requeue_abandoned(self, session: Session):
+        session.exec(
+            update(OutboundEmail)
+            .where(and_(
+                OutboundEmail.status == OutboundEmailStatus.SENDING,
+                OutboundEmail.claimed_at < datetime.utcnow() - SENDING_LEASE
+            ))
+            .values(status=OutboundEmailStatus.QUEUED, claim_token=None)
+        )
+        session.commit()
+
+    def deliver_queued(self) -> int:
+        """
+        Drain due messages from the outbound queue, one SMTP session per batch.
+        Failed messages are retried with exponential backoff.
+
+        Returns:
+            Number of messages sent
+        """
+        sent = 0
+        with Session(self.engine) as session:
+            self._requeue_abandoned(session)
+
+            while True:
+                batch = self._claim_batch(session)
+                if not batch:
+                    break
+
+                try:
+                    errors = self.transport.send_batch([self._build_message(email) for email in batch])
+                except Exception as e:
+                    # Could not open a connection at all
+                    logger.error(f"Email transport unavailable: {e}")
+                    errors = [str(e)] * len(batch)
+
+                now = datetime.utcnow()
+                for email, error in zip(batch, errors):
+                    email.claim_token = None
+                    if error is None:
+                        email.status = OutboundEmailStatus.SENT
+                        email.sent_at = now
+                        email.last_error = None
+                        if email.sensitive:
+                            email.body = None
+                        sent += 1
+                    elif email.attempts >= email.max_attempts:
+                        email.status = OutboundEmailStatus.FAILED
+                        email.last_error = error[-2000:]
+                        logger.error(f"Giving up on email {email.id} to {email.to_email}: {error}")
+                    else:
+                        email.status = OutboundEmailStatus.QUEUED
+                        email.last_error = error[-2000:]
+                        email.next_attempt_at = now + timedelta(
+                            seconds=self.retry_base_seconds * (2 ** (email.attempts - 1))
+                        )
+                    session.add(email)
+                session.commit()
+
+                if all(error is not None for error in errors):
+                    break  # Transport is down, leave the rest for the retry run
+
+            # Wake up again for the earliest pending retry
+            next_retry = session.exec(
+                select(func.min(OutboundEmail.next_attempt_at))
+                .where(OutboundEmail.status == OutboundEmailStatus.QUEUED)
+            ).first()
+
+        if next_retry:
+            self._schedule_delivery(run_after=max(next_retry, datetime.utcnow()))
+        if sent:
+            logger.info(f"Delivered {sent} queued emails")
+        return sent
+
+    # ----- Notifications -----
+
     def send_password_reset_email(
-        self, 
-        to_email: str, 
-        reset_token: str, 
+        self,
+        to_email: str,
+        reset_token: str,
         reset_url: Optional[str] = None
     ) -> bool:
         """
-        Send password reset email
+        Queue password reset email
         """
         try:
-            if not self.smtp_user or not self.smtp_password:
-                logger.warning("SMTP credentials not configured, skipping email send")
-                return False
-            
             subject = f"Password Reset - {settings.APP_NAME}"
-            
+
             # Create email content
             if reset_url:
                 body = f"""
                 Hello,
-                
+
                 You have requested a password reset for your {settings.APP_NAME} account.
-                
+
                 Click the following link to reset your password:
                 {reset_url}?token={reset_token}
-                
+
                 This link will expire in {settings.PASSWORD_RESET_TOKEN_EXPIRE_MINUTES} minutes.
-                
+
                 If you did not request this password reset, please ignore this email.
-                
+
                 Best regards,
                 {settings.APP_NAME} Team
                 """
             else:
                 body = f"""
                 Hello,
-                
+
                 You have requested a password reset for your {settings.APP_NAME} account.
-                
+
                 Your password reset token is: {reset_token}
-                
+
                 This token will expire in {settings.PASSWORD_RESET_TOKEN_EXPIRE_MINUTES} minutes.
-                
+
                 If you did not request this password reset, please ignore this email.
-                
+
                 Best regards,
                 {settings.APP_NAME} Team
                 """
-            
-            # Create message
-            msg = MIMEMultipart()
-            msg['From'] = self.smtp_user
-            msg['To'] = to_email
-            msg['Subject'] = subject
-            
-            msg.attach(MIMEText(body, 'plain'))
-            
-            # Send email
-            server = smtplib.SMTP(self.smtp_host, self.smtp_port)
-            if self.smtp_tls:
-                server.starttls()
-            
-            server.login(self.smtp_user, self.smtp_password)
-            server.send_message(msg)
-            server.quit()
-            
-            logger.info(f"Password reset email sent to {to_email}")
-            return True
-            
+
+            # The body carries the reset token, so it is dropped once sent
+            queued = self.queue_email(to_email, subject, body, sensitive=True)
+            if queued:
+                logger.info(f"Password reset email queued for {to_email}")
+            return queued
+
         except Exception as e:
-            logger.error(f"Failed to send password reset email to {to_email}: {str(e)}")
+            logger.error(f"Failed to queue password reset email to {to_email}: {str(e)}")
             return False
-    
+
     def send_welcome_email(self, to_email: str, user_name: str) -> bool:
         """
-        Send welcome email to new users
+        Queue welcome email to new users
         """
         try:
-            if not self.smtp_user or not self.smtp_password:
-                logger.warning("SMTP credentials not configured, skipping email send")
-                return False
-            
             subject = f"Welcome to {settings.APP_NAME}"
-            
+
             body = f"""
             Hello {user_name},
-            
+
             Welcome to {settings.APP_NAME}!
-            
+
             Your account has been successfully created.
-            
+
             Best regards,
             {settings.APP_NAME} Team
             """
-            
-            # Create message
-            msg = MIMEMultipart()
-            msg['From'] = self.smtp_user
-            msg['To'] = to_email
-            msg['Subject'] = subject
-            
-            msg.attach(MIMEText(body, 'plain'))
-            
-            # Send email
-            server = smtplib.SMTP(self.smtp_host, self.smtp_port)
-            if self.smtp_tls:
-                server.starttls()
-            
-            server.login(self.smtp_user, self.smtp_password)
-            server.send_message(msg)
-            server.quit()
-            
-            logger.info(f"Welcome email sent to {to_email}")
-            return True
-            
+
+            queued = self.queue_email(to_email, subject, body)
+            if queued:
+                logger.info(f"Welcome email queued for {to_email}")
+            return queued
+
         except Exception as e:
-            logger.error(f"Failed to send welcome email to {to_email}: {str(e)}")
+            logger.error(f"Failed to queue welcome email to {to_email}: {str(e)}")
             return False
 
+    def send_meeting_reminder_emails(self, reminders: Iterable[Tuple[str, str, str, datetime, Optional[str]]],
+                                     session: Optional[Session] = None) -> int:
+        """
+        Queue meeting reminders in one insert
+
+        Args:
+            reminders: (to_email, user_name, meeting_title, scheduled_date, venue) tuples
+            session: Queue within the caller's transaction (see queue_emails); errors are raised
+        """
+        try:
+            messages = []
+            for to_email, user_name, title, scheduled_date, venue in reminders:
+                when = scheduled_date.strftime("%d %b %Y, %H:%M") if scheduled_date else "soon"
+                body = f"""
+            Hello {user_name or ''},
+
+            This is a reminder for the meeting "{title}" scheduled on {when}{f' at {venue}' if venue else ''}.
+
+            Best regards,
+            {settings.APP_NAME} Team
+            """
+                messages.append((to_email, f"Meeting Reminder: {title}", body))
+
+            return self.queue_emails(messages, session=session)
+
+        except Exception as e:
+            logger.error(f"Failed to queue meeting reminder emails: {str(e)}")
+            if session is not None:
+                raise
+            return 0
+
+    def send_followup_due_emails(self, notices: Iterable[Tuple[str, str, str, datetime]],
+                                 session: Optional[Session] = None) -> int:
+        """
+        Queue letter follow-up notices in one insert
+
+        Args:
+            notices: (to_email, user_name, letter_subject, due_at) tuples
+            session: Queue within the caller's transaction (see queue_emails); errors are raised
+        """
+        try:
+            messages = []
+            for to_email, user_name, subject, due_at in notices:
+                when = due_at.strftime("%d %b %Y") if due_at else "now"
+                body = f"""
+            Hello {user_name or ''},
+
+            The follow-up for the letter "{subject}" was due on {when} and the letter is still open.
+
+            Best regards,
+            {settings.APP_NAME} Team
+            """
+                messages.append((to_email, f"Follow-up Due: {subject}", body))
+
+            return self.queue_emails(messages, session=session)
+
+        except Exception as e:
+            logger.error(f"Failed to queue follow-up emails: {str(e)}")
+            if session is not None:
+                raise
+            return 0
+
 # Global instance
 email_service = EmailService()
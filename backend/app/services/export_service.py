@@ -0,0 +1,225 @@
+"""
+Export Service
+Streams query results to CSV or XLSX with constant memory
+"""
+
+from sqlmodel import Session, select, and_, or_
+from fastapi.responses import StreamingResponse
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Iterator, Optional, Sequence
+import csv
+import io
+import logging
+import os
+import tempfile
+import zlib
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ("csv", "xlsx")
+
+# Derived or bulky columns left out of every export
+EXCLUDED_COLUMNS = {"geojson_data"}
+
+# Text starting with these is read as a formula by spreadsheet programs, so it is
+# exported with a leading apostrophe (CSV / formula injection)
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+class ExportError(Exception):
+    """Raised when an export cannot be produced (bad format, missing optional dependency)"""
+    pass
+
+class ExportService:
+    """
+    Runs an export query on its own session in keyset-paginated chunks of
+    EXPORT_FETCH_SIZE rows and writes each chunk out before fetching the next,
+    so exports of any size hold at most one chunk in memory. The MySQL driver
+    buffers whole result sets client-side, which rules out a single streamed query.
+    """
+
+    def __init__(self, engine=None):
+        self._engine = engine
+        self._fetch_size = settings.EXPORT_FETCH_SIZE
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from database import engine
+            self._engine = engine
+        return self._engine
+
+    def export_query(self, entity: Any, where=None, order_by=None):
+        """
+        Select every exportable column of an entity as plain rows (no ORM objects)
+
+        Args:
+            where: Access and filter conditions, applied in order
+            order_by: Ascending sort columns; the primary key is appended so the
+                order is unique and can be paginated by key
+        """
+        columns = [column for column in entity.__table__.columns if column.name not in EXCLUDED_COLUMNS]
+        query = select(*columns)
+        for condition in where or []:
+            if condition is not None:
+                query = query.where(condition)
+
+        key_names = [column.key for column in order_by or []]
+        key_names += [column.name for column in entity.__table__.primary_key.columns if column.name not in key_names]
+        order_columns = [entity.__table__.c[name] for name in key_names]
+        return query.order_by(*order_columns).execution_options(export_keys=tuple(key_names))
+
+    @staticmethod
+    def _after(columns: Sequence[Any], values: Sequence[Any]):
+        """
+        Rows sorting after values in (columns...) order, NULLs first as MySQL and
+        SQLite sort them ascending
+        """
+        branches = []
+        for index, (column, value) in enumerate(zip(columns, values)):
+            equal_before = [
+                earlier.is_(None) if earlier_value is None else earlier == earlier_value
+                for earlier, earlier_value in zip(columns[:index], values[:index])
+            ]
+            greater = column.is_not(None) if value is None else column > value
+            branches.append(and_(*equal_before, greater))
+        return or_(*branches)
+
+    def iter_rows(self, query) -> Iterator[Sequence[Any]]:
+        """
+        Yield result rows, fetching EXPORT_FETCH_SIZE at a time with
+        WHERE (order keys) > (last row's keys) ... LIMIT EXPORT_FETCH_SIZE
+        """
+        key_names = query.get_execution_options().get("export_keys")
+        if not key_names:
+            raise ExportError("Export queries must be built with export_query")
+        selected = [column.name for column in query.selected_columns]
+        key_columns = [query.selected_columns[name] for name in key_names]
+        key_positions = [selected.index(name) for name in key_names]
+
+        with Session(self.engine) as session:
+            page = query.limit(self._fetch_size)
+            while True:
+                rows = session.execute(page).all()
+                yield from rows
+                if len(rows) < self._fetch_size:
+                    break
+                last = [rows[-1][position] for position in key_positions]
+                page = query.where(self._after(key_columns, last)).limit(self._fetch_size)
+
+    @staticmethod
+    def _cell(value: Any) -> Any:
+        if isinstance(value, Enum):
+            return value.value
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+            return "'" + value
+        return value
+
+    def iter_csv(self, query, compress: bool = False) -> Iterator[bytes]:
+        """CSV with a header row, emitted in blocks of EXPORT_FETCH_SIZE rows, gzip-compressed on request"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        compressor = zlib.compressobj(wbits=31) if compress else None  # 31: gzip container
+
+        def drain() -> bytes:
+            data = buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate(0)
+            return compressor.compress(data) if compressor else data
+
+        # Byte order mark so spreadsheet programs read the file as UTF-8
+        buffer.write("\ufeff")
+        writer.writerow([column.name for column in query.selected_columns])
+        pending = 0
+        for row in self.iter_rows(query):
+            writer.writerow(["" if value is None else self._cell(value) for value in row])
+            pending += 1
+            if pending >= self._fetch_size:
+                yield drain()
+                pending = 0
+        yield drain()
+        if compressor:
+            yield compressor.flush()
+
+    def write_xlsx(self, query, sheet_title: str):
+        """
+        Write the rows to a temporary XLSX file using openpyxl's write-only mode
+
+        Returns:
+            Open binary file positioned at the start; the caller closes it
+        """
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            raise ExportError("XLSX export requires the openpyxl package")
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(title=sheet_title[:31])
+        sheet.append([column.name for column in query.selected_columns])
+        for row in self.iter_rows(query):
+            sheet.append([self._cell(value) for value in row])
+
+        output = tempfile.TemporaryFile()
+        workbook.save(output)
+        output.seek(0)
+        return output
+
+    @staticmethod
+    def _iter_file(output, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        try:
+            while True:
+                chunk = output.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            output.close()
+
+    def response(
+        self,
+        query,
+        name: str,
+        export_format: str = "csv",
+        accept_encoding: Optional[str] = None
+    ) -> StreamingResponse:
+        """
+        Build the streaming download for an export query
+
+        Args:
+            name: Base file name, also the XLSX sheet title
+            export_format: "csv" or "xlsx"
+            accept_encoding: The request's Accept-Encoding; CSV is gzipped when it allows
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ExportError(f"Unsupported export format: {export_format}. Allowed: {', '.join(EXPORT_FORMATS)}")
+
+        filename = f"{name}_{datetime.utcnow():%Y%m%d}.{export_format}"
+        headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+
+        if export_format == "xlsx":
+            # XLSX is already zip-compressed, so it is never gzipped again
+            output = self.write_xlsx(query, name)
+            size = os.fstat(output.fileno()).st_size
+            headers["Content-Length"] = str(size)
+            logger.info(f"Exporting {filename} ({size} bytes)")
+            return StreamingResponse(self._iter_file(output), media_type=XLSX_MEDIA_TYPE, headers=headers)
+
+        compress = "gzip" in (accept_encoding or "").lower()
+        if compress:
+            headers["Content-Encoding"] = "gzip"
+            headers["Vary"] = "Accept-Encoding"
+        logger.info(f"Exporting {filename}{' (gzip)' if compress else ''}")
+        return StreamingResponse(
+            self.iter_csv(query, compress),
+            media_type="text/csv; charset=utf-8",
+            headers=headers
+        )
+
+# Global export service instance
+export_service = ExportService()
@@ -0,0 +1,113 @@
+"""
+Background Job Handlers
+Slow side effects moved out of the request path; each handler opens its own session
+"""
+
+from sqlmodel import Session
+from typing import Any, Dict
+from datetime import datetime
+import logging
+
+from app.services.job_service import job_runner
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+def _session() -> Session:
+    return Session(job_runner.engine)
+
+# Nominatim allows about one request per second, so geocode one issue at a time
+@job_runner.register("geocode_issue", max_concurrency=1, max_attempts=3)
+def geocode_issue(payload: Dict[str, Any]):
+    from app.crud.citizen_issues_crud import geocode_citizen_issue
+
+    with _session() as db:
+        geocode_citizen_issue(db, payload["issue_id"])
+
+# One delivery run at a time drains the outbound queue in batches; per-message
+# retries are tracked on outbound_emails, so the job itself is not retried
+@job_runner.register("deliver_outbound_emails", max_concurrency=1, max_attempts=1)
+def deliver_outbound_emails(payload: Dict[str, Any]):
+    from app.services.email_service import email_service
+
+    email_service.deliver_queued()
+
+# Meetings are flagged as reminded in the same transaction that queues their
+# emails, so a failed attempt leaves both undone and the retry picks them up
+@job_runner.register("send_meeting_reminders", max_concurrency=1, max_attempts=3)
+def send_meeting_reminders(payload: Dict[str, Any]):
+    from app.crud.meeting_program_crud import get_meetings_due_for_reminder, mark_meeting_reminders_sent
+    from app.crud.meeting_participant_crud import get_meeting_participant_contacts
+    from app.models.user import User
+    from app.services.email_service import email_service
+
+    with _session() as db:
+        user = db.get(User, payload["user_id"])
+        if user is None:
+            logger.warning(f"Reminder job skipped: user {payload['user_id']} not found")
+            return
+
+        meetings = get_meetings_due_for_reminder(db, user)
+        contacts = get_meeting_participant_contacts(db, [meeting.id for meeting in meetings])
+
+        reminders = [
+            (email, name, meeting.title, meeting.scheduled_date, meeting.venue)
+            for meeting in meetings
+            for email, name in contacts.get(meeting.id, [])
+        ]
+        queued = email_service.send_meeting_reminder_emails(reminders, session=db) if reminders else 0
+        mark_meeting_reminders_sent(db, meetings)
+        db.commit()
+        logger.info(f"Reminder job processed {len(meetings)} meetings, queued {queued} emails")
+
+@job_runner.register("pretranslate_content", max_concurrency=1, max_attempts=3)
+def pretranslate_content(payload: Dict[str, Any]):
+    from app.crud.content_translation_crud import pretranslate_entity
+
+    with _session() as db:
+        pretranslate_entity(db, payload["entity_type"], payload["entity_id"])
+
+# Re-enqueues itself, so exactly one sweep is scheduled at a time. Each batch's
+# notices are queued in the transaction that marks it notified, so a failure
+# leaves the batch unannounced for the next sweep instead of losing or repeating it
+@job_runner.register("sweep_letter_followups", max_concurrency=1, max_attempts=1)
+def sweep_letter_followups(payload: Dict[str, Any]):
+    from app.crud.letter_followup_crud import (
+        get_unnotified_due_followups, get_assignee_contacts, mark_followups_notified, schedule_followup_sweep
+    )
+    from app.services.email_service import email_service
+
+    try:
+        now = datetime.utcnow()
+        batch_size = settings.FOLLOWUP_SWEEP_BATCH_SIZE
+        notified = 0
+        with _session() as db:
+            while True:
+                due = get_unnotified_due_followups(db, now, batch_size)
+                if not due:
+                    break
+                contacts = get_assignee_contacts(db, [followup.assignee_id for followup in due])
+                notices = [
+                    (*contacts[followup.assignee_id], followup.subject, followup.due_at)
+                    for followup in due
+                    if followup.assignee_id in contacts
+                ]
+                if notices:
+                    email_service.send_followup_due_emails(notices, session=db)
+                # Rows without a reachable assignee are marked too, so they are not rescanned every sweep
+                mark_followups_notified(db, due, now)
+                db.commit()
+                notified += len(notices)
+                if len(due) < batch_size:
+                    break
+        logger.info(f"Follow-up sweep queued {notified} notices")
+    finally:
+        schedule_followup_sweep()
+
+# Report queries are heavy aggregates; run them one at a time
+@job_runner.register("run_report", max_concurrency=1, max_attempts=2)
+def run_report(payload: Dict[str, Any]):
+    from app.services.report_services import report_service
+
+    report_service.run(payload["result_id"], payload.get("full", False))
+    report_service.purge_expired()
@@ -0,0 +1,412 @@
+"""
+Background Job Service
+In-process job runner backed by the persistent background_jobs table
+"""
+
+from sqlmodel import Session, select, update, and_
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Set
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import traceback
+
+from config import settings
+from app.models.background_job import BackgroundJob, JobStatus
+from app.core.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+class JobDefinition:
+    """Registered handler for a job type"""
+
+    def __init__(self, job_type: str, handler: Callable[[Dict[str, Any]], Any],
+                 max_concurrency: int = 1, max_attempts: int = 3, purge_payload: bool = False):
+        self.job_type = job_type
+        self.handler = handler
+        self.max_attempts = max_attempts
+        self.purge_payload = purge_payload  # Drop payload once done (e.g. it carries a token)
+        self.slots = threading.BoundedSemaphore(max_concurrency)
+
+class JobRunner:
+    """
+    Polls background_jobs for due work and runs it on a thread pool.
+
+    Jobs are claimed with a conditional UPDATE so several processes can share the
+    table. The poller renews the lease of every job this worker is running; a job
+    whose lease expires anyway (worker died, server restarted) is requeued, or
+    failed once it has used up its attempts.
+
+    With JOBS_ENABLED=false no runner polls the table, so due jobs are run inline
+    by the thread that enqueues them.
+    """
+
+    def __init__(self, engine=None):
+        self._engine = engine
+        self._jobs: Dict[str, JobDefinition] = {}
+        self._worker_count = settings.JOB_WORKERS
+        self._poll_interval = settings.JOB_POLL_INTERVAL_SECONDS
+        self._lease = timedelta(seconds=settings.JOB_LEASE_SECONDS)
+        self._retry_base_seconds = settings.JOB_RETRY_BASE_SECONDS
+        self._worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._inline = not settings.JOBS_ENABLED
+        self._renew_interval = self._lease.total_seconds() / 3
+        self._last_renewal = 0.0
+        self._active: Set[str] = set()  # Ids of jobs this process is running
+        self._active_lock = threading.Lock()
+        self._capacity = threading.BoundedSemaphore(self._worker_count)
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._poller: Optional[threading.Thread] = None
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from database import engine
+            self._engine = engine
+        return self._engine
+
+    @property
+    def running(self) -> bool:
+        return self._poller is not None and self._poller.is_alive()
+
+    def register(self, job_type: str, max_concurrency: int = 1, max_attempts: int = 3,
+                 purge_payload: bool = False):
+        """
+        Decorator registering a handler for a job type
+
+        Usage:
+        @job_runner.register("geocode_issue", max_concurrency=2)
+        def geocode_issue(payload: dict):
+            ...
+        """
+        def decorator(handler: Callable[[Dict[str, Any]], Any]):
+            self._jobs[job_type] = JobDefinition(
+                job_type, handler, max_concurrency, max_attempts, purge_payload
+            )
+            return handler
+        return decorator
+
+    def enqueue(self, job_type: str, payload: Optional[Dict[str, Any]] = None,
+                run_after: Optional[datetime] = None, max_attempts: Optional[int] = None) -> str:
+        """Persist a job and wake the poller; returns the job id"""
+        definition = self._jobs.get(job_type)
+        job = BackgroundJob(
+            job_type=job_type,
+            payload=json.dumps(payload or {}, default=str),
+            run_after=run_after or datetime.utcnow(),
+            max_attempts=max_attempts or (definition.max_attempts if definition else 3)
+        )
+        with Session(self.engine) as session:
+            session.add(job)
+            session.commit()
+            job_id = job.id
+
+        logger.info(f"Enqueued job {job_id} ({job_type})")
+        if self._inline:
+            self.run_inline(job_id)
+        self._wake.set()
+        return job_id
+
+    def enqueue_many(self, job_type: str, payloads: List[Dict[str, Any]]) -> List[str]:
+        """Persist one job per payload in a single transaction; returns the job ids"""
+        if not payloads:
+            return []
+        definition = self._jobs.get(job_type)
+        max_attempts = definition.max_attempts if definition else 3
+        now = datetime.utcnow()
+        jobs = [
+            BackgroundJob(
+                job_type=job_type,
+                payload=json.dumps(payload, default=str),
+                run_after=now,
+                max_attempts=max_attempts
+            )
+            for payload in payloads
+        ]
+        with Session(self.engine) as session:
+            session.add_all(jobs)
+            session.commit()
+            job_ids = [job.id for job in jobs]
+
+        logger.info(f"Enqueued {len(job_ids)} {job_type} jobs")
+        if self._inline:
+            for job_id in job_ids:
+                self.run_inline(job_id)
+        self._wake.set()
+        return job_ids
+
+    def enqueue_unique(self, job_type: str, payload: Optional[Dict[str, Any]] = None,
+                       run_after: Optional[datetime] = None) -> str:
+        """Enqueue unless an identical job is already queued to run no later than run_after"""
+        run_after = run_after or datetime.utcnow()
+        with Session(self.engine) as session:
+            existing_id = session.exec(
+                select(BackgroundJob.id)
+                .where(and_(
+                    BackgroundJob.job_type == job_type,
+                    BackgroundJob.status == JobStatus.QUEUED,
+                    BackgroundJob.payload == json.dumps(payload or {}, default=str),
+                    BackgroundJob.run_after <= run_after
+                ))
+                .limit(1)
+            ).first()
+
+        if existing_id:
+            if self._inline:
+                self.run_inline(existing_id)
+            self._wake.set()
+            return existing_id
+        return self.enqueue(job_type, payload, run_after)
+
+    def get_job(self, job_id: str) -> Optional[BackgroundJob]:
+        """Load a job by id"""
+        with Session(self.engine) as session:
+            return session.get(BackgroundJob, job_id)
+
+    def run_inline(self, job_id: str) -> bool:
+        """
+        Run a due job on the calling thread, for when no runner polls the table
+
+        Returns:
+            True if the job was claimed and run (whether or not it succeeded)
+        """
+        with Session(self.engine) as session:
+            job = session.get(BackgroundJob, job_id)
+            if not job or job.status != JobStatus.QUEUED:
+                return False
+            definition = self._jobs.get(job.job_type)
+            if definition is None:
+                logger.error(f"Job {job_id} ({job.job_type}) has no registered handler and cannot run inline")
+                return False
+            if job.run_after > datetime.utcnow():
+                logger.warning(f"Job {job_id} ({job.job_type}) is delayed and stays queued; "
+                               f"it runs once a job runner is enabled")
+                return False
+            payload, attempt = job.payload, job.attempts + 1
+            if not self._claim(session, job_id):
+                return False
+
+        self._execute(definition, job_id, payload, attempt)
+        return True
+
+    def start(self):
+        """Requeue expired leases and start polling"""
+        if self.running:
+            return
+        self._stopping.clear()
+        self.recover_expired_jobs()
+        self._executor = ThreadPoolExecutor(max_workers=self._worker_count, thread_name_prefix="job-worker")
+        self._poller = threading.Thread(target=self._poll_loop, name="job-poller", daemon=True)
+        self._poller.start()
+        logger.info(f"Job runner started with {self._worker_count} workers "
+                    f"for job types: {', '.join(sorted(self._jobs)) or 'none'}")
+
+    def stop(self, timeout: float = 10.0):
+        """Stop polling and wait for running jobs to finish"""
+        self._stopping.set()
+        self._wake.set()
+        if self._poller:
+            self._poller.join(timeout)
+            self._poller = None
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        logger.info("Job runner stopped")
+
+    def recover_expired_jobs(self) -> int:
+        """
+        Release jobs whose worker lease expired
+
+        Jobs with attempts left go back in the queue; the rest are marked failed,
+        so a job that keeps killing its worker is not retried forever.
+
+        Returns:
+            Number of jobs requeued or failed
+        """
+        now = datetime.utcnow()
+        expired = and_(
+            BackgroundJob.status == JobStatus.RUNNING,
+            BackgroundJob.locked_at < now - self._lease
+        )
+        with Session(self.engine) as session:
+            failed = session.exec(
+                update(BackgroundJob)
+                .where(and_(expired, BackgroundJob.attempts >= BackgroundJob.max_attempts))
+                .values(
+                    status=JobStatus.FAILED,
+                    locked_by=None,
+                    locked_at=None,
+                    finished_at=now,
+                    last_error="Worker lease expired on the final attempt"
+                )
+            ).rowcount or 0
+            requeued = session.exec(
+                update(BackgroundJob)
+                .where(and_(expired, BackgroundJob.attempts < BackgroundJob.max_attempts))
+                .values(status=JobStatus.QUEUED, locked_by=None, locked_at=None)
+            ).rowcount or 0
+            session.commit()
+        if requeued:
+            logger.warning(f"Requeued {requeued} jobs with expired leases")
+        if failed:
+            logger.error(f"Failed {failed} jobs whose lease expired on their final attempt")
+        return requeued + failed
+
+    def renew_leases(self) -> int:
+        """Refresh locked_at on the jobs this process is running so they are not recovered"""
+        with self._active_lock:
+            job_ids = list(self._active)
+        if not job_ids:
+            return 0
+        with Session(self.engine) as session:
+            result = session.exec(
+                update(BackgroundJob)
+                .where(and_(
+                    BackgroundJob.id.in_(job_ids),
+                    BackgroundJob.status == JobStatus.RUNNING,
+                    BackgroundJob.locked_by == self._worker_id
+                ))
+                .values(locked_at=datetime.utcnow())
+            )
+            session.commit()
+            return result.rowcount or 0
+
+    def _poll_loop(self):
+        polls = 0
+        while not self._stopping.is_set():
+            try:
+                self._dispatch_due_jobs()
+                polls += 1
+                if time.monotonic() - self._last_renewal >= self._renew_interval:
+                    self.renew_leases()
+                    self._last_renewal = time.monotonic()
+                if polls % 30 == 0:
+                    self.recover_expired_jobs()
+            except Exception as e:
+                logger.error(f"Job poller error: {e}")
+            self._wake.wait(self._poll_interval)
+            self._wake.clear()
+
+    def _dispatch_due_jobs(self):
+        if not self._jobs:
+            return
+
+        with Session(self.engine) as session:
+            due_jobs: List[BackgroundJob] = session.exec(
+                select(BackgroundJob)
+                .where(and_(
+                    BackgroundJob.status == JobStatus.QUEUED,
+                    BackgroundJob.run_after <= datetime.utcnow(),
+                    BackgroundJob.job_type.in_(list(self._jobs))
+                ))
+                .order_by(BackgroundJob.run_after)
+                .limit(self._worker_count * 4)
+            ).all()
+
+            for job in due_jobs:
+                definition = self._jobs[job.job_type]
+                if not definition.slots.acquire(blocking=False):
+                    continue  # Per-type concurrency limit reached
+                if not self._capacity.acquire(blocking=False):
+                    definition.slots.release()
+                    return  # All workers busy
+
+                if not self._claim(session, job.id):
+                    definition.slots.release()
+                    self._capacity.release()
+                    continue
+
+                self._executor.submit(self._run_job, definition, job.id, job.payload, job.attempts + 1)
+
+    def _claim(self, session: Session, job_id: str) -> bool:
+        result = session.exec(
+            update(BackgroundJob)
+            .where(and_(BackgroundJob.id == job_id, BackgroundJob.status == JobStatus.QUEUED))
+            .values(
+                status=JobStatus.RUNNING,
+                locked_by=self._worker_id,
+                locked_at=datetime.utcnow(),
+                attempts=BackgroundJob.attempts + 1
+            )
+        )
+        session.commit()
+        return (result.rowcount or 0) == 1
+
+    def _run_job(self, definition: JobDefinition, job_id: str, payload: Optional[str], attempt: int):
+        try:
+            self._execute(definition, job_id, payload, attempt)
+        finally:
+            definition.slots.release()
+            self._capacity.release()
+            self._wake.set()
+
+    def _execute(self, definition: JobDefinition, job_id: str, payload: Optional[str], attempt: int):
+        with self._active_lock:
+            self._active.add(job_id)
+        try:
+            with tracer.span(f"job {definition.job_type}", attributes={"job.id": job_id}):
+                definition.handler(json.loads(payload) if payload else {})
+        except Exception as e:
+            logger.error(f"Job {job_id} ({definition.job_type}) failed: {e}")
+            self._record_failure(job_id, attempt, f"{e}\n{traceback.format_exc()}")
+        else:
+            self._record_success(job_id, attempt, definition.purge_payload)
+        finally:
+            with self._active_lock:
+                self._active.discard(job_id)
+
+    def _held_lease(self, job_id: str, attempt: int):
+        """WHERE clause matching the job only while this worker still holds the lease for this attempt"""
+        return and_(
+            BackgroundJob.id == job_id,
+            BackgroundJob.status == JobStatus.RUNNING,
+            BackgroundJob.locked_by == self._worker_id,
+            BackgroundJob.attempts == attempt
+        )
+
+    def _record_success(self, job_id: str, attempt: int, purge_payload: bool):
+        values = dict(
+            status=JobStatus.SUCCEEDED,
+            finished_at=datetime.utcnow(),
+            locked_by=None,
+            last_error=None
+        )
+        if purge_payload:
+            values["payload"] = None
+        with Session(self.engine) as session:
+            result = session.exec(
+                update(BackgroundJob).where(self._held_lease(job_id, attempt)).values(**values)
+            )
+            session.commit()
+        if not result.rowcount:
+            logger.warning(f"Job {job_id} finished after losing its lease; result not recorded")
+
+    def _record_failure(self, job_id: str, attempt: int, error: str):
+        with Session(self.engine) as session:
+            max_attempts = session.exec(
+                select(BackgroundJob.max_attempts).where(BackgroundJob.id == job_id)
+            ).first()
+            if max_attempts is None:
+                return
+            values = dict(last_error=error[-4000:], locked_by=None)
+            if attempt >= max_attempts:
+                values.update(status=JobStatus.FAILED, finished_at=datetime.utcnow())
+            else:
+                # Exponential backoff: base, 2x base, 4x base, ...
+                delay = self._retry_base_seconds * (2 ** max(attempt - 1, 0))
+                values.update(status=JobStatus.QUEUED, run_after=datetime.utcnow() + timedelta(seconds=delay))
+            result = session.exec(
+                update(BackgroundJob).where(self._held_lease(job_id, attempt)).values(**values)
+            )
+            session.commit()
+        if not result.rowcount:
+            logger.warning(f"Job {job_id} failed after losing its lease; failure not recorded")
+
+# Global instance
+job_runner = JobRunner()
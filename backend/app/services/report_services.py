@@ -0,0 +1,410 @@
+"""
+Report Service
+Aggregate reports computed in SQL by background jobs and cached in report_results
+
+Every report is grouped by "period", the month a record was created in. That
+month never changes, so a refresh only recomputes the periods containing rows
+updated since the previous run (the watermark) and keeps the others. Deleted
+rows leave no trace to detect, so every REPORT_FULL_REFRESH_HOURS a refresh
+recomputes everything.
+"""
+
+from sqlmodel import Session, select, func, and_, or_
+from sqlalchemy import case, extract, false
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+import logging
+
+from config import settings
+from app.core.metrics import record_cache_lookup
+from app.models.citizen_issues import CitizenIssue
+from app.models.Issue_category import IssueCategory
+from app.models.area import Area
+from app.models.received_letter import ReceivedLetter, LetterStatus
+from app.models.sent_letter import SentLetter, SentLetterStatus
+from app.models.sent_grievance_letter import SentGrievanceLetter, SentGrievanceLetterStatus
+from app.models.meeting_program import MeetingProgram
+from app.models.meeting_participant import MeetingParticipant, ParticipantRSVP
+from app.models.report_result import ReportResult
+from app.crud.report_crud import (
+    get_or_create_report_result, get_report_result, set_report_job, decode_report_rows,
+    decode_report_params, store_report_rows, record_report_failure, purge_expired_report_results
+)
+
+logger = logging.getLogger(__name__)
+
+# Rows updated this long before the watermark are re-read, so a transaction that
+# committed just after a refresh started is not missed; recomputing is idempotent
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+def _count_when(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+def _rate(part: int, whole: int) -> float:
+    return round(part * 100.0 / whole, 1) if whole else 0.0
+
+def _period_expressions(column):
+    return extract("year", column), extract("month", column)
+
+def _period(year, month) -> str:
+    return f"{int(year):04d}-{int(month):02d}"
+
+def _period_bounds(period: str) -> Tuple[datetime, datetime]:
+    year, month = (int(part) for part in period.split("-"))
+    start = datetime(year, month, 1)
+    end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+    return start, end
+
+class ReportScope:
+    """Tenant, date range and (for incremental refreshes) periods a report run covers"""
+
+    def __init__(self, tenant_id: Optional[str] = None, date_from: Optional[datetime] = None,
+                 date_to: Optional[datetime] = None, periods: Optional[Set[str]] = None):
+        self.tenant_id = tenant_id
+        self.date_from = date_from
+        self.date_to = date_to
+        self.periods = periods
+
+    def conditions(self, entity: Any) -> List[Any]:
+        """WHERE conditions on an entity with tenant_id and created_at columns"""
+        conditions = []
+        if self.tenant_id:
+            conditions.append(entity.tenant_id == self.tenant_id)
+        if self.date_from:
+            conditions.append(entity.created_at >= self.date_from)
+        if self.date_to:
+            conditions.append(entity.created_at <= self.date_to)
+        if self.periods is not None:
+            # Ranges rather than YEAR()/MONTH() so the created_at indexes apply
+            conditions.append(or_(*(
+                and_(entity.created_at >= start, entity.created_at < end)
+                for start, end in map(_period_bounds, sorted(self.periods))
+            )) if self.periods else false())
+        return conditions
+
+def _changed_periods(db: Session, entity: Any, scope: ReportScope, changed) -> Set[str]:
+    """Periods of rows in scope matching the changed condition"""
+    year, month = _period_expressions(entity.created_at)
+    query = select(year, month).where(changed, *scope.conditions(entity)).distinct()
+    return {_period(row_year, row_month) for row_year, row_month in db.exec(query).all()}
+
+# ----- Issue resolution by area and category -----
+
+def issue_resolution_rows(db: Session, scope: ReportScope) -> List[Dict[str, Any]]:
+    year, month = _period_expressions(CitizenIssue.created_at)
+    query = (
+        select(
+            year, month,
+            CitizenIssue.area_id, Area.name,
+            CitizenIssue.category_id, IssueCategory.name,
+            func.count(CitizenIssue.id),
+            _count_when(CitizenIssue.status == "Open"),
+            _count_when(CitizenIssue.status == "In Progress"),
+            _count_when(CitizenIssue.status == "Pending"),
+            _count_when(CitizenIssue.status == "Resolved")
+        )
+        .select_from(CitizenIssue)
+        .outerjoin(Area, Area.id == CitizenIssue.area_id)
+        .outerjoin(IssueCategory, IssueCategory.id == CitizenIssue.category_id)
+        .where(*scope.conditions(CitizenIssue))
+        .group_by(year, month, CitizenIssue.area_id, Area.name, CitizenIssue.category_id, IssueCategory.name)
+    )
+
+    rows = []
+    for (row_year, row_month, area_id, area, category_id, category,
+         total, opened, in_progress, pending, resolved) in db.exec(query).all():
+        rows.append({
+            "period": _period(row_year, row_month),
+            "area_id": area_id,
+            "area": area,
+            "category_id": category_id,
+            "category": category,
+            "total": int(total),
+            "open": int(opened),
+            "in_progress": int(in_progress),
+            "pending": int(pending),
+            "resolved": int(resolved),
+            "resolution_rate": _rate(int(resolved), int(total))
+        })
+    return rows
+
+def issue_resolution_changes(db: Session, scope: ReportScope, since: datetime) -> Set[str]:
+    return _changed_periods(db, CitizenIssue, scope, CitizenIssue.updated_at > since)
+
+# ----- Letter response rates -----
+
+# Letter type -> (model, condition for "a response exists", closed status)
+LETTER_RESPONSE_TABLES = {
+    "received_letter": (
+        ReceivedLetter,
+        or_(ReceivedLetter.response_date.isnot(None), ReceivedLetter.status == LetterStatus.REPLIED),
+        LetterStatus.CLOSED
+    ),
+    "sent_letter": (
+        SentLetter,
+        or_(SentLetter.response_received_date.isnot(None), SentLetter.status == SentLetterStatus.RESPONSE_RECEIVED),
+        SentLetterStatus.CLOSED
+    ),
+    "sent_grievance_letter": (
+        SentGrievanceLetter,
+        or_(
+            SentGrievanceLetter.response_received_date.isnot(None),
+            SentGrievanceLetter.status == SentGrievanceLetterStatus.RESPONSE_RECEIVED
+        ),
+        SentGrievanceLetterStatus.CLOSED
+    ),
+}
+
+def letter_response_rows(db: Session, scope: ReportScope) -> List[Dict[str, Any]]:
+    rows = []
+    for letter_type, (model, responded, closed_status) in LETTER_RESPONSE_TABLES.items():
+        year, month = _period_expressions(model.created_at)
+        query = (
+            select(
+                year, month,
+                func.count(model.id),
+                _count_when(responded),
+                _count_when(model.status == closed_status)
+            )
+            .where(*scope.conditions(model))
+            .group_by(year, month)
+        )
+        for row_year, row_month, total, responded_count, closed in db.exec(query).all():
+            rows.append({
+                "period": _period(row_year, row_month),
+                "letter_type": letter_type,
+                "total": int(total),
+                "responded": int(responded_count),
+                "closed": int(closed),
+                "open": int(total) - int(closed),
+                "response_rate": _rate(int(responded_count), int(total))
+            })
+    return rows
+
+def letter_response_changes(db: Session, scope: ReportScope, since: datetime) -> Set[str]:
+    periods: Set[str] = set()
+    for model, _, _ in LETTER_RESPONSE_TABLES.values():
+        periods |= _changed_periods(db, model, scope, model.updated_at > since)
+    return periods
+
+# ----- Meeting attendance -----
+
+def meeting_attendance_rows(db: Session, scope: ReportScope) -> List[Dict[str, Any]]:
+    conditions = scope.conditions(MeetingProgram)
+    # Participants are counted per meeting first, so meeting columns are not multiplied by the join
+    participants = (
+        select(
+            MeetingParticipant.meeting_id.label("meeting_id"),
+            func.count(MeetingParticipant.id).label("invited"),
+            _count_when(MeetingParticipant.rsvp == ParticipantRSVP.ACCEPTED).label("accepted"),
+            _count_when(MeetingParticipant.rsvp == ParticipantRSVP.DECLINED).label("declined"),
+            _count_when(MeetingParticipant.attended == True).label("attended")  # noqa: E712
+        )
+        .where(MeetingParticipant.meeting_id.in_(select(MeetingProgram.id).where(*conditions)))
+        .group_by(MeetingParticipant.meeting_id)
+        .subquery()
+    )
+    year, month = _period_expressions(MeetingProgram.created_at)
+    query = (
+        select(
+            year, month, MeetingProgram.meeting_type,
+            func.count(MeetingProgram.id),
+            _count_when(MeetingProgram.status == "Done"),
+            _count_when(MeetingProgram.status == "Cancelled"),
+            func.coalesce(func.sum(participants.c.invited), 0),
+            func.coalesce(func.sum(participants.c.accepted), 0),
+            func.coalesce(func.sum(participants.c.declined), 0),
+            func.coalesce(func.sum(participants.c.attended), 0),
+            func.coalesce(func.sum(MeetingProgram.expected_attendance), 0),
+            func.coalesce(func.sum(MeetingProgram.actual_attendance), 0)
+        )
+        .select_from(MeetingProgram)
+        .outerjoin(participants, participants.c.meeting_id == MeetingProgram.id)
+        .where(*conditions)
+        .group_by(year, month, MeetingProgram.meeting_type)
+    )
+
+    rows = []
+    for (row_year, row_month, meeting_type, meetings, done, cancelled,
+         invited, accepted, declined, attended, expected, actual) in db.exec(query).all():
+        rows.append({
+            "period": _period(row_year, row_month),
+            "meeting_type": meeting_type,
+            "meetings": int(meetings),
+            "done": int(done),
+            "cancelled": int(cancelled),
+            "invited": int(invited),
+            "accepted": int(accepted),
+            "declined": int(declined),
+            "attended": int(attended),
+            "expected_attendance": int(expected),
+            "actual_attendance": int(actual),
+            "attendance_rate": _rate(int(attended), int(invited))
+        })
+    return rows
+
+def meeting_attendance_changes(db: Session, scope: ReportScope, since: datetime) -> Set[str]:
+    participant_changed = MeetingProgram.id.in_(
+        select(MeetingParticipant.meeting_id).where(MeetingParticipant.updated_at > since)
+    )
+    return _changed_periods(
+        db, MeetingProgram, scope, or_(MeetingProgram.updated_at > since, participant_changed)
+    )
+
+class ReportDefinition:
+    """A report: its row layout plus the queries computing and invalidating it"""
+
+    def __init__(self, key: str, title: str, description: str, dimensions: List[str], metrics: List[str],
+                 compute: Callable[[Session, ReportScope], List[Dict[str, Any]]],
+                 changed_periods: Callable[[Session, ReportScope, datetime], Set[str]]):
+        self.key = key
+        self.title = title
+        self.description = description
+        self.dimensions = dimensions
+        self.metrics = metrics
+        self.compute = compute
+        self.changed_periods = changed_periods
+
+    def sort(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return sorted(rows, key=lambda row: tuple(str(row.get(name) or "") for name in self.dimensions))
+
+REPORTS: Dict[str, ReportDefinition] = {
+    definition.key: definition for definition in [
+        ReportDefinition(
+            "issue_resolution",
+            "Issue resolution by area and category",
+            "Citizen issues raised per month, area and category with their current status",
+            ["period", "area_id", "area", "category_id", "category"],
+            ["total", "open", "in_progress", "pending", "resolved", "resolution_rate"],
+            issue_resolution_rows,
+            issue_resolution_changes
+        ),
+        ReportDefinition(
+            "letter_response_rates",
+            "Letter response rates",
+            "Received, sent and grievance letters per month: how many got a response and how many are closed",
+            ["period", "letter_type"],
+            ["total", "responded", "closed", "open", "response_rate"],
+            letter_response_rows,
+            letter_response_changes
+        ),
+        ReportDefinition(
+            "meeting_attendance",
+            "Meeting attendance",
+            "Meetings per month and type with participant RSVPs and attendance",
+            ["period", "meeting_type"],
+            ["meetings", "done", "cancelled", "invited", "accepted", "declined", "attended",
+             "expected_attendance", "actual_attendance", "attendance_rate"],
+            meeting_attendance_rows,
+            meeting_attendance_changes
+        ),
+    ]
+}
+
+class ReportService:
+    """Serves cached report results and refreshes them through the job runner"""
+
+    def __init__(self, engine=None):
+        self._engine = engine
+        self._full_refresh_interval = timedelta(hours=settings.REPORT_FULL_REFRESH_HOURS)
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from database import engine
+            self._engine = engine
+        return self._engine
+
+    def definitions(self) -> List[ReportDefinition]:
+        return list(REPORTS.values())
+
+    def get_definition(self, report_key: str) -> Optional[ReportDefinition]:
+        return REPORTS.get(report_key)
+
+    def get_result(self, db: Session, report_key: str, tenant_id: Optional[str],
+                   params: Dict[str, Any]) -> Tuple[ReportResult, bool]:
+        """
+        Cached result for a report, queueing a refresh when it is missing or expired
+
+        Returns:
+            (result, stale) where stale means expired rows are being served
+        """
+        result = get_or_create_report_result(db, report_key, tenant_id, params)
+        expired = result.expires_at is None or result.expires_at <= datetime.utcnow()
+        if result.rows is None:
+            record_cache_lookup("report", "miss")
+        else:
+            record_cache_lookup("report", "stale" if expired else "hit")
+        if expired:
+            result = self.request_refresh(db, result)
+        return result, expired and result.rows is not None
+
+    def request_refresh(self, db: Session, result: ReportResult, full: bool = False) -> ReportResult:
+        """Queue a refresh job, reusing one already queued for the same result"""
+        from app.services.job_service import job_runner
+
+        job_id = job_runner.enqueue_unique("run_report", {"result_id": result.id, "full": full})
+        if job_id != result.job_id:
+            result = set_report_job(db, result, job_id)
+        return result
+
+    def run(self, result_id: str, full: bool = False) -> Optional[ReportResult]:
+        """
+        Compute a report and store it; called by the run_report job
+
+        Incremental unless asked for a full run, the result was never computed,
+        or the last full run is older than REPORT_FULL_REFRESH_HOURS.
+        """
+        with Session(self.engine) as db:
+            result = get_report_result(db, result_id)
+            if not result:
+                logger.info(f"Report result {result_id} no longer exists, skipping")
+                return None
+            definition = self.get_definition(result.report_key)
+            if not definition:
+                record_report_failure(db, result_id, f"Unknown report: {result.report_key}")
+                return None
+
+            params = decode_report_params(result)
+            started_at = datetime.utcnow()
+            full = (
+                full
+                or result.rows is None
+                or result.watermark is None
+                or result.full_refresh_at is None
+                or started_at - result.full_refresh_at >= self._full_refresh_interval
+            )
+            try:
+                scope = ReportScope(
+                    tenant_id=result.tenant_id,
+                    date_from=datetime.fromisoformat(params["date_from"]) if params.get("date_from") else None,
+                    date_to=datetime.fromisoformat(params["date_to"]) if params.get("date_to") else None
+                )
+                if full:
+                    rows = definition.compute(db, scope)
+                else:
+                    periods = definition.changed_periods(db, scope, result.watermark - WATERMARK_OVERLAP)
+                    rows = decode_report_rows(result)
+                    if periods:
+                        scope.periods = periods
+                        rows = [row for row in rows if row["period"] not in periods] + definition.compute(db, scope)
+                    logger.info(f"Report {result.report_key} ({result_id}): recomputing {len(periods)} changed periods")
+
+                result = store_report_rows(db, result, definition.sort(rows), started_at, full)
+            except Exception as e:
+                logger.error(f"Report {result.report_key} ({result_id}) failed: {e}")
+                record_report_failure(db, result_id, str(e))
+                raise
+
+            logger.info(
+                f"Report {result.report_key} ({result_id}) {'rebuilt' if full else 'refreshed'}: "
+                f"{result.row_count} rows in {(datetime.utcnow() - started_at).total_seconds():.2f}s"
+            )
+            return result
+
+    def purge_expired(self) -> int:
+        with Session(self.engine) as db:
+            return purge_expired_report_results(db)
+
+# Global report service instance
+report_service = ReportService()
@@ -0,0 +1,255 @@
+"""
+Translation Service
+Cached machine translation for UI labels and content
+
+Lookups go through an in-memory LRU, then the persistent translation_cache table,
+and only strings missing from both are sent to argostranslate (on the warm worker
+pool from translation_workers when it is running).
+"""
+
+from sqlmodel import Session, select, and_
+from sqlalchemy.exc import IntegrityError
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+import asyncio
+import hashlib
+import logging
+import threading
+
+from config import settings
+from app.models.translation_cache import TranslationCacheEntry
+from app.services.translation_workers import translation_workers
+from app.core.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+def text_hash(text: str) -> str:
+    """SHA-256 hex digest used as the persistent cache key"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def _batch_span_attributes(self, texts: List[str], source_lang: str, target_lang: str) -> Dict[str, object]:
+    return {"translation.texts": len(texts), "translation.languages": f"{source_lang}->{target_lang}"}
+
+class TranslationService:
+    """Translation with request-level deduplication, LRU and persistent caching"""
+
+    def __init__(self):
+        self.memory_size = settings.TRANSLATION_CACHE_SIZE
+        self.persist = settings.TRANSLATION_CACHE_PERSIST
+        self._memory: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "requested": 0,      # Strings received, duplicates included
+            "deduplicated": 0,   # Repeats within a single batch
+            "memory_hits": 0,
+            "db_hits": 0,
+            "misses": 0,         # Strings actually sent to the translator
+            "errors": 0
+        }
+        self._engine = None
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from database import engine
+            self._engine = engine
+        return self._engine
+
+    def _count(self, key: str, amount: int = 1):
+        with self._lock:
+            self._stats[key] += amount
+
+    # ----- In-memory LRU -----
+
+    def _memory_get(self, key: Tuple[str, str, str]):
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+            return value
+
+    def _memory_put(self, key: Tuple[str, str, str], value: str):
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    # ----- Persistent cache -----
+
+    def _load_persisted(self, texts: List[str], source_lang: str, target_lang: str) -> Dict[str, str]:
+        hashes = {text_hash(text): text for text in texts}
+        with Session(self.engine) as session:
+            rows = session.exec(
+                select(TranslationCacheEntry.text_hash, TranslationCacheEntry.source_text,
+                       TranslationCacheEntry.translated_text)
+                .where(and_(
+                    TranslationCacheEntry.source_lang == source_lang,
+                    TranslationCacheEntry.target_lang == target_lang,
+                    TranslationCacheEntry.text_hash.in_(list(hashes))
+                ))
+            ).all()
+        # Guard against hash collisions by comparing the stored source text
+        return {
+            source_text: translated
+            for digest, source_text, translated in rows
+            if hashes.get(digest) == source_text
+        }
+
+    def _store_persisted(self, translations: Dict[str, str], source_lang: str, target_lang: str):
+        entries = [
+            TranslationCacheEntry(
+                source_lang=source_lang,
+                target_lang=target_lang,
+                text_hash=text_hash(text),
+                source_text=text,
+                translated_text=translated
+            )
+            for text, translated in translations.items()
+        ]
+        with Session(self.engine) as session:
+            try:
+                session.add_all(entries)
+                session.commit()
+            except IntegrityError:
+                # Another request stored some of these first; insert the rest one by one
+                session.rollback()
+                for entry in entries:
+                    try:
+                        session.add(entry)
+                        session.commit()
+                    except IntegrityError:
+                        session.rollback()
+
+    # ----- Translation -----
+
+    def _translate_uncached(self, texts: List[str], source_lang: str, target_lang: str) -> Dict[str, str]:
+        if translation_workers.running:
+            return dict(zip(texts, translation_workers.translate_batch_blocking(texts, source_lang, target_lang)))
+        # argostranslate pulls in ctranslate2 and friends; only import it when actually translating here
+        import argostranslate.translate
+
+        return {
+            text: argostranslate.translate.translate(text, source_lang, target_lang)
+            for text in texts
+        }
+
+    def _lookup_memory(self, texts: List[str], source_lang: str, target_lang: str) -> Tuple[Dict[str, str], List[str]]:
+        """Deduplicate a batch and resolve what the LRU already holds; returns (result, pending)"""
+        unique_texts = list(dict.fromkeys(texts))
+        self._count("requested", len(texts))
+        self._count("deduplicated", len(texts) - len(unique_texts))
+
+        result: Dict[str, str] = {}
+        pending: List[str] = []
+        memory_hits = 0
+        for text in unique_texts:
+            if source_lang == target_lang or not text.strip():
+                result[text] = text
+                continue
+            cached = self._memory_get((source_lang, target_lang, text))
+            if cached is not None:
+                result[text] = cached
+                memory_hits += 1
+            else:
+                pending.append(text)
+        self._count("memory_hits", memory_hits)
+        return result, pending
+
+    def _lookup_persisted(self, result: Dict[str, str], pending: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Fill result from the translation_cache table; returns the strings still missing"""
+        if not pending or not self.persist:
+            return pending
+        try:
+            persisted = self._load_persisted(pending, source_lang, target_lang)
+        except Exception as e:
+            logger.warning(f"Translation cache lookup failed: {e}")
+            return pending
+
+        for text, translated in persisted.items():
+            result[text] = translated
+            self._memory_put((source_lang, target_lang, text), translated)
+        self._count("db_hits", len(persisted))
+        return [text for text in pending if text not in persisted]
+
+    def _remember(self, translated: Dict[str, str], source_lang: str, target_lang: str):
+        for text, value in translated.items():
+            self._memory_put((source_lang, target_lang, text), value)
+        if self.persist:
+            try:
+                self._store_persisted(translated, source_lang, target_lang)
+            except Exception as e:
+                logger.warning(f"Could not persist translations: {e}")
+
+    @tracer.traced("translation.translate_batch", attributes=_batch_span_attributes)
+    def translate_batch(self, texts: List[str], source_lang: str, target_lang: str) -> Dict[str, str]:
+        """
+        Translate a batch of strings in the calling thread
+
+        Returns:
+            Mapping of each distinct input string to its translation
+        """
+        result, pending = self._lookup_memory(texts, source_lang, target_lang)
+        pending = self._lookup_persisted(result, pending, source_lang, target_lang)
+
+        if pending:
+            self._count("misses", len(pending))
+            try:
+                translated = self._translate_uncached(pending, source_lang, target_lang)
+            except Exception:
+                self._count("errors")
+                raise
+            result.update(translated)
+            self._remember(translated, source_lang, target_lang)
+
+        return result
+
+    @tracer.traced("translation.translate_batch", attributes=_batch_span_attributes)
+    async def translate_batch_async(self, texts: List[str], source_lang: str, target_lang: str) -> Dict[str, str]:
+        """
+        Translate a batch of strings without blocking the event loop.
+        Cache misses go to the translation worker pool when it is running.
+
+        Raises:
+            TranslationTimeout: when the worker pool does not answer in time
+        """
+        result, pending = self._lookup_memory(texts, source_lang, target_lang)
+        if pending and self.persist:
+            pending = await asyncio.to_thread(self._lookup_persisted, result, pending, source_lang, target_lang)
+
+        if pending:
+            self._count("misses", len(pending))
+            try:
+                if translation_workers.running:
+                    values = await translation_workers.translate_batch(pending, source_lang, target_lang)
+                    translated = dict(zip(pending, values))
+                else:
+                    translated = await asyncio.to_thread(self._translate_uncached, pending, source_lang, target_lang)
+            except Exception:
+                self._count("errors")
+                raise
+            result.update(translated)
+            await asyncio.to_thread(self._remember, translated, source_lang, target_lang)
+
+        return result
+
+    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
+        """Translate a single string"""
+        return self.translate_batch([text], source_lang, target_lang)[text]
+
+    async def translate_async(self, text: str, source_lang: str, target_lang: str) -> str:
+        """Translate a single string without blocking the event loop"""
+        return (await self.translate_batch_async([text], source_lang, target_lang))[text]
+
+    def get_stats(self) -> Dict[str, float]:
+        """Cache hit metrics since process start"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        served = stats["requested"]
+        from_cache = stats["deduplicated"] + stats["memory_hits"] + stats["db_hits"]
+        stats["hit_rate"] = round(from_cache / served * 100, 2) if served else 0.0
+        return stats
+
+# Global instance
+translation_service = TranslationService()
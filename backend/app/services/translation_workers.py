@@ -0,0 +1,178 @@
+"""
+Translation Workers
+Process pool running argostranslate outside the API process
+
+Each worker loads the installed argos language pairs once when it starts, so
+requests never pay for model loading and CPU-bound inference never holds the
+API process's GIL. Jobs are queued to the pool and awaited with a timeout.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import logging
+import multiprocessing
+import time
+
+from config import settings
+from app.core.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+class TranslationTimeout(Exception):
+    """Raised when a translation job is not finished within the per-job timeout"""
+    pass
+
+# ----- Worker process side -----
+
+# (source_lang, target_lang) -> argos translation object, filled by _init_worker
+_worker_translations: Dict[Tuple[str, str], object] = {}
+
+def _init_worker(preload: bool):
+    """Load installed language pairs into this worker process"""
+    import argostranslate.translate
+
+    if not preload:
+        return
+    for language in argostranslate.translate.get_installed_languages():
+        for translation in language.translations_from:
+            pair = (translation.from_lang.code, translation.to_lang.code)
+            # Running one string loads the model weights now rather than on first request
+            translation.translate("warm up")
+            _worker_translations[pair] = translation
+
+def _worker_ready() -> List[Tuple[str, str]]:
+    return sorted(_worker_translations)
+
+def _translate_chunk(texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+    translation = _worker_translations.get((source_lang, target_lang))
+    if translation is not None:
+        return [translation.translate(text) for text in texts]
+
+    import argostranslate.translate
+    return [argostranslate.translate.translate(text, source_lang, target_lang) for text in texts]
+
+# ----- API process side -----
+
+class TranslationWorkerPool:
+    """Async front end to a pool of warm translation processes"""
+
+    def __init__(self):
+        self.size = settings.TRANSLATION_WORKERS
+        self.job_timeout = settings.TRANSLATION_JOB_TIMEOUT_SECONDS
+        self.chunk_size = settings.TRANSLATION_CHUNK_SIZE
+        self.max_pending_jobs = settings.TRANSLATION_MAX_PENDING_JOBS
+        self.preload = settings.TRANSLATION_PRELOAD
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: Optional[asyncio.Semaphore] = None
+        self.language_pairs: List[Tuple[str, str]] = []
+
+    @property
+    def running(self) -> bool:
+        return self._executor is not None
+
+    async def start(self):
+        """Spawn the workers and wait until each has loaded its models"""
+        if self.running or self.size <= 0:
+            return
+
+        started = time.monotonic()
+        # spawn, not fork: the API process already runs threads and holds DB connections
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.size,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.preload,)
+        )
+        self._pending = asyncio.Semaphore(self.max_pending_jobs)
+
+        loop = asyncio.get_running_loop()
+        try:
+            ready = await asyncio.gather(*[
+                loop.run_in_executor(self._executor, _worker_ready) for _ in range(self.size)
+            ])
+        except Exception as e:
+            # Broken pool (e.g. argostranslate missing); translation falls back to API threads
+            logger.error(f"Translation workers failed to start: {e}")
+            self.stop()
+            return
+        self.language_pairs = ready[0] if ready else []
+        logger.info(f"Started {self.size} translation workers in {time.monotonic() - started:.1f}s "
+                    f"with language pairs: {self.language_pairs}")
+
+    def stop(self):
+        """Shut the workers down without waiting for queued jobs"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info("Translation workers stopped")
+
+    async def _run_chunk(self, texts: List[str], source_lang: str, target_lang: str, deadline: float) -> List[str]:
+        loop = asyncio.get_running_loop()
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise TranslationTimeout("Translation queue is full")
+        try:
+            await asyncio.wait_for(self._pending.acquire(), remaining)
+        except asyncio.TimeoutError:
+            raise TranslationTimeout("Translation queue is full")
+
+        try:
+            future = loop.run_in_executor(self._executor, _translate_chunk, texts, source_lang, target_lang)
+            return await asyncio.wait_for(future, max(deadline - loop.time(), 0.001))
+        except asyncio.TimeoutError:
+            # A running chunk cannot be interrupted; the worker finishes it and moves on
+            raise TranslationTimeout(f"Translation of {len(texts)} strings timed out")
+        finally:
+            self._pending.release()
+
+    @tracer.traced("translation.workers", kind="client", attributes=lambda self, texts, *args: {"translation.texts": len(texts)})
+    async def translate_batch(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """
+        Translate strings on the worker pool, split into chunks that run in parallel
+
+        Raises:
+            TranslationTimeout: when the job does not finish within the per-job timeout
+        """
+        if not self.running:
+            raise RuntimeError("Translation workers are not running")
+        if not texts:
+            return []
+
+        deadline = asyncio.get_running_loop().time() + self.job_timeout
+        chunks = [texts[i:i + self.chunk_size] for i in range(0, len(texts), self.chunk_size)]
+        results = await asyncio.gather(*[
+            self._run_chunk(chunk, source_lang, target_lang, deadline) for chunk in chunks
+        ])
+        return [translated for chunk in results for translated in chunk]
+
+    @tracer.traced("translation.workers", kind="client", attributes=lambda self, texts, *args: {"translation.texts": len(texts)})
+    def translate_batch_blocking(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """
+        Translate strings on the worker pool from a non-async thread (e.g. a background job)
+
+        Raises:
+            TranslationTimeout: when the job does not finish within the per-job timeout
+        """
+        if not self.running:
+            raise RuntimeError("Translation workers are not running")
+        if not texts:
+            return []
+
+        deadline = time.monotonic() + self.job_timeout
+        futures = [
+            self._executor.submit(_translate_chunk, texts[i:i + self.chunk_size], source_lang, target_lang)
+            for i in range(0, len(texts), self.chunk_size)
+        ]
+        results = []
+        for future in futures:
+            try:
+                results.extend(future.result(timeout=max(deadline - time.monotonic(), 0.001)))
+            except FuturesTimeoutError:
+                for pending in futures:
+                    pending.cancel()
+                raise TranslationTimeout(f"Translation of {len(texts)} strings timed out")
+        return results
+
+# Global instance
+translation_workers = TranslationWorkerPool()
@@ -3,9 +3,10 @@ Geographic utilities for generating GeoJSON and handling location data.
 """
 
 import json
-import requests
 from typing import Dict, Any, Optional, Tuple
 
+from app.core.tracing import tracer
+
 
 def generate_geojson_from_coords(lat: float, lon: float, properties: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
@@ -172,6 +173,7 @@ def string_to_geojson(geojson_string: str) -> Dict[str, Any]:
     return json.loads(geojson_string)
 
 
+@tracer.traced("geocoding.search", kind="client", attributes=lambda location: {"peer.service": "nominatim"})
 def get_coordinates(location: str) -> Tuple[Optional[float], Optional[float]]:
     """
     Get coordinates (latitude, longitude) from a location string using OpenStreetMap Nominatim.
@@ -184,6 +186,9 @@ def get_coordinates(location: str) -> Tuple[Optional[float], Optional[float]]:
     """
     if not location:
         return None, None
+
+    # Imported on first use; only geocoding needs an HTTP client
+    import requests
     
     url = "https://nominatim.openstreetmap.org/search"
     params = {
@@ -67,6 +67,9 @@ class Permission(str, Enum):
     DELETE_TENANT_MEETINGS = "delete_tenant_meetings"
     DELETE_ASSIGNED_MEETINGS = "delete_assigned_meetings"
     CREATE_MEETINGS = "create_meetings"
+    
+    # Report permissions
+    VIEW_REPORTS = "view_reports"
 
 class UserRole(str, Enum):
     """User role enumeration"""
@@ -98,7 +101,8 @@ class RolePermissions:
                 Permission.VIEW_ALL_MEETINGS,
                 Permission.EDIT_ALL_MEETINGS,
                 Permission.DELETE_ALL_MEETINGS,
-                Permission.CREATE_MEETINGS
+                Permission.CREATE_MEETINGS,
+                Permission.VIEW_REPORTS
             ],
             
             UserRole.ADMIN: [
@@ -116,7 +120,8 @@ class RolePermissions:
                 Permission.VIEW_TENANT_MEETINGS,
                 Permission.EDIT_TENANT_MEETINGS,
                 Permission.DELETE_TENANT_MEETINGS,
-                Permission.CREATE_MEETINGS
+                Permission.CREATE_MEETINGS,
+                Permission.VIEW_REPORTS
             ],
             
             UserRole.FIELD_AGENT: [
@@ -298,6 +303,10 @@ class RolePermissions:
         """Check if user can switch between tenants"""
         return self.has_permission(role, Permission.SWITCH_TENANTS)
     
+    def can_view_reports(self, role: str) -> bool:
+        """Check if user can run and read aggregate reports"""
+        return self.has_permission(role, Permission.VIEW_REPORTS)
+    
     # Letter permission methods
     def can_view_letters(self, role: str, target_tenant_id: Optional[str] = None, 
                         user_tenant_id: Optional[str] = None, letter_user_id: Optional[str] = None,
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Startup time benchmark
+Imports main in a fresh interpreter under `python -X importtime` and reports
+the total import time and the slowest modules by cumulative time.
+
+Usage:
+    python benchmark_startup.py [--runs 3] [--top 20] [--fail-above-ms 1500]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+def measure_import(module: str) -> Tuple[float, Dict[str, int]]:
+    """Import a module in a subprocess; returns (wall ms, {module: cumulative us})"""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        print(result.stderr[-2000:])
+        raise SystemExit(f"❌ Importing {module} failed")
+
+    cumulative: Dict[str, int] = {}
+    top_level_us = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        value = int(parts[1].strip())
+        name = parts[2].rstrip()
+        # Nesting is shown by indentation after a single leading space
+        if not name.startswith("  "):
+            top_level_us += value
+        name = name.strip()
+        cumulative[name] = max(value, cumulative.get(name, 0))
+    return top_level_us / 1000, cumulative
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure API import time")
+    parser.add_argument("--module", default="main", help="Module to import (default: main)")
+    parser.add_argument("--runs", type=int, default=3, help="Number of fresh interpreters to average")
+    parser.add_argument("--top", type=int, default=20, help="Slowest modules to list")
+    parser.add_argument("--fail-above-ms", type=float, default=None,
+                        help="Exit non-zero when the median import time exceeds this")
+    args = parser.parse_args()
+
+    print(f"⏱️  Importing '{args.module}' {args.runs} times with -X importtime...")
+    totals: List[float] = []
+    slowest: Dict[str, int] = {}
+    for run in range(args.runs):
+        total_ms, cumulative = measure_import(args.module)
+        totals.append(total_ms)
+        print(f"   Run {run + 1}: {total_ms:.1f} ms")
+        # Keep the last run's breakdown; the first run may include a cold disk cache
+        slowest = cumulative
+
+    median_ms = sorted(totals)[len(totals) // 2]
+    print(f"\n📊 Median import time: {median_ms:.1f} ms (min {min(totals):.1f}, max {max(totals):.1f})")
+
+    print(f"\n🐢 Top {args.top} modules by cumulative import time:")
+    ranked = sorted(slowest.items(), key=lambda item: item[1], reverse=True)[:args.top]
+    for name, cumulative_us in ranked:
+        print(f"   {cumulative_us / 1000:8.1f} ms  {name}")
+
+    for heavy in ("argostranslate", "ctranslate2", "requests", "smtplib"):
+        if heavy in slowest:
+            print(f"⚠️  {heavy} is imported at startup ({slowest[heavy] / 1000:.1f} ms)")
+
+    if args.fail_above_ms is not None and median_ms > args.fail_above_ms:
+        print(f"❌ Startup import time {median_ms:.1f} ms exceeds {args.fail_above_ms:.1f} ms")
+        sys.exit(1)
+    print("✅ Done")
+
+if __name__ == "__main__":
+    main()
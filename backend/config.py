@@ -10,6 +10,7 @@ class Settings(BaseSettings):
     DB_USER: str = "root"
     DB_PASSWORD: str = "15112002"
     DB_NAME: str = "smart_politician_assistant"
+    DB_AUTO_MIGRATE: bool = os.getenv("DB_AUTO_MIGRATE", "False").lower() == "true"  # Local development only
 
     # JWT Security
     SECRET_KEY: str = os.getenv("SECRET_KEY", secrets.token_urlsafe(64))
@@ -43,7 +44,95 @@ class Settings(BaseSettings):
     SMTP_USER: str = os.getenv("SMTP_USER", "")
     SMTP_PASSWORD: str = os.getenv("SMTP_PASSWORD", "")
     SMTP_TLS: bool = True
-    
+    SMTP_TIMEOUT_SECONDS: int = 30
+    SMTP_POOL_SIZE: int = 2  # Authenticated connections kept open for reuse
+    SMTP_MAX_IDLE_SECONDS: int = 60  # Pooled connections idle longer than this are reopened
+    EMAIL_FROM: Optional[str] = os.getenv("EMAIL_FROM")  # Defaults to SMTP_USER
+    EMAIL_TRANSPORT: str = os.getenv("EMAIL_TRANSPORT", "smtp")  # Options: "smtp", "file", "console"
+    EMAIL_FILE_DIR: str = os.getenv("EMAIL_FILE_DIR", "mail_outbox")
+    EMAIL_BATCH_SIZE: int = 50  # Messages sent per SMTP session
+    EMAIL_MAX_ATTEMPTS: int = 5
+    EMAIL_RETRY_BASE_SECONDS: int = 60
+
+    # Geocoding
+    GEOCODING_ENABLED: bool = os.getenv("GEOCODING_ENABLED", "True").lower() == "true"
+
+    # Background Jobs
+    JOBS_ENABLED: bool = os.getenv("JOBS_ENABLED", "True").lower() == "true"  # When false, due jobs run inline as they are enqueued
+    JOB_WORKERS: int = 4
+    JOB_POLL_INTERVAL_SECONDS: float = 2.0
+    JOB_LEASE_SECONDS: int = 600  # Renewed while a job runs; jobs whose lease lapses are requeued or failed
+    JOB_RETRY_BASE_SECONDS: int = 30
+
+    # Letter follow-ups
+    FOLLOWUP_SWEEP_INTERVAL_MINUTES: float = 15  # 0 disables the due follow-up sweeper
+    FOLLOWUP_SWEEP_BATCH_SIZE: int = 200
+
+    # Bulk operations
+    BULK_OPERATION_CHUNK_SIZE: int = 500  # Ids per UPDATE / DELETE statement
+    IMPORT_BATCH_SIZE: int = 1000  # CSV rows validated and inserted per transaction
+    EXPORT_FETCH_SIZE: int = 1000  # Rows per keyset-paginated export query (and written out) at a time
+
+    # Reports
+    REPORT_CACHE_TTL_MINUTES: int = 60  # Cached results older than this are served as stale and refreshed
+    REPORT_FULL_REFRESH_HOURS: int = 24  # Refreshes in between only recompute months with changed rows
+    REPORT_RETENTION_DAYS: int = 7  # Results expired for longer than this are deleted
+
+    # Translation
+    TRANSLATION_ENABLED: bool = os.getenv("TRANSLATION_ENABLED", "True").lower() == "true"  # Mounts /translate and starts workers
+    TRANSLATION_CACHE_SIZE: int = 10000  # Entries kept in the in-memory LRU
+    TRANSLATION_CACHE_PERSIST: bool = True  # Also store translations in the translation_cache table
+    TRANSLATION_WORKERS: int = int(os.getenv("TRANSLATION_WORKERS", "2"))  # 0 translates in API threads
+    TRANSLATION_PRELOAD: bool = True  # Load installed language pairs when workers start
+    TRANSLATION_JOB_TIMEOUT_SECONDS: float = 30.0
+    TRANSLATION_MAX_PENDING_JOBS: int = 32  # Chunks queued or running on the pool at once
+    TRANSLATION_CHUNK_SIZE: int = 32  # Strings per worker job
+    CONTENT_SOURCE_LANGUAGE: str = "en"  # Language issues and letters are written in
+
+    # Query instrumentation
+    QUERY_COUNTER_ENABLED: bool = True
+    SLOW_REQUEST_QUERY_COUNT: int = 50  # Requests running more statements than this are logged
+    SLOW_REQUEST_DB_MS: int = 500  # Requests spending longer than this in the database are logged
+    N_PLUS_ONE_THRESHOLD: int = 10  # Same statement this many times with different parameters is flagged
+    SLOW_QUERY_LOG_ENABLED: bool = True
+    SLOW_QUERY_THRESHOLD_MS: int = 200  # Statements slower than this are logged and fingerprinted
+    SLOW_QUERY_MAX_FINGERPRINTS: int = 500  # Kept in memory per process
+
+    # Metrics
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "True").lower() == "true"  # Mounts /metrics
+    METRICS_TOKEN: Optional[str] = os.getenv("METRICS_TOKEN")  # Scrapers must send "Authorization: Bearer <token>"
+    METRICS_ALLOW_UNAUTHENTICATED: bool = os.getenv("METRICS_ALLOW_UNAUTHENTICATED", "False").lower() == "true"  # Serve /metrics without a token
+
+    # Request profiling
+    PROFILING_ENABLED: bool = os.getenv("PROFILING_ENABLED", "True").lower() == "true"  # Super Admins can send X-Profile
+    PROFILE_SAMPLE_RATE: float = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))  # Fraction of all requests profiled
+    PROFILE_SAMPLE_INTERVAL_MS: float = 5  # Time between stack samples
+    PROFILE_MAX_SECONDS: int = 30  # Sampling stops after this even if the request is still running
+    PROFILE_MAX_CONCURRENT: int = 2  # Further triggered requests run unprofiled
+    PROFILE_MAX_STORED: int = 50  # Latest profiles kept in memory per process
+
+    # Tracing
+    TRACING_ENABLED: bool = os.getenv("TRACING_ENABLED", "False").lower() == "true"
+    TRACING_SAMPLE_RATE: float = float(os.getenv("TRACING_SAMPLE_RATE", "1.0"))  # Fraction of new traces recorded
+    TRACING_EXPORTER: str = os.getenv("TRACING_EXPORTER", "file")  # "file" or "otlp"
+    TRACING_FILE_PATH: str = os.getenv("TRACING_FILE_PATH", "traces.jsonl")
+    TRACING_OTLP_ENDPOINT: str = os.getenv("TRACING_OTLP_ENDPOINT", "http://localhost:4318")  # OTLP/HTTP collector
+
+    # Admission control
+    ADMISSION_CONTROL_ENABLED: bool = os.getenv("ADMISSION_CONTROL_ENABLED", "True").lower() == "true"
+    ADMISSION_MAX_CONCURRENT: Optional[int] = None  # Default: DB pool size + overflow - job workers
+    ADMISSION_EXTRA_THREADS: int = 4  # Sync threads beyond the limit, for exempt endpoints
+    ADMISSION_MAX_QUEUE: int = 200  # Requests waiting for a slot; more are refused
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 10.0
+    ADMISSION_LOW_PRIORITY_TIMEOUT_SECONDS: float = 1.0
+    ADMISSION_RETRY_AFTER_SECONDS: int = 5
+    ADMISSION_LOW_PRIORITY_PATTERN: str = r"/(stats|statistics|geojson|dashboard|kpis|export)(/|$)"  # Shed first
+    ADMISSION_EXEMPT_PATHS: List[str] = ["/health", "/metrics", "/docs", "/redoc", "/openapi.json"]
+
+    # Request coalescing
+    REQUEST_COALESCING_ENABLED: bool = os.getenv("REQUEST_COALESCING_ENABLED", "True").lower() == "true"
+    COALESCE_WAIT_TIMEOUT_SECONDS: float = 30.0  # Identical requests stop waiting for the first one after this
+
     # Application Settings
     APP_NAME: str = "Smart Politician Assistant"
     APP_VERSION: str = "1.0.0"
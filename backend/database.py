@@ -22,6 +22,14 @@ from app.models.received_letter import ReceivedLetter
 from app.models.sent_grievance_letter import SentGrievanceLetter
 from app.models.superadmin import SuperAdmin  #  Add missing import
 from app.models.meeting_program import MeetingProgram
+from app.models.meeting_participant import MeetingParticipant
+from app.models.background_job import BackgroundJob
+from app.models.outbound_email import OutboundEmail
+from app.models.translation_cache import TranslationCacheEntry
+from app.models.content_translation import ContentTranslation
+from app.models.schema_migration import SchemaMigration
+from app.models.letter_followup import LetterFollowUp
+from app.models.report_result import ReportResult
 
 # Add any other models you create here (e.g., CitizenIssue, IssueCategory, etc.)
 # --- END IMPORTANT IMPORTS ---
@@ -45,17 +53,15 @@ engine = create_engine(
 # SessionLocal for the get_db() dependency style
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=Session) # Use SQLModel's Session class directly
 
-def create_db_and_tables():
-    """Create all tables defined in SQLModel models."""
-    print("Creating database tables...")
-    try:
-        SQLModel.metadata.create_all(engine)
-        print("Database tables created successfully!")
-    except Exception as e:
-        print(f"Error creating database tables: {str(e)}")
-        import traceback
-        print(f"Traceback: {traceback.format_exc()}")
-        raise
+def check_database_schema():
+    """Verify the schema version (one row); optionally apply pending migrations first."""
+    from app.migrations import check_schema_version, upgrade
+
+    if settings.DB_AUTO_MIGRATE:
+        applied = upgrade(engine)
+        if applied:
+            print(f"Applied {len(applied)} schema migrations")
+    return check_schema_version(engine)
 
 
 def get_db():
@@ -6,7 +6,6 @@ import os
 
 # Import routers
 from app.routes.auth import router as auth_router
-from app.routes.translate import router as translate_router
 from app.routes.users import router as user_router
 from app.routes.tenant import router as tenant_router
 from app.routes.role import router as role_router
@@ -25,13 +24,27 @@ from app.routes.sent_letters import router as sent_letters_router
 from app.routes.sent_grievance_letters import router as sent_grievance_letters_router
 from app.routes.received_letters import router as received_letters_router
 from app.routes.meeting_programs import router as meeting_programs_router
+from app.routes.jobs import router as jobs_router
+from app.routes.reports import router as reports_router
+from app.routes.metrics import router as metrics_router
 
 # Import middleware
-from app.core.request_middleware import RequestLoggingMiddleware
+from app.core.request_middleware import RequestLoggingMiddleware, QueryCountMiddleware, MetricsMiddleware, ProfilingMiddleware, TracingMiddleware
+from app.core.metrics import install_metrics
+from app.core.tracing import tracer, instrument_crud
+from app.core.admission_control import AdmissionControlMiddleware, admission_controller
+from app.core.query_counter import install_query_counter
+from app.core.slow_query_log import slow_query_log
 from app.core.security_middleware import SecurityMiddleware
 
 # Import database functions
-from database import create_db_and_tables
+from database import check_database_schema, engine
+from app.migrations import SchemaVersionError
+from app.services.job_service import job_runner
+from app.services.email_service import email_service
+from app.services.translation_workers import translation_workers
+import app.services.job_handlers  # Registers background job handlers
+from app.crud.letter_followup_crud import schedule_followup_sweep
 from config import settings
 
 app = FastAPI(
@@ -43,6 +56,29 @@ app = FastAPI(
 # Add security middleware
 app.add_middleware(SecurityMiddleware)
 app.add_middleware(RequestLoggingMiddleware)
+# /metrics is only served behind METRICS_TOKEN unless unauthenticated scraping is allowed explicitly
+metrics_served = settings.METRICS_ENABLED and bool(settings.METRICS_TOKEN or settings.METRICS_ALLOW_UNAUTHENTICATED)
+if settings.METRICS_ENABLED and not metrics_served:
+    print("⚠️ METRICS_TOKEN is not set, /metrics is disabled (set METRICS_ALLOW_UNAUTHENTICATED=true to serve it without a token).")
+if metrics_served:
+    # Added before QueryCountMiddleware so it runs inside it and sees the request's query count
+    install_metrics(engine)
+    app.add_middleware(MetricsMiddleware)
+if settings.QUERY_COUNTER_ENABLED:
+    install_query_counter(engine)
+    app.add_middleware(QueryCountMiddleware)
+if settings.SLOW_QUERY_LOG_ENABLED:
+    slow_query_log.install(engine)
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+if settings.TRACING_ENABLED:
+    # Routers are imported above, so their "from app.crud.x import f" names can be rebound
+    instrument_crud()
+    app.add_middleware(TracingMiddleware)
+if settings.ADMISSION_CONTROL_ENABLED:
+    # Outside the other middleware so refused requests skip them, inside CORS so 503s carry CORS headers
+    admission_controller.configure(engine)
+    app.add_middleware(AdmissionControlMiddleware)
 
 # CORS configuration
 app.add_middleware(
@@ -57,15 +93,42 @@ app.add_middleware(
 async def on_startup():
     """Initialize database on startup"""
     print("🚀 Starting Smart Politicians Assistant API...")
+    if settings.ADMISSION_CONTROL_ENABLED:
+        admission_controller.configure_threadpool()
     try:
-        create_db_and_tables()
-        print("✅ Database tables creation complete.")
+        version = check_database_schema()
+        print(f"✅ Database schema is at version {version}.")
+        if settings.JOBS_ENABLED:
+            job_runner.start()
+            schedule_followup_sweep()
+            print("✅ Background job runner started.")
+        else:
+            print("⚠️ JOBS_ENABLED is false: jobs run inline when enqueued, delayed and scheduled jobs wait for a runner.")
+        if settings.TRANSLATION_ENABLED and settings.TRANSLATION_WORKERS > 0:
+            await translation_workers.start()
+            print(f"✅ {settings.TRANSLATION_WORKERS} translation workers ready.")
+    except SchemaVersionError as e:
+        # Serving against the wrong schema corrupts data; refuse to start instead
+        print(f"❌ {str(e)}")
+        raise
     except Exception as e:
         print(f"❌ Error during startup: {str(e)}")
 
+@app.on_event("shutdown")
+def on_shutdown():
+    """Let running background jobs finish and close pooled SMTP connections"""
+    if job_runner.running:
+        job_runner.stop()
+    translation_workers.stop()
+    email_service.close()
+    if settings.TRACING_ENABLED:
+        tracer.processor.flush()
+
 # Include routers
 app.include_router(auth_router, tags=["Authentication"])
-app.include_router(translate_router, tags=["Translation"])
+if settings.TRANSLATION_ENABLED:
+    from app.routes.translate import router as translate_router
+    app.include_router(translate_router, tags=["Translation"])
 app.include_router(user_router, tags=["Users"])
 app.include_router(tenant_router, tags=["Tenants"])
 app.include_router(role_router, tags=["Roles"])
@@ -84,6 +147,10 @@ app.include_router(letters_legacy_router, tags=["Letters Legacy"])
 app.include_router(sent_letters_router, tags=["Sent Letters"])
 app.include_router(sent_grievance_letters_router, tags=["Sent Grievance Letters"])
 app.include_router(received_letters_router, tags=["Received Letters"])
+app.include_router(jobs_router, tags=["Background Jobs"])
+app.include_router(reports_router, tags=["Reports"])
+if metrics_served:
+    app.include_router(metrics_router)
 
 @app.get("/", tags=["Health Check"])
 def root():
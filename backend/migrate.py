@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Schema migration command
+Applies versioned migrations; the API itself only checks the schema version.
+
+Usage:
+    python migrate.py status
+    python migrate.py upgrade [--target N]
+"""
+
+import argparse
+import logging
+import sys
+
+from app.migrations import get_schema_version, get_status, latest_version, upgrade
+from database import engine
+
+def show_status():
+    current = get_schema_version(engine)
+    print(f"📋 Database schema version: {'none' if current is None else current} (code expects {latest_version()})")
+    for item in get_status(engine):
+        marker = "✅" if item["applied"] else "⏳"
+        applied_at = f"  applied {item['applied_at']}" if item["applied_at"] else ""
+        print(f"   {marker} {item['version']:>4}  {item['name']}{applied_at}")
+
+def run_upgrade(target=None):
+    print("🔧 Applying pending schema migrations...")
+    applied = upgrade(engine, target)
+    if not applied:
+        print("✅ Schema already up to date")
+        return
+    for item in applied:
+        print(f"   ✅ {item.version}: {item.name}")
+    print(f"✅ Schema is now at version {get_schema_version(engine)}")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    parser = argparse.ArgumentParser(description="Manage database schema migrations")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    subcommands.add_parser("status", help="Show applied and pending migrations")
+    upgrade_parser = subcommands.add_parser("upgrade", help="Apply pending migrations")
+    upgrade_parser.add_argument("--target", type=int, default=None, help="Stop after this version")
+    args = parser.parse_args()
+
+    try:
+        if args.command == "status":
+            show_status()
+        else:
+            run_upgrade(args.target)
+    except Exception as e:
+        print(f"❌ Migration failed: {str(e)}")
+        sys.exit(1)
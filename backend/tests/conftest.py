@@ -0,0 +1,81 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Run from anywhere: the application imports modules relative to backend/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine
+
+import database  # Registers every model with SQLModel.metadata
+from database import get_session
+from app.core.auth import get_current_user
+from app.models.role import Role, RoleType
+from app.models.sent_letter import SentLetter  # noqa: F401  Not registered by database.py
+from app.models.tenant import Tenant
+from app.models.user import User
+from app.services.email_service import email_service
+from app.services.export_service import export_service
+from app.services.job_service import job_runner
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "mysql: needs a MySQL server (TEST_MYSQL_URL), skipped otherwise")
+
+@pytest.fixture
+def engine(monkeypatch):
+    """In-memory SQLite shared by every session; services that open their own sessions use it too"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    for service in (job_runner, email_service, export_service):
+        monkeypatch.setattr(service, "_engine", engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def db(engine):
+    with Session(engine) as session:
+        yield session
+
+@pytest.fixture
+def world(db):
+    """Two tenants with an admin and Field Agents, plus a Super Admin, using the role names stored in production"""
+    tenant = Tenant(name="Tenant One", email="one@example.com", password="x")
+    other_tenant = Tenant(name="Tenant Two", email="two@example.com", password="x")
+    super_admin_role = Role(name="SuperAdmin", role_type=RoleType.SUPER_ADMIN)
+    admin_role = Role(name="Admin", role_type=RoleType.ADMIN)
+    field_agent_role = Role(name="FieldAgent", role_type=RoleType.MEMBER)
+    db.add_all([tenant, other_tenant, super_admin_role, admin_role, field_agent_role])
+    db.commit()
+
+    def user(name: str, role: Role, tenant_id=None) -> User:
+        return User(name=name, email=f"{name.lower().replace(' ', '.')}@example.com", password_hash="x",
+                    role_id=role.id, tenant_id=tenant_id)
+
+    users = SimpleNamespace(
+        super_admin=user("Super Admin", super_admin_role),
+        admin=user("Admin One", admin_role, tenant.id),
+        field_agent=user("Agent One", field_agent_role, tenant.id),
+        other_admin=user("Admin Two", admin_role, other_tenant.id),
+        other_agent=user("Agent Two", field_agent_role, other_tenant.id),
+    )
+    db.add_all(vars(users).values())
+    db.commit()
+    for record in vars(users).values():
+        db.refresh(record)
+    return SimpleNamespace(tenant=tenant, other_tenant=other_tenant, **vars(users))
+
+@pytest.fixture
+def client_for(db):
+    """client_for(router, user): a TestClient for one router, authenticated as user, sharing the test session"""
+    def build(router, user: User) -> TestClient:
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_session] = lambda: db
+        app.dependency_overrides[get_current_user] = lambda: user
+        return TestClient(app)
+    return build
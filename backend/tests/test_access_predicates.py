@@ -0,0 +1,29 @@
+"""
+Access predicates
+
+Tenant-scoped roles only reach rows of their own tenant.
+"""
+
+from sqlmodel import select
+
+from app.core.access_predicates import access_scope_key, apply_access_filter, classify_access
+from app.models.sent_letter import SentLetter
+from app.models.user import User
+
+def test_tenant_scope_without_tenant_sees_nothing(db, world):
+    tenantless = User(name="Stray Admin", email="stray@example.com", password_hash="x", role_id=world.admin.role_id)
+    db.add(tenantless)
+    db.commit()
+    db.refresh(tenantless)
+    letter = SentLetter(recipient_name="Collector", subject="Own", content="...", created_by=tenantless.id)
+    db.add(letter)
+    db.commit()
+
+    assert db.exec(apply_access_filter(select(SentLetter), tenantless, SentLetter)).all() == []
+    assert classify_access(db, tenantless, SentLetter, [letter.id], "edit") == {letter.id: False}
+    assert access_scope_key(tenantless, SentLetter) == "none"
+
+def test_tenant_scope_keys_are_shared_within_a_tenant(world):
+    assert access_scope_key(world.admin, SentLetter) == f"tenant:{world.tenant.id}"
+    assert access_scope_key(world.other_admin, SentLetter) == f"tenant:{world.other_tenant.id}"
+    assert access_scope_key(world.super_admin, SentLetter) == "all"
@@ -0,0 +1,80 @@
+"""
+Admission control
+
+Requests beyond the limit queue for a slot, critical ones first; low-priority
+requests are shed while critical ones wait, and refusals are 503s.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.admission_control import AdmissionController, AdmissionControlMiddleware, CRITICAL, LOW
+from config import settings
+
+@pytest.fixture
+def controller(monkeypatch):
+    monkeypatch.setattr(settings, "ADMISSION_MAX_QUEUE", 2)
+    monkeypatch.setattr(settings, "ADMISSION_QUEUE_TIMEOUT_SECONDS", 1.0)
+    monkeypatch.setattr(settings, "ADMISSION_LOW_PRIORITY_TIMEOUT_SECONDS", 0.05)
+    controller = AdmissionController()
+    controller.limit = 1
+    return controller
+
+def test_low_priority_is_shed_while_critical_requests_wait(controller):
+    async def scenario():
+        assert await controller.acquire(CRITICAL) is None
+        waiting = asyncio.ensure_future(controller.acquire(CRITICAL))
+        await asyncio.sleep(0)
+        assert controller.queue_depth(CRITICAL) == 1
+
+        assert await controller.acquire(LOW) == "shed"
+
+        controller.release()  # Handed straight to the waiting critical request
+        assert await waiting is None
+        assert controller.in_flight == 1
+        controller.release()
+        assert controller.in_flight == 0
+
+    asyncio.run(scenario())
+
+def test_queue_limit_and_low_priority_timeout(controller):
+    async def scenario():
+        assert await controller.acquire(CRITICAL) is None
+        low_waiters = [asyncio.ensure_future(controller.acquire(LOW)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        assert await controller.acquire(LOW) == "queue_full"
+        assert await asyncio.gather(*low_waiters) == ["timeout", "timeout"]
+        assert controller.queue_depth() == 0
+        assert controller.in_flight == 1
+
+    asyncio.run(scenario())
+
+def test_middleware_refuses_with_503_and_retry_after(controller):
+    messages = []
+
+    async def app(scope, receive, send):
+        raise AssertionError("refused requests must not reach the application")
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    async def scenario():
+        # One request is running and a critical one is waiting, so a dashboard request is shed
+        assert await controller.acquire(CRITICAL) is None
+        waiting = asyncio.ensure_future(controller.acquire(CRITICAL))
+        await asyncio.sleep(0)
+        scope = {"type": "http", "method": "GET", "path": "/dashboard/stats", "headers": []}
+        await AdmissionControlMiddleware(app, controller)(scope, receive, send)
+        controller.release()
+        await waiting
+
+    asyncio.run(scenario())
+
+    start = messages[0]
+    assert start["status"] == 503
+    assert (b"retry-after", str(settings.ADMISSION_RETRY_AFTER_SECONDS).encode()) in start["headers"]
@@ -0,0 +1,68 @@
+"""
+CSV import of citizen issues
+
+Tenant selection and assignee resolution follow the importer's role and tenant.
+"""
+
+from sqlmodel import select
+
+from app.models.citizen_issues import CitizenIssue
+from app.models.user import User
+from app.routes.citizen_issues import router
+
+def upload(client, rows: str, **params):
+    files = {"file": ("issues.csv", ("title,assigned_to\n" + rows).encode("utf-8"), "text/csv")}
+    return client.post("/citizen-issues/import", files=files, params=params)
+
+def imported(db):
+    return db.exec(select(CitizenIssue).order_by(CitizenIssue.title)).all()
+
+def test_super_admin_tenant_id_is_honoured(db, world, client_for):
+    response = upload(client_for(router, world.super_admin), "Broken pipe,\n", tenant_id=world.other_tenant.id)
+
+    assert response.status_code == 200, response.text
+    assert [issue.tenant_id for issue in imported(db)] == [world.other_tenant.id]
+
+def test_super_admin_unknown_tenant_is_rejected(db, world, client_for):
+    response = upload(client_for(router, world.super_admin), "Broken pipe,\n", tenant_id="no-such-tenant")
+
+    assert response.status_code == 400
+    assert imported(db) == []
+
+def test_admin_cannot_choose_another_tenant(db, world, client_for):
+    response = upload(client_for(router, world.admin), "Broken pipe,\n", tenant_id=world.other_tenant.id)
+
+    assert response.status_code == 200, response.text
+    assert [issue.tenant_id for issue in imported(db)] == [world.tenant.id]
+
+def test_field_agent_import_is_assigned_to_themselves(db, world, client_for):
+    rows = f"Pothole,{world.admin.id}\nStreet light,{world.admin.name}\n"
+    response = upload(client_for(router, world.field_agent), rows)
+
+    assert response.status_code == 200, response.text
+    assert response.json()["imported"] == 2
+    assert {issue.assigned_to for issue in imported(db)} == {world.field_agent.id}
+
+def test_assignees_from_other_tenants_are_rejected(db, world, client_for):
+    rows = f"By id,{world.other_agent.id}\nBy name,{world.other_agent.name}\nSame tenant,{world.field_agent.name}\n"
+    response = upload(client_for(router, world.admin), rows)
+
+    report = response.json()
+    assert report["imported"] == 1
+    assert [error["line"] for error in report["errors"]] == [2, 3]
+    assert [(issue.title, issue.assigned_to) for issue in imported(db)] == [("Same tenant", world.field_agent.id)]
+
+def test_ambiguous_assignee_name_is_a_row_error(db, world, client_for):
+    namesake = User(name=world.field_agent.name, email="namesake@example.com", password_hash="x",
+                    role_id=world.field_agent.role_id, tenant_id=world.tenant.id)
+    db.add(namesake)
+    db.commit()
+
+    rows = f"By name,{world.field_agent.name}\nBy id,{namesake.id}\n"
+    report = upload(client_for(router, world.admin), rows).json()
+
+    assert report["imported"] == 1
+    assert len(report["errors"]) == 1
+    assert report["errors"][0]["line"] == 2
+    assert "More than one assignee" in report["errors"][0]["error"]
+    assert [(issue.title, issue.assigned_to) for issue in imported(db)] == [("By id", namesake.id)]
@@ -0,0 +1,67 @@
+"""
+Stored content translations
+
+Translations are removed with the record they belong to, and list pages are
+localized into the user's preferred language when no lang is requested.
+"""
+
+from sqlmodel import select
+
+from app.crud.citizen_issues_crud import bulk_delete_citizen_issues, delete_citizen_issue
+from app.crud.sent_letter_crud import delete_sent_letter
+from app.models.citizen_issues import CitizenIssue
+from app.models.content_translation import ContentTranslation
+from app.models.sent_letter import SentLetter
+from app.routes.sent_letters import router
+from app.services.translation_service import text_hash
+
+def translate(db, entity_type: str, entity, field: str, text: str, language: str = "hi") -> ContentTranslation:
+    row = ContentTranslation(entity_type=entity_type, entity_id=str(entity.id), field=field, language=language,
+                             tenant_id=entity.tenant_id, source_hash=text_hash(getattr(entity, field)),
+                             translated_text=text)
+    db.add(row)
+    db.commit()
+    return row
+
+def translated_ids(db, entity_type: str):
+    return sorted(db.exec(select(ContentTranslation.entity_id).where(ContentTranslation.entity_type == entity_type)).all())
+
+def issue(db, world, title: str) -> CitizenIssue:
+    record = CitizenIssue(title=title, tenant_id=world.tenant.id, created_by=world.admin.id)
+    db.add(record)
+    db.commit()
+    db.refresh(record)
+    return record
+
+def test_deleting_issues_deletes_their_translations(db, world):
+    records = [issue(db, world, title) for title in ("Single", "Bulk", "Kept")]
+    for record in records:
+        translate(db, "citizen_issue", record, "title", "अनुवाद")
+    single, bulk, kept = (record.id for record in records)
+
+    assert delete_citizen_issue(db, single)
+    assert bulk_delete_citizen_issues(db, world.admin, [bulk]) == {bulk: "deleted"}
+
+    assert translated_ids(db, "citizen_issue") == [kept]
+
+def test_deleting_a_letter_deletes_its_translations(db, world):
+    letter = SentLetter(recipient_name="Collector", subject="Water supply", content="...", tenant_id=world.tenant.id)
+    db.add(letter)
+    db.commit()
+    translate(db, "sent_letter", letter, "subject", "जल आपूर्ति")
+
+    assert delete_sent_letter(db, letter.id)
+
+    assert translated_ids(db, "sent_letter") == []
+
+def test_list_defaults_to_the_users_language(db, world, client_for):
+    letter = SentLetter(recipient_name="Collector", subject="Water supply", content="...",
+                        tenant_id=world.tenant.id, created_by=world.admin.id)
+    db.add(letter)
+    db.commit()
+    translate(db, "sent_letter", letter, "subject", "जल आपूर्ति")
+    world.admin.language_preference = "Hindi"
+    client = client_for(router, world.admin)
+
+    assert [row["subject"] for row in client.get("/sent-letters/").json()["letters"]] == ["जल आपूर्ति"]
+    assert [row["subject"] for row in client.get("/sent-letters/", params={"lang": "en"}).json()["letters"]] == ["Water supply"]
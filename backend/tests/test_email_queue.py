@@ -0,0 +1,79 @@
+"""
+Outbound email queue
+
+Messages queued in a caller's transaction are only scheduled for delivery once
+it commits; delivery marks them sent or retries them with backoff.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlmodel import Session, select
+
+from app.models.background_job import BackgroundJob, JobStatus
+from app.models.outbound_email import OutboundEmail, OutboundEmailStatus
+from app.services.email_service import email_service
+
+class RecordingTransport:
+    def __init__(self, error=None):
+        self.sent = []
+        self.error = error
+
+    def send_batch(self, messages):
+        self.sent.extend(message["To"] for message in messages)
+        return [self.error] * len(messages)
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def transport(monkeypatch):
+    transport = RecordingTransport()
+    monkeypatch.setattr(email_service, "transport_name", "console")
+    monkeypatch.setattr(email_service, "_transport", transport)
+    return transport
+
+def delivery_jobs(db):
+    return db.exec(select(BackgroundJob).where(BackgroundJob.job_type == "deliver_outbound_emails")).all()
+
+def test_delivery_is_scheduled_after_the_callers_commit(db, engine, transport):
+    with Session(engine) as session:
+        assert email_service.queue_emails([("a@example.com", "Hi", "Body")], session=session) == 1
+        assert delivery_jobs(db) == []
+        session.commit()
+
+    jobs = delivery_jobs(db)
+    assert [job.status for job in jobs] == [JobStatus.QUEUED]
+    assert [email.to_email for email in db.exec(select(OutboundEmail)).all()] == ["a@example.com"]
+
+def test_rolled_back_messages_are_neither_stored_nor_scheduled(db, engine, transport):
+    with Session(engine) as session:
+        email_service.queue_emails([("a@example.com", "Hi", "Body")], session=session)
+        session.rollback()
+
+    assert db.exec(select(OutboundEmail)).all() == []
+    assert delivery_jobs(db) == []
+
+def test_delivery_sends_and_purges_sensitive_bodies(db, transport):
+    email_service.queue_emails([("reset@example.com", "Reset", "token")], sensitive=True)
+
+    assert email_service.deliver_queued() == 1
+
+    email = db.exec(select(OutboundEmail)).one()
+    assert transport.sent == ["reset@example.com"]
+    assert (email.status, email.body) == (OutboundEmailStatus.SENT, None)
+
+def test_failed_delivery_is_retried_with_backoff(db, transport):
+    transport.error = "451 try again later"
+    email_service.queue_emails([("a@example.com", "Hi", "Body")])
+    for job in delivery_jobs(db):
+        db.delete(job)  # Stands for the delivery run now in progress
+    db.commit()
+
+    assert email_service.deliver_queued() == 0
+
+    email = db.exec(select(OutboundEmail)).one()
+    assert email.status == OutboundEmailStatus.QUEUED
+    assert email.next_attempt_at > datetime.utcnow()
+    # A delivery run is scheduled for the retry
+    assert [job.run_after >= email.next_attempt_at for job in delivery_jobs(db)] == [True]
@@ -0,0 +1,45 @@
+"""
+CSV / XLSX exports
+
+Text that a spreadsheet program would evaluate as a formula is exported as text.
+"""
+
+import csv
+import io
+
+import pytest
+
+from app.models.sent_letter import SentLetter
+from app.services.export_service import export_service
+
+SUBJECTS = ["=HYPERLINK(\"http://evil\",\"x\")", "+1+2", "-2+3", "@SUM(A1)", "\tTabbed", "Plain - subject"]
+
+def export_rows(query):
+    text = b"".join(export_service.iter_csv(query)).decode("utf-8-sig")
+    return list(csv.DictReader(io.StringIO(text)))
+
+def test_csv_neutralises_formulas(db, world):
+    db.add_all([
+        SentLetter(recipient_name="Collector", subject=subject, content="...", tenant_id=world.tenant.id)
+        for subject in SUBJECTS
+    ])
+    db.commit()
+
+    rows = export_rows(export_service.export_query(SentLetter))
+
+    assert [row["subject"] for row in rows] == [
+        "'=HYPERLINK(\"http://evil\",\"x\")", "'+1+2", "'-2+3", "'@SUM(A1)", "'\tTabbed", "Plain - subject"
+    ]
+    assert rows[0]["recipient_name"] == "Collector"
+
+def test_xlsx_neutralises_formulas(db, world):
+    openpyxl = pytest.importorskip("openpyxl")
+    db.add(SentLetter(recipient_name="=1+1", subject="Plain", content="...", tenant_id=world.tenant.id))
+    db.commit()
+
+    output = export_service.write_xlsx(export_service.export_query(SentLetter), "letters")
+    sheet = openpyxl.load_workbook(output).active
+    header, row = list(sheet.values)
+    output.close()
+
+    assert row[header.index("recipient_name")] == "'=1+1"
@@ -0,0 +1,112 @@
+"""
+Background job runner
+
+Leases are renewed while a handler runs, expired leases are requeued or failed,
+and a worker that lost its lease does not overwrite the job's outcome.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlmodel import Session
+
+from app.models.background_job import BackgroundJob, JobStatus
+from app.services.job_service import JobRunner
+
+@pytest.fixture
+def runner(engine):
+    runner = JobRunner(engine)
+    runner._inline = True  # Run on the test thread instead of starting the poller
+    return runner
+
+def load(engine, job_id: str) -> BackgroundJob:
+    with Session(engine) as session:
+        return session.get(BackgroundJob, job_id)
+
+def expire_lease(engine, job_id: str, **values):
+    with Session(engine) as session:
+        job = session.get(BackgroundJob, job_id)
+        job.locked_at = datetime.utcnow() - timedelta(hours=1)
+        for name, value in values.items():
+            setattr(job, name, value)
+        session.add(job)
+        session.commit()
+
+def test_enqueue_runs_inline_when_runner_disabled(engine, runner):
+    seen = []
+    runner.register("echo")(seen.append)
+
+    job_id = runner.enqueue("echo", {"n": 1})
+    delayed_id = runner.enqueue("echo", {"n": 2}, run_after=datetime.utcnow() + timedelta(hours=1))
+
+    assert seen == [{"n": 1}]
+    assert load(engine, job_id).status == JobStatus.SUCCEEDED
+    assert load(engine, delayed_id).status == JobStatus.QUEUED
+
+def test_renewed_lease_is_not_recovered(engine, runner):
+    states = []
+
+    @runner.register("slow")
+    def slow(payload):
+        expire_lease(engine, payload["id"])
+        runner.renew_leases()
+        runner.recover_expired_jobs()
+        states.append(load(engine, payload["id"]).status)
+
+    job_id = runner.enqueue("slow", run_after=datetime.utcnow() + timedelta(hours=1))
+    expire_lease(engine, job_id, run_after=datetime.utcnow(), payload=f'{{"id": "{job_id}"}}')
+    runner.run_inline(job_id)
+
+    assert states == [JobStatus.RUNNING]
+    assert load(engine, job_id).status == JobStatus.SUCCEEDED
+
+def test_outcome_is_not_recorded_after_losing_the_lease(engine, runner):
+    @runner.register("taken_over")
+    def taken_over(payload):
+        # Lease expired and another worker claimed the job meanwhile
+        expire_lease(engine, payload["id"], locked_by="other-host:1")
+
+    job_id = runner.enqueue("taken_over", run_after=datetime.utcnow() + timedelta(hours=1))
+    expire_lease(engine, job_id, run_after=datetime.utcnow(), payload=f'{{"id": "{job_id}"}}')
+    runner.run_inline(job_id)
+
+    job = load(engine, job_id)
+    assert job.status == JobStatus.RUNNING
+    assert job.locked_by == "other-host:1"
+
+def test_failure_is_retried_with_backoff_then_failed(engine, runner):
+    @runner.register("broken", max_attempts=2)
+    def broken(payload):
+        raise RuntimeError("boom")
+
+    job_id = runner.enqueue("broken")
+    job = load(engine, job_id)
+    assert (job.status, job.attempts) == (JobStatus.QUEUED, 1)
+    assert job.run_after > datetime.utcnow()
+    assert "boom" in job.last_error
+
+    expire_lease(engine, job_id, run_after=datetime.utcnow())
+    runner.run_inline(job_id)
+    job = load(engine, job_id)
+    assert (job.status, job.attempts) == (JobStatus.FAILED, 2)
+    assert job.finished_at is not None
+
+def test_expired_leases_are_requeued_until_attempts_run_out(engine, runner):
+    with Session(engine) as session:
+        retry = BackgroundJob(job_type="x", status=JobStatus.RUNNING, attempts=1, max_attempts=3,
+                              locked_by="dead:1", locked_at=datetime.utcnow() - timedelta(hours=1))
+        exhausted = BackgroundJob(job_type="x", status=JobStatus.RUNNING, attempts=3, max_attempts=3,
+                                  locked_by="dead:1", locked_at=datetime.utcnow() - timedelta(hours=1))
+        fresh = BackgroundJob(job_type="x", status=JobStatus.RUNNING, attempts=3, max_attempts=3,
+                              locked_by="alive:1", locked_at=datetime.utcnow())
+        session.add_all([retry, exhausted, fresh])
+        session.commit()
+        ids = retry.id, exhausted.id, fresh.id
+
+    assert runner.recover_expired_jobs() == 2
+
+    retry, exhausted, fresh = (load(engine, job_id) for job_id in ids)
+    assert (retry.status, retry.locked_by) == (JobStatus.QUEUED, None)
+    assert exhausted.status == JobStatus.FAILED
+    assert exhausted.finished_at is not None
+    assert fresh.status == JobStatus.RUNNING
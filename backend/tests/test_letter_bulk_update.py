@@ -0,0 +1,65 @@
+"""
+Bulk status / priority / assignment updates of letters
+
+Each letter is updated only if the caller may edit it, and assignees must belong
+to the caller's tenant unless the caller is a Super Admin.
+"""
+
+from app.models.sent_letter import SentLetter, SentLetterStatus
+from app.routes.sent_letters import router
+
+def letter(db, subject: str, tenant, creator, assigned_to=None) -> SentLetter:
+    record = SentLetter(recipient_name="Collector", subject=subject, content="...",
+                        tenant_id=tenant.id, created_by=creator.id, assigned_to=assigned_to)
+    db.add(record)
+    db.commit()
+    db.refresh(record)
+    return record
+
+def bulk_update(client, letters, **changes):
+    return client.post("/sent-letters/bulk-update", json={"letter_ids": [l.id for l in letters], **changes})
+
+def test_admin_updates_only_their_tenant(db, world, client_for):
+    own = letter(db, "Own", world.tenant, world.admin)
+    foreign = letter(db, "Foreign", world.other_tenant, world.other_admin)
+
+    response = bulk_update(client_for(router, world.admin), [own, foreign, own], status="Response Received")
+
+    assert response.status_code == 200, response.text
+    assert response.json()["results"] == {str(own.id): "updated", str(foreign.id): "forbidden"}
+    db.refresh(own)
+    db.refresh(foreign)
+    assert own.status == SentLetterStatus.RESPONSE_RECEIVED
+    assert own.response_received_date is not None
+    assert own.updated_by == world.admin.id
+    assert foreign.status == SentLetterStatus.AWAITING_RESPONSE
+
+def test_field_agent_updates_only_assigned_letters(db, world, client_for):
+    assigned = letter(db, "Assigned", world.tenant, world.admin, assigned_to=world.field_agent.id)
+    unassigned = letter(db, "Unassigned", world.tenant, world.admin)
+
+    response = bulk_update(client_for(router, world.field_agent), [assigned, unassigned], priority="High")
+
+    assert response.json()["results"] == {str(assigned.id): "updated", str(unassigned.id): "forbidden"}
+
+def test_assignee_must_be_in_the_admins_tenant(db, world, client_for):
+    own = letter(db, "Own", world.tenant, world.admin)
+
+    response = bulk_update(client_for(router, world.admin), [own], assigned_to=world.other_agent.id)
+    assert response.status_code == 422
+    db.refresh(own)
+    assert own.assigned_to is None
+
+    response = bulk_update(client_for(router, world.admin), [own], assigned_to=world.field_agent.id)
+    assert response.status_code == 200, response.text
+    db.refresh(own)
+    assert own.assigned_to == world.field_agent.id
+
+def test_super_admin_may_assign_across_tenants(db, world, client_for):
+    own = letter(db, "Own", world.tenant, world.admin)
+
+    response = bulk_update(client_for(router, world.super_admin), [own], assigned_to=world.other_agent.id)
+
+    assert response.status_code == 200, response.text
+    db.refresh(own)
+    assert own.assigned_to == world.other_agent.id
@@ -0,0 +1,47 @@
+"""
+Follow-up sweep
+
+Due follow-ups are announced and marked notified in one transaction.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlmodel import select
+
+from app.crud import letter_followup_crud
+from app.models.letter_followup import LetterFollowUp, FollowUpLetterType
+from app.models.outbound_email import OutboundEmail
+from app.services.email_service import email_service
+from app.services.job_handlers import sweep_letter_followups
+
+@pytest.fixture
+def due_followup(db, world, monkeypatch):
+    monkeypatch.setattr(email_service, "transport_name", "console")
+    monkeypatch.setattr(letter_followup_crud, "schedule_followup_sweep", lambda *args: None)
+    followup = LetterFollowUp(letter_type=FollowUpLetterType.SENT_LETTER, letter_id=1, tenant_id=world.tenant.id,
+                              assignee_id=world.field_agent.id, subject="Road repair",
+                              due_at=datetime.utcnow() - timedelta(days=1))
+    db.add(followup)
+    db.commit()
+    return followup
+
+def test_sweep_queues_notice_and_marks_followup(db, world, due_followup):
+    sweep_letter_followups({})
+
+    db.refresh(due_followup)
+    assert due_followup.notified_at is not None
+    emails = db.exec(select(OutboundEmail)).all()
+    assert [(email.to_email, email.subject) for email in emails] == [(world.field_agent.email, "Follow-up Due: Road repair")]
+
+def test_failed_queueing_leaves_followup_unnotified(db, due_followup, monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("database went away")
+    monkeypatch.setattr(email_service, "queue_emails", fail)
+
+    with pytest.raises(RuntimeError):
+        sweep_letter_followups({})
+
+    db.refresh(due_followup)
+    assert due_followup.notified_at is None
+    assert db.exec(select(OutboundEmail)).all() == []
@@ -0,0 +1,147 @@
+"""
+Query plans of the hot letter queries
+
+Runs the list, statistics and overdue queries through the letter CRUDs, captures
+the SQL they send and checks each statement's plan for full scans of a letter table.
+
+On SQLite (always run) this checks that the indexes the queries need exist and
+are usable; SQLite's planner is not MySQL's, so it says nothing about which index
+production picks. Set TEST_MYSQL_URL to a scratch MySQL database to also run the
+checks against MySQL's EXPLAIN (tests marked "mysql"). Its tables are nearly empty,
+where MySQL may prefer a scan anyway, so there a step only fails when a letter
+table is scanned with no possible key at all.
+"""
+
+import os
+import re
+from contextlib import contextmanager
+from typing import List, Tuple
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine
+
+from app.crud import received_letter_crud, sent_letter_crud, sent_grievance_letter_crud
+from app.models.received_letter import LetterStatus
+from app.models.sent_letter import SentLetterStatus
+from app.models.sent_grievance_letter import SentGrievanceLetterStatus
+from app.schemas.received_letter_schema import LetterFilters
+from app.schemas.sent_letter_schema import SentLetterFilters
+from app.schemas.sent_grievance_letter_schema import SentGrievanceLetterFilters
+
+LETTER_TABLES = ("received_letters", "sent_letters", "sent_grievance_letters", "letter_followups")
+
+# "SCAN <table>" without an index is a full table scan; "SEARCH" and index scans are fine
+FULL_SCAN = re.compile(rf"^SCAN ({'|'.join(LETTER_TABLES)})\b(?!.*USING (COVERING )?INDEX)")
+
+TENANT_ID = "tenant-1"
+
+MYSQL_URL = os.getenv("TEST_MYSQL_URL")
+
+@pytest.fixture(params=[
+    "sqlite",
+    pytest.param("mysql", marks=[
+        pytest.mark.mysql,
+        pytest.mark.skipif(not MYSQL_URL, reason="TEST_MYSQL_URL is not set")
+    ]),
+])
+def engine(request):
+    if request.param == "mysql":
+        engine = create_engine(MYSQL_URL)
+    else:
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    if request.param == "mysql":
+        SQLModel.metadata.drop_all(engine)
+    engine.dispose()
+
+@contextmanager
+def captured_selects(engine) -> List[Tuple[str, tuple]]:
+    """Collect every SELECT sent to the database inside the block"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+def scan_steps(engine, statement: str, parameters) -> List[str]:
+    """Plan steps of one statement that fully scan a letter table"""
+    with engine.connect() as connection:
+        if engine.dialect.name == "mysql":
+            rows = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters).mappings().all()
+            return [
+                f"{row['table']}: type={row['type']} possible_keys={row['possible_keys']}"
+                for row in rows
+                if row["table"] in LETTER_TABLES and row["type"] == "ALL" and not row["possible_keys"]
+            ]
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return [row[-1] for row in rows if FULL_SCAN.search(row[-1])]
+
+def full_scans(engine, run) -> List[str]:
+    """Run run(db) and return the plan steps that fully scan a letter table"""
+    with Session(engine) as db, captured_selects(engine) as statements:
+        run(db)
+    assert statements, "the CRUD call ran no queries"
+    return [step for statement, parameters in statements for step in scan_steps(engine, statement, parameters)]
+
+LIST_QUERIES = {
+    "received": lambda db: received_letter_crud.get_filtered_received_letters(
+        db, LetterFilters(status=LetterStatus.NEW), TENANT_ID
+    ),
+    "sent": lambda db: sent_letter_crud.get_filtered_sent_letters(
+        db, SentLetterFilters(status=SentLetterStatus.AWAITING_RESPONSE), TENANT_ID
+    ),
+    "grievance": lambda db: sent_grievance_letter_crud.get_filtered_sent_grievance_letters(
+        db, SentGrievanceLetterFilters(status=SentGrievanceLetterStatus.AWAITING), TENANT_ID
+    ),
+    "received_unfiltered": lambda db: received_letter_crud.get_filtered_received_letters(
+        db, LetterFilters(), TENANT_ID
+    ),
+}
+
+STATISTICS_QUERIES = {
+    "received": lambda db: received_letter_crud.get_letter_statistics(db, tenant_id=TENANT_ID),
+    "sent": lambda db: sent_letter_crud.get_sent_letter_statistics(db, tenant_id=TENANT_ID),
+    "grievance": lambda db: sent_grievance_letter_crud.get_sent_grievance_letter_statistics(db, tenant_id=TENANT_ID),
+}
+
+OVERDUE_QUERIES = {
+    "received": lambda db: received_letter_crud.get_overdue_letters(db, TENANT_ID),
+    "sent": lambda db: sent_letter_crud.get_overdue_followups(db, TENANT_ID),
+    "grievance": lambda db: sent_grievance_letter_crud.get_overdue_followups(db, TENANT_ID),
+}
+
+@pytest.mark.parametrize("name", LIST_QUERIES)
+def test_list_queries_use_indexes(engine, name):
+    assert full_scans(engine, LIST_QUERIES[name]) == []
+
+@pytest.mark.parametrize("name", STATISTICS_QUERIES)
+def test_statistics_queries_use_indexes(engine, name):
+    assert full_scans(engine, STATISTICS_QUERIES[name]) == []
+
+@pytest.mark.parametrize("name", OVERDUE_QUERIES)
+def test_overdue_queries_use_indexes(engine, name):
+    assert full_scans(engine, OVERDUE_QUERIES[name]) == []
+
+@pytest.mark.parametrize("engine", ["sqlite"], indirect=True)
+def test_full_scan_is_detected_without_the_indexes(engine):
+    with engine.begin() as connection:
+        for index in ("ix_received_letters_tenant_created", "ix_received_letters_tenant_status_created",
+                      "ix_received_letters_tenant_priority_created", "ix_received_letters_tenant_due_date"):
+            connection.exec_driver_sql(f"DROP INDEX {index}")
+        # The single-column tenant_id index from the model would still avoid the scan
+        for (name,) in connection.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'received_letters'"
+        ).all():
+            if not name.startswith("sqlite_autoindex"):
+                connection.exec_driver_sql(f"DROP INDEX {name}")
+
+    assert full_scans(engine, LIST_QUERIES["received"])
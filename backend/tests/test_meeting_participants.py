@@ -0,0 +1,42 @@
+"""
+Meeting participation counts
+
+An assignee who is also listed as a participant has two participant rows and
+must still count as one person in one meeting.
+"""
+
+import json
+from datetime import datetime
+
+from app.crud.meeting_participant_crud import (
+    sync_meeting_participants, update_participant_response,
+    get_participation_summary, get_meeting_attendance_counts
+)
+from app.models.meeting_participant import ParticipantRSVP
+from app.models.meeting_program import MeetingProgram
+
+def test_assignee_listed_as_participant_counts_once(db, world):
+    agent = world.field_agent
+    meeting = MeetingProgram(
+        title="Ward review", scheduled_date=datetime(2026, 1, 5, 10), status="Done",
+        created_by=world.admin.id, tenant_id=world.tenant.id, user_id=agent.id,
+        participants=json.dumps([{"user_id": agent.id, "name": agent.name}, {"name": "Guest"}])
+    )
+    db.add(meeting)
+    db.commit()
+    assert len(sync_meeting_participants(db, meeting)) == 3
+    db.commit()
+
+    update_participant_response(db, meeting.id, agent.id, rsvp=ParticipantRSVP.ACCEPTED, attended=True)
+
+    summary = get_participation_summary(db, agent.id)
+    assert summary["total_meetings"] == 1
+    assert summary["accepted"] == 1
+    assert summary["pending"] == 0
+    assert summary["attended"] == 1
+    assert summary["completed_meetings"] == 1
+    assert summary["attendance_rate"] == 100
+
+    assert get_meeting_attendance_counts(db, [meeting.id]) == {
+        meeting.id: {"invited": 2, "accepted": 1, "declined": 0, "attended": 1}
+    }
@@ -0,0 +1,49 @@
+"""
+Schema migrations
+
+A fresh database brought up by the migrations alone must match the schema the
+current models describe, so every model change ships with a migration.
+"""
+
+from sqlalchemy import create_engine, inspect
+from sqlmodel import SQLModel
+
+from app.migrations import latest_version, upgrade, get_schema_version
+
+def schema(engine):
+    inspector = inspect(engine)
+    return {
+        table: {
+            "columns": sorted(
+                (column["name"], str(column["type"]), column["nullable"])
+                for column in inspector.get_columns(table)
+            ),
+            "primary_key": inspector.get_pk_constraint(table)["constrained_columns"],
+            "indexes": sorted(
+                (index["name"], tuple(index["column_names"]), bool(index["unique"]))
+                for index in inspector.get_indexes(table)
+            ),
+            "unique": sorted(tuple(constraint["column_names"]) for constraint in inspector.get_unique_constraints(table)),
+            "foreign_keys": sorted(
+                (tuple(key["constrained_columns"]), key["referred_table"]) for key in inspector.get_foreign_keys(table)
+            ),
+        }
+        for table in inspector.get_table_names()
+    }
+
+def test_migrations_build_the_model_schema():
+    migrated = create_engine("sqlite://")
+    upgrade(migrated)
+    assert get_schema_version(migrated) == latest_version()
+
+    from_models = create_engine("sqlite://")
+    SQLModel.metadata.create_all(from_models)
+
+    assert schema(migrated) == schema(from_models)
+
+def test_migrations_can_be_rerun():
+    engine = create_engine("sqlite://")
+    upgrade(engine)
+    before = schema(engine)
+    assert upgrade(engine) == []
+    assert schema(engine) == before
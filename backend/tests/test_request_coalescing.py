@@ -0,0 +1,80 @@
+"""
+Request coalescing
+
+Concurrent identical calls share one computation; each follower gets its own
+copy of a failure, chained to the leader's.
+"""
+
+import threading
+import time
+
+from fastapi import HTTPException
+
+from app.core.request_coalescing import RequestCoalescer, coalesce_key
+
+def run_concurrently(coalescer: RequestCoalescer, keys, compute):
+    """Start a leader per distinct key, let the rest join, then release the leaders"""
+    release = threading.Event()
+    outcomes = [None] * len(keys)
+
+    def call(index, key):
+        try:
+            outcomes[index] = coalescer.run(key, lambda: compute(release))
+        except Exception as e:
+            outcomes[index] = e
+
+    threads = [threading.Thread(target=call, args=(index, key)) for index, key in enumerate(keys)]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.02)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    return outcomes
+
+def test_identical_calls_share_one_computation():
+    calls = []
+
+    def compute(release):
+        calls.append(1)
+        release.wait(5)
+        return {"total": 3}
+
+    key = coalesce_key("/stats", {"tenant": "t1"}, "tenant:t1")
+    outcomes = run_concurrently(RequestCoalescer(), [key] * 4, compute)
+
+    assert len(calls) == 1
+    assert outcomes == [{"total": 3}] * 4
+
+def test_different_scopes_do_not_share():
+    calls = []
+
+    def compute(release):
+        calls.append(1)
+        release.wait(5)
+        return len(calls)
+
+    keys = [coalesce_key("/stats", {}, "tenant:t1"), coalesce_key("/stats", {}, "tenant:t2")]
+    run_concurrently(RequestCoalescer(), keys, compute)
+
+    assert len(calls) == 2
+
+def test_followers_raise_their_own_copy_of_the_error():
+    def compute(release):
+        release.wait(5)
+        raise HTTPException(status_code=503, detail="Stats unavailable")
+
+    coalescer = RequestCoalescer()
+    leader_error, *follower_errors = run_concurrently(coalescer, [("key",)] * 3, compute)
+
+    assert coalescer.in_flight() == 0
+    for error in follower_errors:
+        assert isinstance(error, HTTPException)
+        assert (error.status_code, error.detail) == (503, "Stats unavailable")
+        assert error is not leader_error
+        assert error.__cause__ is leader_error
+    assert follower_errors[0] is not follower_errors[1]
+
+def test_key_ignores_injected_objects():
+    assert coalesce_key("/stats", {"db": object(), "days": 7}) == coalesce_key("/stats", {"db": object(), "days": 7})
+    assert coalesce_key("/stats", {"days": 7}) != coalesce_key("/stats", {"days": 30})
@@ -0,0 +1,14 @@
+"""
+Translation endpoints
+
+Cache and worker statistics are only shown to Super Admins.
+"""
+
+from app.routes.translate import router
+
+def test_stats_require_super_admin(world, client_for):
+    assert client_for(router, world.admin).get("/translate/stats").status_code == 403
+
+    response = client_for(router, world.super_admin).get("/translate/stats")
+    assert response.status_code == 200, response.text
+    assert "workers" in response.json()